@@ -0,0 +1,199 @@
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class AsyncTtlCache():
+
+    def __init__(
+        self,
+        timeToLive: timedelta,
+        maxSize: int = 256,
+        purgeInterval: timedelta = timedelta(minutes = 1),
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if not isinstance(timeToLive, timedelta):
+            raise ValueError(f'timeToLive argument is malformed: \"{timeToLive}\"')
+        elif timeToLive.total_seconds() <= 0:
+            raise ValueError(f'timeToLive argument is out of bounds: {timeToLive}')
+        elif not utils.isValidInt(maxSize):
+            raise ValueError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+        elif not isinstance(purgeInterval, timedelta):
+            raise ValueError(f'purgeInterval argument is malformed: \"{purgeInterval}\"')
+        elif not callable(clock):
+            raise ValueError(f'clock argument is malformed: \"{clock}\"')
+
+        self.__timeToLiveSeconds: float = timeToLive.total_seconds()
+        self.__maxSize: int = maxSize
+        self.__purgeIntervalSeconds: float = purgeInterval.total_seconds()
+        self.__clock: Callable[[], float] = clock
+
+        # entries are stored as (expiration time, value), least recently used first
+        self.__entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self.__inFlightLoads: Dict[str, asyncio.Future] = dict()
+        self.__generation: int = 0
+        self.__nextPurgeTime: float = clock() + self.__purgeIntervalSeconds
+
+        self.__evictions: int = 0
+        self.__expirations: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def clear(self):
+        # loads that are still in flight finish for their waiters, but their results aren't cached
+        self.__generation = self.__generation + 1
+        self.__entries.clear()
+        self.__inFlightLoads.clear()
+
+    def containsKey(self, key: str) -> bool:
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        # unlike get(), this neither counts towards the stats nor touches the entry's recency
+        entry = self.__entries.get(key)
+        return entry is not None and self.__clock() < entry[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        entry = self.__entries.get(key)
+
+        if entry is None:
+            self.__misses = self.__misses + 1
+            return None
+        elif self.__clock() >= entry[0]:
+            del self.__entries[key]
+            self.__expirations = self.__expirations + 1
+            self.__misses = self.__misses + 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits = self.__hits + 1
+        return entry[1]
+
+    def getEvictions(self) -> int:
+        return self.__evictions
+
+    def getExpirations(self) -> int:
+        return self.__expirations
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMaxSize(self) -> int:
+        return self.__maxSize
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    async def getOrLoad(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+        elif not callable(loader):
+            raise ValueError(f'loader argument is malformed: \"{loader}\"')
+
+        value = self.get(key)
+
+        if value is not None:
+            return value
+
+        # if this key is already being loaded, then just wait on that load instead of starting another one
+        inFlightLoad = self.__inFlightLoads.get(key)
+
+        if inFlightLoad is None:
+            inFlightLoad = asyncio.ensure_future(self.__load(key, loader))
+            inFlightLoad.add_done_callback(self.__onLoadDone)
+            self.__inFlightLoads[key] = inFlightLoad
+
+        # the load runs as its own task, so one waiter being cancelled never cancels it for the others
+        return await asyncio.shield(inFlightLoad)
+
+    def getSize(self) -> int:
+        return len(self.__entries)
+
+    def isLoading(self, key: str) -> bool:
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        return key in self.__inFlightLoads
+
+    async def __load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Optional[Any]]]
+    ) -> Optional[Any]:
+        generation = self.__generation
+
+        try:
+            value = await loader()
+        finally:
+            if generation == self.__generation:
+                self.__inFlightLoads.pop(key, None)
+
+        if value is not None and generation == self.__generation:
+            self.put(key, value)
+
+        return value
+
+    def __onLoadDone(self, inFlightLoad: asyncio.Future):
+        # mark the exception as retrieved, as there may not be any waiters left to see it
+        if not inFlightLoad.cancelled():
+            inFlightLoad.exception()
+
+    def pop(self, key: str) -> Optional[Any]:
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        entry = self.__entries.pop(key, None)
+
+        if entry is None or self.__clock() >= entry[0]:
+            return None
+
+        return entry[1]
+
+    def purgeExpired(self) -> int:
+        now = self.__clock()
+        self.__nextPurgeTime = now + self.__purgeIntervalSeconds
+
+        expiredKeys = [ key for key, entry in self.__entries.items() if now >= entry[0] ]
+
+        for key in expiredKeys:
+            del self.__entries[key]
+
+        self.__expirations = self.__expirations + len(expiredKeys)
+        return len(expiredKeys)
+
+    def put(self, key: str, value: Optional[Any]):
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
+
+        if value is None:
+            self.__entries.pop(key, None)
+            return
+
+        now = self.__clock()
+
+        # expired entries are purged lazily, at most once per purge interval
+        if now >= self.__nextPurgeTime:
+            self.purgeExpired()
+
+        self.__entries[key] = (now + self.__timeToLiveSeconds, value)
+        self.__entries.move_to_end(key)
+
+        while len(self.__entries) > self.__maxSize:
+            self.__entries.popitem(last = False)
+            self.__evictions = self.__evictions + 1
@@ -0,0 +1,431 @@
+import asyncio
+import gzip
+import io
+import json
+import os
+import re
+from datetime import date, datetime, timedelta, timezone
+from typing import (Any, AsyncIterator, Callable, Dict, List, Optional,
+                    Pattern, Set)
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.chatLogger.chatLogEntry import ChatLogEntry
+    from CynanBotCommon.logSink.logSink import LogSink
+    from CynanBotCommon.timber.timberInterface import TimberInterface
+except:
+    import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from chatLogger.chatLogEntry import ChatLogEntry
+    from logSink.logSink import LogSink
+    from timber.timberInterface import TimberInterface
+
+
+# Archives and searches the day files that ChatLogger writes. Once a day is over, its
+# "{channel}/{year}/{month}/{day}.log" file is gzipped into "{day}.log.gz", and a "{day}.index.json"
+# file is written alongside it, which holds each user ID's byte offsets into the uncompressed log.
+# Lookups for a user can then skip any day they didn't chat on, and read only their own lines on
+# the days they did. If a few more statements for an archived day show up later on (ChatLogger
+# flushes on a delay), they're appended to the archive as another gzip member. The index also
+# holds the archive's compressed size, so that an append that was interrupted can be cut back off.
+#
+# ChatLogger's LogSink keeps its log files open between flushes, so a day file is first moved
+# aside to "{day}.log.archiving", and then the LogSink is asked to close it. Once that's done,
+# nothing else can land in the moved file, and any later statements start a new "{day}.log".
+class ChatLogArchive():
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelper,
+        timber: TimberInterface,
+        archiveIntervalSeconds: float = 3600,
+        logRootDirectory: str = 'CynanBotCommon/chatLogger'
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidNum(archiveIntervalSeconds):
+            raise ValueError(f'archiveIntervalSeconds argument is malformed: \"{archiveIntervalSeconds}\"')
+        elif archiveIntervalSeconds < 60 or archiveIntervalSeconds > 86400:
+            raise ValueError(f'archiveIntervalSeconds argument is out of bounds: {archiveIntervalSeconds}')
+        elif not utils.isValidStr(logRootDirectory):
+            raise ValueError(f'logRootDirectory argument is malformed: \"{logRootDirectory}\"')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelper = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__archiveIntervalSeconds: float = archiveIntervalSeconds
+        self.__logRootDirectory: str = logRootDirectory
+
+        self.__archiveLock: Optional[asyncio.Lock] = None
+        self.__logSink: Optional[LogSink] = None
+        self.__isStarted: bool = False
+        self.__chatMessageRegEx: Pattern = re.compile(r'^(\S+ \S+) — (\S+) \(([^)]+)\) — (.*)$')
+        self.__logStatementRegEx: Pattern = re.compile(r'^(\S+ \S+) — (.*)$')
+
+    def __appendToArchive(self, dayPath: str, logFile: str):
+        archiveFile = f'{dayPath}.log.gz'
+        indexFile = f'{dayPath}.index.json'
+
+        with open(logFile, mode = 'rb') as file:
+            logFileStat = os.fstat(file.fileno())
+            contents = file.read()
+
+        # this identifies the log file well enough to tell if it's already been archived
+        source = [ logFileStat.st_ino, logFileStat.st_size, logFileStat.st_mtime_ns ]
+        index = self.__readIndex(dayPath)
+
+        if index is None and os.path.isfile(indexFile):
+            raise RuntimeError(f'Unable to append \"{logFile}\" to the archive, as its index file \"{indexFile}\" is malformed')
+        elif index is None or not os.path.isfile(archiveFile):
+            index = { 'compressedSize': 0, 'size': 0, 'users': dict() }
+        elif index.get('source') == source:
+            # an earlier archive pass was interrupted after writing its index, but before removing this log file
+            os.remove(logFile)
+            return
+
+        compressedSize = index.get('compressedSize')
+
+        if not utils.isValidInt(compressedSize):
+            # indexes written before the compressed size was kept don't have it
+            compressedSize = os.path.getsize(archiveFile)
+
+        offset: int = index['size']
+        users: Dict[str, List[int]] = index['users']
+
+        # split the same way that readline() does, so that the offsets line up with it later on
+        for line in io.BytesIO(contents):
+            match = self.__chatMessageRegEx.fullmatch(line.decode('utf-8', errors = 'replace').rstrip('\n'))
+
+            if match is not None:
+                userId = match.group(3)
+
+                if userId in users:
+                    users[userId].append(offset)
+                else:
+                    users[userId] = [ offset ]
+
+            offset = offset + len(line)
+
+        compressedContents = gzip.compress(contents)
+
+        # A gzip file can be made up of several gzip members back to back, which read back as one.
+        # Anything past the indexed size was appended by an archive pass that was interrupted before
+        # writing its index, and is still in the log file, so it's cut off before appending again.
+        with open(archiveFile, mode = 'ab') as file:
+            file.truncate(compressedSize)
+            file.write(compressedContents)
+
+        index['compressedSize'] = compressedSize + len(compressedContents)
+        index['size'] = offset
+        index['source'] = source
+
+        temporaryIndexFile = f'{indexFile}.tmp'
+
+        with open(temporaryIndexFile, mode = 'w', encoding = 'utf-8') as file:
+            json.dump(index, file, separators = (',', ':'))
+
+        # the index is replaced before the log file is removed, so an interrupted pass can always be picked back up
+        os.replace(temporaryIndexFile, indexFile)
+        os.remove(logFile)
+
+    async def archiveClosedDays(self, today: Optional[date] = None) -> int:
+        if today is None:
+            # ChatLogger names its day files using UTC dates
+            today = datetime.now(timezone.utc).date()
+        elif not isinstance(today, date):
+            raise ValueError(f'today argument is malformed: \"{today}\"')
+
+        async with self.__getArchiveLock():
+            eventLoop = self.__backgroundTaskHelper.getEventLoop()
+            return await eventLoop.run_in_executor(None, self.__archiveClosedDays, today)
+
+    def __archiveClosedDays(self, today: date) -> int:
+        if not os.path.isdir(self.__logRootDirectory):
+            return 0
+
+        archivedFiles = 0
+
+        for twitchChannel in sorted(os.listdir(self.__logRootDirectory)):
+            channelDirectory = os.path.join(self.__logRootDirectory, twitchChannel)
+
+            if not os.path.isdir(channelDirectory):
+                continue
+
+            for directory, _, fileNames in os.walk(channelDirectory):
+                dayNames: Set[str] = set()
+
+                for fileName in fileNames:
+                    if fileName.endswith('.log'):
+                        dayNames.add(fileName[:-len('.log')])
+                    elif fileName.endswith('.log.archiving'):
+                        dayNames.add(fileName[:-len('.log.archiving')])
+
+                for dayName in sorted(dayNames):
+                    logDate = self.__getLogDate(channelDirectory, directory, dayName)
+
+                    if logDate is None or logDate >= today:
+                        continue
+
+                    # this is the same path that ChatLogger hands to its LogSink
+                    dayPath = f'{self.__logRootDirectory}/{twitchChannel}/{logDate.year:04d}/{logDate.month:02d}/{logDate.day:02d}'
+
+                    try:
+                        self.__archiveLogFile(dayPath)
+                        archivedFiles = archivedFiles + 1
+                    except Exception as e:
+                        self.__timber.log('ChatLogArchive', f'Encountered exception when archiving chat log file \"{dayName}.log\" in \"{directory}\": {e}', e)
+
+        if archivedFiles >= 1:
+            self.__timber.log('ChatLogArchive', f'Archived {archivedFiles} chat log file(s)')
+
+        return archivedFiles
+
+    def __archiveLogFile(self, dayPath: str):
+        logFile = f'{dayPath}.log'
+        archivingFile = f'{dayPath}.log.archiving'
+
+        # this is left over from an archive pass that was interrupted partway through
+        if os.path.isfile(archivingFile):
+            self.__appendToArchive(dayPath, archivingFile)
+
+        if not os.path.isfile(logFile):
+            return
+
+        os.replace(logFile, archivingFile)
+        logSink = self.__logSink
+
+        if logSink is not None:
+            logSink.closeLogFile(logFile)
+
+        self.__appendToArchive(dayPath, archivingFile)
+
+    async def fetchMessages(
+        self,
+        twitchChannel: str,
+        startDate: date,
+        endDate: date
+    ) -> AsyncIterator[ChatLogEntry]:
+        async for chatLogEntry in self.__fetchChatLogEntries(
+            twitchChannel = twitchChannel,
+            startDate = startDate,
+            endDate = endDate,
+            readDay = lambda dayPath, logDate: self.__readDay(dayPath, logDate, twitchChannel)
+        ):
+            yield chatLogEntry
+
+    async def fetchMessagesByUser(
+        self,
+        twitchChannel: str,
+        userId: str,
+        startDate: date,
+        endDate: date
+    ) -> AsyncIterator[ChatLogEntry]:
+        if not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+
+        async for chatLogEntry in self.__fetchChatLogEntries(
+            twitchChannel = twitchChannel,
+            startDate = startDate,
+            endDate = endDate,
+            readDay = lambda dayPath, logDate: self.__readDayForUser(dayPath, logDate, twitchChannel, userId)
+        ):
+            yield chatLogEntry
+
+    async def __fetchChatLogEntries(
+        self,
+        twitchChannel: str,
+        startDate: date,
+        endDate: date,
+        readDay: Callable[[str, date], List[ChatLogEntry]]
+    ) -> AsyncIterator[ChatLogEntry]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not isinstance(startDate, date):
+            raise ValueError(f'startDate argument is malformed: \"{startDate}\"')
+        elif not isinstance(endDate, date):
+            raise ValueError(f'endDate argument is malformed: \"{endDate}\"')
+        elif startDate > endDate:
+            raise ValueError(f'startDate argument ({startDate}) must not be after endDate argument ({endDate})')
+
+        eventLoop = self.__backgroundTaskHelper.getEventLoop()
+        logDate = startDate
+
+        # only a single day's worth of entries is ever held onto at once
+        while logDate <= endDate:
+            dayPath = f'{self.__logRootDirectory}/{twitchChannel.lower()}/{logDate.year:04d}/{logDate.month:02d}/{logDate.day:02d}'
+            chatLogEntries = await eventLoop.run_in_executor(None, readDay, dayPath, logDate)
+
+            for chatLogEntry in chatLogEntries:
+                yield chatLogEntry
+
+            logDate = logDate + timedelta(days = 1)
+
+    def __getArchiveLock(self) -> asyncio.Lock:
+        archiveLock = self.__archiveLock
+
+        if archiveLock is None:
+            archiveLock = asyncio.Lock()
+            self.__archiveLock = archiveLock
+
+        return archiveLock
+
+    def __getLogDate(self, channelDirectory: str, directory: str, dayName: str) -> Optional[date]:
+        pathParts = os.path.relpath(directory, channelDirectory).split(os.sep)
+
+        if len(pathParts) != 2:
+            return None
+
+        try:
+            return date(int(pathParts[0]), int(pathParts[1]), int(dayName))
+        except ValueError:
+            return None
+
+    def __parseLine(self, line: str, logDate: date, twitchChannel: str) -> Optional[ChatLogEntry]:
+        line = line.rstrip('\n')
+        match = self.__chatMessageRegEx.fullmatch(line)
+
+        if match is not None:
+            return ChatLogEntry(
+                logDate = logDate,
+                dateTimeStr = match.group(1),
+                msg = match.group(4),
+                twitchChannel = twitchChannel,
+                userId = match.group(3),
+                userName = match.group(2)
+            )
+
+        match = self.__logStatementRegEx.fullmatch(line)
+
+        if match is None:
+            return None
+
+        return ChatLogEntry(
+            logDate = logDate,
+            dateTimeStr = match.group(1),
+            msg = match.group(2),
+            twitchChannel = twitchChannel
+        )
+
+    def __readDay(self, dayPath: str, logDate: date, twitchChannel: str) -> List[ChatLogEntry]:
+        chatLogEntries: List[ChatLogEntry] = list()
+
+        # a day can have both an archive and a log file, if statements showed up after archiving
+        for opener, path in ((gzip.open, f'{dayPath}.log.gz'), (open, f'{dayPath}.log.archiving'), (open, f'{dayPath}.log')):
+            if not os.path.isfile(path):
+                continue
+
+            with opener(path, mode = 'rt', encoding = 'utf-8', errors = 'replace') as file:
+                for line in file:
+                    chatLogEntry = self.__parseLine(line, logDate, twitchChannel)
+
+                    if chatLogEntry is not None:
+                        chatLogEntries.append(chatLogEntry)
+
+        return chatLogEntries
+
+    def __readDayForUser(
+        self,
+        dayPath: str,
+        logDate: date,
+        twitchChannel: str,
+        userId: str
+    ) -> List[ChatLogEntry]:
+        chatLogEntries: List[ChatLogEntry] = list()
+        archiveFile = f'{dayPath}.log.gz'
+        index = self.__readIndex(dayPath)
+
+        if index is not None and os.path.isfile(archiveFile):
+            offsets: List[int] = index['users'].get(userId, list())
+
+            if len(offsets) >= 1:
+                with gzip.open(archiveFile, mode = 'rb') as file:
+                    # the offsets are in ascending order, so this only ever seeks forward
+                    for offset in offsets:
+                        file.seek(offset)
+                        line = file.readline().decode('utf-8', errors = 'replace')
+                        chatLogEntry = self.__parseLine(line, logDate, twitchChannel)
+
+                        if chatLogEntry is not None and chatLogEntry.getUserId() == userId:
+                            chatLogEntries.append(chatLogEntry)
+        elif os.path.isfile(archiveFile):
+            # without an index, there's no way around reading the whole archive
+            for chatLogEntry in self.__readDay(dayPath, logDate, twitchChannel):
+                if chatLogEntry.getUserId() == userId:
+                    chatLogEntries.append(chatLogEntry)
+
+            return chatLogEntries
+
+        for logFile in (f'{dayPath}.log.archiving', f'{dayPath}.log'):
+            if not os.path.isfile(logFile):
+                continue
+
+            with open(logFile, mode = 'rt', encoding = 'utf-8', errors = 'replace') as file:
+                for line in file:
+                    chatLogEntry = self.__parseLine(line, logDate, twitchChannel)
+
+                    if chatLogEntry is not None and chatLogEntry.getUserId() == userId:
+                        chatLogEntries.append(chatLogEntry)
+
+        return chatLogEntries
+
+    def __readIndex(self, dayPath: str) -> Optional[Dict[str, Any]]:
+        indexFile = f'{dayPath}.index.json'
+
+        if not os.path.isfile(indexFile):
+            return None
+
+        try:
+            with open(indexFile, mode = 'r', encoding = 'utf-8') as file:
+                index: Dict[str, Any] = json.load(file)
+        except Exception as e:
+            self.__timber.log('ChatLogArchive', f'Encountered exception when reading chat log index file \"{indexFile}\": {e}', e)
+            return None
+
+        if not isinstance(index, Dict) or not utils.isValidInt(index.get('size')) or not isinstance(index.get('users'), Dict):
+            self.__timber.log('ChatLogArchive', f'Chat log index file \"{indexFile}\" is malformed: {index}')
+            return None
+
+        return index
+
+    async def searchMessages(
+        self,
+        twitchChannel: str,
+        keyword: str,
+        startDate: date,
+        endDate: date
+    ) -> AsyncIterator[ChatLogEntry]:
+        if not utils.isValidStr(keyword):
+            raise ValueError(f'keyword argument is malformed: \"{keyword}\"')
+
+        keyword = keyword.lower()
+
+        async for chatLogEntry in self.fetchMessages(twitchChannel, startDate, endDate):
+            if keyword in chatLogEntry.getMsg().lower():
+                yield chatLogEntry
+
+    def setLogSink(self, logSink: Optional[LogSink]):
+        if logSink is not None and not isinstance(logSink, LogSink):
+            raise ValueError(f'logSink argument is malformed: \"{logSink}\"')
+
+        self.__logSink = logSink
+
+    def start(self):
+        if self.__isStarted:
+            self.__timber.log('ChatLogArchive', 'Not starting ChatLogArchive as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('ChatLogArchive', 'Starting ChatLogArchive...')
+
+        self.__backgroundTaskHelper.createTask(self.__startArchiveLoop())
+
+    async def __startArchiveLoop(self):
+        while True:
+            try:
+                await self.archiveClosedDays()
+            except Exception as e:
+                self.__timber.log('ChatLogArchive', f'Encountered exception when archiving chat logs: {e}', e)
+
+            await asyncio.sleep(self.__archiveIntervalSeconds)
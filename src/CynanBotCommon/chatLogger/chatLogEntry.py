@@ -0,0 +1,60 @@
+from datetime import date
+from typing import Optional
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class ChatLogEntry():
+
+    def __init__(
+        self,
+        logDate: date,
+        dateTimeStr: str,
+        msg: str,
+        twitchChannel: str,
+        userId: Optional[str] = None,
+        userName: Optional[str] = None
+    ):
+        if not isinstance(logDate, date):
+            raise ValueError(f'logDate argument is malformed: \"{logDate}\"')
+        elif not utils.isValidStr(dateTimeStr):
+            raise ValueError(f'dateTimeStr argument is malformed: \"{dateTimeStr}\"')
+        elif not isinstance(msg, str):
+            raise ValueError(f'msg argument is malformed: \"{msg}\"')
+        elif not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif userId is not None and not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif userName is not None and not utils.isValidStr(userName):
+            raise ValueError(f'userName argument is malformed: \"{userName}\"')
+
+        self.__logDate: date = logDate
+        self.__dateTimeStr: str = dateTimeStr
+        self.__msg: str = msg
+        self.__twitchChannel: str = twitchChannel
+        self.__userId: Optional[str] = userId
+        self.__userName: Optional[str] = userName
+
+    def getDateTimeStr(self) -> str:
+        return self.__dateTimeStr
+
+    def getLogDate(self) -> date:
+        return self.__logDate
+
+    def getMsg(self) -> str:
+        return self.__msg
+
+    def getTwitchChannel(self) -> str:
+        return self.__twitchChannel
+
+    def getUserId(self) -> Optional[str]:
+        return self.__userId
+
+    def getUserName(self) -> Optional[str]:
+        return self.__userName
+
+    def hasUserId(self) -> bool:
+        return utils.isValidStr(self.__userId)
@@ -1,31 +1,32 @@
-import asyncio
-import queue
-from collections import defaultdict
-from queue import SimpleQueue
-from typing import Dict, List
-
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
+from typing import Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
     from CynanBotCommon.chatLogger.absChatMessage import AbsChatMessage
     from CynanBotCommon.chatLogger.chatEventType import ChatEventType
+    from CynanBotCommon.chatLogger.chatLogArchive import ChatLogArchive
     from CynanBotCommon.chatLogger.chatLoggerInterface import \
         ChatLoggerInterface
     from CynanBotCommon.chatLogger.chatMessage import ChatMessage
     from CynanBotCommon.chatLogger.raidMessage import RaidMessage
+    from CynanBotCommon.logSink.logSink import LogSink
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+    from CynanBotCommon.logSink.logSinkOverflowPolicy import \
+        LogSinkOverflowPolicy
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
     import utils
     from backgroundTaskHelper import BackgroundTaskHelper
     from chatLogger.absChatMessage import AbsChatMessage
     from chatLogger.chatEventType import ChatEventType
+    from chatLogger.chatLogArchive import ChatLogArchive
     from chatLogger.chatLoggerInterface import ChatLoggerInterface
     from chatLogger.chatMessage import ChatMessage
     from chatLogger.raidMessage import RaidMessage
+    from logSink.logSink import LogSink
+    from logSink.logSinkMetrics import LogSinkMetrics
+    from logSink.logSinkOverflowPolicy import LogSinkOverflowPolicy
     from timber.timberInterface import TimberInterface
 
 
@@ -36,7 +37,10 @@ class ChatLogger(ChatLoggerInterface):
         backgroundTaskHelper: BackgroundTaskHelper,
         timber: TimberInterface,
         sleepTimeSeconds: float = 15,
-        logRootDirectory: str = 'CynanBotCommon/chatLogger'
+        logRootDirectory: str = 'CynanBotCommon/chatLogger',
+        chatLogArchive: Optional[ChatLogArchive] = None,
+        maxQueueSize: int = 65536,
+        overflowPolicy: LogSinkOverflowPolicy = LogSinkOverflowPolicy.DROP_OLDEST
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
             raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -48,14 +52,42 @@ class ChatLogger(ChatLoggerInterface):
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
         elif not utils.isValidStr(logRootDirectory):
             raise ValueError(f'logRootDirectory argument is malformed: \"{logRootDirectory}\"')
+        elif chatLogArchive is not None and not isinstance(chatLogArchive, ChatLogArchive):
+            raise ValueError(f'chatLogArchive argument is malformed: \"{chatLogArchive}\"')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not isinstance(overflowPolicy, LogSinkOverflowPolicy):
+            raise ValueError(f'overflowPolicy argument is malformed: \"{overflowPolicy}\"')
 
-        self.__backgroundTaskHelper: BackgroundTaskHelper = backgroundTaskHelper
         self.__timber: TimberInterface = timber
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__logRootDirectory: str = logRootDirectory
+        self.__chatLogArchive: Optional[ChatLogArchive] = chatLogArchive
 
         self.__isStarted: bool = False
-        self.__messageQueue: SimpleQueue[AbsChatMessage] = SimpleQueue()
+
+        self.__logSink: LogSink = LogSink(
+            backgroundTaskHelper = backgroundTaskHelper,
+            maxFlushDelaySeconds = sleepTimeSeconds,
+            maxQueueSize = maxQueueSize,
+            overflowPolicy = overflowPolicy,
+            spillFile = f'{logRootDirectory}/chatLogger.spill'
+        )
+
+        if chatLogArchive is not None:
+            chatLogArchive.setLogSink(self.__logSink)
+
+    def __getLogFile(self, message: AbsChatMessage) -> str:
+        if not isinstance(message, AbsChatMessage):
+            raise ValueError(f'message argument is malformed: \"{message}\"')
+
+        twitchChannel = message.getTwitchChannel().lower()
+        simpleDateTime = message.getSimpleDateTime()
+        return f'{self.__logRootDirectory}/{twitchChannel}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}/{simpleDateTime.getDayStr()}.log'
+
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        return self.__logSink.getMetrics()
 
     def __getLogStatement(self, message: AbsChatMessage) -> str:
         if not isinstance(message, AbsChatMessage):
@@ -91,7 +123,7 @@ class ChatLogger(ChatLoggerInterface):
             userName = userName
         )
 
-        self.__messageQueue.put(chatMessage)
+        self.__writeToLogFile(chatMessage)
 
     def logRaid(self, raidSize: int, fromWho: str, twitchChannel: str):
         if not utils.isValidInt(raidSize):
@@ -109,7 +141,7 @@ class ChatLogger(ChatLoggerInterface):
             twitchChannel = twitchChannel
         )
 
-        self.__messageQueue.put(raidMessage)
+        self.__writeToLogFile(raidMessage)
 
     def start(self):
         if self.__isStarted:
@@ -119,44 +151,10 @@ class ChatLogger(ChatLoggerInterface):
         self.__isStarted = True
         self.__timber.log('ChatLogger', 'Starting ChatLogger...')
 
-        self.__backgroundTaskHelper.createTask(self.__startMessageLoop())
-
-    async def __startMessageLoop(self):
-        while True:
-            messages: List[AbsChatMessage] = list()
-
-            try:
-                while not self.__messageQueue.empty():
-                    message = self.__messageQueue.get_nowait()
-                    messages.append(message)
-            except queue.Empty:
-                pass
-
-            await self.__writeToLogFiles(messages)
-            await asyncio.sleep(self.__sleepTimeSeconds)
-
-    async def __writeToLogFiles(self, messages: List[AbsChatMessage]):
-        if len(messages) == 0:
-            return
-
-        # The below logic is kind of intense, however, there is a very similar/nearly identical
-        # flow within the Timber class. Check that out for more information and context.
-
-        structure: Dict[str, Dict[str, List[AbsChatMessage]]] = defaultdict(lambda: defaultdict(lambda: list()))
-
-        for message in messages:
-            twitchChannel = message.getTwitchChannel().lower()
-            simpleDateTime = message.getSimpleDateTime()
-            messageDirectory = f'{self.__logRootDirectory}/{twitchChannel}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}'
-            messageFile = f'{messageDirectory}/{simpleDateTime.getDayStr()}.log'
-            structure[messageDirectory][messageFile].append(message)
-
-        for messageDirectory, messageFileToMessagesDict in structure.items():
-            if not await aiofiles.ospath.exists(messageDirectory):
-                await aiofiles.os.makedirs(messageDirectory)
+        self.__logSink.start()
 
-            for messageFile, messagesList in messageFileToMessagesDict.items():
-                async with aiofiles.open(messageFile, mode = 'a', encoding = 'utf-8') as file:
-                    for message in messagesList:
-                        logStatement = self.__getLogStatement(message)
-                        await file.write(logStatement)
+        if self.__chatLogArchive is not None:
+            self.__chatLogArchive.start()
+
+    def __writeToLogFile(self, message: AbsChatMessage):
+        self.__logSink.write(self.__getLogFile(message), self.__getLogStatement(message))
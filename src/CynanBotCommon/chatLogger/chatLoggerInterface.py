@@ -1,8 +1,17 @@
 from abc import ABC, abstractmethod
 
+try:
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+except:
+    from logSink.logSinkMetrics import LogSinkMetrics
+
 
 class ChatLoggerInterface(ABC):
 
+    @abstractmethod
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        pass
+
     @abstractmethod
     def logMessage(self, msg: str, twitchChannel: str, userId: str, userName: str):
         pass
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import os
+from datetime import date
+from typing import List
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...logSink.logSink import LogSink
+    from ...timber.timberStub import TimberStub
+    from ..chatLogArchive import ChatLogArchive
+    from ..chatLogEntry import ChatLogEntry
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from chatLogger.chatLogArchive import ChatLogArchive
+    from chatLogger.chatLogEntry import ChatLogEntry
+    from logSink.logSink import LogSink
+    from timber.timberStub import TimberStub
+
+
+class TestChatLogArchive():
+
+    def __createChatLogArchive(self, logRootDirectory: str) -> ChatLogArchive:
+        return ChatLogArchive(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            timber = TimberStub(),
+            logRootDirectory = logRootDirectory
+        )
+
+    def __writeLogFile(self, logRootDirectory: str, logDate: date, lines: List[str]):
+        directory = os.path.join(logRootDirectory, 'smcharles', f'{logDate.year:04d}', f'{logDate.month:02d}')
+        os.makedirs(directory, exist_ok = True)
+
+        with open(os.path.join(directory, f'{logDate.day:02d}.log'), mode = 'a', encoding = 'utf-8') as file:
+            for line in lines:
+                file.write(f'{line}\n')
+
+    async def __toList(self, chatLogEntries) -> List[ChatLogEntry]:
+        return [ chatLogEntry async for chatLogEntry in chatLogEntries ]
+
+    async def __createArchive(self, tmp_path) -> ChatLogArchive:
+        logRootDirectory = str(tmp_path / 'chatLogger')
+
+        self.__writeLogFile(logRootDirectory, date(2023, 4, 1), [
+            '2023/04/01 10:00:00.000 — samus (1) — hello Ridley',
+            '2023/04/01 10:00:01.000 — ridley (2) — hi Samus',
+            '2023/04/01 10:00:02.000 — Received raid from kraid of 5!',
+            '2023/04/01 10:00:03.000 — samus (1) — bye'
+        ])
+
+        self.__writeLogFile(logRootDirectory, date(2023, 4, 2), [
+            '2023/04/02 10:00:00.000 — ridley (2) — screech'
+        ])
+
+        self.__writeLogFile(logRootDirectory, date(2023, 4, 3), [
+            '2023/04/03 10:00:00.000 — samus (1) — still today'
+        ])
+
+        chatLogArchive = self.__createChatLogArchive(logRootDirectory)
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 2
+        return chatLogArchive
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays(self, tmp_path):
+        await self.__createArchive(tmp_path)
+        directory = tmp_path / 'chatLogger' / 'smcharles' / '2023' / '04'
+
+        assert sorted(os.listdir(directory)) == [
+            '01.index.json', '01.log.gz',
+            '02.index.json', '02.log.gz',
+            '03.log'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays_withInterruptedAppend(self, tmp_path, monkeypatch):
+        chatLogArchive = await self.__createArchive(tmp_path)
+
+        self.__writeLogFile(str(tmp_path / 'chatLogger'), date(2023, 4, 1), [
+            '2023/04/01 23:59:58.000 — ridley (2) — late',
+            '2023/04/01 23:59:59.000 — samus (1) — later'
+        ])
+
+        def interruptedDump(*args, **kwargs):
+            raise RuntimeError('interrupted')
+
+        # the late statements get appended to the archive, but the index is never written
+        with monkeypatch.context() as context:
+            context.setattr(json, 'dump', interruptedDump)
+            assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 0
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 1
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessages('smCharles', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [
+            'hello Ridley', 'hi Samus', 'Received raid from kraid of 5!', 'bye', 'late', 'later'
+        ]
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '1', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hello Ridley', 'bye', 'later' ]
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '2', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hi Samus', 'late' ]
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays_withInterruptedFirstAppend(self, tmp_path, monkeypatch):
+        logRootDirectory = str(tmp_path / 'chatLogger')
+
+        self.__writeLogFile(logRootDirectory, date(2023, 4, 1), [
+            '2023/04/01 10:00:00.000 — samus (1) — hello Ridley'
+        ])
+
+        chatLogArchive = self.__createChatLogArchive(logRootDirectory)
+
+        def interruptedDump(*args, **kwargs):
+            raise RuntimeError('interrupted')
+
+        with monkeypatch.context() as context:
+            context.setattr(json, 'dump', interruptedDump)
+            assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 0
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 1
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessages('smCharles', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hello Ridley' ]
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays_withInterruptedRemove(self, tmp_path, monkeypatch):
+        logRootDirectory = str(tmp_path / 'chatLogger')
+
+        self.__writeLogFile(logRootDirectory, date(2023, 4, 1), [
+            '2023/04/01 10:00:00.000 — samus (1) — hello Ridley'
+        ])
+
+        chatLogArchive = self.__createChatLogArchive(logRootDirectory)
+        remove = os.remove
+
+        def interruptedRemove(path):
+            if str(path).endswith('.log.archiving'):
+                raise RuntimeError('interrupted')
+
+            remove(path)
+
+        # the archive and its index are both written, but the log file is never removed
+        with monkeypatch.context() as context:
+            context.setattr(os, 'remove', interruptedRemove)
+            assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 0
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 1
+        assert sorted(os.listdir(tmp_path / 'chatLogger' / 'smcharles' / '2023' / '04')) == [ '01.index.json', '01.log.gz' ]
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessages('smCharles', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hello Ridley' ]
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays_withLateStatements(self, tmp_path):
+        chatLogArchive = await self.__createArchive(tmp_path)
+
+        self.__writeLogFile(str(tmp_path / 'chatLogger'), date(2023, 4, 1), [
+            '2023/04/01 23:59:59.000 — samus (1) — late'
+        ])
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 3)) == 1
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '1', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hello Ridley', 'bye', 'late' ]
+
+    @pytest.mark.asyncio
+    async def test_archiveClosedDays_withLogSinkStillWriting(self, tmp_path):
+        logRootDirectory = str(tmp_path / 'chatLogger')
+        logFile = f'{logRootDirectory}/smcharles/2023/04/01.log'
+        chatLogArchive = self.__createChatLogArchive(logRootDirectory)
+        logSink = LogSink(backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()))
+        chatLogArchive.setLogSink(logSink)
+
+        logSink.write(logFile, '2023/04/01 23:59:58.000 — samus (1) — first\n')
+        await logSink.flush()
+        assert logSink.getOpenFilesSize() == 1
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 2)) == 1
+        assert logSink.getOpenFilesSize() == 0
+
+        # this one was flushed on a delay, after its day had already been archived
+        logSink.write(logFile, '2023/04/01 23:59:59.000 — samus (1) — second\n')
+        await logSink.flush()
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '1', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'first', 'second' ]
+
+        assert await chatLogArchive.archiveClosedDays(date(2023, 4, 2)) == 1
+        await logSink.close()
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '1', date(2023, 4, 1), date(2023, 4, 1)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'first', 'second' ]
+        assert sorted(os.listdir(tmp_path / 'chatLogger' / 'smcharles' / '2023' / '04')) == [ '01.index.json', '01.log.gz' ]
+
+    @pytest.mark.asyncio
+    async def test_fetchMessages(self, tmp_path):
+        chatLogArchive = await self.__createArchive(tmp_path)
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessages('smCharles', date(2023, 4, 1), date(2023, 4, 3)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [
+            'hello Ridley', 'hi Samus', 'Received raid from kraid of 5!', 'bye', 'screech', 'still today'
+        ]
+
+        assert chatLogEntries[0].getUserName() == 'samus'
+        assert chatLogEntries[0].getLogDate() == date(2023, 4, 1)
+        assert not chatLogEntries[2].hasUserId()
+        assert chatLogEntries[4].getDateTimeStr() == '2023/04/02 10:00:00.000'
+
+    @pytest.mark.asyncio
+    async def test_fetchMessagesByUser(self, tmp_path):
+        chatLogArchive = await self.__createArchive(tmp_path)
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '1', date(2023, 3, 31), date(2023, 4, 3)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hello Ridley', 'bye', 'still today' ]
+
+        chatLogEntries = await self.__toList(chatLogArchive.fetchMessagesByUser('smCharles', '2', date(2023, 4, 2), date(2023, 4, 2)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'screech' ]
+
+    @pytest.mark.asyncio
+    async def test_searchMessages(self, tmp_path):
+        chatLogArchive = await self.__createArchive(tmp_path)
+
+        chatLogEntries = await self.__toList(chatLogArchive.searchMessages('smCharles', 'samus', date(2023, 4, 1), date(2023, 4, 3)))
+        assert [ chatLogEntry.getMsg() for chatLogEntry in chatLogEntries ] == [ 'hi Samus' ]
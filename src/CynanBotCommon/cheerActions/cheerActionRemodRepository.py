@@ -9,7 +9,6 @@ try:
         CheerActionRemodRepositoryInterface
     from CynanBotCommon.simpleDateTime import SimpleDateTime
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
@@ -19,7 +18,6 @@ except:
         CheerActionRemodRepositoryInterface
     from simpleDateTime import SimpleDateTime
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
 
@@ -43,22 +41,21 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__remodTimeBuffer: timedelta = remodTimeBuffer
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def add(self, data: CheerActionRemodData):
         if not isinstance(data, CheerActionRemodData):
             raise ValueError(f'data argument is malformed: \"{data}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO cheerremodactions (broadcasteruserid, remoddatetime, userid)
-                VALUES ($1, $2, $3)
-            ''',
-            data.getBroadcasterUserId(), data.getRemodDateTime().getIsoFormatStr(), data.getUserId()
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO cheerremodactions (broadcasteruserid, remoddatetime, userid)
+                    VALUES ($1, $2, $3)
+                ''',
+                data.getBroadcasterUserId(), data.getRemodDateTime().getIsoFormatStr(), data.getUserId()
+            )
 
-        await connection.close()
         self.__timber.log('CheerActionRemodRepository', f'Added remod action ({data=})')
 
     async def delete(self, broadcasterUserId: str, userId: str):
@@ -67,29 +64,27 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
         elif not utils.isValidStr(userId):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM cheerremodactions
-                WHERE broadcasteruserid = $1 AND userid = $2
-            ''',
-            broadcasterUserId, userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM cheerremodactions
+                    WHERE broadcasteruserid = $1 AND userid = $2
+                ''',
+                broadcasterUserId, userId
+            )
 
-        await connection.close()
         self.__timber.log('CheerActionRemodRepository', f'Deleted remod action ({broadcasterUserId=}) ({userId=})')
 
     async def getAll(self) -> List[CheerActionRemodData]:
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cheerremodactions.broadcasteruserid, cheerremodactions.remoddatetime, cheerremodactions.userid, userids.username FROM cheerremodactions
-                INNER JOIN userids ON cheerremodactions.userid = userids.userid
-                ORDER BY cheerremodactions.remoddatetime ASC
-            '''
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cheerremodactions.broadcasteruserid, cheerremodactions.remoddatetime, cheerremodactions.userid, userids.username FROM cheerremodactions
+                    INNER JOIN userids ON cheerremodactions.userid = userids.userid
+                    ORDER BY cheerremodactions.remoddatetime ASC
+                '''
+            )
 
-        await connection.close()
         data: List[CheerActionRemodData] = list()
         now = SimpleDateTime()
 
@@ -109,19 +104,12 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
 
         return data
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cheerremodactions (
                         broadcasteruserid public.citext NOT NULL,
@@ -131,8 +119,8 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cheerremodactions (
                         broadcasteruserid TEXT NOT NULL COLLATE NOCASE,
@@ -143,6 +131,9 @@ class CheerActionRemodRepository(CheerActionRemodRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'CheerActionRemodRepository',
+            statements = statements
+        )
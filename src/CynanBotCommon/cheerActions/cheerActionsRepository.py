@@ -14,7 +14,6 @@ try:
         CheerActionAlreadyExistsException,
         TimeoutDurationSecondsTooLongException, TooManyCheerActionsException)
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
@@ -30,7 +29,6 @@ except:
         CheerActionAlreadyExistsException,
         TimeoutDurationSecondsTooLongException, TooManyCheerActionsException)
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
 
@@ -60,7 +58,7 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__maximumPerUser: int = maximumPerUser
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
         self.__cache: Dict[str, Optional[List[CheerAction]]] = dict()
 
     async def addAction(
@@ -107,16 +105,15 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
                 userId = userId
             )
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO cheeractions (actionid, actionrequirement, actiontype, amount, durationseconds, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            actionId, actionRequirement.toStr(), actionType.toStr(), amount, durationSeconds, userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO cheeractions (actionid, actionrequirement, actiontype, amount, durationseconds, userid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                ''',
+                actionId, actionRequirement.toStr(), actionType.toStr(), amount, durationSeconds, userId
+            )
 
-        await connection.close()
         self.__cache.pop(userId, None)
 
         action = await self.getAction(
@@ -149,16 +146,15 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
             self.__timber.log('CheerActionsRepository', f'Attempted to delete cheer action ID \"{actionId}\", but it does not exist in the database')
             return None
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM cheeractions
-                WHERE actionid = $1 AND userid = $2
-            ''',
-            actionId, userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM cheeractions
+                    WHERE actionid = $1 AND userid = $2
+                ''',
+                actionId, userId
+            )
 
-        await connection.close()
         self.__cache.pop(action.getUserId(), None)
         self.__timber.log('CheerActionsRepository', f'Deleted cheer action ({actionId=}) ({userId=}) ({action=})')
 
@@ -188,18 +184,17 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         if userId in self.__cache:
             return self.__cache[userId]
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cheeractions.actionid, cheeractions.actionrequirement, cheeractions.actiontype, cheeractions.amount, cheeractions.durationseconds, cheeractions.userid, userids.username FROM cheeractions
-                INNER JOIN userids ON cheeractions.userid = userids.userid
-                WHERE cheeractions.userid = $1
-                ORDER BY cheeractions.amount DESC
-            ''',
-            userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cheeractions.actionid, cheeractions.actionrequirement, cheeractions.actiontype, cheeractions.amount, cheeractions.durationseconds, cheeractions.userid, userids.username FROM cheeractions
+                    INNER JOIN userids ON cheeractions.userid = userids.userid
+                    WHERE cheeractions.userid = $1
+                    ORDER BY cheeractions.amount DESC
+                ''',
+                userId
+            )
 
-        await connection.close()
         actions: List[CheerAction] = list()
 
         if utils.hasItems(records):
@@ -217,19 +212,12 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__cache[userId] = actions
         return actions
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cheeractions (
                         actionid public.citext NOT NULL,
@@ -242,8 +230,8 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cheeractions (
                         actionid TEXT NOT NULL COLLATE NOCASE,
@@ -257,6 +245,9 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'CheerActionsRepository',
+            statements = statements
+        )
@@ -0,0 +1,142 @@
+from collections import deque
+from typing import Deque, Dict, List, Optional, Set
+
+try:
+    from CynanBotCommon.contentScanner.absBannedWord import AbsBannedWord
+    from CynanBotCommon.contentScanner.bannedPhrase import BannedPhrase
+    from CynanBotCommon.contentScanner.bannedWord import BannedWord
+    from CynanBotCommon.contentScanner.bannedWordType import BannedWordType
+except:
+    from contentScanner.absBannedWord import AbsBannedWord
+    from contentScanner.bannedPhrase import BannedPhrase
+    from contentScanner.bannedWord import BannedWord
+    from contentScanner.bannedWordType import BannedWordType
+
+
+# Exact words are looked up in a dict, while all of the banned phrases are compiled into a
+# single Aho-Corasick automaton, so that any text can be searched for every phrase at once.
+class BannedWordsMatcher():
+
+    def __init__(self, bannedWords: Set[AbsBannedWord]):
+        if not isinstance(bannedWords, Set):
+            raise ValueError(f'bannedWords argument is malformed: \"{bannedWords}\"')
+
+        self.__bannedWords: Dict[str, BannedWord] = dict()
+
+        # automaton state 0 is the root, and each state's output is the banned phrase (if any)
+        # that ends at that state, either directly or through its chain of failure links
+        self.__transitions: List[Dict[str, int]] = [ dict() ]
+        self.__failures: List[int] = [ 0 ]
+        self.__outputs: List[Optional[BannedPhrase]] = [ None ]
+        self.__phrasesSize: int = 0
+
+        for absBannedWord in bannedWords:
+            if absBannedWord.getType() is BannedWordType.EXACT_WORD:
+                bannedWord: BannedWord = absBannedWord
+                self.__bannedWords[bannedWord.getWord()] = bannedWord
+            elif absBannedWord.getType() is BannedWordType.PHRASE:
+                self.__addPhrase(absBannedWord)
+            else:
+                raise RuntimeError(f'unknown BannedWordType ({absBannedWord}): \"{absBannedWord.getType()}\"')
+
+        self.__buildFailures()
+
+    def __addPhrase(self, bannedPhrase: BannedPhrase):
+        state = 0
+
+        for character in bannedPhrase.getPhrase():
+            nextState = self.__transitions[state].get(character)
+
+            if nextState is None:
+                nextState = len(self.__transitions)
+                self.__transitions.append(dict())
+                self.__failures.append(0)
+                self.__outputs.append(None)
+                self.__transitions[state][character] = nextState
+
+            state = nextState
+
+        if self.__outputs[state] is None:
+            self.__outputs[state] = bannedPhrase
+            self.__phrasesSize = self.__phrasesSize + 1
+
+    def __buildFailures(self):
+        # failure links are built breadth first, so that every shorter state is done before a longer one
+        queue: Deque[int] = deque(self.__transitions[0].values())
+
+        while len(queue) > 0:
+            state = queue.popleft()
+
+            for character, nextState in self.__transitions[state].items():
+                queue.append(nextState)
+                failure = self.__failures[state]
+
+                while failure != 0 and character not in self.__transitions[failure]:
+                    failure = self.__failures[failure]
+
+                failure = self.__transitions[failure].get(character, 0)
+
+                if failure == nextState:
+                    failure = 0
+
+                self.__failures[nextState] = failure
+
+                if self.__outputs[nextState] is None:
+                    self.__outputs[nextState] = self.__outputs[failure]
+
+    def findBannedPhrase(self, phrase: Optional[str]) -> Optional[BannedPhrase]:
+        if not isinstance(phrase, str) or self.__phrasesSize == 0:
+            return None
+
+        transitions = self.__transitions
+        failures = self.__failures
+        outputs = self.__outputs
+        state = 0
+
+        for character in phrase:
+            while state != 0 and character not in transitions[state]:
+                state = failures[state]
+
+            state = transitions[state].get(character, 0)
+            output = outputs[state]
+
+            if output is not None:
+                return output
+
+        return None
+
+    def findBannedWord(self, words: Set[Optional[str]]) -> Optional[BannedWord]:
+        if len(self.__bannedWords) == 0:
+            return None
+
+        for word in words:
+            bannedWord = self.__bannedWords.get(word)
+
+            if bannedWord is not None:
+                return bannedWord
+
+        return None
+
+    def findMatch(
+        self,
+        phrases: Set[Optional[str]],
+        words: Set[Optional[str]]
+    ) -> Optional[AbsBannedWord]:
+        bannedWord = self.findBannedWord(words)
+
+        if bannedWord is not None:
+            return bannedWord
+
+        for phrase in phrases:
+            bannedPhrase = self.findBannedPhrase(phrase)
+
+            if bannedPhrase is not None:
+                return bannedPhrase
+
+        return None
+
+    def getBannedPhrasesSize(self) -> int:
+        return self.__phrasesSize
+
+    def getBannedWordsSize(self) -> int:
+        return len(self.__bannedWords)
@@ -1,12 +1,16 @@
+import asyncio
 import re
 import traceback
 from typing import List, Optional, Pattern, Set
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
     from CynanBotCommon.contentScanner.absBannedWord import AbsBannedWord
     from CynanBotCommon.contentScanner.bannedPhrase import BannedPhrase
     from CynanBotCommon.contentScanner.bannedWord import BannedWord
+    from CynanBotCommon.contentScanner.bannedWordsMatcher import \
+        BannedWordsMatcher
     from CynanBotCommon.contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
     from CynanBotCommon.storage.linesReaderInterface import \
@@ -14,9 +18,11 @@ try:
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
     import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
     from contentScanner.absBannedWord import AbsBannedWord
     from contentScanner.bannedPhrase import BannedPhrase
     from contentScanner.bannedWord import BannedWord
+    from contentScanner.bannedWordsMatcher import BannedWordsMatcher
     from contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
     from storage.linesReaderInterface import LinesReaderInterface
@@ -28,21 +34,41 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
     def __init__(
         self,
         bannedWordsLinesReader: LinesReaderInterface,
-        timber: TimberInterface
+        timber: TimberInterface,
+        backgroundTaskHelper: Optional[BackgroundTaskHelper] = None,
+        reloadIntervalSeconds: float = 15
     ):
         if not isinstance(bannedWordsLinesReader, LinesReaderInterface):
             raise ValueError(f'bannedWordsLinesReader argument is malformed: \"{bannedWordsLinesReader}\"')
         elif not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif backgroundTaskHelper is not None and not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not utils.isValidNum(reloadIntervalSeconds):
+            raise ValueError(f'reloadIntervalSeconds argument is malformed: \"{reloadIntervalSeconds}\"')
+        elif reloadIntervalSeconds < 1 or reloadIntervalSeconds > 3600:
+            raise ValueError(f'reloadIntervalSeconds argument is out of bounds: {reloadIntervalSeconds}')
 
         self.__bannedWordsLinesReader: LinesReaderInterface = bannedWordsLinesReader
         self.__timber: TimberInterface = timber
+        self.__backgroundTaskHelper: Optional[BackgroundTaskHelper] = backgroundTaskHelper
+        self.__reloadIntervalSeconds: float = reloadIntervalSeconds
 
         self.__exactWordRegEx: Pattern = re.compile(r'^\"(.+)\"$', re.IGNORECASE)
         self.__cache: Optional[Set[BannedWord]] = None
+        self.__matcherCache: Optional[BannedWordsMatcher] = None
+        self.__modificationTime: Optional[float] = None
+        self.__isReloadLoopStarted: bool = False
+        self.__reloadLoopTask: Optional[asyncio.Task] = None
+
+        # when given a BackgroundTaskHelper, the banned words file is watched for changes right away
+        if backgroundTaskHelper is not None:
+            self.__ensureReloadLoopStarted()
 
     async def clearCaches(self):
         self.__cache = None
+        self.__matcherCache = None
+        self.__modificationTime = None
         self.__timber.log('BannedWordsRepository', 'Caches cleared')
 
     def __createCleanedBannedWordsSetFromLines(
@@ -62,6 +88,19 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
 
         return cleanedBannedWords
 
+    def __ensureReloadLoopStarted(self):
+        if self.__isReloadLoopStarted:
+            return
+
+        self.__isReloadLoopStarted = True
+        backgroundTaskHelper = self.__backgroundTaskHelper
+
+        if backgroundTaskHelper is None:
+            # without a BackgroundTaskHelper, the reload loop runs on the event loop that first read the banned words
+            self.__reloadLoopTask = asyncio.get_running_loop().create_task(self.__startReloadLoop())
+        else:
+            backgroundTaskHelper.createTask(self.__startReloadLoop())
+
     def __fetchBannedWords(self) -> Set[AbsBannedWord]:
         lines: Optional[List[Optional[str]]] = None
 
@@ -98,12 +137,32 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
         if self.__cache is not None:
             return self.__cache
 
+        # the modification time is read first, so that a change made during the read still gets reloaded later
+        modificationTime = await self.__bannedWordsLinesReader.getModificationTimeAsync()
         bannedWords = await self.__fetchBannedWordsAsync()
         self.__cache = bannedWords
+        self.__modificationTime = modificationTime
         self.__timber.log('BannedWordsRepository', f'Asynchronously read in {len(bannedWords)} banned word(s)')
 
+        self.__ensureReloadLoopStarted()
         return bannedWords
 
+    async def getBannedWordsMatcherAsync(self) -> BannedWordsMatcher:
+        if self.__matcherCache is not None:
+            return self.__matcherCache
+
+        bannedWords = await self.getBannedWordsAsync()
+        matcher = BannedWordsMatcher(bannedWords)
+
+        # a reload may have swapped in newer banned words while this matcher was being built
+        if self.__cache is bannedWords:
+            self.__matcherCache = matcher
+
+        self.__timber.log('BannedWordsRepository', f'Compiled {matcher.getBannedWordsSize()} banned word(s) and {matcher.getBannedPhrasesSize()} banned phrase(s)')
+
+        self.__ensureReloadLoopStarted()
+        return matcher
+
     def __processLine(self, line: Optional[str]) -> Optional[AbsBannedWord]:
         if not utils.isValidStr(line):
             return None
@@ -119,3 +178,30 @@ class BannedWordsRepository(BannedWordsRepositoryInterface):
             return BannedWord(exactWordMatch.group(1))
         else:
             return BannedPhrase(line)
+
+    async def reloadIfModified(self) -> bool:
+        modificationTime = await self.__bannedWordsLinesReader.getModificationTimeAsync()
+
+        if self.__matcherCache is not None and (modificationTime is None or modificationTime == self.__modificationTime):
+            return False
+
+        bannedWords = await self.__fetchBannedWordsAsync()
+        matcher = BannedWordsMatcher(bannedWords)
+
+        # Both caches are swapped together and only once the new matcher is completely built,
+        # so a scan either sees the old banned words or the new ones, but never a mix.
+        self.__cache = bannedWords
+        self.__matcherCache = matcher
+        self.__modificationTime = modificationTime
+
+        self.__timber.log('BannedWordsRepository', f'Reloaded {len(bannedWords)} banned word(s) (modificationTime={modificationTime})')
+        return True
+
+    async def __startReloadLoop(self):
+        while True:
+            try:
+                await self.reloadIfModified()
+            except Exception as e:
+                self.__timber.log('BannedWordsRepository', f'Encountered unknown Exception when reloading banned words: {e}', e, traceback.format_exc())
+
+            await asyncio.sleep(self.__reloadIntervalSeconds)
@@ -4,9 +4,12 @@ from typing import Set
 try:
     from CynanBotCommon.clearable import Clearable
     from CynanBotCommon.contentScanner.absBannedWord import AbsBannedWord
+    from CynanBotCommon.contentScanner.bannedWordsMatcher import \
+        BannedWordsMatcher
 except:
     from clearable import Clearable
     from contentScanner.absBannedWord import AbsBannedWord
+    from contentScanner.bannedWordsMatcher import BannedWordsMatcher
 
 
 class BannedWordsRepositoryInterface(Clearable):
@@ -18,3 +21,11 @@ class BannedWordsRepositoryInterface(Clearable):
     @abstractmethod
     async def getBannedWordsAsync(self) -> Set[AbsBannedWord]:
         pass
+
+    @abstractmethod
+    async def getBannedWordsMatcherAsync(self) -> BannedWordsMatcher:
+        pass
+
+    @abstractmethod
+    async def reloadIfModified(self) -> bool:
+        pass
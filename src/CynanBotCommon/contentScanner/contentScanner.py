@@ -3,8 +3,6 @@ from typing import Optional, Pattern, Set
 
 try:
     import CynanBotCommon.utils as utils
-    from CynanBotCommon.contentScanner.bannedPhrase import BannedPhrase
-    from CynanBotCommon.contentScanner.bannedWord import BannedWord
     from CynanBotCommon.contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
     from CynanBotCommon.contentScanner.bannedWordType import BannedWordType
@@ -14,8 +12,6 @@ try:
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
     import utils
-    from contentScanner.bannedPhrase import BannedPhrase
-    from contentScanner.bannedWord import BannedWord
     from contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
     from contentScanner.bannedWordType import BannedWordType
@@ -78,26 +74,17 @@ class ContentScanner(ContentScannerInterface):
         elif not isinstance(words, Set):
             raise ValueError(f'words argument is malformed: \"{words}\"')
 
-        absBannedWords = await self.__bannedWordsRepository.getBannedWordsAsync()
+        bannedWordsMatcher = await self.__bannedWordsRepository.getBannedWordsMatcherAsync()
+        absBannedWord = bannedWordsMatcher.findMatch(phrases, words)
 
-        for absBannedWord in absBannedWords:
-            if absBannedWord.getType() is BannedWordType.EXACT_WORD:
-                bannedWord: BannedWord = absBannedWord
+        if absBannedWord is None:
+            return ContentCode.OK
+        elif absBannedWord.getType() is BannedWordType.EXACT_WORD:
+            self.__timber.log('ContentScanner', f'Content contains a banned word ({absBannedWord}): \"{absBannedWord.getWord()}\"')
+        else:
+            self.__timber.log('ContentScanner', f'Content contains a banned phrase ({absBannedWord}): \"{absBannedWord.getPhrase()}\"')
 
-                if bannedWord.getWord() in words:
-                    self.__timber.log('ContentScanner', f'Content contains a banned word ({absBannedWord}): \"{bannedWord.getWord()}\"')
-                    return ContentCode.CONTAINS_BANNED_CONTENT
-            elif absBannedWord.getType() is BannedWordType.PHRASE:
-                bannedPhrase: BannedPhrase = absBannedWord
-
-                for phrase in phrases:
-                    if bannedPhrase.getPhrase() in phrase:
-                        self.__timber.log('ContentScanner', f'Content contains a banned phrase ({absBannedWord}): \"{bannedPhrase.getPhrase()}\"')
-                        return ContentCode.CONTAINS_BANNED_CONTENT
-            else:
-                raise RuntimeError(f'unknown BannedWordType ({absBannedWord}): \"{absBannedWord.getType()}\"')
-
-        return ContentCode.OK
+        return ContentCode.CONTAINS_BANNED_CONTENT
 
     async def updatePhrasesContent(
         self,
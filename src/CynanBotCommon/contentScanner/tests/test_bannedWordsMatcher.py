@@ -0,0 +1,56 @@
+try:
+    from ...contentScanner.bannedPhrase import BannedPhrase
+    from ...contentScanner.bannedWord import BannedWord
+    from ...contentScanner.bannedWordsMatcher import BannedWordsMatcher
+except:
+    from contentScanner.bannedPhrase import BannedPhrase
+    from contentScanner.bannedWord import BannedWord
+    from contentScanner.bannedWordsMatcher import BannedWordsMatcher
+
+
+class TestBannedWordsMatcher():
+
+    matcher = BannedWordsMatcher({
+        BannedPhrase('he'),
+        BannedPhrase('hers'),
+        BannedPhrase('his'),
+        BannedPhrase('she'),
+        BannedPhrase('sony'),
+        BannedWord('qanon')
+    })
+
+    def test_findBannedPhrase(self):
+        assert self.matcher.findBannedPhrase('ushers') == BannedPhrase('she')
+        assert self.matcher.findBannedPhrase('this') == BannedPhrase('his')
+        assert self.matcher.findBannedPhrase('i love my sony tv') == BannedPhrase('sony')
+
+    def test_findBannedPhrase_withNoMatch(self):
+        assert self.matcher.findBannedPhrase('sonic') is None
+        assert self.matcher.findBannedPhrase('') is None
+        assert self.matcher.findBannedPhrase(None) is None
+
+    def test_findBannedPhrase_withSuffixOfLongerPhrase(self):
+        # "hi" leads down the "his" branch, and the failure link must still find "he" afterwards
+        matcher = BannedWordsMatcher({ BannedPhrase('his'), BannedPhrase('ihe') })
+        assert matcher.findBannedPhrase('hihe') == BannedPhrase('ihe')
+        assert matcher.findBannedPhrase('hih') is None
+
+    def test_findBannedWord(self):
+        assert self.matcher.findBannedWord({ 'believers', 'qanon' }) == BannedWord('qanon')
+        assert self.matcher.findBannedWord({ 'qanonbelievers' }) is None
+        assert self.matcher.findBannedWord(set()) is None
+
+    def test_findMatch(self):
+        assert self.matcher.findMatch({ 'qanon believers' }, { 'qanon', 'believers' }) == BannedWord('qanon')
+        assert self.matcher.findMatch({ 'new sony phone' }, { 'new', 'sony', 'phone' }) == BannedPhrase('sony')
+        assert self.matcher.findMatch({ 'xbox' }, { 'xbox' }) is None
+
+    def test_getSizes(self):
+        assert self.matcher.getBannedPhrasesSize() == 5
+        assert self.matcher.getBannedWordsSize() == 1
+
+    def test_withEmptyBannedWords(self):
+        matcher = BannedWordsMatcher(set())
+        assert matcher.findMatch({ 'anything' }, { 'anything' }) is None
+        assert matcher.getBannedPhrasesSize() == 0
+        assert matcher.getBannedWordsSize() == 0
@@ -1,3 +1,6 @@
+import asyncio
+import os
+
 import pytest
 
 try:
@@ -6,6 +9,7 @@ try:
     from ...contentScanner.bannedWordsRepository import BannedWordsRepository
     from ...contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
+    from ...storage.linesFileReader import LinesFileReader
     from ...storage.linesReaderInterface import LinesReaderInterface
     from ...storage.linesStaticReader import LinesStaticReader
     from ...timber.timberInterface import TimberInterface
@@ -16,6 +20,7 @@ except:
     from contentScanner.bannedWordsRepository import BannedWordsRepository
     from contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
+    from storage.linesFileReader import LinesFileReader
     from storage.linesReaderInterface import LinesReaderInterface
     from storage.linesStaticReader import LinesStaticReader
     from timber.timberInterface import TimberInterface
@@ -79,3 +84,102 @@ class TestBannedWordsRepository():
 
         bannedWords = await bannedWordsRepository.getBannedWordsAsync()
         assert len(bannedWords) == 0
+
+    @pytest.mark.asyncio
+    async def test_getBannedWordsMatcherAsync(self):
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = self.bannedWordsLinesReader,
+            timber = self.timber
+        )
+
+        matcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert matcher.getBannedPhrasesSize() == 2
+        assert matcher.getBannedWordsSize() == 1
+        assert matcher is await bannedWordsRepository.getBannedWordsMatcherAsync()
+
+        await bannedWordsRepository.clearCaches()
+        assert matcher is not await bannedWordsRepository.getBannedWordsMatcherAsync()
+
+    @pytest.mark.asyncio
+    async def test_getBannedWordsMatcherAsync_startsReloadLoop(self, tmp_path):
+        bannedWordsFile = tmp_path / 'bannedWords.txt'
+        bannedWordsFile.write_text('hello\n', encoding = 'utf-8')
+
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = LinesFileReader(str(bannedWordsFile)),
+            timber = self.timber,
+            reloadIntervalSeconds = 1
+        )
+
+        matcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert matcher.getBannedPhrasesSize() == 1
+
+        bannedWordsFile.write_text('hello\nworld\n', encoding = 'utf-8')
+        modificationTime = os.path.getmtime(bannedWordsFile) + 10
+        os.utime(bannedWordsFile, (modificationTime, modificationTime))
+
+        # no BackgroundTaskHelper was given, so only the reload loop started by the first read can pick this change up
+        for _ in range(50):
+            if await bannedWordsRepository.getBannedWordsMatcherAsync() is not matcher:
+                break
+
+            await asyncio.sleep(0.1)
+
+        reloadedMatcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert reloadedMatcher is not matcher
+        assert reloadedMatcher.getBannedPhrasesSize() == 2
+
+    @pytest.mark.asyncio
+    async def test_getBannedWordsMatcherAsync_recordsModificationTime(self, tmp_path):
+        bannedWordsFile = tmp_path / 'bannedWords.txt'
+        bannedWordsFile.write_text('hello\n', encoding = 'utf-8')
+
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = LinesFileReader(str(bannedWordsFile)),
+            timber = self.timber
+        )
+
+        matcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+
+        # the file hasn't changed since the matcher was built, so there's nothing to reload
+        assert not await bannedWordsRepository.reloadIfModified()
+        assert matcher is await bannedWordsRepository.getBannedWordsMatcherAsync()
+
+    @pytest.mark.asyncio
+    async def test_reloadIfModified(self, tmp_path):
+        bannedWordsFile = tmp_path / 'bannedWords.txt'
+        bannedWordsFile.write_text('hello\n', encoding = 'utf-8')
+
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = LinesFileReader(str(bannedWordsFile)),
+            timber = self.timber
+        )
+
+        assert await bannedWordsRepository.reloadIfModified()
+        assert not await bannedWordsRepository.reloadIfModified()
+
+        matcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert matcher.getBannedPhrasesSize() == 1
+
+        bannedWordsFile.write_text('hello\nworld\n"qanon"\n', encoding = 'utf-8')
+        modificationTime = os.path.getmtime(bannedWordsFile) + 10
+        os.utime(bannedWordsFile, (modificationTime, modificationTime))
+
+        assert await bannedWordsRepository.reloadIfModified()
+        assert len(await bannedWordsRepository.getBannedWordsAsync()) == 3
+
+        reloadedMatcher = await bannedWordsRepository.getBannedWordsMatcherAsync()
+        assert reloadedMatcher is not matcher
+        assert reloadedMatcher.getBannedPhrasesSize() == 2
+        assert reloadedMatcher.getBannedWordsSize() == 1
+        assert matcher.getBannedPhrasesSize() == 1
+
+    @pytest.mark.asyncio
+    async def test_reloadIfModified_withStaticLines(self):
+        bannedWordsRepository: BannedWordsRepositoryInterface = BannedWordsRepository(
+            bannedWordsLinesReader = self.bannedWordsLinesReader,
+            timber = self.timber
+        )
+
+        assert await bannedWordsRepository.reloadIfModified()
+        assert not await bannedWordsRepository.reloadIfModified()
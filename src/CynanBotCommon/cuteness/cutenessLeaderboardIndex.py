@@ -0,0 +1,99 @@
+import bisect
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.cuteness.cutenessLeaderboardEntry import \
+        CutenessLeaderboardEntry
+except:
+    import utils
+    from cuteness.cutenessLeaderboardEntry import CutenessLeaderboardEntry
+
+
+class CutenessLeaderboardIndex():
+
+    def __init__(self):
+        # ranking keys are (negated cuteness, userId) so that ascending order is leaderboard order,
+        # with ties broken consistently by userId
+        self.__rankingKeys: List[Tuple[int, str]] = list()
+        self.__users: Dict[str, Tuple[int, str]] = dict()
+
+    def getCuteness(self, userId: str) -> int:
+        if not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+
+        user = self.__users.get(userId)
+
+        if user is None:
+            return 0
+
+        return user[0]
+
+    def getRank(self, userId: str, excludeUserId: Optional[str] = None) -> Optional[int]:
+        if not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+
+        if userId == excludeUserId:
+            return None
+
+        user = self.__users.get(userId)
+
+        if user is None:
+            return None
+
+        rank = bisect.bisect_left(self.__rankingKeys, (-user[0], userId)) + 1
+
+        if utils.isValidStr(excludeUserId):
+            excludedUser = self.__users.get(excludeUserId)
+
+            if excludedUser is not None and (-excludedUser[0], excludeUserId) < (-user[0], userId):
+                rank = rank - 1
+
+        return rank
+
+    def getSize(self) -> int:
+        return len(self.__rankingKeys)
+
+    def getTop(self, count: int, excludeUserId: Optional[str] = None) -> List[CutenessLeaderboardEntry]:
+        if not utils.isValidInt(count):
+            raise ValueError(f'count argument is malformed: \"{count}\"')
+        elif count < 0 or count > utils.getIntMaxSafeSize():
+            raise ValueError(f'count argument is out of bounds: {count}')
+
+        entries: List[CutenessLeaderboardEntry] = list()
+
+        for cuteness, userId in self.__rankingKeys:
+            if len(entries) >= count:
+                break
+            elif userId == excludeUserId:
+                continue
+
+            entries.append(CutenessLeaderboardEntry(
+                cuteness = -cuteness,
+                rank = len(entries) + 1,
+                userId = userId,
+                userName = self.__users[userId][1]
+            ))
+
+        return entries
+
+    def update(self, cuteness: int, userId: str, userName: str):
+        if not utils.isValidInt(cuteness):
+            raise ValueError(f'cuteness argument is malformed: \"{cuteness}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+        elif not utils.isValidStr(userName):
+            raise ValueError(f'userName argument is malformed: \"{userName}\"')
+
+        oldUser = self.__users.pop(userId, None)
+
+        if oldUser is not None:
+            index = bisect.bisect_left(self.__rankingKeys, (-oldUser[0], userId))
+            del self.__rankingKeys[index]
+
+        # users with no cuteness are never shown on a leaderboard
+        if cuteness < 1:
+            return
+
+        self.__users[userId] = (cuteness, userName)
+        bisect.insort(self.__rankingKeys, (-cuteness, userId))
@@ -1,4 +1,6 @@
-from typing import List, Optional
+import asyncio
+from collections import OrderedDict
+from typing import Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
@@ -9,17 +11,17 @@ try:
         CutenessHistoryEntry
     from CynanBotCommon.cuteness.cutenessHistoryResult import \
         CutenessHistoryResult
-    from CynanBotCommon.cuteness.cutenessLeaderboardEntry import \
-        CutenessLeaderboardEntry
     from CynanBotCommon.cuteness.cutenessLeaderboardHistoryResult import \
         CutenessLeaderboardHistoryResult
+    from CynanBotCommon.cuteness.cutenessLeaderboardIndex import \
+        CutenessLeaderboardIndex
     from CynanBotCommon.cuteness.cutenessLeaderboardResult import \
         CutenessLeaderboardResult
     from CynanBotCommon.cuteness.cutenessRepositoryInterface import \
         CutenessRepositoryInterface
     from CynanBotCommon.cuteness.cutenessResult import CutenessResult
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.users.userIdsRepositoryInterface import \
         UserIdsRepositoryInterface
@@ -29,20 +31,50 @@ except:
     from cuteness.cutenessDate import CutenessDate
     from cuteness.cutenessHistoryEntry import CutenessHistoryEntry
     from cuteness.cutenessHistoryResult import CutenessHistoryResult
-    from cuteness.cutenessLeaderboardEntry import CutenessLeaderboardEntry
     from cuteness.cutenessLeaderboardHistoryResult import \
         CutenessLeaderboardHistoryResult
+    from cuteness.cutenessLeaderboardIndex import CutenessLeaderboardIndex
     from cuteness.cutenessLeaderboardResult import CutenessLeaderboardResult
     from cuteness.cutenessRepositoryInterface import \
         CutenessRepositoryInterface
     from cuteness.cutenessResult import CutenessResult
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
     from storage.databaseType import DatabaseType
 
     from users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
 
+fetchChampionsIndexStatement: DatabaseStatement = DatabaseStatement(
+    name = 'cuteness.fetchChampionsIndex',
+    query = '''
+        SELECT SUM(cuteness.cuteness) AS totalcuteness, cuteness.userid, userids.username FROM cuteness
+        INNER JOIN userids ON cuteness.userid = userids.userid
+        WHERE cuteness.twitchchannel = $1
+        GROUP BY cuteness.userid, userids.username
+    '''
+)
+
+fetchLeaderboardHistoryMonthsStatement: DatabaseStatement = DatabaseStatement(
+    name = 'cuteness.fetchLeaderboardHistoryMonths',
+    query = '''
+        SELECT DISTINCT utcyearandmonth FROM cuteness
+        WHERE twitchchannel = $1 AND utcyearandmonth != $2
+        ORDER BY utcyearandmonth DESC
+        LIMIT $3
+    '''
+)
+
+fetchLeaderboardIndexStatement: DatabaseStatement = DatabaseStatement(
+    name = 'cuteness.fetchLeaderboardIndex',
+    query = '''
+        SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+        INNER JOIN userids ON cuteness.userid = userids.userid
+        WHERE cuteness.twitchchannel = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1
+    '''
+)
+
+
 class CutenessRepository(CutenessRepositoryInterface):
 
     def __init__(
@@ -51,6 +83,7 @@ class CutenessRepository(CutenessRepositoryInterface):
         userIdsRepository: UserIdsRepositoryInterface,
         historyLeaderboardSize: int = 3,
         historySize: int = 5,
+        leaderboardIndexCacheSize: int = 32,
         leaderboardSize: int = 10
     ):
         if not isinstance(backingDatabase, BackingDatabase):
@@ -65,6 +98,10 @@ class CutenessRepository(CutenessRepositoryInterface):
             raise ValueError(f'historySize argument is malformed: \"{historySize}\"')
         elif historySize < 2 or historySize > 12:
             raise ValueError(f'historySize argument is out of bounds: {historySize}')
+        elif not utils.isValidInt(leaderboardIndexCacheSize):
+            raise ValueError(f'leaderboardIndexCacheSize argument is malformed: \"{leaderboardIndexCacheSize}\"')
+        elif leaderboardIndexCacheSize < 1 or leaderboardIndexCacheSize > 1024:
+            raise ValueError(f'leaderboardIndexCacheSize argument is out of bounds: {leaderboardIndexCacheSize}')
         elif not utils.isValidInt(leaderboardSize):
             raise ValueError(f'leaderboardSize argument is malformed: \"{leaderboardSize}\"')
         elif leaderboardSize < 3 or leaderboardSize > 10:
@@ -74,9 +111,38 @@ class CutenessRepository(CutenessRepositoryInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__historyLeaderboardSize: int = historyLeaderboardSize
         self.__historySize: int = historySize
+        self.__leaderboardIndexCacheSize: int = leaderboardIndexCacheSize
         self.__leaderboardSize: int = leaderboardSize
 
-        self.__isDatabaseReady: bool = False
+        # one lock per Twitch channel, so that building one channel's index never holds up another's
+        self.__indexLocks: Dict[str, asyncio.Lock] = dict()
+        self.__championsIndexes: Dict[str, CutenessLeaderboardIndex] = dict()
+
+        # least recently used on the left, so that old months fall out once the cache is full
+        self.__leaderboardIndexes: OrderedDict[str, CutenessLeaderboardIndex] = OrderedDict()
+
+        self.__registerDatabaseTables()
+
+    async def clearCaches(self):
+        self.__championsIndexes.clear()
+        self.__leaderboardIndexes.clear()
+
+    def __createIndex(self, records: Optional[List[List]]) -> CutenessLeaderboardIndex:
+        index = CutenessLeaderboardIndex()
+
+        if not utils.hasItems(records):
+            return index
+
+        for record in records:
+            # Cuteness can potentially arrive from the database as a decimal.Decimal type,
+            # so let's make sure to convert that into an int.
+            index.update(
+                cuteness = int(round(record[0])),
+                userId = record[1],
+                userName = record[2]
+            )
+
+        return index
 
     async def fetchCuteness(
         self,
@@ -97,18 +163,16 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         cutenessDate = CutenessDate()
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannel, userId, cutenessDate.getStr()
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
+                    INNER JOIN userids ON cuteness.userid = userids.userid
+                    WHERE cuteness.twitchchannel = $1 AND cuteness.userid = $2 AND cuteness.utcyearandmonth = $3
+                    LIMIT 1
+                ''',
+                twitchChannel, userId, cutenessDate.getStr()
+            )
 
         if not utils.hasItems(record):
             return CutenessResult(
@@ -133,38 +197,17 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         twitchChannelUserId = await self.__userIdsRepository.requireUserId(userName = twitchChannel)
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.userid, userids.username, SUM(cuteness.cuteness) AS totalcuteness FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.userid != $2
-                GROUP BY cuteness.userid, userids.username
-                ORDER BY totalcuteness DESC
-                LIMIT $3
-            ''',
-            twitchChannel, twitchChannelUserId, self.__leaderboardSize
-        )
+        async with self.__getIndexLock(twitchChannel):
+            championsIndex = await self.__getChampionsIndex(twitchChannel)
 
-        await connection.close()
+        champions = championsIndex.getTop(
+            count = self.__leaderboardSize,
+            excludeUserId = twitchChannelUserId
+        )
 
-        if not utils.hasItems(records):
+        if not utils.hasItems(champions):
             return CutenessChampionsResult(twitchChannel = twitchChannel)
 
-        champions: List[CutenessLeaderboardEntry] = list()
-
-        for index, record in enumerate(records):
-            # Cuteness can potentially arrive from the database as a decimal.Decimal type,
-            # so let's make sure to convert that into an int.
-            cuteness = int(round(record[2]))
-
-            champions.append(CutenessLeaderboardEntry(
-                cuteness = cuteness,
-                rank = index + 1,
-                userId = record[0],
-                userName = record[1]
-            ))
-
         return CutenessChampionsResult(
             twitchChannel = twitchChannel,
             champions = champions
@@ -187,74 +230,71 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         await self.__userIdsRepository.setUser(userId = userId, userName = userName)
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannel, userId, self.__historySize
-        )
-
-        if not utils.hasItems(records):
-            await connection.close()
-            return CutenessHistoryResult(
-                userId = userId,
-                userName = userName
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY utcyearandmonth DESC
+                    LIMIT $3
+                ''',
+                twitchChannel, userId, self.__historySize
             )
 
-        entries: List[CutenessHistoryEntry] = list()
+            if not utils.hasItems(records):
+                return CutenessHistoryResult(
+                    userId = userId,
+                    userName = userName
+                )
 
-        for record in records:
-            entries.append(CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
-            ))
+            entries: List[CutenessHistoryEntry] = list()
 
-        # sort entries into newest to oldest order
-        entries.sort(key = lambda entry: entry.getCutenessDate(), reverse = True)
+            for record in records:
+                entries.append(CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                ))
 
-        record = await connection.fetchRow(
-            '''
-                SELECT SUM(cuteness) FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
+            # sort entries into newest to oldest order
+            entries.sort(key = lambda entry: entry.getCutenessDate(), reverse = True)
 
-        totalCuteness: int = 0
+            record = await connection.fetchRow(
+                '''
+                    SELECT SUM(cuteness) FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
 
-        if utils.hasItems(record):
-            # this should be impossible at this point, but let's just be safe
-            totalCuteness = record[0]
+            totalCuteness: int = 0
 
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness, utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
-                ORDER BY cuteness DESC
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
+            if utils.hasItems(record):
+                # this should be impossible at this point, but let's just be safe
+                totalCuteness = record[0]
 
-        bestCuteness: Optional[CutenessHistoryEntry] = None
-
-        if utils.hasItems(record):
-            # again, this should be impossible here, but let's just be safe
-            bestCuteness = CutenessHistoryEntry(
-                cutenessDate = CutenessDate(record[1]),
-                cuteness = record[0],
-                userId = userId,
-                userName = userName
+            record = await connection.fetchRow(
+                '''
+                    SELECT cuteness, utcyearandmonth FROM cuteness
+                    WHERE twitchchannel = $1 AND userid = $2 AND cuteness IS NOT NULL AND cuteness >= 1
+                    ORDER BY cuteness DESC
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
             )
 
-        await connection.close()
+            bestCuteness: Optional[CutenessHistoryEntry] = None
+
+            if utils.hasItems(record):
+                # again, this should be impossible here, but let's just be safe
+                bestCuteness = CutenessHistoryEntry(
+                    cutenessDate = CutenessDate(record[1]),
+                    cuteness = record[0],
+                    userId = userId,
+                    userName = userName
+                )
 
         return CutenessHistoryResult(
             userId = userId,
@@ -288,38 +328,57 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         cutenessDate = CutenessDate()
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT cuteness FROM cuteness
-                WHERE twitchchannel = $1 AND userid = $2 AND utcyearandmonth = $3
-                LIMIT 1
-            ''',
-            twitchChannel, userId, cutenessDate.getStr()
-        )
+        # the channel's index lock is held across the whole read-modify-write so that its in-memory
+        # leaderboards can never be seeded in between the database write and their update
+        async with self.__getIndexLock(twitchChannel):
+            async with await self.__backingDatabase.getConnection() as connection:
+                record = await connection.fetchRow(
+                    '''
+                        SELECT cuteness FROM cuteness
+                        WHERE twitchchannel = $1 AND userid = $2 AND utcyearandmonth = $3
+                        LIMIT 1
+                    ''',
+                    twitchChannel, userId, cutenessDate.getStr()
+                )
 
-        oldCuteness: int = 0
+                oldCuteness: int = 0
 
-        if utils.hasItems(record):
-            oldCuteness = record[0]
+                if utils.hasItems(record):
+                    oldCuteness = record[0]
 
-        newCuteness: int = oldCuteness + incrementAmount
+                newCuteness: int = oldCuteness + incrementAmount
 
-        if newCuteness < 0:
-            newCuteness = 0
-        elif newCuteness > utils.getLongMaxSafeSize():
-            raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {incrementAmount})')
+                if newCuteness < 0:
+                    newCuteness = 0
+                elif newCuteness > utils.getLongMaxSafeSize():
+                    raise OverflowError(f'New cuteness ({newCuteness}) would be too large (old cuteness = {oldCuteness}) (increment amount = {incrementAmount})')
 
-        await connection.execute(
-            '''
-                INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannel, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
-            ''',
-            newCuteness, twitchChannel, userId, cutenessDate.getStr()
-        )
+                await connection.execute(
+                    '''
+                        INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel, userid, utcyearandmonth) DO UPDATE SET cuteness = EXCLUDED.cuteness
+                    ''',
+                    newCuteness, twitchChannel, userId, cutenessDate.getStr()
+                )
+
+            leaderboardIndex = self.__leaderboardIndexes.get(self.__toLeaderboardIndexKey(twitchChannel, cutenessDate))
 
-        await connection.close()
+            if leaderboardIndex is not None:
+                leaderboardIndex.update(
+                    cuteness = newCuteness,
+                    userId = userId,
+                    userName = userName
+                )
+
+            championsIndex = self.__championsIndexes.get(twitchChannel.lower())
+
+            if championsIndex is not None:
+                championsIndex.update(
+                    cuteness = championsIndex.getCuteness(userId) + newCuteness - oldCuteness,
+                    userId = userId,
+                    userName = userName
+                )
 
         return CutenessResult(
             cutenessDate = cutenessDate,
@@ -340,32 +399,17 @@ class CutenessRepository(CutenessRepositoryInterface):
         twitchChannelUserId = await self.__userIdsRepository.fetchUserId(userName = twitchChannel)
 
         cutenessDate = CutenessDate()
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                INNER JOIN userids ON cuteness.userid = userids.userid
-                WHERE cuteness.twitchchannel = $1 AND cuteness.utcyearandmonth = $2 AND cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.userid != $3
-                ORDER BY cuteness.cuteness DESC
-                LIMIT $4
-            ''',
-            twitchChannel, cutenessDate.getStr(), twitchChannelUserId, self.__leaderboardSize
-        )
 
-        await connection.close()
+        async with self.__getIndexLock(twitchChannel):
+            leaderboardIndex = await self.__getLeaderboardIndex(twitchChannel, cutenessDate)
 
-        if not utils.hasItems(records):
-            return CutenessLeaderboardResult(cutenessDate = cutenessDate)
-
-        entries: List[CutenessLeaderboardEntry] = list()
+        entries = leaderboardIndex.getTop(
+            count = self.__leaderboardSize,
+            excludeUserId = twitchChannelUserId
+        )
 
-        for index, record in enumerate(records):
-            entries.append(CutenessLeaderboardEntry(
-                cuteness = record[0],
-                rank = index + 1,
-                userId = record[1],
-                userName = record[2]
-            ))
+        if not utils.hasItems(entries):
+            return CutenessLeaderboardResult(cutenessDate = cutenessDate)
 
         specificLookupAlreadyInResults: bool = False
         if utils.isValidStr(specificLookupUserId) or utils.isValidStr(specificLookupUserName):
@@ -403,76 +447,118 @@ class CutenessRepository(CutenessRepositoryInterface):
 
         twitchChannelUserId = await self.__userIdsRepository.requireUserId(userName = twitchChannel)
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT DISTINCT utcyearandmonth FROM cuteness
-                WHERE twitchchannel = $1 AND utcyearandmonth != $2
-                ORDER BY utcyearandmonth DESC
-                LIMIT $3
-            ''',
-            twitchChannel, CutenessDate().getStr(), self.__historyLeaderboardSize
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                fetchLeaderboardHistoryMonthsStatement,
+                twitchChannel, CutenessDate().getStr(), self.__historyLeaderboardSize
+            )
 
         if not utils.hasItems(records):
-            await connection.close()
             return CutenessLeaderboardHistoryResult(twitchChannel = twitchChannel)
 
         leaderboards: List[CutenessLeaderboardResult] = list()
 
         for record in records:
             cutenessDate = CutenessDate(record[0])
-            monthRecords = await connection.fetchRows(
-                '''
-                    SELECT cuteness.cuteness, cuteness.userid, userids.username FROM cuteness
-                    INNER JOIN userids ON cuteness.userid = userids.userid
-                    WHERE cuteness.cuteness IS NOT NULL AND cuteness.cuteness >= 1 AND cuteness.twitchchannel = $1 AND cuteness.userid != $2 AND cuteness.utcyearandmonth = $3
-                    ORDER BY cuteness.cuteness DESC
-                    LIMIT $4
-                ''',
-                twitchChannel, twitchChannelUserId, cutenessDate.getStr(), self.__historyLeaderboardSize
-            )
 
-            if not utils.hasItems(monthRecords):
-                continue
+            async with self.__getIndexLock(twitchChannel):
+                leaderboardIndex = await self.__getLeaderboardIndex(twitchChannel, cutenessDate)
 
-            entries: List[CutenessLeaderboardEntry] = list()
-            rank: int = 1
+            entries = leaderboardIndex.getTop(
+                count = self.__historyLeaderboardSize,
+                excludeUserId = twitchChannelUserId
+            )
 
-            for monthRecord in monthRecords:
-                entries.append(CutenessLeaderboardEntry(
-                    cuteness = monthRecord[0],
-                    rank = rank,
-                    userId = monthRecord[1],
-                    userName = monthRecord[2]
-                ))
-                rank = rank + 1
+            if not utils.hasItems(entries):
+                continue
 
             leaderboards.append(CutenessLeaderboardResult(
                 cutenessDate = cutenessDate,
                 entries = entries
             ))
 
-        await connection.close()
-
         return CutenessLeaderboardHistoryResult(
             twitchChannel = twitchChannel,
             leaderboards = leaderboards
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    async def fetchCutenessLeaderboardPlacement(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> Optional[int]:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+        elif not utils.isValidStr(userId):
+            raise ValueError(f'userId argument is malformed: \"{userId}\"')
+
+        twitchChannelUserId = await self.__userIdsRepository.fetchUserId(userName = twitchChannel)
+
+        async with self.__getIndexLock(twitchChannel):
+            leaderboardIndex = await self.__getLeaderboardIndex(twitchChannel, CutenessDate())
+
+        return leaderboardIndex.getRank(
+            userId = userId,
+            excludeUserId = twitchChannelUserId
+        )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
+    async def __getChampionsIndex(self, twitchChannel: str) -> CutenessLeaderboardIndex:
+        # this method must only be called while holding the channel's index lock
+        championsIndex = self.__championsIndexes.get(twitchChannel.lower())
 
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+        if championsIndex is not None:
+            return championsIndex
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(fetchChampionsIndexStatement, twitchChannel)
+
+        championsIndex = self.__createIndex(records)
+        self.__championsIndexes[twitchChannel.lower()] = championsIndex
+
+        return championsIndex
+
+    def __getIndexLock(self, twitchChannel: str) -> asyncio.Lock:
+        indexLock = self.__indexLocks.get(twitchChannel.lower())
+
+        if indexLock is None:
+            indexLock = asyncio.Lock()
+            self.__indexLocks[twitchChannel.lower()] = indexLock
+
+        return indexLock
+
+    async def __getLeaderboardIndex(
+        self,
+        twitchChannel: str,
+        cutenessDate: CutenessDate
+    ) -> CutenessLeaderboardIndex:
+        # this method must only be called while holding the channel's index lock
+        key = self.__toLeaderboardIndexKey(twitchChannel, cutenessDate)
+        leaderboardIndex = self.__leaderboardIndexes.get(key)
+
+        if leaderboardIndex is not None:
+            self.__leaderboardIndexes.move_to_end(key)
+            return leaderboardIndex
+
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                fetchLeaderboardIndexStatement,
+                twitchChannel, cutenessDate.getStr()
+            )
+
+        leaderboardIndex = self.__createIndex(records)
+        self.__leaderboardIndexes[key] = leaderboardIndex
+
+        while len(self.__leaderboardIndexes) > self.__leaderboardIndexCacheSize:
+            self.__leaderboardIndexes.popitem(last = False)
+
+        return leaderboardIndex
+
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
+
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cuteness (
                         cuteness bigint DEFAULT 0 NOT NULL,
@@ -483,8 +569,23 @@ class CutenessRepository(CutenessRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS cuteness_twitchchannel_utcyearandmonth_cuteness
+                    ON cuteness (twitchchannel, utcyearandmonth, cuteness DESC)
+                    INCLUDE (userid)
+                '''
+            )
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS cuteness_twitchchannel_userid_cuteness
+                    ON cuteness (twitchchannel, userid, cuteness)
+                '''
+            )
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS cuteness (
                         cuteness INTEGER NOT NULL DEFAULT 0,
@@ -495,7 +596,28 @@ class CutenessRepository(CutenessRepositoryInterface):
                     )
                 '''
             )
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS cuteness_twitchchannel_utcyearandmonth_cuteness
+                    ON cuteness (twitchchannel, utcyearandmonth, cuteness DESC, userid)
+                '''
+            )
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS cuteness_twitchchannel_userid_cuteness
+                    ON cuteness (twitchchannel, userid, cuteness)
+                '''
+            )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
+
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'CutenessRepository',
+            statements = statements,
+            version = 2
+        )
 
-        await connection.close()
+    def __toLeaderboardIndexKey(self, twitchChannel: str, cutenessDate: CutenessDate) -> str:
+        return f'{twitchChannel.lower()}:{cutenessDate.getStr()}'
@@ -1,7 +1,8 @@
-from abc import ABC, abstractmethod
+from abc import abstractmethod
 from typing import Optional
 
 try:
+    from CynanBotCommon.clearable import Clearable
     from CynanBotCommon.cuteness.cutenessChampionsResult import \
         CutenessChampionsResult
     from CynanBotCommon.cuteness.cutenessHistoryResult import \
@@ -12,6 +13,7 @@ try:
         CutenessLeaderboardResult
     from CynanBotCommon.cuteness.cutenessResult import CutenessResult
 except:
+    from clearable import Clearable
     from cuteness.cutenessChampionsResult import CutenessChampionsResult
     from cuteness.cutenessHistoryResult import CutenessHistoryResult
     from cuteness.cutenessLeaderboardHistoryResult import \
@@ -20,7 +22,7 @@ except:
     from cuteness.cutenessResult import CutenessResult
 
 
-class CutenessRepositoryInterface(ABC):
+class CutenessRepositoryInterface(Clearable):
 
     @abstractmethod
     async def fetchCuteness(
@@ -66,3 +68,11 @@ class CutenessRepositoryInterface(ABC):
     @abstractmethod
     async def fetchCutenessLeaderboardHistory(self, twitchChannel: str) -> CutenessLeaderboardHistoryResult:
         pass
+
+    @abstractmethod
+    async def fetchCutenessLeaderboardPlacement(
+        self,
+        twitchChannel: str,
+        userId: str
+    ) -> Optional[int]:
+        pass
@@ -0,0 +1,60 @@
+try:
+    from ..cutenessLeaderboardIndex import CutenessLeaderboardIndex
+except:
+    from cuteness.cutenessLeaderboardIndex import CutenessLeaderboardIndex
+
+
+class TestCutenessLeaderboardIndex():
+
+    def __createIndex(self) -> CutenessLeaderboardIndex:
+        index = CutenessLeaderboardIndex()
+        index.update(cuteness = 10, userId = '1', userName = 'Samus')
+        index.update(cuteness = 30, userId = '2', userName = 'Mario')
+        index.update(cuteness = 20, userId = '3', userName = 'Link')
+        return index
+
+    def test_getRank(self):
+        index = self.__createIndex()
+        assert index.getRank('2') == 1
+        assert index.getRank('3') == 2
+        assert index.getRank('1') == 3
+        assert index.getRank('4') is None
+
+    def test_getRank_withExcludedUser(self):
+        index = self.__createIndex()
+        assert index.getRank('2', excludeUserId = '2') is None
+        assert index.getRank('3', excludeUserId = '2') == 1
+        assert index.getRank('1', excludeUserId = '2') == 2
+        assert index.getRank('3', excludeUserId = '1') == 2
+
+    def test_getTop(self):
+        index = self.__createIndex()
+        entries = index.getTop(2)
+        assert len(entries) == 2
+        assert entries[0].getUserName() == 'Mario'
+        assert entries[0].getCuteness() == 30
+        assert entries[0].getRank() == 1
+        assert entries[1].getUserName() == 'Link'
+        assert entries[1].getRank() == 2
+
+    def test_getTop_withExcludedUser(self):
+        index = self.__createIndex()
+        entries = index.getTop(3, excludeUserId = '2')
+        assert [ entry.getUserId() for entry in entries ] == [ '3', '1' ]
+        assert [ entry.getRank() for entry in entries ] == [ 1, 2 ]
+
+    def test_update_movesUser(self):
+        index = self.__createIndex()
+        index.update(cuteness = 50, userId = '1', userName = 'Samus')
+        assert index.getRank('1') == 1
+        assert index.getRank('2') == 2
+        assert index.getCuteness('1') == 50
+        assert index.getSize() == 3
+
+    def test_update_withZeroCutenessRemovesUser(self):
+        index = self.__createIndex()
+        index.update(cuteness = 0, userId = '2', userName = 'Mario')
+        assert index.getRank('2') is None
+        assert index.getCuteness('2') == 0
+        assert index.getRank('3') == 1
+        assert index.getSize() == 2
@@ -0,0 +1,98 @@
+import asyncio
+from unittest import mock
+
+import pytest
+
+try:
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchApiServiceInterface import \
+        TwitchApiServiceInterface
+    from ...users.userIdsRepository import UserIdsRepository
+    from ..cutenessDate import CutenessDate
+    from ..cutenessRepository import CutenessRepository
+except:
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessRepository import CutenessRepository
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+    from twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+
+    from users.userIdsRepository import UserIdsRepository
+
+
+class TestCutenessRepository():
+
+    async def __createRepository(
+        self,
+        backingDatabase: BackingSqliteDatabase,
+        leaderboardIndexCacheSize: int = 32
+    ) -> CutenessRepository:
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            twitchApiService = mock.MagicMock(spec = TwitchApiServiceInterface)
+        )
+
+        await userIdsRepository.setUser(userId = '100', userName = 'smCharles')
+        await userIdsRepository.setUser(userId = '1', userName = 'Samus')
+        await userIdsRepository.setUser(userId = '2', userName = 'Mario')
+
+        return CutenessRepository(
+            backingDatabase = backingDatabase,
+            userIdsRepository = userIdsRepository,
+            leaderboardIndexCacheSize = leaderboardIndexCacheSize
+        )
+
+    def __createBackingDatabase(self, tmp_path) -> BackingSqliteDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessIncrementedBy_updatesCachedLeaderboard(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = await self.__createRepository(backingDatabase)
+
+        await repository.fetchCutenessIncrementedBy(5, 'smCharles', '1', 'Samus')
+        result = await repository.fetchCutenessLeaderboard('smCharles')
+        assert [ entry.getUserId() for entry in result.getEntries() ] == [ '1' ]
+
+        await repository.fetchCutenessIncrementedBy(10, 'smCharles', '2', 'Mario')
+        result = await repository.fetchCutenessLeaderboard('smCharles')
+        assert [ entry.getUserId() for entry in result.getEntries() ] == [ '2', '1' ]
+
+        assert await repository.fetchCutenessLeaderboardPlacement('smCharles', '1') == 2
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchCutenessLeaderboardHistory_withSmallIndexCache(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = await self.__createRepository(backingDatabase, leaderboardIndexCacheSize = 1)
+        months = [ '2020-03', '2020-02', '2020-01' ]
+
+        async with await backingDatabase.getConnection() as connection:
+            for index, month in enumerate(months):
+                await connection.execute(
+                    'INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth) VALUES ($1, $2, $3, $4)',
+                    10 + index, 'smCharles', '1', month
+                )
+
+                await connection.execute(
+                    'INSERT INTO cuteness (cuteness, twitchchannel, userid, utcyearandmonth) VALUES ($1, $2, $3, $4)',
+                    20 - index * 10, 'smCharles', '2', month
+                )
+
+        # the cache only ever holds one month here, so each pass has to rebuild evicted months
+        for _ in range(2):
+            result = await repository.fetchCutenessLeaderboardHistory('smCharles')
+            leaderboards = result.getLeaderboards()
+
+            assert [ leaderboard.getCutenessDate().getStr() for leaderboard in leaderboards ] == months
+            assert [ entry.getUserId() for entry in leaderboards[0].getEntries() ] == [ '2', '1' ]
+            assert [ entry.getUserId() for entry in leaderboards[1].getEntries() ] == [ '1', '2' ]
+            assert [ entry.getUserId() for entry in leaderboards[2].getEntries() ] == [ '1' ]
+
+        assert CutenessDate().getStr() not in months
+        await backingDatabase.close()
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
@@ -41,7 +41,7 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__seedFileReader: Optional[JsonReaderInterface] = seedFileReader
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
         self.__cache: Dict[str, Optional[str]] = dict()
 
     async def clearCaches(self):
@@ -78,7 +78,7 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__timber.log('FuntoonTokensRepository', f'Finished reading in seed file \"{seedFileReader}\"')
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
+        await self.__consumeSeedFile()
         return await self.__backingDatabase.getConnection()
 
     async def getToken(self, twitchChannel: str) -> Optional[str]:
@@ -88,17 +88,16 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         if twitchChannel.lower() in self.__cache:
             return self.__cache[twitchChannel.lower()]
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT token FROM funtoontokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
+        async with await self.__getDatabaseConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT token FROM funtoontokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
-        await connection.close()
         token: Optional[str] = None
 
         if utils.hasItems(record):
@@ -108,15 +107,12 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
 
         return token
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS funtoontokens (
                         token text DEFAULT NULL,
@@ -124,8 +120,8 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS funtoontokens (
                         token TEXT DEFAULT NULL,
@@ -134,10 +130,12 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
-        await self.__consumeSeedFile()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'FuntoonTokensRepository',
+            statements = statements
+        )
 
     async def requireToken(self, twitchChannel: str) -> str:
         if not utils.isValidStr(twitchChannel):
@@ -156,30 +154,27 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-
-        if utils.isValidStr(token):
-            await connection.execute(
-                '''
-                    INSERT INTO funtoontokens (token, twitchchannel)
-                    VALUES ($1, $2)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET token = EXCLUDED.token
-                ''',
-                token, twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = token
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been updated (\"{token}\")')
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM funtoontokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = None
-            self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been deleted')
-
-        await connection.close()
+        async with await self.__getDatabaseConnection() as connection:
+            if utils.isValidStr(token):
+                await connection.execute(
+                    '''
+                        INSERT INTO funtoontokens (token, twitchchannel)
+                        VALUES ($1, $2)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET token = EXCLUDED.token
+                    ''',
+                    token, twitchChannel
+                )
+
+                self.__cache[twitchChannel.lower()] = token
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been updated (\"{token}\")')
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM funtoontokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
+
+                self.__cache[twitchChannel.lower()] = None
+                self.__timber.log('FuntoonTokensRepository', f'Funtoon token for \"{twitchChannel}\" has been deleted')
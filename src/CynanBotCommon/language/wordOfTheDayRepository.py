@@ -6,6 +6,7 @@ import xmltodict
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.asyncTtlCache import AsyncTtlCache
     from CynanBotCommon.language.languageEntry import LanguageEntry
     from CynanBotCommon.language.wordOfTheDayRepositoryInterface import \
         WordOfTheDayRepositoryInterface
@@ -15,9 +16,9 @@ try:
     from CynanBotCommon.network.networkClientProvider import \
         NetworkClientProvider
     from CynanBotCommon.timber.timberInterface import TimberInterface
-    from CynanBotCommon.timedDict import TimedDict
 except:
     import utils
+    from asyncTtlCache import AsyncTtlCache
     from language.languageEntry import LanguageEntry
     from language.wordOfTheDayRepositoryInterface import \
         WordOfTheDayRepositoryInterface
@@ -25,7 +26,6 @@ except:
     from network.exceptions import GenericNetworkException
     from network.networkClientProvider import NetworkClientProvider
     from timber.timberInterface import TimberInterface
-    from timedDict import TimedDict
 
 
 class WordOfTheDayRepository(WordOfTheDayRepositoryInterface):
@@ -45,7 +45,7 @@ class WordOfTheDayRepository(WordOfTheDayRepositoryInterface):
 
         self.__networkClientProvider: NetworkClientProvider = networkClientProvider
         self.__timber: TimberInterface = timber
-        self.__cache: TimedDict = TimedDict(timeDelta = cacheTimeDelta)
+        self.__cache: AsyncTtlCache = AsyncTtlCache(timeToLive = cacheTimeDelta)
 
     async def clearCaches(self):
         self.__cache.clear()
@@ -57,14 +57,10 @@ class WordOfTheDayRepository(WordOfTheDayRepositoryInterface):
         elif not languageEntry.hasWotdApiCode():
             raise ValueError(f'the given languageEntry is not supported for Word Of The Day: \"{languageEntry.getName()}\"')
 
-        cacheValue = self.__cache[languageEntry.getName()]
-        if cacheValue is not None:
-            return cacheValue
-
-        wotd = await self.__fetchWotd(languageEntry)
-        self.__cache[languageEntry.getName()] = wotd
-
-        return wotd
+        return await self.__cache.getOrLoad(
+            key = languageEntry.getName(),
+            loader = lambda: self.__fetchWotd(languageEntry)
+        )
 
     async def __fetchWotd(self, languageEntry: LanguageEntry) -> WordOfTheDayResponse:
         if not isinstance(languageEntry, LanguageEntry):
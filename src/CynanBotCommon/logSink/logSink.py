@@ -0,0 +1,436 @@
+import asyncio
+import json
+import math
+import os
+import threading
+import time
+from asyncio import AbstractEventLoop
+from collections import defaultdict, deque
+from datetime import date, datetime, timezone
+from typing import (BinaryIO, Callable, Deque, Dict, List, Optional,
+                    OrderedDict, Set, Tuple, Union)
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+    from CynanBotCommon.logSink.logSinkOverflowPolicy import \
+        LogSinkOverflowPolicy
+except:
+    import utils
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from logSink.logSinkMetrics import LogSinkMetrics
+    from logSink.logSinkOverflowPolicy import LogSinkOverflowPolicy
+
+
+# Writes log statements out to their log files in the background. This is shared by Timber,
+# ChatLogger, and SentMessageLogger, each of which just decides what a log statement looks like
+# and which file it belongs in. Statements are buffered until either enough of them have built up
+# or the oldest of them has waited long enough, and then each file's statements are written with
+# a single write call. Log files are kept open between flushes, and are closed once they stop
+# being written to after the day rolls over (which, for day-based log files, is a rotation).
+# A statement can also be handed over as a function that builds it, in which case the statement
+# isn't built until it's about to be written, on the writer thread.
+#
+# The queue of statements is bounded. Once it's full, the overflow policy decides what happens:
+# BLOCK has the caller write the queue out itself, DROP_OLDEST throws away the oldest statement,
+# and SPILL_TO_DISK moves the queue into a spill file, which the next flush writes out first.
+class LogSink():
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelper,
+        flushThresholdBytes: int = 65536,
+        maxFlushDelaySeconds: float = 15,
+        maxOpenFiles: int = 32,
+        maxQueueSize: int = 65536,
+        overflowPolicy: LogSinkOverflowPolicy = LogSinkOverflowPolicy.DROP_OLDEST,
+        spillFile: Optional[str] = None
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
+            raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not utils.isValidInt(flushThresholdBytes):
+            raise ValueError(f'flushThresholdBytes argument is malformed: \"{flushThresholdBytes}\"')
+        elif flushThresholdBytes < 1 or flushThresholdBytes > utils.getIntMaxSafeSize():
+            raise ValueError(f'flushThresholdBytes argument is out of bounds: {flushThresholdBytes}')
+        elif not utils.isValidNum(maxFlushDelaySeconds):
+            raise ValueError(f'maxFlushDelaySeconds argument is malformed: \"{maxFlushDelaySeconds}\"')
+        elif maxFlushDelaySeconds < 0.1 or maxFlushDelaySeconds > 300:
+            raise ValueError(f'maxFlushDelaySeconds argument is out of bounds: {maxFlushDelaySeconds}')
+        elif not utils.isValidInt(maxOpenFiles):
+            raise ValueError(f'maxOpenFiles argument is malformed: \"{maxOpenFiles}\"')
+        elif maxOpenFiles < 1 or maxOpenFiles > 1024:
+            raise ValueError(f'maxOpenFiles argument is out of bounds: {maxOpenFiles}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not isinstance(overflowPolicy, LogSinkOverflowPolicy):
+            raise ValueError(f'overflowPolicy argument is malformed: \"{overflowPolicy}\"')
+        elif overflowPolicy is LogSinkOverflowPolicy.SPILL_TO_DISK and not utils.isValidStr(spillFile):
+            raise ValueError(f'spillFile argument is malformed: \"{spillFile}\"')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelper = backgroundTaskHelper
+        self.__flushThresholdBytes: int = flushThresholdBytes
+        self.__maxFlushDelaySeconds: float = maxFlushDelaySeconds
+        self.__maxOpenFiles: int = maxOpenFiles
+        self.__maxQueueSize: int = maxQueueSize
+        self.__overflowPolicy: LogSinkOverflowPolicy = overflowPolicy
+        self.__spillFile: Optional[str] = spillFile
+        self.__flushingSpillFile: Optional[str] = None
+
+        if utils.isValidStr(spillFile):
+            self.__flushingSpillFile = f'{spillFile}.flushing'
+
+        self.__eventLoop: AbstractEventLoop = backgroundTaskHelper.getEventLoop()
+        self.__flushEvent: Optional[asyncio.Event] = None
+        self.__flushLock: Optional[asyncio.Lock] = None
+        self.__isFlushRequested: bool = False
+        self.__isStarted: bool = False
+
+        # write() can be called from any thread, so everything here is guarded by the queue lock
+        self.__queueLock: threading.Lock = threading.Lock()
+        self.__statementQueue: Deque[Tuple[str, Union[str, Callable[[], str]], int, float]] = deque()
+        self.__pendingBytes: int = 0
+        self.__spillFileHandle: Optional[BinaryIO] = None
+        self.__spillOldestTime: Optional[float] = None
+        self.__bytesWritten: int = 0
+        self.__droppedStatements: int = 0
+        self.__flushes: int = 0
+        self.__flushDurationHistogram: Dict[float, int] = { bound: 0 for bound in (0.001, 0.01, 0.1, 1, 10, math.inf) }
+        self.__spilledStatements: int = 0
+
+        # everything here is only touched while holding the write lock, which is held for the
+        # entirety of each flush, so that statements always reach their files in order
+        self.__writeLock: threading.Lock = threading.Lock()
+        self.__existingDirectories: Set[str] = set()
+        self.__openFiles: OrderedDict[str, Tuple[BinaryIO, date]] = OrderedDict()
+
+    async def close(self):
+        await self.flush()
+
+        async with self.__getFlushLock():
+            await self.__eventLoop.run_in_executor(None, self.__closeFiles)
+
+    def __closeFile(self, logFile: str):
+        file, _ = self.__openFiles.pop(logFile)
+
+        try:
+            file.close()
+        except Exception as e:
+            print(f'LogSink encountered an Exception when closing log file \"{logFile}\": {e}')
+
+    def __closeFiles(self):
+        with self.__writeLock:
+            for logFile in list(self.__openFiles.keys()):
+                self.__closeFile(logFile)
+
+    def closeLogFile(self, logFile: str):
+        if not utils.isValidStr(logFile):
+            raise ValueError(f'logFile argument is malformed: \"{logFile}\"')
+
+        # This waits for any flush that's underway, so once it returns, nothing else will be written
+        # to the file that was open. A later statement for this log file just opens it up again.
+        with self.__writeLock:
+            if logFile in self.__openFiles:
+                self.__closeFile(logFile)
+
+    def __closeStaleFiles(self, today: date):
+        for logFile, (_, lastWriteDate) in list(self.__openFiles.items()):
+            if lastWriteDate != today:
+                self.__closeFile(logFile)
+
+        while len(self.__openFiles) > self.__maxOpenFiles:
+            leastRecentlyWrittenLogFile = next(iter(self.__openFiles))
+            self.__closeFile(leastRecentlyWrittenLogFile)
+
+    async def flush(self):
+        async with self.__getFlushLock():
+            self.__isFlushRequested = False
+            await self.__eventLoop.run_in_executor(None, self.__flushQueue)
+
+    def __flushQueue(self):
+        with self.__writeLock:
+            startTime = time.perf_counter()
+            statements: Dict[str, List[Union[str, Callable[[], str]]]] = defaultdict(lambda: list())
+
+            # this is left over from a flush that was interrupted partway through
+            for logFile, statement in self.__readSpillFile():
+                statements[logFile].append(statement)
+
+            with self.__queueLock:
+                queuedStatements = list(self.__statementQueue)
+                self.__statementQueue.clear()
+                self.__pendingBytes = 0
+                self.__spillOldestTime = None
+                spillFileHandle = self.__spillFileHandle
+                self.__spillFileHandle = None
+
+                if spillFileHandle is not None:
+                    spillFileHandle.close()
+
+                # a spill that happens after the queue lock is let go of then starts a new spill file
+                self.__moveSpillFile()
+
+            # anything that was spilled is older than what's in the queue, so it goes first
+            for logFile, statement in self.__readSpillFile():
+                statements[logFile].append(statement)
+
+            for logFile, statement, _, _ in queuedStatements:
+                statements[logFile].append(statement)
+
+            if len(statements) == 0:
+                return
+
+            bytesWritten = self.__writeStatements(statements)
+            flushDurationSeconds = time.perf_counter() - startTime
+
+            with self.__queueLock:
+                self.__bytesWritten = self.__bytesWritten + bytesWritten
+                self.__flushes = self.__flushes + 1
+
+                for bound in self.__flushDurationHistogram:
+                    if flushDurationSeconds <= bound:
+                        self.__flushDurationHistogram[bound] = self.__flushDurationHistogram[bound] + 1
+                        break
+
+    def __getFlushEvent(self) -> asyncio.Event:
+        flushEvent = self.__flushEvent
+
+        if flushEvent is None:
+            flushEvent = asyncio.Event()
+            self.__flushEvent = flushEvent
+
+        return flushEvent
+
+    def __getFlushLock(self) -> asyncio.Lock:
+        flushLock = self.__flushLock
+
+        if flushLock is None:
+            flushLock = asyncio.Lock()
+            self.__flushLock = flushLock
+
+        return flushLock
+
+    def getMetrics(self) -> LogSinkMetrics:
+        with self.__queueLock:
+            oldestTimes: List[float] = list()
+
+            if len(self.__statementQueue) >= 1:
+                oldestTimes.append(self.__statementQueue[0][3])
+
+            if self.__spillOldestTime is not None:
+                oldestTimes.append(self.__spillOldestTime)
+
+            oldestStatementAgeSeconds: Optional[float] = None
+
+            if len(oldestTimes) >= 1:
+                oldestStatementAgeSeconds = time.monotonic() - min(oldestTimes)
+
+            return LogSinkMetrics(
+                bytesWritten = self.__bytesWritten,
+                droppedStatements = self.__droppedStatements,
+                flushDurationHistogram = dict(self.__flushDurationHistogram),
+                flushes = self.__flushes,
+                maxQueueSize = self.__maxQueueSize,
+                oldestStatementAgeSeconds = oldestStatementAgeSeconds,
+                queueSize = len(self.__statementQueue),
+                spilledStatements = self.__spilledStatements
+            )
+
+    def getOpenFilesSize(self) -> int:
+        return len(self.__openFiles)
+
+    def __moveSpillFile(self):
+        # this is only ever called while holding the queue lock
+        spillFile = self.__spillFile
+
+        if not utils.isValidStr(spillFile) or not os.path.isfile(spillFile):
+            return
+
+        try:
+            os.replace(spillFile, self.__flushingSpillFile)
+        except Exception as e:
+            print(f'LogSink encountered an Exception when moving spill file \"{spillFile}\": {e}')
+
+    def __openFile(self, logFile: str, today: date) -> BinaryIO:
+        openFile = self.__openFiles.get(logFile)
+
+        if openFile is not None:
+            self.__openFiles.move_to_end(logFile)
+            self.__openFiles[logFile] = (openFile[0], today)
+            return openFile[0]
+
+        logDirectory = os.path.dirname(logFile)
+
+        if utils.isValidStr(logDirectory) and logDirectory not in self.__existingDirectories:
+            os.makedirs(logDirectory, exist_ok = True)
+            self.__existingDirectories.add(logDirectory)
+
+        file = open(logFile, mode = 'ab')
+        self.__openFiles[logFile] = (file, today)
+        return file
+
+    def __readSpillFile(self) -> List[Tuple[str, str]]:
+        spillFile = self.__flushingSpillFile
+
+        if not utils.isValidStr(spillFile) or not os.path.isfile(spillFile):
+            return list()
+
+        spilledStatements: List[Tuple[str, str]] = list()
+
+        try:
+            with open(spillFile, mode = 'r', encoding = 'utf-8') as file:
+                for line in file:
+                    try:
+                        logFile, statement = json.loads(line)
+                        spilledStatements.append((logFile, statement))
+                    except Exception as e:
+                        # this is most likely the last line of a spill that got cut off partway through
+                        print(f'LogSink encountered an Exception when reading a line of spill file \"{spillFile}\": {e}')
+
+            os.remove(spillFile)
+        except Exception as e:
+            print(f'LogSink encountered an Exception when reading spill file \"{spillFile}\": {e}')
+
+        return spilledStatements
+
+    def __renderStatement(self, statement: Union[str, Callable[[], str]]) -> str:
+        if isinstance(statement, str):
+            return statement
+
+        try:
+            return statement()
+        except Exception as e:
+            return f'LogSink encountered an Exception when building a log statement: {e}\n'
+
+    def __setFlushEvent(self):
+        self.__getFlushEvent().set()
+
+    def __spillQueue(self):
+        # this is only ever called while holding the queue lock
+        spillFileHandle = self.__spillFileHandle
+
+        if spillFileHandle is None:
+            spillDirectory = os.path.dirname(self.__spillFile)
+
+            if utils.isValidStr(spillDirectory):
+                os.makedirs(spillDirectory, exist_ok = True)
+
+            spillFileHandle = open(self.__spillFile, mode = 'ab')
+            self.__spillFileHandle = spillFileHandle
+
+        spilledLines: List[str] = list()
+
+        for logFile, statement, _, enqueueTime in self.__statementQueue:
+            spilledLines.append(f'{json.dumps([ logFile, self.__renderStatement(statement) ], ensure_ascii = False)}\n')
+
+            if self.__spillOldestTime is None:
+                self.__spillOldestTime = enqueueTime
+
+        spillFileHandle.write(''.join(spilledLines).encode('utf-8'))
+        self.__spilledStatements = self.__spilledStatements + len(spilledLines)
+        self.__statementQueue.clear()
+        self.__pendingBytes = 0
+
+    def start(self):
+        if self.__isStarted:
+            return
+
+        self.__isStarted = True
+        self.__backgroundTaskHelper.createTask(self.__startFlushLoop())
+
+    async def __startFlushLoop(self):
+        flushEvent = self.__getFlushEvent()
+
+        while True:
+            try:
+                await asyncio.wait_for(flushEvent.wait(), timeout = self.__maxFlushDelaySeconds)
+            except asyncio.TimeoutError:
+                pass
+
+            flushEvent.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                print(f'LogSink encountered an Exception when flushing log statements: {e}')
+
+    def write(
+        self,
+        logFile: str,
+        statement: Union[str, Callable[[], str]],
+        sizeInBytes: Optional[int] = None
+    ):
+        if not utils.isValidStr(logFile):
+            raise ValueError(f'logFile argument is malformed: \"{logFile}\"')
+        elif not isinstance(statement, str) and not callable(statement):
+            raise ValueError(f'statement argument is malformed: \"{statement}\"')
+        elif sizeInBytes is not None and not utils.isValidInt(sizeInBytes):
+            raise ValueError(f'sizeInBytes argument is malformed: \"{sizeInBytes}\"')
+
+        if sizeInBytes is None:
+            if isinstance(statement, str):
+                sizeInBytes = len(statement)
+            else:
+                # an unbuilt statement's size isn't known yet, so just guess at a typical one
+                sizeInBytes = 128
+
+        if self.__overflowPolicy is LogSinkOverflowPolicy.BLOCK:
+            with self.__queueLock:
+                isQueueFull = len(self.__statementQueue) >= self.__maxQueueSize
+
+            if isQueueFull:
+                # the caller pays for writing the queue out, which is what keeps it from outrunning the disk
+                self.__flushQueue()
+
+        with self.__queueLock:
+            if len(self.__statementQueue) >= self.__maxQueueSize:
+                if self.__overflowPolicy is LogSinkOverflowPolicy.SPILL_TO_DISK:
+                    try:
+                        self.__spillQueue()
+                    except Exception as e:
+                        print(f'LogSink encountered an Exception when spilling log statements to \"{self.__spillFile}\": {e}')
+
+                if len(self.__statementQueue) >= self.__maxQueueSize:
+                    _, _, droppedSizeInBytes, _ = self.__statementQueue.popleft()
+                    self.__pendingBytes = self.__pendingBytes - droppedSizeInBytes
+                    self.__droppedStatements = self.__droppedStatements + 1
+
+            self.__statementQueue.append((logFile, statement, sizeInBytes, time.monotonic()))
+            self.__pendingBytes = self.__pendingBytes + sizeInBytes
+            isFlushNeeded = self.__pendingBytes >= self.__flushThresholdBytes and not self.__isFlushRequested
+
+            if isFlushNeeded:
+                self.__isFlushRequested = True
+
+        if isFlushNeeded:
+            # write() can be called from outside of the event loop, so this is the only safe way to wake up the flush loop
+            self.__eventLoop.call_soon_threadsafe(self.__setFlushEvent)
+
+    def __writeStatements(self, statements: Dict[str, List[Union[str, Callable[[], str]]]]) -> int:
+        # log files are named after SimpleDateTime's days, which are UTC days by default
+        today = datetime.now(timezone.utc).date()
+        writtenFiles: List[BinaryIO] = list()
+        bytesWritten = 0
+
+        for logFile, logFileStatements in statements.items():
+            try:
+                file = self.__openFile(logFile, today)
+                contents = ''.join(self.__renderStatement(statement) for statement in logFileStatements).encode('utf-8')
+                file.write(contents)
+                writtenFiles.append(file)
+                bytesWritten = bytesWritten + len(contents)
+            except Exception as e:
+                # the log file's directory might have been removed out from under us, so check for it again next time
+                self.__existingDirectories.discard(os.path.dirname(logFile))
+                print(f'LogSink encountered an Exception when writing {len(logFileStatements)} statement(s) to log file \"{logFile}\": {e}')
+
+        for file in writtenFiles:
+            try:
+                file.flush()
+            except Exception as e:
+                print(f'LogSink encountered an Exception when flushing log file \"{file.name}\": {e}')
+
+        self.__closeStaleFiles(today)
+        return bytesWritten
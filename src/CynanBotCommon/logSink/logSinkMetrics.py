@@ -0,0 +1,90 @@
+from typing import Dict, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class LogSinkMetrics():
+
+    def __init__(
+        self,
+        bytesWritten: int,
+        droppedStatements: int,
+        flushDurationHistogram: Dict[float, int],
+        flushes: int,
+        maxQueueSize: int,
+        oldestStatementAgeSeconds: Optional[float],
+        queueSize: int,
+        spilledStatements: int
+    ):
+        if not utils.isValidInt(bytesWritten):
+            raise ValueError(f'bytesWritten argument is malformed: \"{bytesWritten}\"')
+        elif bytesWritten < 0 or bytesWritten > utils.getLongMaxSafeSize():
+            raise ValueError(f'bytesWritten argument is out of bounds: {bytesWritten}')
+        elif not utils.isValidInt(droppedStatements):
+            raise ValueError(f'droppedStatements argument is malformed: \"{droppedStatements}\"')
+        elif droppedStatements < 0 or droppedStatements > utils.getLongMaxSafeSize():
+            raise ValueError(f'droppedStatements argument is out of bounds: {droppedStatements}')
+        elif not isinstance(flushDurationHistogram, Dict):
+            raise ValueError(f'flushDurationHistogram argument is malformed: \"{flushDurationHistogram}\"')
+        elif not utils.isValidInt(flushes):
+            raise ValueError(f'flushes argument is malformed: \"{flushes}\"')
+        elif flushes < 0 or flushes > utils.getLongMaxSafeSize():
+            raise ValueError(f'flushes argument is out of bounds: {flushes}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif oldestStatementAgeSeconds is not None and not utils.isValidNum(oldestStatementAgeSeconds):
+            raise ValueError(f'oldestStatementAgeSeconds argument is malformed: \"{oldestStatementAgeSeconds}\"')
+        elif not utils.isValidInt(queueSize):
+            raise ValueError(f'queueSize argument is malformed: \"{queueSize}\"')
+        elif not utils.isValidInt(spilledStatements):
+            raise ValueError(f'spilledStatements argument is malformed: \"{spilledStatements}\"')
+        elif spilledStatements < 0 or spilledStatements > utils.getLongMaxSafeSize():
+            raise ValueError(f'spilledStatements argument is out of bounds: {spilledStatements}')
+
+        self.__bytesWritten: int = bytesWritten
+        self.__droppedStatements: int = droppedStatements
+        self.__flushDurationHistogram: Dict[float, int] = flushDurationHistogram
+        self.__flushes: int = flushes
+        self.__maxQueueSize: int = maxQueueSize
+        self.__oldestStatementAgeSeconds: Optional[float] = oldestStatementAgeSeconds
+        self.__queueSize: int = queueSize
+        self.__spilledStatements: int = spilledStatements
+
+    def getBytesWritten(self) -> int:
+        return self.__bytesWritten
+
+    def getDroppedStatements(self) -> int:
+        return self.__droppedStatements
+
+    # each key is a bucket's upper bound in seconds (the last one is infinity), and each value is
+    # the number of flushes that took at most that long, but longer than the previous bucket's bound
+    def getFlushDurationHistogram(self) -> Dict[float, int]:
+        return self.__flushDurationHistogram
+
+    def getFlushes(self) -> int:
+        return self.__flushes
+
+    def getMaxQueueSize(self) -> int:
+        return self.__maxQueueSize
+
+    def getOldestStatementAgeSeconds(self) -> Optional[float]:
+        return self.__oldestStatementAgeSeconds
+
+    def getQueueSize(self) -> int:
+        return self.__queueSize
+
+    def getSpilledStatements(self) -> int:
+        return self.__spilledStatements
+
+    def toStr(self) -> str:
+        oldestStatementAgeSeconds = self.__oldestStatementAgeSeconds
+
+        if oldestStatementAgeSeconds is not None:
+            oldestStatementAgeSeconds = round(oldestStatementAgeSeconds, 3)
+
+        flushDurationHistogram = ', '.join(f'<={bound}s: {count}' for bound, count in self.__flushDurationHistogram.items())
+
+        return f'queueSize={self.__queueSize}, maxQueueSize={self.__maxQueueSize}, oldestStatementAgeSeconds={oldestStatementAgeSeconds}, bytesWritten={self.__bytesWritten}, flushes={self.__flushes}, flushDurationHistogram={{{flushDurationHistogram}}}, droppedStatements={self.__droppedStatements}, spilledStatements={self.__spilledStatements}'
@@ -0,0 +1,29 @@
+from enum import Enum, auto
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class LogSinkOverflowPolicy(Enum):
+
+    BLOCK = auto()
+    DROP_OLDEST = auto()
+    SPILL_TO_DISK = auto()
+
+    @classmethod
+    def fromStr(cls, text: str):
+        if not utils.isValidStr(text):
+            raise ValueError(f'text argument is malformed: \"{text}\"')
+
+        text = text.lower()
+
+        if text == 'block':
+            return LogSinkOverflowPolicy.BLOCK
+        elif text == 'drop_oldest':
+            return LogSinkOverflowPolicy.DROP_OLDEST
+        elif text == 'spill_to_disk':
+            return LogSinkOverflowPolicy.SPILL_TO_DISK
+        else:
+            raise ValueError(f'unknown LogSinkOverflowPolicy: \"{text}\"')
@@ -0,0 +1,238 @@
+import asyncio
+import os
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ..logSink import LogSink
+    from ..logSinkOverflowPolicy import LogSinkOverflowPolicy
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from logSink.logSink import LogSink
+    from logSink.logSinkOverflowPolicy import LogSinkOverflowPolicy
+
+
+class TestLogSink():
+
+    def __createLogSink(
+        self,
+        flushThresholdBytes: int = 65536,
+        maxOpenFiles: int = 32,
+        maxQueueSize: int = 65536,
+        overflowPolicy: LogSinkOverflowPolicy = LogSinkOverflowPolicy.DROP_OLDEST,
+        spillFile: str = None
+    ) -> LogSink:
+        return LogSink(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            flushThresholdBytes = flushThresholdBytes,
+            maxOpenFiles = maxOpenFiles,
+            maxQueueSize = maxQueueSize,
+            overflowPolicy = overflowPolicy,
+            spillFile = spillFile
+        )
+
+    def __readLogFile(self, logFile: str) -> str:
+        with open(logFile, encoding = 'utf-8') as file:
+            return file.read()
+
+    @pytest.mark.asyncio
+    async def test_flush(self, tmp_path):
+        logSink = self.__createLogSink()
+        logFile = str(tmp_path / 'smcharles' / '2023' / '04' / '01.log')
+
+        logSink.write(logFile, 'hello\n')
+        logSink.write(logFile, 'world\n')
+        await logSink.flush()
+
+        logSink.write(logFile, 'again\n')
+        await logSink.flush()
+
+        with open(logFile, encoding = 'utf-8') as file:
+            assert file.read() == 'hello\nworld\nagain\n'
+
+        assert logSink.getOpenFilesSize() == 1
+        await logSink.close()
+        assert logSink.getOpenFilesSize() == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_withDeferredStatements(self, tmp_path):
+        logSink = self.__createLogSink()
+        logFile = str(tmp_path / 'timber.log')
+        calls = list()
+
+        def buildStatement() -> str:
+            calls.append(True)
+            return 'built\n'
+
+        logSink.write(logFile, buildStatement)
+        logSink.write(logFile, lambda: 1 / 0)
+        assert len(calls) == 0
+
+        await logSink.flush()
+        assert len(calls) == 1
+
+        with open(logFile, encoding = 'utf-8') as file:
+            lines = file.readlines()
+
+        assert lines[0] == 'built\n'
+        assert lines[1].startswith('LogSink encountered an Exception')
+
+        await logSink.close()
+
+    @pytest.mark.asyncio
+    async def test_flush_withMaxOpenFiles(self, tmp_path):
+        logSink = self.__createLogSink(maxOpenFiles = 2)
+
+        for day in range(1, 6):
+            logSink.write(str(tmp_path / f'{day}.log'), f'day {day}\n')
+
+        await logSink.flush()
+        assert logSink.getOpenFilesSize() == 2
+
+        for day in range(1, 6):
+            with open(tmp_path / f'{day}.log', encoding = 'utf-8') as file:
+                assert file.read() == f'day {day}\n'
+
+        await logSink.close()
+
+    @pytest.mark.asyncio
+    async def test_write_flushesOnceThresholdIsReached(self, tmp_path):
+        logSink = self.__createLogSink(flushThresholdBytes = 10)
+        logSink.start()
+        logFile = str(tmp_path / 'timber.log')
+
+        logSink.write(logFile, 'this is over ten bytes\n')
+        await asyncio.sleep(0.5)
+
+        with open(logFile, encoding = 'utf-8') as file:
+            assert file.read() == 'this is over ten bytes\n'
+
+        await logSink.close()
+
+    @pytest.mark.asyncio
+    async def test_getMetrics(self, tmp_path):
+        logSink = self.__createLogSink()
+        logFile = str(tmp_path / 'timber.log')
+
+        metrics = logSink.getMetrics()
+        assert metrics.getQueueSize() == 0
+        assert metrics.getOldestStatementAgeSeconds() is None
+
+        logSink.write(logFile, 'hello\n')
+        logSink.write(logFile, 'wörld\n')
+        metrics = logSink.getMetrics()
+        assert metrics.getQueueSize() == 2
+        assert metrics.getOldestStatementAgeSeconds() >= 0
+
+        await logSink.flush()
+        metrics = logSink.getMetrics()
+        assert metrics.getQueueSize() == 0
+        assert metrics.getBytesWritten() == 13
+        assert metrics.getFlushes() == 1
+        assert sum(metrics.getFlushDurationHistogram().values()) == 1
+        assert 'bytesWritten=13' in metrics.toStr()
+
+        await logSink.close()
+
+    @pytest.mark.asyncio
+    async def test_write_withBlockOverflowPolicy(self, tmp_path):
+        logSink = self.__createLogSink(maxQueueSize = 2, overflowPolicy = LogSinkOverflowPolicy.BLOCK)
+        logFile = str(tmp_path / 'timber.log')
+
+        for index in range(5):
+            logSink.write(logFile, f'{index}\n')
+
+        # the third and fifth writes had to write the full queue out themselves
+        assert self.__readLogFile(logFile) == '0\n1\n2\n3\n'
+        assert logSink.getMetrics().getQueueSize() == 1
+
+        await logSink.close()
+        assert self.__readLogFile(logFile) == '0\n1\n2\n3\n4\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withDropOldestOverflowPolicy(self, tmp_path):
+        logSink = self.__createLogSink(maxQueueSize = 2)
+        logFile = str(tmp_path / 'timber.log')
+
+        for index in range(5):
+            logSink.write(logFile, f'{index}\n')
+
+        assert logSink.getMetrics().getDroppedStatements() == 3
+
+        await logSink.close()
+        assert self.__readLogFile(logFile) == '3\n4\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withSpillToDiskOverflowPolicy(self, tmp_path):
+        spillFile = str(tmp_path / 'spill' / 'timber.spill')
+        logSink = self.__createLogSink(
+            maxQueueSize = 2,
+            overflowPolicy = LogSinkOverflowPolicy.SPILL_TO_DISK,
+            spillFile = spillFile
+        )
+
+        firstLogFile = str(tmp_path / 'first.log')
+        secondLogFile = str(tmp_path / 'second.log')
+
+        for index in range(5):
+            logSink.write(firstLogFile, f'{index}\n')
+            logSink.write(secondLogFile, lambda: 'deferred\n')
+
+        metrics = logSink.getMetrics()
+        assert metrics.getSpilledStatements() == 8
+        assert metrics.getDroppedStatements() == 0
+        assert metrics.getQueueSize() == 2
+        assert os.path.isfile(spillFile)
+
+        await logSink.close()
+        assert not os.path.isfile(spillFile)
+        assert self.__readLogFile(firstLogFile) == '0\n1\n2\n3\n4\n'
+        assert self.__readLogFile(secondLogFile) == 'deferred\n' * 5
+
+    @pytest.mark.asyncio
+    async def test_write_withSpillToDiskOverflowPolicyDuringFlush(self, tmp_path, monkeypatch):
+        spillFile = str(tmp_path / 'spill' / 'timber.spill')
+        logSink = self.__createLogSink(
+            maxQueueSize = 2,
+            overflowPolicy = LogSinkOverflowPolicy.SPILL_TO_DISK,
+            spillFile = spillFile
+        )
+
+        logFile = str(tmp_path / 'timber.log')
+
+        for index in range(5):
+            logSink.write(logFile, f'a{index}\n')
+
+        remove = os.remove
+        isSpilling = True
+
+        # spills more statements right as the flush is done reading the spill file
+        def removeAfterSpilling(path: str):
+            nonlocal isSpilling
+
+            if isSpilling:
+                isSpilling = False
+
+                for index in range(5):
+                    logSink.write(logFile, f'b{index}\n')
+
+            remove(path)
+
+        monkeypatch.setattr(os, 'remove', removeAfterSpilling)
+        await logSink.flush()
+        monkeypatch.setattr(os, 'remove', remove)
+
+        assert self.__readLogFile(logFile) == 'a0\na1\na2\na3\na4\n'
+        assert os.path.isfile(spillFile)
+
+        metrics = logSink.getMetrics()
+        assert metrics.getSpilledStatements() == 8
+        assert metrics.getDroppedStatements() == 0
+        assert metrics.getQueueSize() == 1
+        assert metrics.getOldestStatementAgeSeconds() is not None
+
+        await logSink.close()
+        assert not os.path.isfile(spillFile)
+        assert not os.path.isfile(f'{spillFile}.flushing')
+        assert self.__readLogFile(logFile) == 'a0\na1\na2\na3\na4\nb0\nb1\nb2\nb3\nb4\n'
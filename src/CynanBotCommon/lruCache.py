@@ -1,106 +1,112 @@
-from typing import Dict, Optional
+import sys
+from typing import Any, Callable, Optional, OrderedDict, Tuple
 
 try:
     import CynanBotCommon.utils as utils
 except:
     import utils
 
-# This class was taken from online:
-# https://gist.github.com/jerryan999/6677a2619e8175e54ed05d3c6e1621cf
-#
-# I then slightly tweaked it for simplifcation... (fingers crossed it works)
-
-
-class LinkedNode():
-
-    def __init__(self, key: str):
-        if not utils.isValidStr(key):
-            raise ValueError(f'key argument is malformed: \"{key}\"')
-
-        self.key: str = key
-        self.next: Optional[LinkedNode] = None
-        self.prev: Optional[LinkedNode] = None
-
 
 class LruCache():
 
-    def __init__(self, capacity: int):
+    def __init__(
+        self,
+        capacity: int,
+        sizeOf: Callable[[Any], int] = sys.getsizeof
+    ):
         if not utils.isValidInt(capacity):
             raise ValueError(f'capacity argument is malformed: \"{capacity}\"')
         elif capacity < 2 or capacity > utils.getIntMaxSafeSize():
             raise ValueError(f'capacity argument is out of bounds: {capacity}')
+        elif not callable(sizeOf):
+            raise ValueError(f'sizeOf argument is malformed: \"{sizeOf}\"')
 
         self.__capacity: int = capacity
-        self.__lookup: Dict[str, Optional[LinkedNode]] = dict()
-        self.__stub: LinkedNode = LinkedNode("stub")
-        self.__head: Optional[LinkedNode] = self.__stub.next
-        self.__tail: Optional[LinkedNode] = self.__stub.next
-
-    def __append_new_node(self, newNode: LinkedNode):
-        """  add the new node to the tail end
-        """
-        if not self.__tail:
-            self.__head = newNode
-            self.__tail = newNode
-        else:
-            self.__tail.next = newNode
-            newNode.prev = self.__tail
-            self.__tail = self.__tail.next
+        self.__sizeOf: Callable[[Any], int] = sizeOf
+
+        # entries are stored as (value, size in bytes), least recently used first
+        self.__entries: OrderedDict[str, Tuple[Optional[Any], int]] = OrderedDict()
+        self.__sizeInBytes: int = 0
+
+        self.__evictions: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+
+    def clear(self):
+        self.__entries.clear()
+        self.__sizeInBytes = 0
 
     def contains(self, key: str) -> bool:
-        if not utils.isValidStr(key) or key not in self.__lookup:
+        if key not in self.__entries:
             return False
 
-        node = self.__lookup[key]
+        self.__entries.move_to_end(key)
+        return True
 
-        if node is not self.__tail:
-            self.__unlink_cur_node(node)
-            self.__append_new_node(node)
+    def __evict(self):
+        while len(self.__entries) > self.__capacity:
+            _, (_, size) = self.__entries.popitem(last = False)
+            self.__sizeInBytes = self.__sizeInBytes - size
+            self.__evictions = self.__evictions + 1
 
-        return True
+    def get(self, key: str) -> Optional[Any]:
+        entry = self.__entries.get(key)
 
-    def put(self, key: str):
-        if not utils.isValidStr(key):
-            raise ValueError(f'key argument is malformed: \"{key}\"')
+        if entry is None:
+            self.__misses = self.__misses + 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.__hits = self.__hits + 1
+        return entry[0]
+
+    def getCapacity(self) -> int:
+        return self.__capacity
+
+    def getEvictions(self) -> int:
+        return self.__evictions
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMisses(self) -> int:
+        return self.__misses
 
-        if key in self.__lookup:
-            self.contains(key)
-            return
+    def getSize(self) -> int:
+        return len(self.__entries)
 
-        if len(self.__lookup) == self.__capacity:
-            # remove head node and corresponding key
-            self.__lookup.pop(self.__head.key)
-            self.__remove_head_node()
+    def getSizeInBytes(self) -> int:
+        return self.__sizeInBytes
 
-        # add new node and hash key
-        newNode: LinkedNode = LinkedNode(key)
-        self.__lookup[key] = newNode
-        self.__append_new_node(newNode)
+    def pop(self, key: str) -> Optional[Any]:
+        entry = self.__entries.pop(key, None)
 
-    def __remove_head_node(self):
-        if not self.__head:
-            return
+        if entry is None:
+            return None
 
-        prev = self.__head
-        self.__head = self.__head.next
+        self.__sizeInBytes = self.__sizeInBytes - entry[1]
+        return entry[0]
 
-        if self.__head:
-            self.__head.prev = None
+    def put(self, key: str, value: Optional[Any] = None):
+        if not utils.isValidStr(key):
+            raise ValueError(f'key argument is malformed: \"{key}\"')
 
-        del prev
+        size = self.__sizeOf(key) + self.__sizeOf(value)
+        oldEntry = self.__entries.get(key)
 
-    def __unlink_cur_node(self, node: LinkedNode):
-        """ unlink current linked node
-        """
-        if self.__head is node:
-            self.__head = node.next
+        if oldEntry is not None:
+            self.__sizeInBytes = self.__sizeInBytes - oldEntry[1]
 
-            if node.next:
-                node.next.prev = None
+        self.__entries[key] = (value, size)
+        self.__entries.move_to_end(key)
+        self.__sizeInBytes = self.__sizeInBytes + size
+        self.__evict()
 
-            return
+    def setCapacity(self, capacity: int):
+        if not utils.isValidInt(capacity):
+            raise ValueError(f'capacity argument is malformed: \"{capacity}\"')
+        elif capacity < 2 or capacity > utils.getIntMaxSafeSize():
+            raise ValueError(f'capacity argument is out of bounds: {capacity}')
 
-        # removing the node from somewhere in the middle; update pointers
-        prev, nex = node.prev, node.next
-        prev.next = nex    
-        nex.prev = prev
+        self.__capacity = capacity
+        self.__evict()
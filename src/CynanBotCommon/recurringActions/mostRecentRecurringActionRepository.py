@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 try:
     import CynanBotCommon.utils as utils
@@ -12,7 +12,6 @@ try:
         RecurringActionType
     from CynanBotCommon.simpleDateTime import SimpleDateTime
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
@@ -25,7 +24,6 @@ except:
     from recurringActions.recurringActionType import RecurringActionType
     from simpleDateTime import SimpleDateTime
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
 
@@ -49,11 +47,7 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         self.__timber: TimberInterface = timber
         self.__timeZone: timezone = timeZone
 
-        self.__isDatabaseReady: bool = False
-
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        self.__registerDatabaseTables()
 
     async def getMostRecentRecurringAction(
         self,
@@ -62,17 +56,15 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT actiontype, datetime FROM mostrecentrecurringaction
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT actiontype, datetime FROM mostrecentrecurringaction
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
         if not utils.hasItems(record):
             return None
@@ -86,15 +78,12 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             twitchChannel = twitchChannel
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
                         actiontype text NOT NULL,
@@ -103,8 +92,8 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
                         actiontype TEXT NOT NULL,
@@ -114,9 +103,12 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'MostRecentRecurringActionRepository',
+            statements = statements
+        )
 
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -125,16 +117,14 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannel)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (twitchchannel) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
-            ''',
-            action.getActionType().toStr(), nowDateTimeStr, action.getTwitchChannel()
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO mostrecentrecurringaction (actiontype, datetime, twitchchannel)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (twitchchannel) DO UPDATE SET actiontype = EXCLUDED.actiontype, datetime = EXCLUDED.datetime
+                ''',
+                action.getActionType().toStr(), nowDateTimeStr, action.getTwitchChannel()
+            )
 
         self.__timber.log('MostRecentRecurringActionRepository', f'Updated \"{action.getActionType()}\" for \"{action.getTwitchChannel()}\" ({nowDateTimeStr})')
@@ -16,7 +16,6 @@ try:
     from CynanBotCommon.recurringActions.wordOfTheDayRecurringAction import \
         WordOfTheDayRecurringAction
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
 except:
@@ -33,7 +32,6 @@ except:
     from recurringActions.wordOfTheDayRecurringAction import \
         WordOfTheDayRecurringAction
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
 
@@ -57,7 +55,7 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__recurringActionsJsonParser: RecurringActionsJsonParserInterface = recurringActionsJsonParser
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def getAllRecurringActions(
         self,
@@ -82,10 +80,6 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
 
         return recurringActions
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def __getRecurringAction(
         self,
         actionType: RecurringActionType,
@@ -96,17 +90,15 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
-                WHERE actiontype = $1 AND twitchchannel = $2
-                LIMIT 1
-            ''',
-            actionType.toStr(), twitchChannel
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT configurationjson, isenabled, minutesbetween FROM recurringactions
+                    WHERE actiontype = $1 AND twitchchannel = $2
+                    LIMIT 1
+                ''',
+                actionType.toStr(), twitchChannel
+            )
 
         if utils.hasItems(record):
             return record
@@ -179,15 +171,12 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
             twitchChannel = twitchChannel
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS recurringactions (
                         actiontype text NOT NULL,
@@ -199,8 +188,8 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS recurringactions (
                         actiontype TEXT NOT NULL,
@@ -213,9 +202,12 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'RecurringActionsRepository',
+            statements = statements
+        )
 
     async def setRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
@@ -237,14 +229,12 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
     ):
         isEnabled = utils.boolToNum(action.isEnabled())
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannel)
-                VALUES ($1, $2, $3, $4, $5)
-                ON CONFLICT (actiontype, twitchchannel) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
-            ''',
-            action.getActionType().toStr(), configurationJson, isEnabled, action.getMinutesBetween(), action.getTwitchChannel()
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO recurringactions (actiontype, configurationjson, isenabled, minutesbetween, twitchchannel)
+                    VALUES ($1, $2, $3, $4, $5)
+                    ON CONFLICT (actiontype, twitchchannel) DO UPDATE SET configurationjson = EXCLUDED.configurationjson, isenabled = EXCLUDED.isenabled, minutesbetween = EXCLUDED.minutesbetween
+                ''',
+                action.getActionType().toStr(), configurationJson, isEnabled, action.getMinutesBetween(), action.getTwitchChannel()
+            )
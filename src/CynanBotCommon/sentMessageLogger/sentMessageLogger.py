@@ -1,22 +1,21 @@
-import asyncio
-import queue
-from collections import defaultdict
-from queue import SimpleQueue
-from typing import Dict, List, Optional
-
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
+from typing import List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.logSink.logSink import LogSink
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+    from CynanBotCommon.logSink.logSinkOverflowPolicy import \
+        LogSinkOverflowPolicy
     from CynanBotCommon.sentMessageLogger.sentMessage import SentMessage
     from CynanBotCommon.sentMessageLogger.sentMessageLoggerInterface import \
         SentMessageLoggerInterface
 except:
     import utils
     from backgroundTaskHelper import BackgroundTaskHelper
+    from logSink.logSink import LogSink
+    from logSink.logSinkMetrics import LogSinkMetrics
+    from logSink.logSinkOverflowPolicy import LogSinkOverflowPolicy
     from sentMessageLogger.sentMessage import SentMessage
     from sentMessageLogger.sentMessageLoggerInterface import \
         SentMessageLoggerInterface
@@ -28,7 +27,9 @@ class SentMessageLogger(SentMessageLoggerInterface):
         self,
         backgroundTaskHelper: BackgroundTaskHelper,
         sleepTimeSeconds: float = 15,
-        logRootDirectory: str = 'CynanBotCommon/sentMessageLogger'
+        logRootDirectory: str = 'CynanBotCommon/sentMessageLogger',
+        maxQueueSize: int = 65536,
+        overflowPolicy: LogSinkOverflowPolicy = LogSinkOverflowPolicy.DROP_OLDEST
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
             raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -38,12 +39,35 @@ class SentMessageLogger(SentMessageLoggerInterface):
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
         elif not utils.isValidStr(logRootDirectory):
             raise ValueError(f'logRootDirectory argument is malformed: \"{logRootDirectory}\"')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not isinstance(overflowPolicy, LogSinkOverflowPolicy):
+            raise ValueError(f'overflowPolicy argument is malformed: \"{overflowPolicy}\"')
 
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__logRootDirectory: str = logRootDirectory
 
-        self.__messageQueue: SimpleQueue[SentMessage] = SimpleQueue()
-        backgroundTaskHelper.createTask(self.__startMessageLoop())
+        self.__logSink: LogSink = LogSink(
+            backgroundTaskHelper = backgroundTaskHelper,
+            maxFlushDelaySeconds = sleepTimeSeconds,
+            maxQueueSize = maxQueueSize,
+            overflowPolicy = overflowPolicy,
+            spillFile = f'{logRootDirectory}/sentMessageLogger.spill'
+        )
+
+        self.__logSink.start()
+
+    def __getLogFile(self, message: SentMessage) -> str:
+        if not isinstance(message, SentMessage):
+            raise ValueError(f'message argument is malformed: \"{message}\"')
+
+        twitchChannel = message.getTwitchChannel().lower()
+        simpleDateTime = message.getSimpleDateTime()
+        return f'{self.__logRootDirectory}/{twitchChannel}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}/{simpleDateTime.getDayStr()}.log'
+
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        return self.__logSink.getMetrics()
 
     def __getLogStatement(self, message: SentMessage) -> str:
         if not isinstance(message, SentMessage):
@@ -87,44 +111,4 @@ class SentMessageLogger(SentMessageLoggerInterface):
             twitchChannel = twitchChannel
         )
 
-        self.__messageQueue.put(sentMessage)
-
-    async def __startMessageLoop(self):
-        while True:
-            messages: List[SentMessage] = list()
-
-            try:
-                while not self.__messageQueue.empty():
-                    message = self.__messageQueue.get_nowait()
-                    messages.append(message)
-            except queue.Empty:
-                pass
-
-            await self.__writeToLogFiles(messages)
-            await asyncio.sleep(self.__sleepTimeSeconds)
-
-    async def __writeToLogFiles(self, messages: List[SentMessage]):
-        if len(messages) == 0:
-            return
-
-        # The below logic is kind of intense, however, there is a very similar/nearly identical
-        # flow within the Timber class. Check that out for more information and context.
-
-        structure: Dict[str, Dict[str, List[SentMessage]]] = defaultdict(lambda: defaultdict(lambda: list()))
-
-        for message in messages:
-            twitchChannel = message.getTwitchChannel().lower()
-            simpleDateTime = message.getSimpleDateTime()
-            messageDirectory = f'{self.__logRootDirectory}/{twitchChannel}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}'
-            messageFile = f'{messageDirectory}/{simpleDateTime.getDayStr()}.log'
-            structure[messageDirectory][messageFile].append(message)
-
-        for messageDirectory, messageFileToMessagesDict in structure.items():
-            if not await aiofiles.ospath.exists(messageDirectory):
-                await aiofiles.os.makedirs(messageDirectory)
-
-            for messageFile, messagesList in messageFileToMessagesDict.items():
-                async with aiofiles.open(messageFile, mode = 'a', encoding = 'utf-8') as file:
-                    for message in messagesList:
-                        logStatement = self.__getLogStatement(message)
-                        await file.write(logStatement)
+        self.__logSink.write(self.__getLogFile(sentMessage), self.__getLogStatement(sentMessage))
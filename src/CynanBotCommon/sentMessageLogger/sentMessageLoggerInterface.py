@@ -1,9 +1,18 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+try:
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+except:
+    from logSink.logSinkMetrics import LogSinkMetrics
+
 
 class SentMessageLoggerInterface(ABC):
 
+    @abstractmethod
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        pass
+
     @abstractmethod
     def log(
         self,
@@ -2,14 +2,24 @@ from abc import ABC, abstractmethod
 
 try:
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseSchemaRegistry import \
+        DatabaseSchemaRegistry
+    from CynanBotCommon.storage.databaseStatementCache import \
+        DatabaseStatementCache
     from CynanBotCommon.storage.databaseType import DatabaseType
 except:
     from storage.databaseConnection import DatabaseConnection
+    from storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+    from storage.databaseStatementCache import DatabaseStatementCache
     from storage.databaseType import DatabaseType
 
 
 class BackingDatabase(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @abstractmethod
     async def getConnection(self) -> DatabaseConnection:
         pass
@@ -17,3 +27,11 @@ class BackingDatabase(ABC):
     @abstractmethod
     def getDatabaseType(self) -> DatabaseType:
         pass
+
+    @abstractmethod
+    def getSchemaRegistry(self) -> DatabaseSchemaRegistry:
+        pass
+
+    @abstractmethod
+    def getStatementCache(self) -> DatabaseStatementCache:
+        pass
@@ -6,6 +6,10 @@ import asyncpg
 try:
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseSchemaRegistry import \
+        DatabaseSchemaRegistry
+    from CynanBotCommon.storage.databaseStatementCache import \
+        DatabaseStatementCache
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.storage.psqlCredentialsProvider import \
         PsqlCredentialsProvider
@@ -14,6 +18,8 @@ try:
 except:
     from storage.backingDatabase import BackingDatabase
     from storage.databaseConnection import DatabaseConnection
+    from storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+    from storage.databaseStatementCache import DatabaseStatementCache
     from storage.databaseType import DatabaseType
     from storage.psqlCredentialsProvider import PsqlCredentialsProvider
     from storage.psqlDatabaseConnection import PsqlDatabaseConnection
@@ -35,6 +41,17 @@ class BackingPsqlDatabase(BackingDatabase):
         self.__psqlCredentialsProvider: PsqlCredentialsProvider = psqlCredentialsProvider
 
         self.__connectionPool: Optional[asyncpg.Pool] = None
+        self.__schemaRegistry: DatabaseSchemaRegistry = DatabaseSchemaRegistry()
+        self.__statementCache: DatabaseStatementCache = DatabaseStatementCache()
+
+    async def close(self):
+        connectionPool = self.__connectionPool
+
+        if connectionPool is None:
+            return
+
+        self.__connectionPool = None
+        await connectionPool.close()
 
     async def __createCollations(self, databaseConnection: DatabaseConnection):
         if not isinstance(databaseConnection, DatabaseConnection):
@@ -64,13 +81,27 @@ class BackingPsqlDatabase(BackingDatabase):
 
         databaseConnection: DatabaseConnection = PsqlDatabaseConnection(
             connection = connection,
-            pool = self.__connectionPool
+            pool = self.__connectionPool,
+            statementCache = self.__statementCache
         )
 
-        if connectionPoolCreated:
-            await self.__createCollations(databaseConnection)
+        try:
+            if connectionPoolCreated:
+                await self.__createCollations(databaseConnection)
+
+            if self.__schemaRegistry.hasPendingSchemas():
+                await self.__schemaRegistry.migrate(databaseConnection)
+        except:
+            await databaseConnection.close()
+            raise
 
         return databaseConnection
 
     def getDatabaseType(self) -> DatabaseType:
         return DatabaseType.POSTGRESQL
+
+    def getSchemaRegistry(self) -> DatabaseSchemaRegistry:
+        return self.__schemaRegistry
+
+    def getStatementCache(self) -> DatabaseStatementCache:
+        return self.__statementCache
@@ -1,19 +1,26 @@
 from asyncio import AbstractEventLoop
 
-import aiosqlite
-
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseSchemaRegistry import \
+        DatabaseSchemaRegistry
+    from CynanBotCommon.storage.databaseStatementCache import \
+        DatabaseStatementCache
     from CynanBotCommon.storage.databaseType import DatabaseType
+    from CynanBotCommon.storage.sqliteConnectionPool import \
+        SqliteConnectionPool
     from CynanBotCommon.storage.sqliteDatabaseConnection import \
         SqliteDatabaseConnection
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
     from storage.databaseConnection import DatabaseConnection
+    from storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+    from storage.databaseStatementCache import DatabaseStatementCache
     from storage.databaseType import DatabaseType
+    from storage.sqliteConnectionPool import SqliteConnectionPool
     from storage.sqliteDatabaseConnection import SqliteDatabaseConnection
 
 
@@ -22,21 +29,51 @@ class BackingSqliteDatabase(BackingDatabase):
     def __init__(
         self,
         eventLoop: AbstractEventLoop,
-        backingDatabaseFile: str = 'CynanBotCommon/storage/database.sqlite'
+        backingDatabaseFile: str = 'CynanBotCommon/storage/database.sqlite',
+        maxConnections: int = 8,
+        idleTimeoutSeconds: float = 300
     ):
         if not isinstance(eventLoop, AbstractEventLoop):
             raise ValueError(f'eventLoop argument is malformed: \"{eventLoop}\"')
         elif not utils.isValidStr(backingDatabaseFile):
             raise ValueError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
 
-        self.__eventLoop: AbstractEventLoop = eventLoop
-        self.__backingDatabaseFile: str = backingDatabaseFile
+        self.__connectionPool: SqliteConnectionPool = SqliteConnectionPool(
+            eventLoop = eventLoop,
+            databaseFile = backingDatabaseFile,
+            maxConnections = maxConnections,
+            idleTimeoutSeconds = idleTimeoutSeconds
+        )
+
+        self.__schemaRegistry: DatabaseSchemaRegistry = DatabaseSchemaRegistry()
+        self.__statementCache: DatabaseStatementCache = DatabaseStatementCache()
+
+    async def close(self):
+        await self.__connectionPool.close()
 
     async def getConnection(self) -> DatabaseConnection:
-        return SqliteDatabaseConnection(await aiosqlite.connect(
-            database = self.__backingDatabaseFile,
-            loop = self.__eventLoop
-        ))
+        connection = await self.__connectionPool.acquire()
+
+        databaseConnection: DatabaseConnection = SqliteDatabaseConnection(
+            connection = connection,
+            pool = self.__connectionPool,
+            statementCache = self.__statementCache
+        )
+
+        if self.__schemaRegistry.hasPendingSchemas():
+            try:
+                await self.__schemaRegistry.migrate(databaseConnection)
+            except:
+                await databaseConnection.close()
+                raise
+
+        return databaseConnection
 
     def getDatabaseType(self) -> DatabaseType:
         return DatabaseType.SQLITE
+
+    def getSchemaRegistry(self) -> DatabaseSchemaRegistry:
+        return self.__schemaRegistry
+
+    def getStatementCache(self) -> DatabaseStatementCache:
+        return self.__statementCache
@@ -1,14 +1,22 @@
 from abc import ABC, abstractmethod
-from typing import Any, List, Optional
+from typing import Any, AsyncContextManager, List, Optional, Union
 
 try:
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
     from CynanBotCommon.storage.databaseType import DatabaseType
 except:
+    from storage.databaseStatement import DatabaseStatement
     from storage.databaseType import DatabaseType
 
 
 class DatabaseConnection(ABC):
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, excType, excValue, traceback):
+        await self.close()
+
     @abstractmethod
     async def close(self):
         pass
@@ -18,15 +26,19 @@ class DatabaseConnection(ABC):
         pass
 
     @abstractmethod
-    async def execute(self, query: str, *args: Optional[Any]):
+    async def execute(self, query: Union[str, DatabaseStatement], *args: Optional[Any]):
+        pass
+
+    @abstractmethod
+    async def executeMany(self, query: Union[str, DatabaseStatement], argsList: List[List[Any]]):
         pass
 
     @abstractmethod
-    async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
+    async def fetchRow(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[Any]]:
         pass
 
     @abstractmethod
-    async def fetchRows(self, query: str, *args: Optional[Any]) -> Optional[List[List[Any]]]:
+    async def fetchRows(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[List[Any]]]:
         pass
 
     @abstractmethod
@@ -36,3 +48,7 @@ class DatabaseConnection(ABC):
     @abstractmethod
     def isClosed(self) -> bool:
         pass
+
+    @abstractmethod
+    def transaction(self) -> AsyncContextManager[None]:
+        pass
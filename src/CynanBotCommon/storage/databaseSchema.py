@@ -0,0 +1,37 @@
+from typing import List
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class DatabaseSchema():
+
+    def __init__(
+        self,
+        name: str,
+        statements: List[str],
+        version: int
+    ):
+        if not utils.isValidStr(name):
+            raise ValueError(f'name argument is malformed: \"{name}\"')
+        elif not utils.hasItems(statements) or not utils.areValidStrs(statements):
+            raise ValueError(f'statements argument is malformed: \"{statements}\"')
+        elif not utils.isValidInt(version):
+            raise ValueError(f'version argument is malformed: \"{version}\"')
+        elif version < 1 or version > utils.getIntMaxSafeSize():
+            raise ValueError(f'version argument is out of bounds: {version}')
+
+        self.__name: str = name
+        self.__statements: List[str] = statements
+        self.__version: int = version
+
+    def getName(self) -> str:
+        return self.__name
+
+    def getStatements(self) -> List[str]:
+        return self.__statements
+
+    def getVersion(self) -> int:
+        return self.__version
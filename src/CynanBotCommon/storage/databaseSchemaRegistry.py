@@ -0,0 +1,108 @@
+import asyncio
+from typing import Dict, List, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseSchema import DatabaseSchema
+except:
+    import utils
+    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseSchema import DatabaseSchema
+
+
+class DatabaseSchemaRegistry():
+
+    def __init__(self):
+        self.__lock: Optional[asyncio.Lock] = None
+        self.__pendingSchemas: Dict[str, DatabaseSchema] = dict()
+        self.__schemas: Dict[str, DatabaseSchema] = dict()
+
+    def __getLock(self) -> asyncio.Lock:
+        lock = self.__lock
+
+        if lock is None:
+            lock = asyncio.Lock()
+            self.__lock = lock
+
+        return lock
+
+    def getSchemas(self) -> List[DatabaseSchema]:
+        return list(self.__schemas.values())
+
+    def hasPendingSchemas(self) -> bool:
+        return len(self.__pendingSchemas) >= 1
+
+    async def migrate(self, connection: DatabaseConnection):
+        if not isinstance(connection, DatabaseConnection):
+            raise ValueError(f'connection argument is malformed: \"{connection}\"')
+
+        async with self.__getLock():
+            if not self.hasPendingSchemas():
+                return
+
+            pendingSchemas = list(self.__pendingSchemas.values())
+
+            async with connection.transaction():
+                await connection.execute(
+                    '''
+                        CREATE TABLE IF NOT EXISTS databaseschemas (
+                            name TEXT NOT NULL PRIMARY KEY,
+                            version INTEGER NOT NULL
+                        )
+                    '''
+                )
+
+                records = await connection.fetchRows(
+                    '''
+                        SELECT name, version FROM databaseschemas
+                    '''
+                )
+
+                installedVersions: Dict[str, int] = dict()
+
+                if utils.hasItems(records):
+                    for record in records:
+                        installedVersions[record[0]] = record[1]
+
+                for schema in pendingSchemas:
+                    if installedVersions.get(schema.getName(), 0) >= schema.getVersion():
+                        continue
+
+                    for statement in schema.getStatements():
+                        await connection.execute(statement)
+
+                    await connection.execute(
+                        '''
+                            INSERT INTO databaseschemas (name, version)
+                            VALUES ($1, $2)
+                            ON CONFLICT (name) DO UPDATE SET version = EXCLUDED.version
+                        ''',
+                        schema.getName(), schema.getVersion()
+                    )
+
+            for schema in pendingSchemas:
+                self.__pendingSchemas.pop(schema.getName(), None)
+
+    def register(
+        self,
+        name: str,
+        statements: List[str],
+        version: int = 1
+    ):
+        schema = DatabaseSchema(
+            name = name,
+            statements = statements,
+            version = version
+        )
+
+        existingSchema = self.__schemas.get(name, None)
+
+        if existingSchema is not None:
+            if existingSchema.getVersion() == version and existingSchema.getStatements() == statements:
+                return
+
+            raise ValueError(f'A different schema has already been registered under the name \"{name}\"')
+
+        self.__schemas[name] = schema
+        self.__pendingSchemas[name] = schema
@@ -0,0 +1,25 @@
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class DatabaseStatement():
+
+    def __init__(self, name: str, query: str):
+        if not utils.isValidStr(name):
+            raise ValueError(f'name argument is malformed: \"{name}\"')
+        elif not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
+
+        self.__name: str = name
+        self.__query: str = query
+
+    def getName(self) -> str:
+        return self.__name
+
+    def getQuery(self) -> str:
+        return self.__query
+
+    def __repr__(self) -> str:
+        return self.__name
@@ -0,0 +1,73 @@
+import re
+from typing import Dict, Pattern, Set
+
+try:
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
+except:
+    from storage.databaseStatement import DatabaseStatement
+
+
+class DatabaseStatementCache():
+
+    def __init__(self):
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__placeholderRegEx: Pattern = re.compile(r'\$(\d+)')
+        self.__psqlQueries: Set[str] = set()
+        self.__registeredQueries: Dict[str, str] = dict()
+        self.__sqliteQueries: Dict[str, str] = dict()
+
+    def getHits(self) -> int:
+        return self.__hits
+
+    def getMisses(self) -> int:
+        return self.__misses
+
+    def getPsqlQuery(self, statement: DatabaseStatement) -> str:
+        if not isinstance(statement, DatabaseStatement):
+            raise ValueError(f'statement argument is malformed: \"{statement}\"')
+
+        self.__requireRegistered(statement)
+
+        # A miss is the first time that a statement is looked up, and every lookup after that is
+        # a hit. asyncpg prepares each statement once per pooled connection, so there can be a
+        # few more prepares than misses, but the hit rate still shows how often statements are reused.
+        if statement.getName() in self.__psqlQueries:
+            self.__hits = self.__hits + 1
+        else:
+            self.__misses = self.__misses + 1
+            self.__psqlQueries.add(statement.getName())
+
+        # asyncpg already keeps an LRU cache of prepared statements on every connection,
+        # keyed by the query text (see the statement_cache_size pool argument). Holding on
+        # to PreparedStatement objects ourselves would break as soon as the connection is
+        # released back to the pool, so PostgreSQL simply gets the query text.
+        return statement.getQuery()
+
+    def getSqliteQuery(self, statement: DatabaseStatement) -> str:
+        if not isinstance(statement, DatabaseStatement):
+            raise ValueError(f'statement argument is malformed: \"{statement}\"')
+
+        self.__requireRegistered(statement)
+        sqliteQuery = self.__sqliteQueries.get(statement.getName(), None)
+
+        if sqliteQuery is not None:
+            self.__hits = self.__hits + 1
+            return sqliteQuery
+
+        self.__misses = self.__misses + 1
+
+        # SQLite understands numbered "?NNN" parameters, which bind positionally just like
+        # the "$1" style parameters that our queries are written with for PostgreSQL
+        sqliteQuery = self.__placeholderRegEx.sub(r'?\1', statement.getQuery())
+        self.__sqliteQueries[statement.getName()] = sqliteQuery
+
+        return sqliteQuery
+
+    def __requireRegistered(self, statement: DatabaseStatement):
+        registeredQuery = self.__registeredQueries.get(statement.getName(), None)
+
+        if registeredQuery is None:
+            self.__registeredQueries[statement.getName()] = statement.getQuery()
+        elif registeredQuery != statement.getQuery():
+            raise ValueError(f'A different query has already been registered under the name \"{statement.getName()}\"')
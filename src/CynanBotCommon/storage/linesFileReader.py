@@ -21,6 +21,12 @@ class LinesFileReader(LinesReaderInterface):
 
         self.__fileName: str = fileName
 
+    async def getModificationTimeAsync(self) -> Optional[float]:
+        if not await aiofiles.ospath.exists(self.__fileName):
+            return None
+
+        return await aiofiles.ospath.getmtime(self.__fileName)
+
     def readLines(self) -> Optional[List[str]]:
         if not os.path.exists(self.__fileName):
             raise FileNotFoundError(f'File not found: \"{self.__fileName}\"')
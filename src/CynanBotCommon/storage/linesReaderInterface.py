@@ -4,6 +4,10 @@ from typing import List, Optional
 
 class LinesReaderInterface(ABC):
 
+    @abstractmethod
+    async def getModificationTimeAsync(self) -> Optional[float]:
+        pass
+
     @abstractmethod
     def readLines(self) -> Optional[List[str]]:
         pass
@@ -12,6 +12,10 @@ class LinesStaticReader(LinesReaderInterface):
     def __init__(self, lines: Optional[List[str]]):
         self.__lines: Optional[List[str]] = lines
 
+    async def getModificationTimeAsync(self) -> Optional[float]:
+        # static lines can never change, so there is no modification time
+        return None
+
     def readLines(self) -> Optional[List[str]]:
         return self.__lines
 
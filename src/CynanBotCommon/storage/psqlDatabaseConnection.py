@@ -1,32 +1,47 @@
-from typing import Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional, Union
 
 import asyncpg
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
+    from CynanBotCommon.storage.databaseStatementCache import \
+        DatabaseStatementCache
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.storage.exceptions import \
         DatabaseConnectionIsClosedException
 except:
     import utils
     from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
+    from storage.databaseStatementCache import DatabaseStatementCache
     from storage.databaseType import DatabaseType
     from storage.exceptions import DatabaseConnectionIsClosedException
 
 
 class PsqlDatabaseConnection(DatabaseConnection):
 
-    def __init__(self, connection: asyncpg.Connection, pool: asyncpg.Pool):
+    def __init__(
+        self,
+        connection: asyncpg.Connection,
+        pool: asyncpg.Pool,
+        statementCache: DatabaseStatementCache
+    ):
         if not isinstance(connection, asyncpg.Connection):
             raise ValueError(f'connection argument is malformed: \"{connection}\"')
         elif not isinstance(pool, asyncpg.Pool):
             raise ValueError(f'pool argument is malformed: \"{pool}\"')
+        elif not isinstance(statementCache, DatabaseStatementCache):
+            raise ValueError(f'statementCache argument is malformed: \"{statementCache}\"')
 
         self.__connection: asyncpg.Connection = connection
         self.__pool: asyncpg.Pool = pool
+        self.__statementCache: DatabaseStatementCache = statementCache
 
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.isClosed():
@@ -46,33 +61,55 @@ class PsqlDatabaseConnection(DatabaseConnection):
         else:
             await self.execute(query)
 
-    async def execute(self, query: str, *args: Optional[Any]):
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
+    async def execute(self, query: Union[str, DatabaseStatement], *args: Optional[Any]):
+        self.__requireValidQuery(query)
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            await self.__execute(query, *args)
+        else:
+            async with self.__connection.transaction():
+                await self.__execute(query, *args)
+
+    async def __execute(self, query: Union[str, DatabaseStatement], *args: Optional[Any]):
+        await self.__connection.execute(self.__toQueryText(query), *args)
+
+    async def executeMany(self, query: Union[str, DatabaseStatement], argsList: List[List[Any]]):
+        self.__requireValidQuery(query)
+
+        if not isinstance(argsList, List):
+            raise ValueError(f'argsList argument is malformed: \"{argsList}\"')
 
         self.__requireNotClosed()
 
-        async with self.__connection.transaction():
-            await self.__connection.execute(query, *args)
+        if len(argsList) == 0:
+            return
 
-    async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
+        if self.__isInTransaction:
+            await self.__executeMany(query, argsList)
+        else:
+            async with self.__connection.transaction():
+                await self.__executeMany(query, argsList)
+
+    async def __executeMany(self, query: Union[str, DatabaseStatement], argsList: List[List[Any]]):
+        await self.__connection.executemany(self.__toQueryText(query), argsList)
 
+    async def fetchRow(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[Any]]:
+        self.__requireValidQuery(query)
         self.__requireNotClosed()
-        record = await self.__connection.fetchrow(query, *args)
+
+        record = await self.__connection.fetchrow(self.__toQueryText(query), *args)
 
         if not utils.hasItems(record):
             return None
 
         return list(record)
 
-    async def fetchRows(self, query: str, *args: Optional[Any]) -> Optional[List[List[Any]]]:
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
-
+    async def fetchRows(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[List[Any]]]:
+        self.__requireValidQuery(query)
         self.__requireNotClosed()
-        records = await self.__connection.fetch(query, *args)
+
+        records = await self.__connection.fetch(self.__toQueryText(query), *args)
 
         if not utils.hasItems(records):
             return None
@@ -93,3 +130,30 @@ class PsqlDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.isClosed():
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    def __requireValidQuery(self, query: Union[str, DatabaseStatement]):
+        if not isinstance(query, DatabaseStatement) and not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
+
+    def __toQueryText(self, query: Union[str, DatabaseStatement]) -> str:
+        if isinstance(query, DatabaseStatement):
+            return self.__statementCache.getPsqlQuery(query)
+        else:
+            return query
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions simply join the outermost one
+            yield
+            return
+
+        self.__isInTransaction = True
+
+        try:
+            async with self.__connection.transaction():
+                yield
+        finally:
+            self.__isInTransaction = False
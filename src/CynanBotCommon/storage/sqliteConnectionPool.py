@@ -0,0 +1,183 @@
+import asyncio
+import time
+from asyncio import AbstractEventLoop
+from collections import deque
+from typing import Deque, List, Optional, Tuple
+
+import aiosqlite
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class SqliteConnectionPool():
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        databaseFile: str,
+        maxConnections: int = 8,
+        healthCheckAfterSeconds: float = 60,
+        idleTimeoutSeconds: float = 300,
+        pragmas: Optional[List[str]] = None
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise ValueError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not utils.isValidStr(databaseFile):
+            raise ValueError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+        elif not utils.isValidInt(maxConnections):
+            raise ValueError(f'maxConnections argument is malformed: \"{maxConnections}\"')
+        elif maxConnections < 1 or maxConnections > 64:
+            raise ValueError(f'maxConnections argument is out of bounds: {maxConnections}')
+        elif not utils.isValidNum(healthCheckAfterSeconds):
+            raise ValueError(f'healthCheckAfterSeconds argument is malformed: \"{healthCheckAfterSeconds}\"')
+        elif healthCheckAfterSeconds < 0 or healthCheckAfterSeconds > utils.getIntMaxSafeSize():
+            raise ValueError(f'healthCheckAfterSeconds argument is out of bounds: {healthCheckAfterSeconds}')
+        elif not utils.isValidNum(idleTimeoutSeconds):
+            raise ValueError(f'idleTimeoutSeconds argument is malformed: \"{idleTimeoutSeconds}\"')
+        elif idleTimeoutSeconds < 1 or idleTimeoutSeconds > utils.getIntMaxSafeSize():
+            raise ValueError(f'idleTimeoutSeconds argument is out of bounds: {idleTimeoutSeconds}')
+        elif pragmas is not None and not isinstance(pragmas, List):
+            raise ValueError(f'pragmas argument is malformed: \"{pragmas}\"')
+
+        if pragmas is None:
+            pragmas = [
+                'PRAGMA journal_mode = WAL',
+                'PRAGMA synchronous = NORMAL',
+                'PRAGMA temp_store = MEMORY'
+            ]
+
+        self.__eventLoop: AbstractEventLoop = eventLoop
+        self.__databaseFile: str = databaseFile
+        self.__maxConnections: int = maxConnections
+        self.__healthCheckAfterSeconds: float = healthCheckAfterSeconds
+        self.__idleTimeoutSeconds: float = idleTimeoutSeconds
+        self.__pragmas: List[str] = pragmas
+
+        self.__isClosed: bool = False
+        self.__openConnections: int = 0
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+
+        # idle connections are stored alongside the monotonic time at which they were released,
+        # oldest on the left and most recently used on the right
+        self.__idleConnections: Deque[Tuple[aiosqlite.Connection, float]] = deque()
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self.__isClosed:
+            raise RuntimeError(f'This SqliteConnectionPool has already been closed! (\"{self.__databaseFile}\")')
+
+        semaphore = self.__getSemaphore()
+        await semaphore.acquire()
+
+        try:
+            await self.__closeExpiredConnections()
+
+            while len(self.__idleConnections) >= 1:
+                connection, releaseTime = self.__idleConnections.pop()
+
+                if time.monotonic() - releaseTime < self.__healthCheckAfterSeconds:
+                    return connection
+                elif await self.__isHealthy(connection):
+                    return connection
+
+                await self.__closeConnection(connection)
+
+            return await self.__createConnection()
+        except:
+            semaphore.release()
+            raise
+
+    async def close(self):
+        if self.__isClosed:
+            return
+
+        self.__isClosed = True
+
+        while len(self.__idleConnections) >= 1:
+            connection, _ = self.__idleConnections.popleft()
+            await self.__closeConnection(connection)
+
+    async def __closeConnection(self, connection: aiosqlite.Connection):
+        self.__openConnections = self.__openConnections - 1
+
+        try:
+            await connection.close()
+        except:
+            pass
+
+    async def __closeExpiredConnections(self):
+        now = time.monotonic()
+
+        while len(self.__idleConnections) >= 1 and now - self.__idleConnections[0][1] >= self.__idleTimeoutSeconds:
+            connection, _ = self.__idleConnections.popleft()
+            await self.__closeConnection(connection)
+
+    async def __createConnection(self) -> aiosqlite.Connection:
+        connection = await aiosqlite.connect(
+            database = self.__databaseFile,
+            loop = self.__eventLoop
+        )
+
+        self.__openConnections = self.__openConnections + 1
+
+        try:
+            for pragma in self.__pragmas:
+                cursor = await connection.execute(pragma)
+                await cursor.close()
+        except:
+            await self.__closeConnection(connection)
+            raise
+
+        return connection
+
+    def getIdleConnectionsSize(self) -> int:
+        return len(self.__idleConnections)
+
+    def getMaxConnections(self) -> int:
+        return self.__maxConnections
+
+    def getOpenConnectionsSize(self) -> int:
+        return self.__openConnections
+
+    def __getSemaphore(self) -> asyncio.Semaphore:
+        semaphore = self.__semaphore
+
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.__maxConnections)
+            self.__semaphore = semaphore
+
+        return semaphore
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    async def __isHealthy(self, connection: aiosqlite.Connection) -> bool:
+        try:
+            cursor = await connection.execute('SELECT 1')
+            row = await cursor.fetchone()
+            await cursor.close()
+            return utils.hasItems(row)
+        except:
+            return False
+
+    async def release(self, connection: aiosqlite.Connection):
+        if not isinstance(connection, aiosqlite.Connection):
+            raise ValueError(f'connection argument is malformed: \"{connection}\"')
+
+        try:
+            if self.__isClosed:
+                await self.__closeConnection(connection)
+                return
+
+            try:
+                if connection.in_transaction:
+                    await connection.rollback()
+            except:
+                await self.__closeConnection(connection)
+                return
+
+            self.__idleConnections.append((connection, time.monotonic()))
+        finally:
+            self.__getSemaphore().release()
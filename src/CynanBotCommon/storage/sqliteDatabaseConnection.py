@@ -1,35 +1,63 @@
-from typing import Any, List, Optional
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, List, Optional, Union
 
 import aiosqlite
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
+    from CynanBotCommon.storage.databaseStatementCache import \
+        DatabaseStatementCache
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.storage.exceptions import \
         DatabaseConnectionIsClosedException
+    from CynanBotCommon.storage.sqliteConnectionPool import \
+        SqliteConnectionPool
 except:
     import utils
     from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
+    from storage.databaseStatementCache import DatabaseStatementCache
     from storage.databaseType import DatabaseType
     from storage.exceptions import DatabaseConnectionIsClosedException
+    from storage.sqliteConnectionPool import SqliteConnectionPool
 
 
 class SqliteDatabaseConnection(DatabaseConnection):
 
-    def __init__(self, connection: aiosqlite.Connection):
+    def __init__(
+        self,
+        connection: aiosqlite.Connection,
+        pool: SqliteConnectionPool,
+        statementCache: DatabaseStatementCache
+    ):
         if not isinstance(connection, aiosqlite.Connection):
             raise ValueError(f'connection argument is malformed: \"{connection}\"')
+        elif not isinstance(pool, SqliteConnectionPool):
+            raise ValueError(f'pool argument is malformed: \"{pool}\"')
+        elif not isinstance(statementCache, DatabaseStatementCache):
+            raise ValueError(f'statementCache argument is malformed: \"{statementCache}\"')
 
         self.__connection: aiosqlite.Connection = connection
+        self.__pool: SqliteConnectionPool = pool
+        self.__statementCache: DatabaseStatementCache = statementCache
+
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.__isClosed:
             return
 
         self.__isClosed = True
-        await self.__connection.close()
+        await self.__pool.release(self.__connection)
+
+    async def __commitImplicitTransaction(self):
+        # writes that return rows (e.g. INSERT ... RETURNING) go through fetchRow() and fetchRows(),
+        # so any transaction that sqlite3 implicitly opened for them needs to be committed here
+        if not self.__isInTransaction and self.__connection.in_transaction:
+            await self.__connection.commit()
 
     async def createTableIfNotExists(self, query: str, *args: Optional[Any]):
         if not utils.isValidStr(query):
@@ -40,43 +68,52 @@ class SqliteDatabaseConnection(DatabaseConnection):
         else:
             await self.execute(query)
 
-    async def execute(self, query: str, *args: Optional[Any]):
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
+    async def execute(self, query: Union[str, DatabaseStatement], *args: Optional[Any]):
+        self.__requireNotClosed()
+        cursor = await self.__connection.execute(self.__resolveQuery(query), args)
+        await cursor.close()
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
+    async def executeMany(self, query: Union[str, DatabaseStatement], argsList: List[List[Any]]):
+        if not isinstance(argsList, List):
+            raise ValueError(f'argsList argument is malformed: \"{argsList}\"')
 
         self.__requireNotClosed()
-        cursor = await self.__connection.execute(query, args)
-        await self.__connection.commit()
+
+        if len(argsList) == 0:
+            return
+
+        cursor = await self.__connection.executemany(self.__resolveQuery(query), argsList)
         await cursor.close()
 
-    async def fetchRow(self, query: str, *args: Optional[Any]) -> Optional[List[Any]]:
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
+        if not self.__isInTransaction:
+            await self.__connection.commit()
 
+    async def fetchRow(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[Any]]:
         self.__requireNotClosed()
-        cursor = await self.__connection.execute(query, args)
+        cursor = await self.__connection.execute(self.__resolveQuery(query), args)
         row = await cursor.fetchone()
+        await cursor.close()
+        await self.__commitImplicitTransaction()
 
         if not utils.hasItems(row):
-            await cursor.close()
             return None
 
         results: List[Any] = list()
         results.extend(row)
 
-        await cursor.close()
         return results
 
-    async def fetchRows(self, query: str, *args: Optional[Any]) -> Optional[List[List[Any]]]:
-        if not utils.isValidStr(query):
-            raise ValueError(f'query argument is malformed: \"{query}\"')
-
+    async def fetchRows(self, query: Union[str, DatabaseStatement], *args: Optional[Any]) -> Optional[List[List[Any]]]:
         self.__requireNotClosed()
-        cursor = await self.__connection.execute(query, args)
+        cursor = await self.__connection.execute(self.__resolveQuery(query), args)
         rows = await cursor.fetchall()
+        await cursor.close()
+        await self.__commitImplicitTransaction()
 
         if not utils.hasItems(rows):
-            await cursor.close()
             return None
 
         records: List[List[Any]] = list()
@@ -84,7 +121,6 @@ class SqliteDatabaseConnection(DatabaseConnection):
         for record in rows:
             records.append(list(record))
 
-        await cursor.close()
         return records
 
     def getDatabaseType(self) -> DatabaseType:
@@ -93,6 +129,39 @@ class SqliteDatabaseConnection(DatabaseConnection):
     def isClosed(self) -> bool:
         return self.__isClosed
 
+    def __resolveQuery(self, query: Union[str, DatabaseStatement]) -> str:
+        if isinstance(query, DatabaseStatement):
+            return self.__statementCache.getSqliteQuery(query)
+        elif not utils.isValidStr(query):
+            raise ValueError(f'query argument is malformed: \"{query}\"')
+
+        return query
+
     def __requireNotClosed(self):
         if self.__isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.getDatabaseType()})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # nested transactions simply join the outermost one
+            yield
+            return
+
+        self.__isInTransaction = True
+
+        try:
+            cursor = await self.__connection.execute('BEGIN IMMEDIATE')
+            await cursor.close()
+
+            try:
+                yield
+            except:
+                await self.__connection.rollback()
+                raise
+
+            await self.__connection.commit()
+        finally:
+            self.__isInTransaction = False
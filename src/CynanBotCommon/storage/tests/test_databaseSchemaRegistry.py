@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+try:
+    from ..backingSqliteDatabase import BackingSqliteDatabase
+    from ..databaseSchemaRegistry import DatabaseSchemaRegistry
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+
+
+class TestDatabaseSchemaRegistry():
+
+    @pytest.mark.asyncio
+    async def test_getConnection_migratesRegisteredSchemas(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        schemaRegistry = backingDatabase.getSchemaRegistry()
+        schemaRegistry.register(
+            name = 'things',
+            statements = [
+                'CREATE TABLE IF NOT EXISTS things (name TEXT NOT NULL PRIMARY KEY)',
+                'CREATE INDEX IF NOT EXISTS things_name ON things (name)'
+            ]
+        )
+
+        assert schemaRegistry.hasPendingSchemas()
+
+        connection = await backingDatabase.getConnection()
+        assert not schemaRegistry.hasPendingSchemas()
+
+        await connection.execute('INSERT INTO things (name) VALUES ($1)', 'a')
+        record = await connection.fetchRow('SELECT version FROM databaseschemas WHERE name = $1', 'things')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record == [ 1 ]
+
+    @pytest.mark.asyncio
+    async def test_getConnection_releasesConnectionWhenMigrationFails(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+            maxConnections = 1
+        )
+
+        backingDatabase.getSchemaRegistry().register(
+            name = 'things',
+            statements = [ 'this is not valid sql' ]
+        )
+
+        for _ in range(3):
+            # were the only pooled connection leaked, the next attempt would time out instead
+            exception: Exception = None
+
+            try:
+                await asyncio.wait_for(backingDatabase.getConnection(), timeout = 5)
+            except Exception as e:
+                exception = e
+
+            assert exception is not None
+            assert not isinstance(exception, asyncio.TimeoutError)
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_migrate_skipsSchemasThatAreAlreadyInstalled(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.execute('CREATE TABLE databaseschemas (name TEXT NOT NULL PRIMARY KEY, version INTEGER NOT NULL)')
+        await connection.execute('INSERT INTO databaseschemas (name, version) VALUES ($1, $2)', 'things', 2)
+
+        schemaRegistry = DatabaseSchemaRegistry()
+        schemaRegistry.register(
+            name = 'things',
+            statements = [ 'this is not valid sql' ],
+            version = 2
+        )
+
+        await schemaRegistry.migrate(connection)
+        await connection.close()
+        await backingDatabase.close()
+
+        assert not schemaRegistry.hasPendingSchemas()
+
+    def test_register_withConflictingSchemas(self):
+        schemaRegistry = DatabaseSchemaRegistry()
+        schemaRegistry.register(name = 'things', statements = [ 'CREATE TABLE a (b TEXT)' ])
+        schemaRegistry.register(name = 'things', statements = [ 'CREATE TABLE a (b TEXT)' ])
+
+        with pytest.raises(ValueError):
+            schemaRegistry.register(name = 'things', statements = [ 'CREATE TABLE c (d TEXT)' ])
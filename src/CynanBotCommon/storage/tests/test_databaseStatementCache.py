@@ -0,0 +1,47 @@
+import pytest
+
+try:
+    from ..databaseStatement import DatabaseStatement
+    from ..databaseStatementCache import DatabaseStatementCache
+except:
+    from storage.databaseStatement import DatabaseStatement
+    from storage.databaseStatementCache import DatabaseStatementCache
+
+
+class TestDatabaseStatementCache():
+
+    def test_getPsqlQuery_countsHitsAndMisses(self):
+        cache = DatabaseStatementCache()
+        statement = DatabaseStatement(name = 'test.select', query = 'SELECT a FROM b WHERE c = $1')
+
+        assert cache.getPsqlQuery(statement) == statement.getQuery()
+        cache.getPsqlQuery(statement)
+        cache.getPsqlQuery(statement)
+
+        assert cache.getMisses() == 1
+        assert cache.getHits() == 2
+
+    def test_getSqliteQuery_countsHitsAndMisses(self):
+        cache = DatabaseStatementCache()
+        statement = DatabaseStatement(name = 'test.select', query = 'SELECT a FROM b WHERE c = $1')
+
+        cache.getSqliteQuery(statement)
+        cache.getSqliteQuery(statement)
+        cache.getSqliteQuery(statement)
+
+        assert cache.getMisses() == 1
+        assert cache.getHits() == 2
+
+    def test_getSqliteQuery_translatesPlaceholders(self):
+        cache = DatabaseStatementCache()
+        statement = DatabaseStatement(name = 'test.insert', query = 'INSERT INTO b (a, c) VALUES ($1, $2) ON CONFLICT (a) DO UPDATE SET c = $12')
+
+        result = cache.getSqliteQuery(statement)
+        assert result == 'INSERT INTO b (a, c) VALUES (?1, ?2) ON CONFLICT (a) DO UPDATE SET c = ?12'
+
+    def test_getSqliteQuery_withConflictingNames(self):
+        cache = DatabaseStatementCache()
+        cache.getSqliteQuery(DatabaseStatement(name = 'test.select', query = 'SELECT a FROM b'))
+
+        with pytest.raises(ValueError):
+            cache.getSqliteQuery(DatabaseStatement(name = 'test.select', query = 'SELECT c FROM d'))
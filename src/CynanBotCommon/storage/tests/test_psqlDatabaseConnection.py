@@ -0,0 +1,82 @@
+from typing import Any, List
+
+import asyncpg
+import pytest
+
+try:
+    from ..databaseStatement import DatabaseStatement
+    from ..databaseStatementCache import DatabaseStatementCache
+    from ..psqlDatabaseConnection import PsqlDatabaseConnection
+except:
+    from storage.databaseStatement import DatabaseStatement
+    from storage.databaseStatementCache import DatabaseStatementCache
+    from storage.psqlDatabaseConnection import PsqlDatabaseConnection
+
+
+class StubPreparedStatement():
+
+    def __init__(self, connection: 'StubPsqlConnection'):
+        self.__connection: StubPsqlConnection = connection
+        self.__releaseCounter: int = connection._pool_release_ctr
+
+    async def fetchrow(self, *args: Any) -> List[Any]:
+        # mirrors asyncpg's ConnectionResource validity check
+        if self.__connection._pool_release_ctr != self.__releaseCounter:
+            raise asyncpg.InterfaceError('the underlying connection has been released back to the pool')
+
+        return list(args)
+
+
+class StubPsqlConnection(asyncpg.Connection):
+
+    def __init__(self):
+        self._pool_release_ctr = 0
+        self.queries: List[str] = list()
+
+    def __del__(self):
+        # there's no real protocol behind this stub, so there's nothing to warn about
+        pass
+
+    async def fetchrow(self, query: str, *args: Any) -> List[Any]:
+        self.queries.append(query)
+        return list(args)
+
+    async def prepare(self, query: str) -> StubPreparedStatement:
+        return StubPreparedStatement(self)
+
+
+class StubPsqlPool(asyncpg.Pool):
+
+    def __init__(self, connection: StubPsqlConnection):
+        self.__connection: StubPsqlConnection = connection
+
+    async def acquire(self) -> StubPsqlConnection:
+        return self.__connection
+
+    async def release(self, connection: StubPsqlConnection):
+        connection._pool_release_ctr = connection._pool_release_ctr + 1
+
+
+class TestPsqlDatabaseConnection():
+
+    @pytest.mark.asyncio
+    async def test_fetchRow_withStatementAfterConnectionIsReacquired(self):
+        connection = StubPsqlConnection()
+        pool = StubPsqlPool(connection)
+        statementCache = DatabaseStatementCache()
+        statement = DatabaseStatement(name = 'test.select', query = 'SELECT $1::int')
+
+        for value in range(3):
+            databaseConnection = PsqlDatabaseConnection(
+                connection = await pool.acquire(),
+                pool = pool,
+                statementCache = statementCache
+            )
+
+            record = await databaseConnection.fetchRow(statement, value)
+            await databaseConnection.close()
+
+            assert record == [ value ]
+
+        assert connection._pool_release_ctr == 3
+        assert connection.queries == [ statement.getQuery() ] * 3
@@ -0,0 +1,133 @@
+import asyncio
+from typing import List
+from unittest import mock
+
+import pytest
+
+try:
+    from ...cuteness.cutenessRepository import (
+        CutenessRepository, fetchChampionsIndexStatement,
+        fetchLeaderboardHistoryMonthsStatement, fetchLeaderboardIndexStatement)
+    from ...timber.timberStub import TimberStub
+    from ...trivia.triviaHistoryRepository import (
+        TriviaHistoryRepository, fetchMostRecentTriviaQuestionStatement)
+    from ...trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from ...twitch.twitchApiServiceInterface import \
+        TwitchApiServiceInterface
+    from ...users.userIdsRepository import UserIdsRepository
+    from ..backingDatabase import BackingDatabase
+    from ..backingSqliteDatabase import BackingSqliteDatabase
+    from ..databaseStatement import DatabaseStatement
+    from ..jsonStaticReader import JsonStaticReader
+except:
+    from cuteness.cutenessRepository import (
+        CutenessRepository, fetchChampionsIndexStatement,
+        fetchLeaderboardHistoryMonthsStatement, fetchLeaderboardIndexStatement)
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.databaseStatement import DatabaseStatement
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.triviaHistoryRepository import (
+        TriviaHistoryRepository, fetchMostRecentTriviaQuestionStatement)
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+
+    from users.userIdsRepository import UserIdsRepository
+
+
+class TestQueryPlans():
+
+    async def __createBackingDatabase(self, tmp_path) -> BackingDatabase:
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        timber = TimberStub()
+
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = timber,
+            twitchApiService = mock.MagicMock(spec = TwitchApiServiceInterface)
+        )
+
+        CutenessRepository(
+            backingDatabase = backingDatabase,
+            userIdsRepository = userIdsRepository
+        )
+
+        TriviaHistoryRepository(
+            backingDatabase = backingDatabase,
+            timber = timber,
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(dict())
+            )
+        )
+
+        return backingDatabase
+
+    async def __explainQueryPlan(
+        self,
+        backingDatabase: BackingDatabase,
+        statement: DatabaseStatement,
+        *args
+    ) -> List[str]:
+        # the statements are the very same ones that the repositories run, so that a change to a
+        # repository's query is always checked here too
+        async with await backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(f'EXPLAIN QUERY PLAN {statement.getQuery()}', *args)
+
+        # each EXPLAIN QUERY PLAN row is (id, parent, notused, detail)
+        return [ record[3] for record in records ]
+
+    @pytest.mark.asyncio
+    async def test_cutenessChampionsIndex_usesIndex(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        details = await self.__explainQueryPlan(
+            backingDatabase,
+            fetchChampionsIndexStatement,
+            'smCharles'
+        )
+        await backingDatabase.close()
+
+        assert any('cuteness_twitchchannel_userid_cuteness' in detail for detail in details)
+        assert not any(detail == 'SCAN cuteness' for detail in details)
+
+    @pytest.mark.asyncio
+    async def test_cutenessLeaderboardIndex_usesIndex(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        details = await self.__explainQueryPlan(
+            backingDatabase,
+            fetchLeaderboardIndexStatement,
+            'smCharles', '2023-01'
+        )
+        await backingDatabase.close()
+
+        assert any('cuteness_twitchchannel_utcyearandmonth_cuteness' in detail for detail in details)
+        assert not any(detail == 'SCAN cuteness' for detail in details)
+
+    @pytest.mark.asyncio
+    async def test_cutenessLeaderboardHistoryMonths_usesIndex(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        details = await self.__explainQueryPlan(
+            backingDatabase,
+            fetchLeaderboardHistoryMonthsStatement,
+            'smCharles', '2023-01', 3
+        )
+        await backingDatabase.close()
+
+        assert any('cuteness_twitchchannel_utcyearandmonth_cuteness' in detail for detail in details)
+
+    @pytest.mark.asyncio
+    async def test_triviaHistoryMostRecentQuestion_usesIndex(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        details = await self.__explainQueryPlan(
+            backingDatabase,
+            fetchMostRecentTriviaQuestionStatement,
+            '🧮', 'smCharles'
+        )
+        await backingDatabase.close()
+
+        assert any('USING COVERING INDEX triviahistory_twitchchannel_emote_datetime' in detail for detail in details)
+        assert not any('TEMP B-TREE' in detail for detail in details)
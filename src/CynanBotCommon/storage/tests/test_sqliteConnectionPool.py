@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+try:
+    from ..sqliteConnectionPool import SqliteConnectionPool
+except:
+    from storage.sqliteConnectionPool import SqliteConnectionPool
+
+
+class TestSqliteConnectionPool():
+
+    @pytest.mark.asyncio
+    async def test_acquire_appliesWalJournalMode(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            databaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        connection = await pool.acquire()
+        cursor = await connection.execute('PRAGMA journal_mode')
+        row = await cursor.fetchone()
+        await cursor.close()
+        await pool.release(connection)
+        await pool.close()
+
+        assert row[0] == 'wal'
+
+    @pytest.mark.asyncio
+    async def test_acquire_reusesReleasedConnection(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            databaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        first = await pool.acquire()
+        await pool.release(first)
+        second = await pool.acquire()
+        await pool.release(second)
+
+        assert first is second
+        assert pool.getOpenConnectionsSize() == 1
+        assert pool.getIdleConnectionsSize() == 1
+
+        await pool.close()
+        assert pool.getOpenConnectionsSize() == 0
+
+    @pytest.mark.asyncio
+    async def test_acquire_waitsWhenPoolIsExhausted(self, tmp_path):
+        pool = SqliteConnectionPool(
+            eventLoop = asyncio.get_running_loop(),
+            databaseFile = str(tmp_path / 'database.sqlite'),
+            maxConnections = 1
+        )
+
+        first = await pool.acquire()
+        pendingAcquire = asyncio.ensure_future(pool.acquire())
+        await asyncio.sleep(0.05)
+        assert not pendingAcquire.done()
+
+        await pool.release(first)
+        second = await asyncio.wait_for(pendingAcquire, timeout = 5)
+        assert first is second
+
+        await pool.release(second)
+        await pool.close()
+
+    def test_constructWithZeroMaxConnections(self):
+        pool: SqliteConnectionPool = None
+        exception: Exception = None
+
+        try:
+            pool = SqliteConnectionPool(
+                eventLoop = asyncio.new_event_loop(),
+                databaseFile = 'database.sqlite',
+                maxConnections = 0
+            )
+        except Exception as e:
+            exception = e
+
+        assert pool is None
+        assert isinstance(exception, ValueError)
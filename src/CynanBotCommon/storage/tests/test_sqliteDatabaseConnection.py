@@ -0,0 +1,128 @@
+import asyncio
+
+import pytest
+
+try:
+    from ..backingSqliteDatabase import BackingSqliteDatabase
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+
+
+class TestSqliteDatabaseConnection():
+
+    async def __createBackingDatabase(self, tmp_path) -> BackingSqliteDatabase:
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.createTableIfNotExists('CREATE TABLE IF NOT EXISTS things (name TEXT NOT NULL PRIMARY KEY, amount INTEGER NOT NULL)')
+        await connection.close()
+
+        return backingDatabase
+
+    @pytest.mark.asyncio
+    async def test_asyncWith_releasesConnectionOnException(self, tmp_path):
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+            maxConnections = 1
+        )
+
+        exception: Exception = None
+
+        try:
+            async with await backingDatabase.getConnection() as connection:
+                await connection.fetchRow('SELECT 1')
+                raise RuntimeError('boom')
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, RuntimeError)
+        assert connection.isClosed()
+
+        # the only pooled connection was given back, so this doesn't wait forever
+        async with await asyncio.wait_for(backingDatabase.getConnection(), timeout = 5) as connection:
+            record = await connection.fetchRow('SELECT 1')
+
+        await backingDatabase.close()
+        assert record == [ 1 ]
+
+    @pytest.mark.asyncio
+    async def test_executeMany(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+        await connection.executeMany(
+            'INSERT INTO things (name, amount) VALUES ($1, $2)',
+            [ [ 'a', 1 ], [ 'b', 2 ], [ 'c', 3 ] ]
+        )
+        await connection.close()
+
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT COUNT(*), SUM(amount) FROM things')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record == [ 3, 6 ]
+
+    @pytest.mark.asyncio
+    async def test_fetchRow_commitsReturningWrite(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('INSERT INTO things (name, amount) VALUES ($1, $2) RETURNING amount', 'a', 1)
+        await connection.close()
+
+        assert record == [ 1 ]
+
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT amount FROM things WHERE name = $1', 'a')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record == [ 1 ]
+
+    @pytest.mark.asyncio
+    async def test_transaction_commits(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO things (name, amount) VALUES ($1, $2)', 'a', 1)
+            await connection.execute('UPDATE things SET amount = $1 WHERE name = $2', 5, 'a')
+
+        await connection.close()
+
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT amount FROM things WHERE name = $1', 'a')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record == [ 5 ]
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollsBackOnException(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+
+        connection = await backingDatabase.getConnection()
+        exception: Exception = None
+
+        try:
+            async with connection.transaction():
+                await connection.execute('INSERT INTO things (name, amount) VALUES ($1, $2)', 'a', 1)
+                raise RuntimeError('boom')
+        except Exception as e:
+            exception = e
+
+        await connection.close()
+        assert isinstance(exception, RuntimeError)
+
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT COUNT(*) FROM things')
+        await connection.close()
+        await backingDatabase.close()
+
+        assert record == [ 0 ]
@@ -1,10 +1,9 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.simpleDateTime import SimpleDateTime
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.supStreamer.supStreamerAction import SupStreamerAction
     from CynanBotCommon.supStreamer.supStreamerChatter import \
@@ -16,7 +15,6 @@ except:
     import utils
     from simpleDateTime import SimpleDateTime
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from supStreamer.supStreamerAction import SupStreamerAction
     from supStreamer.supStreamerChatter import SupStreamerChatter
@@ -41,7 +39,7 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         self.__timber: TimberInterface = timber
 
         self.__cache: Dict[str, Optional[SupStreamerAction]] = dict()
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def clearCaches(self):
         self.__cache.clear()
@@ -54,18 +52,17 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         if twitchChannelId in self.__cache:
             return self.__cache[twitchChannelId]
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT supstreamerchatters.mostrecentsup, supstreamerchatters.chatteruserid, userids.username FROM supstreamerchatters
-                INNER JOIN userids ON supstreamerchatters.twitchchannelid = userids.userid
-                ORDER BY supstreamerchatters.mostrecentsup ASC
-                WHERE supstreamerchatters.twitchchannelid = $1
-            ''',
-            twitchChannelId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT supstreamerchatters.mostrecentsup, supstreamerchatters.chatteruserid, userids.username FROM supstreamerchatters
+                    INNER JOIN userids ON supstreamerchatters.twitchchannelid = userids.userid
+                    ORDER BY supstreamerchatters.mostrecentsup ASC
+                    WHERE supstreamerchatters.twitchchannelid = $1
+                ''',
+                twitchChannelId
+            )
 
-        await connection.close()
         twitchChannelName: Optional[str] = None
         chatters: Dict[str, Optional[SupStreamerChatter]] = dict()
 
@@ -98,19 +95,12 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
         self.__cache[twitchChannelId] = action
         return action
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS supstreamerchatters (
                         mostrecentsup text NOT NULL,
@@ -119,8 +109,8 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS supstreamerchatters (
                         mostrecentsup TEXT NOT NULL,
@@ -130,9 +120,12 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'SupStreamerRepository',
+            statements = statements
+        )
 
     async def update(self, chatterUserId: str, twitchChannelId: str):
         if not utils.isValidStr(chatterUserId):
@@ -142,17 +135,16 @@ class SupStreamerRepository(SupStreamerRepositoryInterface):
 
         now = SimpleDateTime()
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO supstreamerchatters (mostrecentsup, chatteruserid, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (mostrecentsup, chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
-            ''',
-            now.getIsoFormatStr(), chatterUserId, twitchChannelId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO supstreamerchatters (mostrecentsup, chatteruserid, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (mostrecentsup, chatteruserid, twitchchannelid) DO UPDATE SET mostrecentsup = EXCLUDED.mostrecentsup
+                ''',
+                now.getIsoFormatStr(), chatterUserId, twitchChannelId
+            )
 
-        await connection.close()
         action = await self.get(twitchChannelId)
 
         if action is None:
@@ -0,0 +1,46 @@
+import asyncio
+import io
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ..timber import Timber
+    from ..timberConsoleSink import TimberConsoleSink
+    from ..timberLevel import TimberLevel
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from timber.timber import Timber
+    from timber.timberConsoleSink import TimberConsoleSink
+    from timber.timberLevel import TimberLevel
+
+
+class TestTimber():
+
+    def __createTimber(self, tmp_path, minimumFileLevel: TimberLevel = TimberLevel.INFO) -> Timber:
+        return Timber(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            timberRootDirectory = str(tmp_path),
+            timberConsoleSink = TimberConsoleSink(stream = io.StringIO()),
+            minimumFileLevel = minimumFileLevel
+        )
+
+    @pytest.mark.asyncio
+    async def test_log_withDebugMinimumFileLevel(self, tmp_path):
+        timber = self.__createTimber(tmp_path, minimumFileLevel = TimberLevel.DEBUG)
+
+        timber.log('Tag', 'answer for %s', level = TimberLevel.DEBUG, args = [ 'smCharles' ])
+        assert timber.getLogSinkMetrics().getQueueSize() == 1
+
+    @pytest.mark.asyncio
+    async def test_log_withLevelBelowMinimumFileLevel(self, tmp_path):
+        timber = self.__createTimber(tmp_path)
+
+        timber.log('Tag', 'answer for %s', level = TimberLevel.DEBUG, args = [ 'smCharles' ])
+        assert timber.getLogSinkMetrics().getQueueSize() == 0
+
+        timber.log('Tag', 'answer for %s', args = [ 'smCharles' ])
+        assert timber.getLogSinkMetrics().getQueueSize() == 1
+
+        timber.log('Tag', 'no answer', exception = RuntimeError('samus'))
+        assert timber.getLogSinkMetrics().getQueueSize() == 3
@@ -0,0 +1,92 @@
+import io
+
+try:
+    from ..timberConsoleSink import TimberConsoleSink
+    from ..timberLevel import TimberLevel
+except:
+    from timber.timberConsoleSink import TimberConsoleSink
+    from timber.timberLevel import TimberLevel
+
+
+class TestTimberConsoleSink():
+
+    def test_write(self):
+        stream = io.StringIO()
+        consoleSink = TimberConsoleSink(stream = stream)
+        consoleSink.start()
+
+        consoleSink.write('TriviaRepository', TimberLevel.INFO, 'hello\n')
+        consoleSink.write('TriviaRepository', TimberLevel.ERROR, 'world\n')
+        assert consoleSink.flush()
+        consoleSink.close()
+
+        assert stream.getvalue() == 'hello\nworld\n'
+
+    def test_write_withDeferredStatements(self):
+        stream = io.StringIO()
+        consoleSink = TimberConsoleSink(
+            tagMinimumLevels = { 'TriviaAnswerChecker': TimberLevel.INFO },
+            stream = stream
+        )
+
+        consoleSink.write('TriviaAnswerChecker', TimberLevel.DEBUG, lambda: 1 / 0)
+        consoleSink.write('TriviaAnswerChecker', TimberLevel.INFO, lambda: 'built\n')
+
+        consoleSink.start()
+        assert consoleSink.flush()
+        consoleSink.close()
+
+        assert stream.getvalue() == 'built\n'
+
+    def test_write_withFullBuffer(self):
+        stream = io.StringIO()
+        consoleSink = TimberConsoleSink(maxBufferSize = 2, stream = stream)
+
+        # the sink isn't started yet, so nothing is written out of the buffer
+        for index in range(5):
+            consoleSink.write('TwitchWebsocketClient', TimberLevel.INFO, f'{index}\n')
+
+        assert consoleSink.getBufferSize() == 2
+
+        consoleSink.start()
+        assert consoleSink.flush()
+        consoleSink.close()
+
+        assert stream.getvalue() == 'TimberConsoleSink — 3 line(s) dropped\n3\n4\n'
+
+    def test_write_withTagMinimumLevels(self):
+        stream = io.StringIO()
+        consoleSink = TimberConsoleSink(
+            tagMinimumLevels = { 'TriviaAnswerChecker': TimberLevel.ERROR },
+            stream = stream
+        )
+
+        assert not consoleSink.isWritable('TriviaAnswerChecker', TimberLevel.INFO)
+        assert consoleSink.isWritable('TriviaAnswerChecker', TimberLevel.ERROR)
+        assert consoleSink.isWritable('TriviaRepository', TimberLevel.DEBUG)
+
+        consoleSink.start()
+        consoleSink.write('TriviaAnswerChecker', TimberLevel.INFO, 'quiet\n')
+        consoleSink.write('TriviaAnswerChecker', TimberLevel.ERROR, 'loud\n')
+        assert consoleSink.flush()
+        consoleSink.close()
+
+        assert stream.getvalue() == 'loud\n'
+
+    def test_write_withTagSampleRates(self):
+        stream = io.StringIO()
+        consoleSink = TimberConsoleSink(
+            tagSampleRates = { 'TwitchWebsocketClient': 3 },
+            stream = stream
+        )
+
+        for index in range(7):
+            consoleSink.write('TwitchWebsocketClient', TimberLevel.INFO, f'{index}\n')
+
+        consoleSink.write('TwitchWebsocketClient', TimberLevel.ERROR, 'error\n')
+
+        consoleSink.start()
+        assert consoleSink.flush()
+        consoleSink.close()
+
+        assert stream.getvalue() == '0\n3\n6\nerror\n'
@@ -0,0 +1,55 @@
+try:
+    from ..timberEntry import TimberEntry
+    from ..timberLevel import TimberLevel
+except:
+    from timber.timberEntry import TimberEntry
+    from timber.timberLevel import TimberLevel
+
+
+class TestTimberEntry():
+
+    def test_getLevel(self):
+        assert TimberEntry(tag = 'Tag', msg = 'msg').getLevel() is TimberLevel.INFO
+        assert TimberEntry(tag = 'Tag', msg = 'msg', exception = ValueError()).getLevel() is TimberLevel.ERROR
+        assert TimberEntry(tag = 'Tag', msg = 'msg', level = TimberLevel.DEBUG).getLevel() is TimberLevel.DEBUG
+
+    def test_getMsg(self):
+        assert TimberEntry(tag = 'Tag', msg = ' {"json": 100%} ').getMsg() == '{"json": 100%}'
+
+    def test_getMsg_withArgs(self):
+        timberEntry = TimberEntry(tag = 'Tag', msg = 'answer for %s is %d', args = [ 'smCharles', 5 ])
+        assert timberEntry.getMsg() == 'answer for smCharles is 5'
+
+    def test_getMsg_withArgsChangedAfterCreation(self):
+        extras = { 'userId': '12345' }
+        answers = [ 'a' ]
+        args = [ extras, answers ]
+        timberEntry = TimberEntry(tag = 'Tag', msg = 'extras=%s answers=%s', args = args)
+
+        extras['userId'] = '67890'
+        answers.append('b')
+        args.append('c')
+
+        assert timberEntry.getMsg() == "extras={'userId': '12345'} answers=['a']"
+
+    def test_getMsg_withMalformedArgs(self):
+        timberEntry = TimberEntry(tag = 'Tag', msg = 'answer is %d', args = ( 'five', ))
+        assert timberEntry.getMsg() == "answer is %d ('five',)"
+
+    def test_getTraceback_withExcInfo(self):
+        try:
+            raise RuntimeError('samus')
+        except RuntimeError:
+            timberEntry = TimberEntry(tag = 'Tag', msg = 'msg', excInfo = True)
+
+        assert timberEntry.hasException()
+        assert timberEntry.hasTraceback()
+        assert timberEntry.getLevel() is TimberLevel.ERROR
+        assert isinstance(timberEntry.getException(), RuntimeError)
+        assert 'RuntimeError: samus' in timberEntry.getTraceback()
+        assert 'test_getTraceback_withExcInfo' in timberEntry.getTraceback()
+
+    def test_getTraceback_withExcInfoAndNoException(self):
+        timberEntry = TimberEntry(tag = 'Tag', msg = 'msg', excInfo = True)
+        assert not timberEntry.hasException()
+        assert timberEntry.getTraceback() is None
@@ -0,0 +1,18 @@
+try:
+    from ..timberLevel import TimberLevel
+except:
+    from timber.timberLevel import TimberLevel
+
+
+class TestTimberLevel():
+
+    def test_fromStr(self):
+        assert TimberLevel.fromStr('debug') is TimberLevel.DEBUG
+        assert TimberLevel.fromStr('INFO') is TimberLevel.INFO
+        assert TimberLevel.fromStr('warning') is TimberLevel.WARNING
+        assert TimberLevel.fromStr('Error') is TimberLevel.ERROR
+
+    def test_isAtLeast(self):
+        assert TimberLevel.ERROR.isAtLeast(TimberLevel.INFO)
+        assert TimberLevel.INFO.isAtLeast(TimberLevel.INFO)
+        assert not TimberLevel.DEBUG.isAtLeast(TimberLevel.INFO)
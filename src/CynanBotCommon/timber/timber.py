@@ -1,23 +1,27 @@
-import asyncio
-import queue
-from collections import defaultdict
-from queue import SimpleQueue
-from typing import Dict, List, Optional
-
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
+import json
+from typing import Any, Optional, Sequence
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.backgroundTaskHelper import BackgroundTaskHelper
+    from CynanBotCommon.logSink.logSink import LogSink
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+    from CynanBotCommon.logSink.logSinkOverflowPolicy import \
+        LogSinkOverflowPolicy
+    from CynanBotCommon.timber.timberConsoleSink import TimberConsoleSink
     from CynanBotCommon.timber.timberEntry import TimberEntry
     from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.timber.timberLevel import TimberLevel
 except:
     import utils
     from backgroundTaskHelper import BackgroundTaskHelper
+    from logSink.logSink import LogSink
+    from logSink.logSinkMetrics import LogSinkMetrics
+    from logSink.logSinkOverflowPolicy import LogSinkOverflowPolicy
+    from timber.timberConsoleSink import TimberConsoleSink
     from timber.timberEntry import TimberEntry
     from timber.timberInterface import TimberInterface
+    from timber.timberLevel import TimberLevel
 
 
 class Timber(TimberInterface):
@@ -26,7 +30,12 @@ class Timber(TimberInterface):
         self,
         backgroundTaskHelper: BackgroundTaskHelper,
         sleepTimeSeconds: float = 15,
-        timberRootDirectory: str = 'CynanBotCommon/timber'
+        timberRootDirectory: str = 'CynanBotCommon/timber',
+        timberConsoleSink: Optional[TimberConsoleSink] = None,
+        isJsonLinesEnabled: bool = False,
+        maxQueueSize: int = 65536,
+        minimumFileLevel: TimberLevel = TimberLevel.INFO,
+        overflowPolicy: LogSinkOverflowPolicy = LogSinkOverflowPolicy.DROP_OLDEST
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
             raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -36,12 +45,37 @@ class Timber(TimberInterface):
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
         elif not utils.isValidStr(timberRootDirectory):
             raise ValueError(f'timberRootDirectory argument is malformed: \"{timberRootDirectory}\"')
+        elif timberConsoleSink is not None and not isinstance(timberConsoleSink, TimberConsoleSink):
+            raise ValueError(f'timberConsoleSink argument is malformed: \"{timberConsoleSink}\"')
+        elif not utils.isValidBool(isJsonLinesEnabled):
+            raise ValueError(f'isJsonLinesEnabled argument is malformed: \"{isJsonLinesEnabled}\"')
+        elif not utils.isValidInt(maxQueueSize):
+            raise ValueError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not isinstance(minimumFileLevel, TimberLevel):
+            raise ValueError(f'minimumFileLevel argument is malformed: \"{minimumFileLevel}\"')
+        elif not isinstance(overflowPolicy, LogSinkOverflowPolicy):
+            raise ValueError(f'overflowPolicy argument is malformed: \"{overflowPolicy}\"')
+
+        if timberConsoleSink is None:
+            timberConsoleSink = TimberConsoleSink()
 
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__timberRootDirectory: str = timberRootDirectory
+        self.__timberConsoleSink: TimberConsoleSink = timberConsoleSink
+        self.__isJsonLinesEnabled: bool = isJsonLinesEnabled
+        self.__minimumFileLevel: TimberLevel = minimumFileLevel
+
+        self.__logSink: LogSink = LogSink(
+            backgroundTaskHelper = backgroundTaskHelper,
+            maxFlushDelaySeconds = sleepTimeSeconds,
+            maxQueueSize = maxQueueSize,
+            overflowPolicy = overflowPolicy,
+            spillFile = f'{timberRootDirectory}/timber.spill'
+        )
 
-        self.__entryQueue: SimpleQueue[TimberEntry] = SimpleQueue()
-        backgroundTaskHelper.createTask(self.__startEventLoop())
+        self.__logSink.start()
+        self.__timberConsoleSink.start()
 
     def __getErrorStatement(self, ensureNewLine: bool, timberEntry: TimberEntry) -> Optional[str]:
         if not utils.isValidBool(ensureNewLine):
@@ -62,6 +96,28 @@ class Timber(TimberInterface):
 
         return errorStatement
 
+    def __getJsonStatement(self, timberEntry: TimberEntry) -> str:
+        if not isinstance(timberEntry, TimberEntry):
+            raise ValueError(f'timberEntry argument is malformed: \"{timberEntry}\"')
+
+        jsonContents = {
+            'dateTime': timberEntry.getSimpleDateTime().getDateTime().isoformat(),
+            'level': timberEntry.getLevel().name.lower(),
+            'msg': timberEntry.getMsg(),
+            'tag': timberEntry.getTag()
+        }
+
+        if timberEntry.hasException():
+            jsonContents['exception'] = f'{timberEntry.getException()}'
+
+        if timberEntry.hasTraceback():
+            jsonContents['traceback'] = timberEntry.getTraceback()
+
+        return f'{json.dumps(jsonContents, ensure_ascii = False)}\n'
+
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        return self.__logSink.getMetrics()
+
     def __getLogStatement(self, ensureNewLine: bool, timberEntry: TimberEntry) -> str:
         if not utils.isValidBool(ensureNewLine):
             raise ValueError(f'ensureNewLine argument is malformed: \"{ensureNewLine}\"')
@@ -83,88 +139,53 @@ class Timber(TimberInterface):
         tag: str,
         msg: str,
         exception: Optional[Exception] = None,
-        traceback: Optional[str] = None
+        traceback: Optional[str] = None,
+        level: Optional[TimberLevel] = None,
+        args: Optional[Sequence[Any]] = None,
+        excInfo: bool = False
     ):
-        if not utils.isValidStr(tag):
-            raise ValueError(f'tag argument is malformed: \"{tag}\"')
-        elif not utils.isValidStr(msg):
-            raise ValueError(f'msg argument is malformed: \"{msg}\"')
-        elif exception is not None and not isinstance(exception, Exception):
-            raise ValueError(f'exception argument is malformed: \"{exception}\"')
-        elif traceback is not None and not isinstance(traceback, str):
-            raise ValueError(f'traceback argument is malformed: \"{traceback}\"')
-
         timberEntry = TimberEntry(
             tag = tag,
             msg = msg,
             exception = exception,
-            traceback = traceback
+            traceback = traceback,
+            level = level,
+            args = args,
+            excInfo = excInfo
         )
 
-        self.__entryQueue.put(timberEntry)
-        print(self.__getLogStatement(False, timberEntry))
-
-    async def __startEventLoop(self):
-        while True:
-            entries: List[TimberEntry] = list()
-
-            try:
-                while not self.__entryQueue.empty():
-                    entry = self.__entryQueue.get_nowait()
-                    entries.append(entry)
-            except queue.Empty:
-                pass
-
-            await self.__writeToLogFiles(entries)
-            await asyncio.sleep(self.__sleepTimeSeconds)
+        # None of the statements are built here. The console and log file writers each build
+        # theirs on their own threads, and the console skips building any that it filters out.
+        self.__timberConsoleSink.write(
+            tag = timberEntry.getTag(),
+            level = timberEntry.getLevel(),
+            statement = lambda: self.__getLogStatement(True, timberEntry)
+        )
 
-    async def __writeToLogFiles(self, entries: List[TimberEntry]):
-        if len(entries) == 0:
+        # entries below the minimum file level never reach the log sink, so their statements are never built for it
+        if not timberEntry.getLevel().isAtLeast(self.__minimumFileLevel):
             return
 
-        # The logic below is kind of intense, but we do this in order to favor logical complexity
-        # in exchange for I/O simplicity. By doing things this way, we only need to attempt to
-        # create folders once, files once, and we also just open a file handle one time too.
-
-        # This dictionary stores a directory, and then a list of files, and then the contents to
-        # write into the files themselves. This dictionary does not make any attempt at handling
-        # error logging.
-        structure: Dict[str, Dict[str, List[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
-
-        # This dictionary is used for error logging, and just like the dictionary above, stores
-        # a directory, and then a list of files, and then the contents to write into the files
-        # themselves.
-        errorStructure: Dict[str, Dict[str, List[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
-
-        for entry in entries:
-            simpleDateTime = entry.getSimpleDateTime()
-            timberDirectory = f'{self.__timberRootDirectory}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}'
-            timberFile = f'{timberDirectory}/{simpleDateTime.getDayStr()}.log'
-            structure[timberDirectory][timberFile].append(entry)
-
-            if entry.hasException():
-                timberErrorDirectory = f'{timberDirectory}/errors'
-                timberErrorFile = f'{timberErrorDirectory}/{simpleDateTime.getDayStr()}.log'
-                errorStructure[timberErrorDirectory][timberErrorFile].append(entry)
-
-        for timberDirectory, timberFileToEntriesDict in structure.items():
-            if not await aiofiles.ospath.exists(timberDirectory):
-                await aiofiles.os.makedirs(timberDirectory)
-
-            for timberFile, entriesList in timberFileToEntriesDict.items():
-                async with aiofiles.open(timberFile, mode = 'a', encoding = 'utf-8') as file:
-                    for entry in entriesList:
-                        logStatement = self.__getLogStatement(True, entry)
-                        await file.write(logStatement)
-
-        for timberErrorDirectory, timberErrorFileToEntriesDict in errorStructure.items():
-            if not await aiofiles.ospath.exists(timberErrorDirectory):
-                await aiofiles.os.makedirs(timberErrorDirectory)
-
-            for timberErrorFile, entriesList in timberErrorFileToEntriesDict.items():
-                async with aiofiles.open(timberErrorFile, mode = 'a', encoding = 'utf-8') as file:
-                    for entry in entriesList:
-                        errorStatement = self.__getErrorStatement(True, entry)
-
-                        if utils.isValidStr(errorStatement):
-                            await file.write(errorStatement)
+        simpleDateTime = timberEntry.getSimpleDateTime()
+        timberDirectory = f'{self.__timberRootDirectory}/{simpleDateTime.getYearStr()}/{simpleDateTime.getMonthStr()}'
+        sizeEstimate = timberEntry.getSizeEstimate()
+
+        if self.__isJsonLinesEnabled:
+            self.__logSink.write(
+                logFile = f'{timberDirectory}/{simpleDateTime.getDayStr()}.jsonl',
+                statement = lambda: self.__getJsonStatement(timberEntry),
+                sizeInBytes = sizeEstimate
+            )
+        else:
+            self.__logSink.write(
+                logFile = f'{timberDirectory}/{simpleDateTime.getDayStr()}.log',
+                statement = lambda: self.__getLogStatement(True, timberEntry),
+                sizeInBytes = sizeEstimate
+            )
+
+            if timberEntry.hasException():
+                self.__logSink.write(
+                    logFile = f'{timberDirectory}/errors/{simpleDateTime.getDayStr()}.log',
+                    statement = lambda: self.__getErrorStatement(True, timberEntry),
+                    sizeInBytes = sizeEstimate
+                )
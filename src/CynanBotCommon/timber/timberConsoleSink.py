@@ -0,0 +1,176 @@
+import sys
+import threading
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, List, Optional, TextIO, Union
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.timber.timberLevel import TimberLevel
+except:
+    import utils
+    from timber.timberLevel import TimberLevel
+
+
+# Prints Timber's log statements to the console from a background thread, so that a slow terminal
+# or pipe never holds up the event loop. Statements wait in a bounded ring buffer, and if the
+# console can't keep up, the oldest statements are dropped and a summary line says how many were
+# lost. Chatty tags can be quieted down with a per-tag minimum level, or with a sample rate (only
+# every Nth statement is printed). Error statements are never sampled. A statement can also be
+# handed over as a function that builds it, which is then only called on the console thread, and
+# never at all for a statement that gets filtered, sampled, or dropped.
+class TimberConsoleSink():
+
+    def __init__(
+        self,
+        maxBufferSize: int = 4096,
+        minimumLevel: TimberLevel = TimberLevel.DEBUG,
+        tagMinimumLevels: Optional[Dict[str, TimberLevel]] = None,
+        tagSampleRates: Optional[Dict[str, int]] = None,
+        stream: Optional[TextIO] = None
+    ):
+        if not utils.isValidInt(maxBufferSize):
+            raise ValueError(f'maxBufferSize argument is malformed: \"{maxBufferSize}\"')
+        elif maxBufferSize < 1 or maxBufferSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBufferSize argument is out of bounds: {maxBufferSize}')
+        elif not isinstance(minimumLevel, TimberLevel):
+            raise ValueError(f'minimumLevel argument is malformed: \"{minimumLevel}\"')
+        elif tagMinimumLevels is not None and not isinstance(tagMinimumLevels, Dict):
+            raise ValueError(f'tagMinimumLevels argument is malformed: \"{tagMinimumLevels}\"')
+        elif tagSampleRates is not None and not isinstance(tagSampleRates, Dict):
+            raise ValueError(f'tagSampleRates argument is malformed: \"{tagSampleRates}\"')
+
+        if tagSampleRates is not None:
+            for tag, sampleRate in tagSampleRates.items():
+                if not utils.isValidInt(sampleRate) or sampleRate < 1:
+                    raise ValueError(f'tagSampleRates argument has a malformed sample rate for tag \"{tag}\": {sampleRate}')
+
+        self.__maxBufferSize: int = maxBufferSize
+        self.__minimumLevel: TimberLevel = minimumLevel
+        self.__tagMinimumLevels: Dict[str, TimberLevel] = dict(tagMinimumLevels or dict())
+        self.__tagSampleRates: Dict[str, int] = dict(tagSampleRates or dict())
+        self.__stream: Optional[TextIO] = stream
+
+        self.__buffer: Deque[Union[str, Callable[[], str]]] = deque(maxlen = maxBufferSize)
+        self.__condition: threading.Condition = threading.Condition()
+        self.__droppedLines: int = 0
+        self.__isClosed: bool = False
+        self.__isWriting: bool = False
+        self.__tagCounts: Dict[str, int] = defaultdict(lambda: 0)
+        self.__thread: Optional[threading.Thread] = None
+
+    def close(self, timeoutSeconds: float = 5):
+        with self.__condition:
+            self.__isClosed = True
+            self.__condition.notify_all()
+
+        thread = self.__thread
+
+        if thread is not None:
+            thread.join(timeoutSeconds)
+
+    def flush(self, timeoutSeconds: float = 5) -> bool:
+        with self.__condition:
+            return self.__condition.wait_for(
+                predicate = lambda: len(self.__buffer) == 0 and not self.__isWriting,
+                timeout = timeoutSeconds
+            )
+
+    def getBufferSize(self) -> int:
+        return len(self.__buffer)
+
+    def getMaxBufferSize(self) -> int:
+        return self.__maxBufferSize
+
+    def __getStream(self) -> TextIO:
+        stream = self.__stream
+
+        if stream is None:
+            # looked up every time, so that anything which swaps out sys.stdout still sees our output
+            stream = sys.stdout
+
+        return stream
+
+    def __isSampledOut(self, tag: str, level: TimberLevel) -> bool:
+        sampleRate = self.__tagSampleRates.get(tag)
+
+        if sampleRate is None or sampleRate == 1 or level is TimberLevel.ERROR:
+            return False
+
+        tagCount = self.__tagCounts[tag]
+        self.__tagCounts[tag] = tagCount + 1
+        return tagCount % sampleRate != 0
+
+    def isWritable(self, tag: str, level: TimberLevel) -> bool:
+        minimumLevel = self.__tagMinimumLevels.get(tag, self.__minimumLevel)
+        return level.isAtLeast(minimumLevel)
+
+    def __renderStatement(self, statement: Union[str, Callable[[], str]]) -> str:
+        if isinstance(statement, str):
+            return statement
+
+        try:
+            return statement()
+        except Exception as e:
+            return f'TimberConsoleSink encountered an Exception when building a log statement: {e}\n'
+
+    def __run(self):
+        while True:
+            with self.__condition:
+                self.__condition.wait_for(lambda: len(self.__buffer) >= 1 or self.__isClosed)
+
+                if len(self.__buffer) == 0 and self.__isClosed:
+                    return
+
+                pendingStatements: List[Union[str, Callable[[], str]]] = list(self.__buffer)
+                self.__buffer.clear()
+                droppedLines = self.__droppedLines
+                self.__droppedLines = 0
+                self.__isWriting = True
+
+            statements: List[str] = list()
+
+            if droppedLines >= 1:
+                statements.append(f'TimberConsoleSink — {droppedLines} line(s) dropped\n')
+
+            for statement in pendingStatements:
+                statements.append(self.__renderStatement(statement))
+
+            try:
+                stream = self.__getStream()
+                stream.write(''.join(statements))
+                stream.flush()
+            except Exception:
+                # there's nowhere left to report a broken console to, so just move on
+                pass
+
+            with self.__condition:
+                self.__isWriting = False
+                self.__condition.notify_all()
+
+    def start(self):
+        with self.__condition:
+            if self.__thread is not None:
+                return
+
+            self.__thread = threading.Thread(
+                target = self.__run,
+                name = 'TimberConsoleSink',
+                daemon = True
+            )
+
+            self.__thread.start()
+
+    def write(self, tag: str, level: TimberLevel, statement: Union[str, Callable[[], str]]):
+        if not self.isWritable(tag, level):
+            return
+
+        with self.__condition:
+            if self.__isSampledOut(tag, level):
+                return
+
+            if len(self.__buffer) == self.__maxBufferSize:
+                # the deque drops its oldest statement on its own, this is just keeping count
+                self.__droppedLines = self.__droppedLines + 1
+
+            self.__buffer.append(statement)
+            self.__condition.notify()
@@ -1,13 +1,21 @@
-from typing import Optional
+import copy
+import sys
+from traceback import format_exception
+from types import TracebackType
+from typing import Any, Optional, Sequence, Tuple, Type
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.simpleDateTime import SimpleDateTime
+    from CynanBotCommon.timber.timberLevel import TimberLevel
 except:
     import utils
     from simpleDateTime import SimpleDateTime
+    from timber.timberLevel import TimberLevel
 
 
+# The message and traceback are only formatted the first time that something asks for them,
+# which is normally one of Timber's writer threads rather than whoever called Timber.log().
 class TimberEntry():
 
     def __init__(
@@ -15,7 +23,10 @@ class TimberEntry():
         tag: str,
         msg: str,
         exception: Optional[Exception] = None,
-        traceback: Optional[str] = None
+        traceback: Optional[str] = None,
+        level: Optional[TimberLevel] = None,
+        args: Optional[Sequence[Any]] = None,
+        excInfo: bool = False
     ):
         if not utils.isValidStr(tag):
             raise ValueError(f'tag argument is malformed: \"{tag}\"')
@@ -25,31 +36,118 @@ class TimberEntry():
             raise ValueError(f'exception argument is malformed: \"{exception}\"')
         elif traceback is not None and not isinstance(traceback, str):
             raise ValueError(f'traceback argument is malformed: \"{traceback}\"')
+        elif level is not None and not isinstance(level, TimberLevel):
+            raise ValueError(f'level argument is malformed: \"{level}\"')
+        elif args is not None and (isinstance(args, str) or not isinstance(args, Sequence)):
+            raise ValueError(f'args argument is malformed: \"{args}\"')
+        elif not utils.isValidBool(excInfo):
+            raise ValueError(f'excInfo argument is malformed: \"{excInfo}\"')
 
         self.__tag: str = tag.strip()
-        self.__msg: str = msg.strip()
+        self.__msg: str = msg
         self.__exception: Optional[Exception] = exception
         self.__traceback: Optional[str] = traceback
+        self.__args: Optional[Sequence[Any]] = None
+
+        if args is not None:
+            self.__args = tuple(self.__copyArg(arg) for arg in args)
+
+        # only the exception itself is held onto here, the traceback text is rendered later
+        self.__excInfo: Optional[Tuple[Type[BaseException], BaseException, Optional[TracebackType]]] = None
+
+        if excInfo and traceback is None:
+            if exception is not None:
+                self.__excInfo = (type(exception), exception, exception.__traceback__)
+            else:
+                currentExcInfo = sys.exc_info()
+
+                if currentExcInfo[1] is not None:
+                    self.__excInfo = currentExcInfo
+
+        if level is None:
+            if self.hasException():
+                level = TimberLevel.ERROR
+            else:
+                level = TimberLevel.INFO
+
+        self.__level: TimberLevel = level
+        self.__formattedMsg: Optional[str] = None
+        self.__formattedTraceback: Optional[str] = None
 
         self.__sdt: SimpleDateTime = SimpleDateTime()
 
-    def getException(self) -> Optional[Exception]:
-        return self.__exception
+    def __copyArg(self, arg: Any) -> Any:
+        # the caller is free to change its own dicts, lists, and sets once log() returns,
+        # which could be before the message is formatted, so those are shallow copied here
+        if isinstance(arg, (dict, list, set)):
+            return copy.copy(arg)
+        else:
+            return arg
+
+    def getException(self) -> Optional[BaseException]:
+        if self.__exception is not None:
+            return self.__exception
+        elif self.__excInfo is not None:
+            return self.__excInfo[1]
+        else:
+            return None
+
+    def getLevel(self) -> TimberLevel:
+        return self.__level
 
     def getMsg(self) -> str:
-        return self.__msg
+        formattedMsg = self.__formattedMsg
+
+        if formattedMsg is not None:
+            return formattedMsg
+
+        if self.__args is None:
+            formattedMsg = self.__msg.strip()
+        else:
+            try:
+                formattedMsg = (self.__msg % tuple(self.__args)).strip()
+            except Exception:
+                # a bad template shouldn't cost us the log statement
+                formattedMsg = f'{self.__msg.strip()} {self.__args}'
+
+        self.__formattedMsg = formattedMsg
+        return formattedMsg
 
     def getSimpleDateTime(self) -> SimpleDateTime:
         return self.__sdt
 
+    def getSizeEstimate(self) -> int:
+        sizeEstimate = len(self.__msg) + len(self.__tag) + 64
+
+        if self.__args is not None:
+            sizeEstimate = sizeEstimate + 16 * len(self.__args)
+
+        if self.__traceback is not None:
+            sizeEstimate = sizeEstimate + len(self.__traceback)
+        elif self.__excInfo is not None:
+            sizeEstimate = sizeEstimate + 1024
+
+        return sizeEstimate
+
     def getTag(self) -> str:
         return self.__tag
 
     def getTraceback(self) -> Optional[str]:
-        return self.__traceback
+        if self.__traceback is not None:
+            return self.__traceback
+        elif self.__excInfo is None:
+            return None
+
+        formattedTraceback = self.__formattedTraceback
+
+        if formattedTraceback is None:
+            formattedTraceback = ''.join(format_exception(*self.__excInfo))
+            self.__formattedTraceback = formattedTraceback
+
+        return formattedTraceback
 
     def hasException(self) -> bool:
-        return self.__exception is not None
+        return self.__exception is not None or self.__excInfo is not None
 
     def hasTraceback(self) -> bool:
-        return utils.isValidStr(self.__traceback)
+        return utils.isValidStr(self.__traceback) or self.__excInfo is not None
@@ -1,15 +1,29 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional, Sequence
+
+try:
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
+    from CynanBotCommon.timber.timberLevel import TimberLevel
+except:
+    from logSink.logSinkMetrics import LogSinkMetrics
+    from timber.timberLevel import TimberLevel
 
 
 class TimberInterface(ABC):
 
+    @abstractmethod
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        pass
+
     @abstractmethod
     def log(
         self,
         tag: str,
         msg: str,
         exception: Optional[Exception] = None,
-        traceback: Optional[str] = None
+        traceback: Optional[str] = None,
+        level: Optional[TimberLevel] = None,
+        args: Optional[Sequence[Any]] = None,
+        excInfo: bool = False
     ):
         pass
@@ -0,0 +1,38 @@
+from enum import Enum, auto
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+class TimberLevel(Enum):
+
+    DEBUG = auto()
+    INFO = auto()
+    WARNING = auto()
+    ERROR = auto()
+
+    @classmethod
+    def fromStr(cls, text: str):
+        if not utils.isValidStr(text):
+            raise ValueError(f'text argument is malformed: \"{text}\"')
+
+        text = text.lower()
+
+        if text == 'debug':
+            return TimberLevel.DEBUG
+        elif text == 'info':
+            return TimberLevel.INFO
+        elif text == 'warning':
+            return TimberLevel.WARNING
+        elif text == 'error':
+            return TimberLevel.ERROR
+        else:
+            raise ValueError(f'unknown TimberLevel: \"{text}\"')
+
+    def isAtLeast(self, level) -> bool:
+        if not isinstance(level, TimberLevel):
+            raise ValueError(f'level argument is malformed: \"{level}\"')
+
+        return self.value >= level.value
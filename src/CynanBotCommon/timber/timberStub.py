@@ -1,9 +1,13 @@
-from typing import Optional
+from typing import Any, Optional, Sequence
 
 try:
+    from CynanBotCommon.logSink.logSinkMetrics import LogSinkMetrics
     from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.timber.timberLevel import TimberLevel
 except:
+    from logSink.logSinkMetrics import LogSinkMetrics
     from timber.timberInterface import TimberInterface
+    from timber.timberLevel import TimberLevel
 
 
 class TimberStub(TimberInterface):
@@ -11,11 +15,26 @@ class TimberStub(TimberInterface):
     def __init__(self):
         pass
 
+    def getLogSinkMetrics(self) -> LogSinkMetrics:
+        return LogSinkMetrics(
+            bytesWritten = 0,
+            droppedStatements = 0,
+            flushDurationHistogram = dict(),
+            flushes = 0,
+            maxQueueSize = 0,
+            oldestStatementAgeSeconds = None,
+            queueSize = 0,
+            spilledStatements = 0
+        )
+
     def log(
         self,
         tag: str,
         msg: str,
         exception: Optional[Exception] = None,
-        traceback: Optional[str] = None
+        traceback: Optional[str] = None,
+        level: Optional[TimberLevel] = None,
+        args: Optional[Sequence[Any]] = None,
+        excInfo: bool = False
     ):
         pass
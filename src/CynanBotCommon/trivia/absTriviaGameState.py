@@ -8,11 +8,13 @@ try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.specialTriviaStatus import SpecialTriviaStatus
+    from CynanBotCommon.trivia.triviaAnswerMatcher import TriviaAnswerMatcher
     from CynanBotCommon.trivia.triviaGameType import TriviaGameType
 except:
     import utils
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.specialTriviaStatus import SpecialTriviaStatus
+    from trivia.triviaAnswerMatcher import TriviaAnswerMatcher
     from trivia.triviaGameType import TriviaGameType
 
 
@@ -67,6 +69,7 @@ class AbsTriviaGameState(ABC):
 
         self.__endTime: datetime = datetime.now(timezone.utc) + timedelta(seconds = secondsToLive)
         self.__gameId: str = ''.join(random.choice(string.ascii_lowercase) for _ in range(12))
+        self.__triviaAnswerMatcher: Optional[TriviaAnswerMatcher] = None
 
     def getActionId(self) -> str:
         return self.__actionId
@@ -92,6 +95,9 @@ class AbsTriviaGameState(ABC):
     def getSpecialTriviaStatus(self) -> Optional[SpecialTriviaStatus]:
         return self.__specialTriviaStatus
 
+    def getTriviaAnswerMatcher(self) -> Optional[TriviaAnswerMatcher]:
+        return self.__triviaAnswerMatcher
+
     def getTriviaGameType(self) -> TriviaGameType:
         return self.__triviaGameType
 
@@ -106,3 +112,9 @@ class AbsTriviaGameState(ABC):
 
     def isToxic(self) -> bool:
         return self.__specialTriviaStatus is SpecialTriviaStatus.TOXIC
+
+    def setTriviaAnswerMatcher(self, triviaAnswerMatcher: Optional[TriviaAnswerMatcher]):
+        if triviaAnswerMatcher is not None and not isinstance(triviaAnswerMatcher, TriviaAnswerMatcher):
+            raise ValueError(f'triviaAnswerMatcher argument is malformed: \"{triviaAnswerMatcher}\"')
+
+        self.__triviaAnswerMatcher = triviaAnswerMatcher
@@ -3,7 +3,6 @@ from typing import List, Optional
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.additionalTriviaAnswer import \
@@ -30,7 +29,6 @@ try:
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.additionalTriviaAnswer import AdditionalTriviaAnswer
@@ -85,7 +83,7 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def addAdditionalTriviaAnswer(
         self,
@@ -160,16 +158,15 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
                 triviaType = triviaType
             )
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
-                VALUES ($1, $2, $3, $4, $5)
-            ''',
-            additionalAnswer, triviaId, triviaSource.toStr(), triviaType.toStr(), userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO additionaltriviaanswers (additionalanswer, triviaid, triviasource, triviatype, userid)
+                    VALUES ($1, $2, $3, $4, $5)
+                ''',
+                additionalAnswer, triviaId, triviaSource.toStr(), triviaType.toStr(), userId
+            )
 
-        await connection.close()
         self.__timber.log('AdditionalTriviaAnswersRepository', f'Added additional answer (\"{additionalAnswer}\") for {triviaSource.toStr()}:{triviaId}, all answers: {additionalAnswersList}')
 
         return AdditionalTriviaAnswers(
@@ -228,16 +225,15 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             self.__timber.log('AdditionalTriviaAnswersRepository', f'Attempted to delete additional answers for {triviaSource.toStr()}:{triviaId}, but there were none')
             return None
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM additionaltriviaanswers
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
-            ''',
-            triviaId, triviaSource.toStr(), triviaType.toStr()
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM additionaltriviaanswers
+                    WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3
+                ''',
+                triviaId, triviaSource.toStr(), triviaType.toStr()
+            )
 
-        await connection.close()
         self.__timber.log('AdditionalTriviaAnswersRepository', f'Deleted additional answers for {triviaSource.toStr()}:{triviaId} (existing additional answers were {reference.getAdditionalAnswers()})')
 
         return reference
@@ -258,18 +254,16 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         if not await self.__triviaSettingsRepository.areAdditionalTriviaAnswersEnabled():
             return None
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
-                INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
-                WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
-                ORDER BY additionaltriviaanswers.additionalanswer ASC
-            ''',
-            triviaId, triviaSource.toStr(), triviaType.toStr()
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT additionaltriviaanswers.additionalanswer, additionaltriviaanswers.userid, userids.username FROM additionaltriviaanswers
+                    INNER JOIN userids ON additionaltriviaanswers.userid = userids.userid
+                    WHERE additionaltriviaanswers.triviaid = $1 AND additionaltriviaanswers.triviasource = $2 AND additionaltriviaanswers.triviatype = $3
+                    ORDER BY additionaltriviaanswers.additionalanswer ASC
+                ''',
+                triviaId, triviaSource.toStr(), triviaType.toStr()
+            )
 
         if not utils.hasItems(records):
             return None
@@ -292,19 +286,12 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
             triviaType = triviaType
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
                         additionalanswer text NOT NULL,
@@ -315,8 +302,8 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
                         additionalanswer TEXT NOT NULL,
@@ -328,6 +315,9 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'AdditionalTriviaAnswersRepository',
+            statements = statements
+        )
@@ -5,7 +5,6 @@ try:
     from CynanBotCommon.administratorProviderInterface import \
         AdministratorProviderInterface
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.addBannedTriviaGameControllerResult import \
@@ -24,7 +23,6 @@ except:
     import utils
     from administratorProviderInterface import AdministratorProviderInterface
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.addBannedTriviaGameControllerResult import \
@@ -67,7 +65,7 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def addBannedController(self, userName: str) -> AddBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -85,87 +83,76 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             self.__timber.log('BannedTriviaGameControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to add \"{userName}\" as a banned trivia game controller: \"{userId}\"')
             return AddBannedTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM bannedtriviagamecontrollers
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM bannedtriviagamecontrollers
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId
+            )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
-
-        if utils.isValidInt(count) and count >= 1:
-            await connection.close()
-            self.__timber.log('BannedTriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller, but this user has already been added as one')
-            return AddBannedTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviagamecontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
+
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('BannedTriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller, but this user has already been added as one')
+                return AddBannedTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviagamecontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
 
-        await connection.close()
         self.__timber.log('BannedTriviaGameControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller')
 
         return AddBannedTriviaGameControllerResult.ADDED
 
     async def getBannedControllers(self) -> List[BannedTriviaGameController]:
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT bannedtriviagamecontrollers.userid, userids.username FROM bannedtriviagamecontrollers
-                INNER JOIN userids ON bannedtriviagamecontrollers.userid = userids.userid
-                ORDER BY userids.username ASC
-            '''
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT bannedtriviagamecontrollers.userid, userids.username FROM bannedtriviagamecontrollers
+                    INNER JOIN userids ON bannedtriviagamecontrollers.userid = userids.userid
+                    ORDER BY userids.username ASC
+                '''
+            )
 
-        controllers: List[BannedTriviaGameController] = list()
+            controllers: List[BannedTriviaGameController] = list()
 
-        if not utils.hasItems(records):
-            await connection.close()
-            return controllers
+            if not utils.hasItems(records):
+                return controllers
 
-        for record in records:
-            controllers.append(BannedTriviaGameController(
-                userId = record[0],
-                userName = record[1]
-            ))
+            for record in records:
+                controllers.append(BannedTriviaGameController(
+                    userId = record[0],
+                    userName = record[1]
+                ))
 
-        await connection.close()
         controllers.sort(key = lambda controller: controller.getUserName().lower())
 
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
                         userid public.citext NOT NULL PRIMARY KEY
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
                         userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
@@ -173,9 +160,12 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'BannedTriviaGameControllersRepository',
+            statements = statements
+        )
 
     async def removeBannedController(self, userName: str) -> RemoveBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -187,16 +177,15 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
             self.__timber.log('BannedTriviaGameControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to remove \"{userName}\" as a banned trivia game controller')
             return RemoveBannedTriviaGameControllerResult.ERROR
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviagamecontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviagamecontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
 
-        await connection.close()
         self.__timber.log('BannedTriviaGameControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a banned trivia game controller')
 
         return RemoveBannedTriviaGameControllerResult.REMOVED
@@ -1,9 +1,9 @@
-from typing import Optional
+import asyncio
+from typing import List, Optional, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.bannedTriviaIdsRepositoryInterface import \
@@ -15,7 +15,6 @@ try:
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.bannedTriviaIdsRepositoryInterface import \
@@ -40,7 +39,11 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
+        # every banned question, keyed by its lowercased trivia ID and its trivia source
+        self.__bannedTriviaIds: Optional[Set[Tuple[str, TriviaSource]]] = None
+        self.__bannedTriviaIdsLock: Optional[asyncio.Lock] = None
+
+        self.__registerDatabaseTables()
 
     async def ban(
         self,
@@ -55,31 +58,66 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        info = await self.getInfo(triviaId = triviaId, triviaSource = triviaSource)
+        bannedTriviaIds = await self.__getBannedTriviaIds()
+        key = self.__createKey(triviaId, triviaSource)
 
-        if info is not None:
-            self.__timber.log('BannedTriviaIdsRepository', f'Attempted to ban trivia question but it\'s already been banned: {info}')
+        if key in bannedTriviaIds:
+            self.__timber.log('BannedTriviaIdsRepository', f'Attempted to ban trivia question but it\'s already been banned (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
             return BanTriviaQuestionResult.ALREADY_BANNED
 
         self.__timber.log('BannedTriviaIdsRepository', f'Banning trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")...')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
-                VALUES ($1, $2, $3)
-            ''',
-            triviaId, triviaSource.toStr(), userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO bannedtriviaids (triviaid, triviasource, userid)
+                    VALUES ($1, $2, $3)
+                ''',
+                triviaId, triviaSource.toStr(), userId
+            )
 
-        await connection.close()
+        bannedTriviaIds.add(key)
         self.__timber.log('BannedTriviaIdsRepository', f'Banned trivia question (triviaId=\"{triviaId}\", userId=\"{userId}\", triviaSource=\"{triviaSource}\")')
 
         return BanTriviaQuestionResult.BANNED
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    def __createKey(self, triviaId: str, triviaSource: TriviaSource) -> Tuple[str, TriviaSource]:
+        # the triviaid column is case insensitive, so the in-memory ban list needs to be too
+        return triviaId.lower(), triviaSource
+
+    async def __getBannedTriviaIds(self) -> Set[Tuple[str, TriviaSource]]:
+        if self.__bannedTriviaIds is not None:
+            return self.__bannedTriviaIds
+
+        async with self.__getBannedTriviaIdsLock():
+            if self.__bannedTriviaIds is not None:
+                return self.__bannedTriviaIds
+
+            async with await self.__backingDatabase.getConnection() as connection:
+                records = await connection.fetchRows(
+                    '''
+                        SELECT triviaid, triviasource FROM bannedtriviaids
+                    '''
+                )
+
+            bannedTriviaIds: Set[Tuple[str, TriviaSource]] = set()
+
+            if utils.hasItems(records):
+                for record in records:
+                    bannedTriviaIds.add(self.__createKey(record[0], TriviaSource.fromStr(record[1])))
+
+            self.__timber.log('BannedTriviaIdsRepository', f'Loaded {len(bannedTriviaIds)} banned trivia question(s)')
+            self.__bannedTriviaIds = bannedTriviaIds
+            return bannedTriviaIds
+
+    def __getBannedTriviaIdsLock(self) -> asyncio.Lock:
+        bannedTriviaIdsLock = self.__bannedTriviaIdsLock
+
+        if bannedTriviaIdsLock is None:
+            bannedTriviaIdsLock = asyncio.Lock()
+            self.__bannedTriviaIdsLock = bannedTriviaIdsLock
+
+        return bannedTriviaIdsLock
 
     async def getInfo(
         self,
@@ -91,18 +129,16 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
-                INNER JOIN userids ON bannedtriviaids.userid = userids.userid
-                WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
-                LIMIT 1
-            ''',
-            triviaId, triviaSource.toStr()
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT bannedtriviaids.triviaid, bannedtriviaids.triviasource, bannedtriviaids.userid, userids.username FROM bannedtriviaids
+                    INNER JOIN userids ON bannedtriviaids.userid = userids.userid
+                    WHERE bannedtriviaids.triviaid = $1 AND bannedtriviaids.triviasource = $2
+                    LIMIT 1
+                ''',
+                triviaId, triviaSource.toStr()
+            )
 
         if not utils.hasItems(record):
             return None
@@ -114,15 +150,12 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
             triviaSource = TriviaSource.fromStr(record[1])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviaids (
                         triviaid public.citext NOT NULL,
@@ -132,8 +165,8 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS bannedtriviaids (
                         triviaid TEXT NOT NULL COLLATE NOCASE,
@@ -144,9 +177,12 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'BannedTriviaIdsRepository',
+            statements = statements
+        )
 
     async def isBanned(self, triviaId: str, triviaSource: TriviaSource) -> bool:
         if not utils.isValidStr(triviaId):
@@ -154,15 +190,12 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        info = await self.getInfo(
-            triviaId = triviaId,
-            triviaSource = triviaSource
-        )
+        bannedTriviaIds = await self.__getBannedTriviaIds()
 
-        if info is None:
+        if self.__createKey(triviaId, triviaSource) not in bannedTriviaIds:
             return False
 
-        self.__timber.log('BannedTriviaIdsRepository', f'Encountered banned trivia question ({info})')
+        self.__timber.log('BannedTriviaIdsRepository', f'Encountered banned trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
         return True
 
     async def unban(
@@ -175,24 +208,25 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         elif not isinstance(triviaSource, TriviaSource):
             raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
 
-        info = await self.getInfo(triviaId = triviaId, triviaSource = triviaSource)
+        bannedTriviaIds = await self.__getBannedTriviaIds()
+        key = self.__createKey(triviaId, triviaSource)
 
-        if info is None:
+        if key not in bannedTriviaIds:
             self.__timber.log('BannedTriviaIdsRepository', f'Attempted to unban trivia question but it wasn\'t banned (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
             return BanTriviaQuestionResult.NOT_BANNED
 
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanning trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")...')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM bannedtriviaids
-                WHERE triviaid = $1 AND triviasource = $2
-            ''',
-            triviaId, triviaSource.toStr()
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM bannedtriviaids
+                    WHERE triviaid = $1 AND triviasource = $2
+                ''',
+                triviaId, triviaSource.toStr()
+            )
 
-        await connection.close()
+        bannedTriviaIds.discard(key)
         self.__timber.log('BannedTriviaIdsRepository', f'Unbanned trivia question (triviaId=\"{triviaId}\", triviaSource=\"{triviaSource}\")')
 
         return BanTriviaQuestionResult.UNBANNED
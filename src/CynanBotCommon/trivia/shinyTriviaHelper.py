@@ -80,21 +80,11 @@ class ShinyTriviaHelper():
         elif not utils.isValidStr(userId):
             raise ValueError(f'userId argument is malformed: \"{userId}\"')
 
-        cutenessLeaderboard = await self.__cutenessRepository.fetchCutenessLeaderboard(
-            twitchChannel = twitchChannel
+        return await self.__cutenessRepository.fetchCutenessLeaderboardPlacement(
+            twitchChannel = twitchChannel,
+            userId = userId
         )
 
-        if not cutenessLeaderboard.hasEntries():
-            return None
-
-        userId = userId.lower()
-
-        for entry in cutenessLeaderboard.getEntries():
-            if entry.getUserId().lower() == userId:
-                return entry.getRank()
-
-        return None
-
     async def isShinyTriviaQuestion(
         self,
         twitchChannel: str,
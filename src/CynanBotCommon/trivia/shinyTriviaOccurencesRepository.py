@@ -1,16 +1,14 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.trivia.shinyTriviaResult import ShinyTriviaResult
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from trivia.shinyTriviaResult import ShinyTriviaResult
 
@@ -30,7 +28,7 @@ class ShinyTriviaOccurencesRepository():
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timeZone: timezone = timeZone
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def fetchDetails(
         self,
@@ -44,24 +42,22 @@ class ShinyTriviaOccurencesRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT count, mostrecent FROM shinytriviaoccurences
-                WHERE twitchchannel = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
-
-        shinyCount: int = 0
-        mostRecent: Optional[datetime] = None
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT count, mostrecent FROM shinytriviaoccurences
+                    WHERE twitchchannel = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
 
-        if utils.hasItems(record):
-            shinyCount = record[0]
-            mostRecent = utils.getDateTimeFromStr(record[1])
+            shinyCount: int = 0
+            mostRecent: Optional[datetime] = None
 
-        await connection.close()
+            if utils.hasItems(record):
+                shinyCount = record[0]
+                mostRecent = utils.getDateTimeFromStr(record[1])
 
         return ShinyTriviaResult(
             mostRecent = mostRecent,
@@ -71,10 +67,6 @@ class ShinyTriviaOccurencesRepository():
             userId = userId
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def incrementShinyCount(
         self,
         twitchChannel: str,
@@ -110,15 +102,12 @@ class ShinyTriviaOccurencesRepository():
 
         return newResult
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
                         count integer DEFAULT 0 NOT NULL,
@@ -129,8 +118,8 @@ class ShinyTriviaOccurencesRepository():
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
                         count INTEGER NOT NULL DEFAULT 0,
@@ -142,9 +131,12 @@ class ShinyTriviaOccurencesRepository():
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'ShinyTriviaOccurencesRepository',
+            statements = statements
+        )
 
     async def __updateShinyCount(
         self,
@@ -166,14 +158,12 @@ class ShinyTriviaOccurencesRepository():
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannel, userid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannel, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
-            ''',
-            newShinyCount, nowDateTimeStr, twitchChannel, userId
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannel, userid)
+                    VALUES ($1, $2, $3, $4)
+                    ON CONFLICT (twitchchannel, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
+                ''',
+                newShinyCount, nowDateTimeStr, twitchChannel, userId
+            )
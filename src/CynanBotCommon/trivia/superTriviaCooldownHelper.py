@@ -33,6 +33,12 @@ class SuperTriviaCooldownHelper(SuperTriviaCooldownHelperInterface):
 
         self.__values: Dict[str, datetime] = defaultdict(lambda: datetime.now(timeZone) - timedelta(days = 1))
 
+    def getCooldownEndTime(self, twitchChannel: str) -> datetime:
+        if not utils.isValidStr(twitchChannel):
+            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
+
+        return self.__values[twitchChannel.lower()]
+
     async def getTwitchChannelsInCooldown(self) -> Set[str]:
         twitchChannels: Set[str] = set()
         now = datetime.now(self.__timeZone)
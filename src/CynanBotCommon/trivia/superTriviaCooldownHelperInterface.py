@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Set
 
 
 class SuperTriviaCooldownHelperInterface(ABC):
 
+    @abstractmethod
+    def getCooldownEndTime(self, twitchChannel: str) -> datetime:
+        pass
+
     @abstractmethod
     async def getTwitchChannelsInCooldown(self) -> Set[str]:
         pass
@@ -0,0 +1,72 @@
+import asyncio
+
+import pytest
+
+try:
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...timber.timberStub import TimberStub
+    from ..bannedTriviaIdsRepository import BannedTriviaIdsRepository
+    from ..banTriviaQuestionResult import BanTriviaQuestionResult
+    from ..triviaSource import TriviaSource
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from timber.timberStub import TimberStub
+    from trivia.bannedTriviaIdsRepository import BannedTriviaIdsRepository
+    from trivia.banTriviaQuestionResult import BanTriviaQuestionResult
+    from trivia.triviaSource import TriviaSource
+
+
+class TestBannedTriviaIdsRepository():
+
+    def __createBackingDatabase(self, tmp_path) -> BackingSqliteDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+    def __createRepository(self, backingDatabase: BackingSqliteDatabase) -> BannedTriviaIdsRepository:
+        return BannedTriviaIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub()
+        )
+
+    @pytest.mark.asyncio
+    async def test_ban(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        assert not await repository.isBanned('abc123', TriviaSource.J_SERVICE)
+
+        assert await repository.ban('abc123', '12345', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.BANNED
+        assert await repository.ban('ABC123', '12345', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.ALREADY_BANNED
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE)
+        assert await repository.isBanned('ABC123', TriviaSource.J_SERVICE)
+        assert not await repository.isBanned('abc123', TriviaSource.OPEN_TRIVIA_QA)
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_isBanned_loadsBansFromDatabase(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        await repository.ban('abc123', '12345', TriviaSource.J_SERVICE)
+        await backingDatabase.close()
+
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        assert await repository.isBanned('abc123', TriviaSource.J_SERVICE)
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_unban(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        assert await repository.unban('abc123', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.NOT_BANNED
+
+        await repository.ban('abc123', '12345', TriviaSource.J_SERVICE)
+        assert await repository.unban('abc123', TriviaSource.J_SERVICE) is BanTriviaQuestionResult.UNBANNED
+        assert not await repository.isBanned('abc123', TriviaSource.J_SERVICE)
+        await backingDatabase.close()
+
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        assert not await repository.isBanned('abc123', TriviaSource.J_SERVICE)
+        await backingDatabase.close()
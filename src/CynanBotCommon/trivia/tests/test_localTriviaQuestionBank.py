@@ -0,0 +1,59 @@
+try:
+    from ..triviaRepositories.localTriviaQuestionBank import \
+        LocalTriviaQuestionBank
+except:
+    from trivia.triviaRepositories.localTriviaQuestionBank import \
+        LocalTriviaQuestionBank
+
+
+class TestLocalTriviaQuestionBank():
+
+    questionBank = LocalTriviaQuestionBank(
+        columns = [ 'category', 'difficulty', 'questionId' ],
+        rows = [
+            ('Games', 'easy', 1),
+            ('Games', 'hard', 2),
+            ('Music', 'easy', 3),
+            ('Music', 'easy', 4),
+            ('Science', 'medium', 5)
+        ]
+    )
+
+    def test_chooseRandomRows(self):
+        rows = self.questionBank.chooseRandomRows(3)
+        assert len(rows) == 3
+        assert len({ row[2] for row in rows }) == 3
+
+    def test_chooseRandomRows_withCountLargerThanSize(self):
+        rows = self.questionBank.chooseRandomRows(10)
+        assert { row[2] for row in rows } == { 1, 2, 3, 4, 5 }
+
+    def test_chooseRandomRows_withColumnFilter(self):
+        rows = self.questionBank.chooseRandomRows(10, { 'category': 'Music' })
+        assert { row[2] for row in rows } == { 3, 4 }
+
+    def test_chooseRandomRows_withColumnFilters(self):
+        rows = self.questionBank.chooseRandomRows(10, { 'category': 'Games', 'difficulty': 'easy' })
+        assert rows == [ ('Games', 'easy', 1) ]
+
+    def test_chooseRandomRows_withNoMatches(self):
+        assert self.questionBank.chooseRandomRows(10, { 'category': 'Sports' }) == list()
+
+    def test_chooseRandomRows_withUnknownColumn(self):
+        exception: Exception = None
+
+        try:
+            self.questionBank.chooseRandomRows(1, { 'answer': 'Samus' })
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
+
+    def test_getColumnValues(self):
+        assert self.questionBank.getColumnValues('difficulty') == { 'easy', 'hard', 'medium' }
+
+    def test_getSize(self):
+        assert self.questionBank.getSize() == 5
+
+    def test_getSizeInBytes(self):
+        assert self.questionBank.getSizeInBytes() > 0
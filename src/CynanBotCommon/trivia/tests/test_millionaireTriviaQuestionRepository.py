@@ -0,0 +1,117 @@
+import sqlite3
+from typing import Set
+
+import pytest
+
+try:
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaQuestionCompiler import TriviaQuestionCompiler
+    from ..triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+except:
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaQuestionCompiler import TriviaQuestionCompiler
+    from trivia.triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+
+
+class TestMillionaireTriviaQuestionRepository():
+
+    fetchOptions = TriviaFetchOptions(twitchChannel = 'smCharles')
+
+    def __createRepository(
+        self,
+        triviaDatabaseFile: str,
+        isPreloadEnabled: bool = False
+    ) -> MillionaireTriviaQuestionRepository:
+        return MillionaireTriviaQuestionRepository(
+            timber = TimberStub(),
+            triviaQuestionCompiler = TriviaQuestionCompiler(),
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(dict())
+            ),
+            triviaDatabaseFile = triviaDatabaseFile,
+            isPreloadEnabled = isPreloadEnabled
+        )
+
+    def __createDatabase(self, triviaDatabaseFile: str, triviaIds: Set[int]):
+        connection = sqlite3.connect(triviaDatabaseFile)
+        connection.execute('CREATE TABLE millionaireQuestions (answer TEXT, question TEXT, responseA TEXT, responseB TEXT, responseC TEXT, responseD TEXT, triviaId TEXT)')
+
+        for triviaId in triviaIds:
+            connection.execute(
+                'INSERT INTO millionaireQuestions (rowid, answer, question, responseA, responseB, responseC, responseD, triviaId) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (triviaId, 'Samus', f'Question {triviaId}?', 'Samus', 'Ridley', 'Kraid', 'Phantoon', str(triviaId))
+            )
+
+        connection.commit()
+        connection.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion(self, tmp_path):
+        triviaDatabaseFile = str(tmp_path / 'millionaire.sqlite')
+        self.__createDatabase(triviaDatabaseFile, { 1, 2, 3 })
+        repository = self.__createRepository(triviaDatabaseFile)
+
+        question = await repository.fetchTriviaQuestion(self.fetchOptions)
+        assert question.getTriviaId() in { '1', '2', '3' }
+        assert question.getTriviaSource() is TriviaSource.MILLIONAIRE
+        assert question.getQuestion() == f'Question {question.getTriviaId()}?'
+
+        await repository.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestions_withNonContiguousRowIds(self, tmp_path):
+        triviaDatabaseFile = str(tmp_path / 'millionaire.sqlite')
+        self.__createDatabase(triviaDatabaseFile, { 2, 5, 11, 40 })
+        repository = self.__createRepository(triviaDatabaseFile)
+
+        questions = await repository.fetchTriviaQuestions(self.fetchOptions, 3)
+        triviaIds = { question.getTriviaId() for question in questions }
+        assert len(triviaIds) == 3
+        assert triviaIds.issubset({ '2', '5', '11', '40' })
+
+        questions = await repository.fetchTriviaQuestions(self.fetchOptions, 10)
+        assert len(questions) == 4
+
+        await repository.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestions_withColumnFilters(self, tmp_path):
+        triviaDatabaseFile = str(tmp_path / 'millionaire.sqlite')
+        self.__createDatabase(triviaDatabaseFile, { 1, 2, 3 })
+
+        for isPreloadEnabled in (False, True):
+            repository = self.__createRepository(triviaDatabaseFile, isPreloadEnabled)
+            questions = await repository.fetchTriviaQuestions(self.fetchOptions, 10, { 'triviaId': '2' })
+            assert [ question.getTriviaId() for question in questions ] == [ '2' ]
+            await repository.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestions_withPreloadEnabled(self, tmp_path):
+        triviaDatabaseFile = str(tmp_path / 'millionaire.sqlite')
+        self.__createDatabase(triviaDatabaseFile, { 2, 5, 11, 40 })
+        repository = self.__createRepository(triviaDatabaseFile, isPreloadEnabled = True)
+        assert repository.getPreloadedSizeInBytes() is None
+
+        await repository.preload()
+        assert repository.getPreloadedSizeInBytes() > 0
+
+        questions = await repository.fetchTriviaQuestions(self.fetchOptions, 10)
+        assert { question.getTriviaId() for question in questions } == { '2', '5', '11', '40' }
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaQuestion_withMissingDatabaseFile(self, tmp_path):
+        repository = self.__createRepository(str(tmp_path / 'missing.sqlite'))
+        assert not await repository.hasQuestionSetAvailable()
+
+        with pytest.raises(FileNotFoundError):
+            await repository.fetchTriviaQuestion(self.fetchOptions)
@@ -955,6 +955,62 @@ class TestTriviaAnswerChecker():
         result = await self.triviaAnswerChecker.checkAnswer('idk', question)
         assert result is TriviaAnswerCheckResult.INCORRECT
 
+    @pytest.mark.asyncio
+    async def test_checkAnswers_withMultipleChoiceQuestion(self):
+        question: AbsTriviaQuestion = MultipleChoiceTriviaQuestion(
+            correctAnswers = [ 'stashiocat' ],
+            multipleChoiceResponses = [ 'Eddie', 'Imyt', 'smCharles', 'stashiocat' ],
+            category = None,
+            categoryId = None,
+            question = 'Which of these Super Metroid players is a bully?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.BONGO
+        )
+
+        results = await self.triviaAnswerChecker.checkAnswers([ 'a', 'a', 'z', 'd', 'b' ], question)
+        assert results == [
+            TriviaAnswerCheckResult.INCORRECT,
+            TriviaAnswerCheckResult.INCORRECT,
+            TriviaAnswerCheckResult.INVALID_INPUT,
+            TriviaAnswerCheckResult.CORRECT
+        ]
+
+    @pytest.mark.asyncio
+    async def test_checkAnswers_withQuestionAnswerQuestion(self):
+        answer = 'North Korea'
+
+        correctAnswers = await self.triviaQuestionCompiler.compileResponses([ answer ])
+        cleanedCorrectAnswers = await self.triviaAnswerCompiler.compileTextAnswersList([ answer ])
+
+        question: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+            correctAnswers = correctAnswers,
+            cleanedCorrectAnswers = cleanedCorrectAnswers,
+            category = 'Test Category',
+            categoryId = None,
+            question = 'The Korean country farthest north.',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        results = await self.triviaAnswerChecker.checkAnswers([ 'south korea', '', 'South Korea!', 'the north korea', 'north korea' ], question)
+        assert results == [
+            TriviaAnswerCheckResult.INCORRECT,
+            TriviaAnswerCheckResult.INVALID_INPUT,
+            TriviaAnswerCheckResult.INCORRECT,
+            TriviaAnswerCheckResult.CORRECT
+        ]
+
+        results = await self.triviaAnswerChecker.checkAnswers([ 'south korea', 'japan' ], question)
+        assert results == [
+            TriviaAnswerCheckResult.INCORRECT,
+            TriviaAnswerCheckResult.INCORRECT
+        ]
+
+        results = await self.triviaAnswerChecker.checkAnswers(list(), question)
+        assert len(results) == 0
+
     def test_sanity(self):
         assert self.triviaAnswerChecker is not None
         assert isinstance(self.triviaAnswerChecker, TriviaAnswerChecker)
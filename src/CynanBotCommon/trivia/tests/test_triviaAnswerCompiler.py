@@ -640,6 +640,25 @@ class TestTriviaAnswerCompiler():
         assert 'the fourteenth' in result  # ordinal preceded by 'the'
         assert 'xiv' in result
 
+    @pytest.mark.asyncio
+    async def test_expandNumerals_withManyNumerals(self):
+        triviaAnswerCompiler = TriviaAnswerCompiler(
+            timber = self.timber,
+            maxNumeralExpansions = 16
+        )
+
+        result: List[str] = await triviaAnswerCompiler.expandNumerals('1 2 3 4 5 6 7')
+        assert result is not None
+        assert len(result) == 16
+
+    @pytest.mark.asyncio
+    async def test_expandNumerals_withRepeatedRomanNumerals(self):
+        result1: List[str] = await self.triviaAnswerCompiler.expandNumerals('henry viii')
+        result2: List[str] = await self.triviaAnswerCompiler.expandNumerals('henry VIII')
+        assert set(result1) == set(result2)
+        assert 'henry viii' in result2
+        assert 'henry the eighth' in result2
+
     def test_sanity(self):
         assert self.triviaAnswerCompiler is not None
         assert isinstance(self.triviaAnswerCompiler, TriviaAnswerCompiler)
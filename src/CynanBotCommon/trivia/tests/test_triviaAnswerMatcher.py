@@ -0,0 +1,65 @@
+from typing import Generator
+
+try:
+    from ..triviaAnswerMatcher import TriviaAnswerMatcher
+except:
+    from trivia.triviaAnswerMatcher import TriviaAnswerMatcher
+
+
+class TestTriviaAnswerMatcher():
+
+    def __variantGenerator(self, word: str) -> Generator[str, None, None]:
+        yield word
+
+        if word == 'mt':
+            yield 'mount'
+
+    def __createMatcher(self) -> TriviaAnswerMatcher:
+        return TriviaAnswerMatcher(
+            cleanedCorrectAnswers = [ 'mount everest', 'sagarmatha' ],
+            thresholdGrowthRate = 7,
+            variantGenerator = self.__variantGenerator
+        )
+
+    def test_constructWithEmptyAnswers(self):
+        matcher: TriviaAnswerMatcher = None
+        exception: Exception = None
+
+        try:
+            matcher = TriviaAnswerMatcher(
+                cleanedCorrectAnswers = list(),
+                thresholdGrowthRate = 7,
+                variantGenerator = self.__variantGenerator
+            )
+        except Exception as e:
+            exception = e
+
+        assert matcher is None
+        assert isinstance(exception, ValueError)
+
+    def test_isMatch_withExactAnswer(self):
+        matcher = self.__createMatcher()
+        assert matcher.isMatch('mount everest')
+        assert matcher.isMatch('sagarmatha')
+
+    def test_isMatch_withMergedWords(self):
+        matcher = self.__createMatcher()
+        assert matcher.isMatch('mounteverest')
+        assert matcher.isMatch('saga rmatha')
+
+    def test_isMatch_withTypo(self):
+        matcher = self.__createMatcher()
+        assert matcher.isMatch('sagarmata')
+        assert matcher.isMatch('mounteverst')
+        assert not matcher.isMatch('mount everst')
+
+    def test_isMatch_withVariant(self):
+        matcher = self.__createMatcher()
+        assert matcher.isMatch('mt everest')
+        assert not matcher.isMatch('mt')
+
+    def test_isMatch_withWrongAnswer(self):
+        matcher = self.__createMatcher()
+        assert not matcher.isMatch('k2')
+        assert not matcher.isMatch('')
+        assert not matcher.isMatch(None)
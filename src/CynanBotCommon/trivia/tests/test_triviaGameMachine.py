@@ -0,0 +1,372 @@
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...cuteness.cutenessDate import CutenessDate
+    from ...cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from ...cuteness.cutenessResult import CutenessResult
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberInterface import TimberInterface
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+    from ...users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+    from ..absTriviaEvent import AbsTriviaEvent
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..checkAnswerTriviaAction import CheckAnswerTriviaAction
+    from ..checkSuperAnswerTriviaAction import CheckSuperAnswerTriviaAction
+    from ..correctAnswerTriviaEvent import CorrectAnswerTriviaEvent
+    from ..correctSuperAnswerTriviaEvent import CorrectSuperAnswerTriviaEvent
+    from ..incorrectSuperAnswerTriviaEvent import \
+        IncorrectSuperAnswerTriviaEvent
+    from ..multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
+    from ..newTriviaGameEvent import NewTriviaGameEvent
+    from ..outOfTimeTriviaEvent import OutOfTimeTriviaEvent
+    from ..queuedTriviaGameStore import QueuedTriviaGameStore
+    from ..shinyTriviaHelper import ShinyTriviaHelper
+    from ..startNewTriviaGameAction import StartNewTriviaGameAction
+    from ..superGameNotReadyCheckAnswerTriviaEvent import \
+        SuperGameNotReadyCheckAnswerTriviaEvent
+    from ..superTriviaCooldownHelper import SuperTriviaCooldownHelper
+    from ..superTriviaGameState import SuperTriviaGameState
+    from ..toxicTriviaHelper import ToxicTriviaHelper
+    from ..triviaAnswerChecker import TriviaAnswerChecker
+    from ..triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from ..triviaAnswerCompiler import TriviaAnswerCompiler
+    from ..triviaAnswerMatcher import TriviaAnswerMatcher
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaEmoteGeneratorInterface import TriviaEmoteGeneratorInterface
+    from ..triviaEventListener import TriviaEventListener
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaGameMachine import TriviaGameMachine
+    from ..triviaGameStore import TriviaGameStore
+    from ..triviaRepositories.triviaRepositoryInterface import \
+        TriviaRepositoryInterface
+    from ..triviaScoreRepository import TriviaScoreRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from cuteness.cutenessDate import CutenessDate
+    from cuteness.cutenessRepositoryInterface import \
+        CutenessRepositoryInterface
+    from cuteness.cutenessResult import CutenessResult
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberInterface import TimberInterface
+    from timber.timberStub import TimberStub
+    from trivia.absTriviaEvent import AbsTriviaEvent
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.checkAnswerTriviaAction import CheckAnswerTriviaAction
+    from trivia.checkSuperAnswerTriviaAction import \
+        CheckSuperAnswerTriviaAction
+    from trivia.correctAnswerTriviaEvent import CorrectAnswerTriviaEvent
+    from trivia.correctSuperAnswerTriviaEvent import \
+        CorrectSuperAnswerTriviaEvent
+    from trivia.incorrectSuperAnswerTriviaEvent import \
+        IncorrectSuperAnswerTriviaEvent
+    from trivia.multipleChoiceTriviaQuestion import \
+        MultipleChoiceTriviaQuestion
+    from trivia.newTriviaGameEvent import NewTriviaGameEvent
+    from trivia.outOfTimeTriviaEvent import OutOfTimeTriviaEvent
+    from trivia.queuedTriviaGameStore import QueuedTriviaGameStore
+    from trivia.shinyTriviaHelper import ShinyTriviaHelper
+    from trivia.startNewTriviaGameAction import StartNewTriviaGameAction
+    from trivia.superGameNotReadyCheckAnswerTriviaEvent import \
+        SuperGameNotReadyCheckAnswerTriviaEvent
+    from trivia.superTriviaCooldownHelper import SuperTriviaCooldownHelper
+    from trivia.superTriviaGameState import SuperTriviaGameState
+    from trivia.toxicTriviaHelper import ToxicTriviaHelper
+    from trivia.triviaAnswerChecker import TriviaAnswerChecker
+    from trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
+    from trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+    from trivia.triviaAnswerMatcher import TriviaAnswerMatcher
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaEmoteGeneratorInterface import \
+        TriviaEmoteGeneratorInterface
+    from trivia.triviaEventListener import TriviaEventListener
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaGameMachine import TriviaGameMachine
+    from trivia.triviaGameStore import TriviaGameStore
+    from trivia.triviaRepositories.triviaRepositoryInterface import \
+        TriviaRepositoryInterface
+    from trivia.triviaScoreRepository import TriviaScoreRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+
+    from twitch.twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+    from users.userIdsRepositoryInterface import UserIdsRepositoryInterface
+
+
+class CountingTriviaAnswerChecker(TriviaAnswerChecker):
+
+    def __init__(self, timber: TimberInterface, triviaSettingsRepository: TriviaSettingsRepository):
+        super().__init__(
+            timber = timber,
+            triviaAnswerCompiler = TriviaAnswerCompiler(timber = timber),
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        self.checkAnswersCalls: List[List[Optional[str]]] = list()
+
+    async def checkAnswers(
+        self,
+        answers: List[Optional[str]],
+        triviaQuestion: AbsTriviaQuestion,
+        extras: Optional[Dict[str, Any]] = None,
+        answerMatcher: Optional[TriviaAnswerMatcher] = None
+    ) -> List[TriviaAnswerCheckResult]:
+        self.checkAnswersCalls.append(list(answers))
+
+        return await super().checkAnswers(
+            answers = answers,
+            triviaQuestion = triviaQuestion,
+            extras = extras,
+            answerMatcher = answerMatcher
+        )
+
+
+class QueueingTriviaEventListener(TriviaEventListener):
+
+    def __init__(self):
+        self.events: asyncio.Queue = asyncio.Queue()
+
+    async def nextEvent(self) -> AbsTriviaEvent:
+        return await asyncio.wait_for(self.events.get(), timeout = 5)
+
+    async def onNewTriviaEvent(self, event: AbsTriviaEvent):
+        self.events.put_nowait(event)
+
+
+class TestTriviaGameMachine():
+
+    triviaQuestion: AbsTriviaQuestion = MultipleChoiceTriviaQuestion(
+        correctAnswers = [ 'stashiocat' ],
+        multipleChoiceResponses = [ 'Eddie', 'Imyt', 'smCharles', 'stashiocat' ],
+        category = None,
+        categoryId = None,
+        question = 'Which of these Super Metroid players is a bully?',
+        triviaId = 'abc123',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        triviaSource = TriviaSource.BONGO
+    )
+
+    def __createMachine(self, tmp_path) -> TriviaGameMachine:
+        eventLoop = asyncio.get_running_loop()
+        timber: TimberInterface = TimberStub()
+
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader(dict())
+        )
+
+        cutenessRepository = mock.MagicMock(spec = CutenessRepositoryInterface)
+        cutenessRepository.fetchCutenessIncrementedBy.return_value = CutenessResult(
+            cutenessDate = CutenessDate(),
+            cuteness = 10,
+            userId = '12345',
+            userName = 'smCharles'
+        )
+
+        triviaEmoteGenerator = mock.MagicMock(spec = TriviaEmoteGeneratorInterface)
+        triviaEmoteGenerator.getNextEmoteFor.return_value = '🏫'
+
+        triviaRepository = mock.MagicMock(spec = TriviaRepositoryInterface)
+        triviaRepository.fetchTrivia.return_value = self.triviaQuestion
+
+        self.triviaAnswerChecker = CountingTriviaAnswerChecker(
+            timber = timber,
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        self.triviaGameStore = TriviaGameStore()
+
+        self.backingDatabase = BackingSqliteDatabase(
+            eventLoop = eventLoop,
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        self.triviaScoreRepository = TriviaScoreRepository(backingDatabase = self.backingDatabase)
+
+        return TriviaGameMachine(
+            backgroundTaskHelper = BackgroundTaskHelper(eventLoop = eventLoop),
+            cutenessRepository = cutenessRepository,
+            queuedTriviaGameStore = QueuedTriviaGameStore(
+                timber = timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            shinyTriviaHelper = mock.MagicMock(spec = ShinyTriviaHelper),
+            superTriviaCooldownHelper = SuperTriviaCooldownHelper(
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            timber = timber,
+            toxicTriviaHelper = mock.MagicMock(spec = ToxicTriviaHelper),
+            triviaAnswerChecker = self.triviaAnswerChecker,
+            triviaEmoteGenerator = triviaEmoteGenerator,
+            triviaGameStore = self.triviaGameStore,
+            triviaRepository = triviaRepository,
+            triviaScoreRepository = self.triviaScoreRepository,
+            triviaSettingsRepository = triviaSettingsRepository,
+            twitchTokensRepository = mock.MagicMock(spec = TwitchTokensRepositoryInterface),
+            userIdsRepository = mock.MagicMock(spec = UserIdsRepositoryInterface)
+        )
+
+    def __createStartNewTriviaGameAction(self) -> StartNewTriviaGameAction:
+        return StartNewTriviaGameAction(
+            isShinyTriviaEnabled = False,
+            pointsForWinning = 5,
+            secondsToLive = 1,
+            shinyMultiplier = 8,
+            twitchChannel = 'smCharles',
+            userId = '12345',
+            userName = 'stashiocat',
+            triviaFetchOptions = TriviaFetchOptions(twitchChannel = 'smCharles')
+        )
+
+    async def __stopMachine(self):
+        # the machine's loops run forever, so they're cancelled here rather than left for the event loop to clean up
+        currentTask = asyncio.current_task()
+        tasks = [ task for task in asyncio.all_tasks() if task is not currentTask ]
+
+        for task in tasks:
+            task.cancel()
+
+        await asyncio.gather(*tasks, return_exceptions = True)
+        await self.backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_checkAnswer_withCorrectAnswerCancelsDeadline(self, tmp_path):
+        machine = self.__createMachine(tmp_path)
+        listener = QueueingTriviaEventListener()
+        machine.setEventListener(listener)
+        machine.startMachine()
+
+        machine.submitAction(self.__createStartNewTriviaGameAction())
+        assert isinstance(await listener.nextEvent(), NewTriviaGameEvent)
+
+        machine.submitAction(CheckAnswerTriviaAction(
+            answer = 'd',
+            twitchChannel = 'smCharles',
+            userId = '12345',
+            userName = 'stashiocat'
+        ))
+
+        assert isinstance(await listener.nextEvent(), CorrectAnswerTriviaEvent)
+
+        # wait out the game's deadline, which should no longer produce an out of time event
+        await asyncio.sleep(1.5)
+        assert listener.events.empty()
+
+        triviaScore = await self.triviaScoreRepository.fetchTriviaScore('smCharles', '12345')
+        await self.__stopMachine()
+
+        assert triviaScore.getTriviaLosses() == 0
+        assert triviaScore.getTriviaWins() == 1
+
+    @pytest.mark.asyncio
+    async def test_checkSuperAnswer_withBatchedAnswers(self, tmp_path):
+        machine = self.__createMachine(tmp_path)
+        listener = QueueingTriviaEventListener()
+        machine.setEventListener(listener)
+        machine.startMachine()
+
+        state = SuperTriviaGameState(
+            triviaQuestion = self.triviaQuestion,
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 60,
+            toxicTriviaPunishmentMultiplier = 0,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🏫',
+            twitchChannel = 'smCharles'
+        )
+
+        state.setTriviaAnswerMatcher(await self.triviaAnswerChecker.compileAnswerMatcher(self.triviaQuestion))
+        await self.triviaGameStore.add(state)
+
+        # these are all submitted before the action loop gets to run, so they're all checked together
+        for answer, userId in [ ('a', '1'), ('d', '2'), ('d', '3') ]:
+            machine.submitAction(CheckSuperAnswerTriviaAction(
+                answer = answer,
+                twitchChannel = 'smCharles',
+                userId = userId,
+                userName = f'user{userId}'
+            ))
+
+        events = [ await listener.nextEvent() for _ in range(3) ]
+        await self.__stopMachine()
+
+        assert self.triviaAnswerChecker.checkAnswersCalls == [ [ 'a', 'd', 'd' ] ]
+
+        assert isinstance(events[0], IncorrectSuperAnswerTriviaEvent)
+        assert events[0].getUserId() == '1'
+        assert isinstance(events[1], CorrectSuperAnswerTriviaEvent)
+        assert events[1].getUserId() == '2'
+        assert isinstance(events[2], SuperGameNotReadyCheckAnswerTriviaEvent)
+        assert events[2].getUserId() == '3'
+        assert await self.triviaGameStore.getSuperGame('smCharles') is None
+
+    @pytest.mark.asyncio
+    async def test_setEventListener_afterEventsAreQueued(self, tmp_path):
+        machine = self.__createMachine(tmp_path)
+        machine.startMachine()
+
+        machine.submitAction(self.__createStartNewTriviaGameAction())
+
+        while await self.triviaGameStore.getNormalGame('smCharles', '12345') is None:
+            await asyncio.sleep(0.05)
+
+        listener = QueueingTriviaEventListener()
+        machine.setEventListener(listener)
+
+        event = await listener.nextEvent()
+        await self.__stopMachine()
+
+        assert isinstance(event, NewTriviaGameEvent)
+
+    @pytest.mark.asyncio
+    async def test_startNewTriviaGame_withDeadlineTimeout(self, tmp_path):
+        machine = self.__createMachine(tmp_path)
+        listener = QueueingTriviaEventListener()
+        machine.setEventListener(listener)
+        machine.startMachine()
+
+        machine.submitAction(self.__createStartNewTriviaGameAction())
+        assert isinstance(await listener.nextEvent(), NewTriviaGameEvent)
+
+        # nothing else submits actions, so only the deadline loop can end this game
+        event = await listener.nextEvent()
+        triviaScore = await self.triviaScoreRepository.fetchTriviaScore('smCharles', '12345')
+        await self.__stopMachine()
+
+        assert isinstance(event, OutOfTimeTriviaEvent)
+        assert await self.triviaGameStore.getNormalGame('smCharles', '12345') is None
+        assert triviaScore.getTriviaLosses() == 1
+
+    @pytest.mark.asyncio
+    async def test_submitAction_fromAnotherThread(self, tmp_path):
+        machine = self.__createMachine(tmp_path)
+        listener = QueueingTriviaEventListener()
+        machine.setEventListener(listener)
+        machine.startMachine()
+
+        await asyncio.get_running_loop().run_in_executor(
+            None,
+            machine.submitAction,
+            self.__createStartNewTriviaGameAction()
+        )
+
+        event = await listener.nextEvent()
+        await self.__stopMachine()
+
+        assert isinstance(event, NewTriviaGameEvent)
+        assert event.getUserId() == '12345'
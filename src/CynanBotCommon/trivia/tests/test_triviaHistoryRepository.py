@@ -0,0 +1,88 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+try:
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..triviaContentCode import TriviaContentCode
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaHistoryRepository import TriviaHistoryRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+    from ..trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.triviaContentCode import TriviaContentCode
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaHistoryRepository import TriviaHistoryRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+    from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+
+
+class TestTriviaHistoryRepository():
+
+    def __createQuestion(self, triviaId: str) -> AbsTriviaQuestion:
+        correctAnswers: List[bool] = list()
+        correctAnswers.append(True)
+
+        return TrueFalseTriviaQuestion(
+            correctAnswers = correctAnswers,
+            category = None,
+            categoryId = None,
+            question = 'Samus is the main character of Metroid.',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            triviaSource = TriviaSource.OPEN_TRIVIA_QA
+        )
+
+    def __createBackingDatabase(self, tmp_path) -> BackingSqliteDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+    def __createRepository(self, backingDatabase: BackingSqliteDatabase, settings: Dict[str, Any]) -> TriviaHistoryRepository:
+        return TriviaHistoryRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(settings)
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_verify(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase, dict())
+        question = self.__createQuestion('abc123')
+
+        assert await repository.verify(question, 'PogChamp', 'smCharles') is TriviaContentCode.OK
+        assert await repository.verify(question, 'PogChamp', 'smCharles') is TriviaContentCode.REPEAT
+        assert await repository.verify(question, 'PogChamp', 'imyt') is TriviaContentCode.OK
+
+        # trivia IDs are case insensitive
+        assert await repository.verify(self.__createQuestion('ABC123'), 'PogChamp', 'smCharles') is TriviaContentCode.REPEAT
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_verify_updatesMostRecentTriviaQuestionDetails(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase, { 'min_days_before_repeat_question': 0 })
+        question = self.__createQuestion('abc123')
+
+        assert await repository.verify(question, 'PogChamp', 'smCharles') is TriviaContentCode.OK
+        assert await repository.verify(question, 'Kappa', 'smCharles') is TriviaContentCode.OK
+
+        reference = await repository.getMostRecentTriviaQuestionDetails('Kappa', 'smCharles')
+        assert reference is not None
+        assert reference.getTriviaId() == 'abc123'
+        assert await repository.getMostRecentTriviaQuestionDetails('PogChamp', 'smCharles') is None
+        await backingDatabase.close()
@@ -0,0 +1,568 @@
+import asyncio
+from typing import Any, Dict, List, Optional, Set
+
+import pytest
+
+try:
+    from ...backgroundTaskHelper import BackgroundTaskHelper
+    from ...storage.jsonStaticReader import JsonStaticReader
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchHandleProviderInterface import \
+        TwitchHandleProviderInterface
+    from ..absTriviaQuestion import AbsTriviaQuestion
+    from ..multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
+    from ..questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+    from ..triviaContentCode import TriviaContentCode
+    from ..triviaDifficulty import TriviaDifficulty
+    from ..triviaExceptions import GenericTriviaNetworkException
+    from ..triviaFetchOptions import TriviaFetchOptions
+    from ..triviaRepositories.bongoTriviaQuestionRepository import \
+        BongoTriviaQuestionRepository
+    from ..triviaRepositories.funtoonTriviaQuestionRepository import \
+        FuntoonTriviaQuestionRepository
+    from ..triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from ..triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import \
+        OpenTriviaDatabaseTriviaQuestionRepository
+    from ..triviaRepositories.openTriviaQaTriviaQuestionRepository import \
+        OpenTriviaQaTriviaQuestionRepository
+    from ..triviaRepositories.pkmnTriviaQuestionRepository import \
+        PkmnTriviaQuestionRepository
+    from ..triviaRepositories.triviaDatabaseTriviaQuestionRepository import \
+        TriviaDatabaseTriviaQuestionRepository
+    from ..triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
+        TriviaQuestionCompanyTriviaQuestionRepository
+    from ..triviaRepositories.triviaRepository import TriviaRepository
+    from ..triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from ..triviaRepositories.wwtbamTriviaQuestionRepository import \
+        WwtbamTriviaQuestionRepository
+    from ..triviaSettingsRepository import TriviaSettingsRepository
+    from ..triviaSource import TriviaSource
+    from ..triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
+    from ..triviaType import TriviaType
+    from ..triviaVerifierInterface import TriviaVerifierInterface
+except:
+    from backgroundTaskHelper import BackgroundTaskHelper
+    from storage.jsonStaticReader import JsonStaticReader
+    from timber.timberStub import TimberStub
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.multipleChoiceTriviaQuestion import \
+        MultipleChoiceTriviaQuestion
+    from trivia.questionAnswerTriviaQuestion import \
+        QuestionAnswerTriviaQuestion
+    from trivia.triviaContentCode import TriviaContentCode
+    from trivia.triviaDifficulty import TriviaDifficulty
+    from trivia.triviaExceptions import GenericTriviaNetworkException
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaRepositories.bongoTriviaQuestionRepository import \
+        BongoTriviaQuestionRepository
+    from trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
+        FuntoonTriviaQuestionRepository
+    from trivia.triviaRepositories.millionaireTriviaQuestionRepository import \
+        MillionaireTriviaQuestionRepository
+    from trivia.triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import \
+        OpenTriviaDatabaseTriviaQuestionRepository
+    from trivia.triviaRepositories.openTriviaQaTriviaQuestionRepository import \
+        OpenTriviaQaTriviaQuestionRepository
+    from trivia.triviaRepositories.pkmnTriviaQuestionRepository import \
+        PkmnTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaDatabaseTriviaQuestionRepository import \
+        TriviaDatabaseTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
+        TriviaQuestionCompanyTriviaQuestionRepository
+    from trivia.triviaRepositories.triviaRepository import TriviaRepository
+    from trivia.triviaRepositories.willFryTriviaQuestionRepository import \
+        WillFryTriviaQuestionRepository
+    from trivia.triviaRepositories.wwtbamTriviaQuestionRepository import \
+        WwtbamTriviaQuestionRepository
+    from trivia.triviaSettingsRepository import TriviaSettingsRepository
+    from trivia.triviaSource import TriviaSource
+    from trivia.triviaSourceInstabilityHelper import \
+        TriviaSourceInstabilityHelper
+    from trivia.triviaType import TriviaType
+    from trivia.triviaVerifierInterface import TriviaVerifierInterface
+
+    from twitch.twitchHandleProviderInterface import \
+        TwitchHandleProviderInterface
+
+
+class StubClock():
+
+    def __init__(self):
+        self.now: float = 1000
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# How each fetch behaves, in the order that the fetches are started, no matter which trivia
+# source they were started on. This keeps hedging tests deterministic even though the trivia
+# source that is tried first is picked at random.
+class StubFetchPlan():
+
+    def __init__(
+        self,
+        delaysSeconds: Optional[List[float]] = None,
+        rejectedFetches: Optional[Set[int]] = None
+    ):
+        self.delaysSeconds: List[float] = delaysSeconds or list()
+        self.rejectedFetches: Set[int] = rejectedFetches or set()
+        self.triviaSources: List[TriviaSource] = list()
+
+    def getDelaySeconds(self, fetchIndex: int) -> float:
+        if fetchIndex < len(self.delaysSeconds):
+            return self.delaysSeconds[fetchIndex]
+        else:
+            return 0
+
+    def isRejected(self, fetchIndex: int) -> bool:
+        return fetchIndex in self.rejectedFetches
+
+    def startFetch(self, triviaSource: TriviaSource) -> int:
+        self.triviaSources.append(triviaSource)
+        return len(self.triviaSources) - 1
+
+
+# Stands in for a real trivia question source. The real repository classes are mixed in below
+# only so that TriviaRepository's type checks pass, their constructors are never called.
+class StubTriviaSource():
+
+    def __init__(self, triviaSource: TriviaSource, fetchPlan: StubFetchPlan):
+        self.triviaSource: TriviaSource = triviaSource
+        self.fetchPlan: StubFetchPlan = fetchPlan
+        self.isFailing: bool = False
+        self.cancelledFetches: int = 0
+        self.concurrentFetches: int = 0
+        self.maxConcurrentFetches: int = 0
+        self.fetchCounts: List[int] = list()
+        self.supportedTriviaTypes: Set[TriviaType] = { TriviaType.MULTIPLE_CHOICE }
+
+    def __createTriviaQuestion(self, fetchOptions: TriviaFetchOptions, fetchIndex: int) -> AbsTriviaQuestion:
+        triviaId = f'{self.triviaSource.name.lower()}-{fetchIndex}'
+
+        if self.fetchPlan.isRejected(fetchIndex):
+            triviaId = f'rejected-{triviaId}'
+
+        if fetchOptions.requireQuestionAnswerTriviaQuestion():
+            return QuestionAnswerTriviaQuestion(
+                correctAnswers = [ 'Samus' ],
+                cleanedCorrectAnswers = [ 'samus' ],
+                category = None,
+                categoryId = None,
+                question = 'Who is the main character of Metroid?',
+                triviaId = triviaId,
+                triviaDifficulty = TriviaDifficulty.UNKNOWN,
+                triviaSource = self.triviaSource
+            )
+        else:
+            return MultipleChoiceTriviaQuestion(
+                correctAnswers = [ 'Samus' ],
+                multipleChoiceResponses = [ 'Kraid', 'Ridley', 'Samus' ],
+                category = None,
+                categoryId = None,
+                question = 'Who is the main character of Metroid?',
+                triviaId = triviaId,
+                triviaDifficulty = TriviaDifficulty.UNKNOWN,
+                triviaSource = self.triviaSource
+            )
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        questions = await self.fetchTriviaQuestions(fetchOptions, 1)
+        return questions[0]
+
+    async def fetchTriviaQuestions(self, fetchOptions: TriviaFetchOptions, count: int) -> List[AbsTriviaQuestion]:
+        fetchIndex = self.fetchPlan.startFetch(self.triviaSource)
+        self.fetchCounts.append(count)
+        self.concurrentFetches = self.concurrentFetches + 1
+        self.maxConcurrentFetches = max(self.maxConcurrentFetches, self.concurrentFetches)
+
+        try:
+            # even without a delay, this gives any other fetches that were started alongside this one the chance to begin
+            await asyncio.sleep(self.fetchPlan.getDelaySeconds(fetchIndex))
+
+            if self.isFailing:
+                raise GenericTriviaNetworkException(self.triviaSource)
+
+            return [ self.__createTriviaQuestion(fetchOptions, fetchIndex) for _ in range(count) ]
+        except asyncio.CancelledError:
+            self.cancelledFetches = self.cancelledFetches + 1
+            raise
+        finally:
+            self.concurrentFetches = self.concurrentFetches - 1
+
+    def getSupportedTriviaTypes(self) -> Set[TriviaType]:
+        return self.supportedTriviaTypes
+
+    def getTriviaSource(self) -> TriviaSource:
+        return self.triviaSource
+
+    async def hasQuestionSetAvailable(self) -> bool:
+        return True
+
+
+class StubBongoTriviaQuestionRepository(StubTriviaSource, BongoTriviaQuestionRepository):
+    pass
+
+
+class StubFuntoonTriviaQuestionRepository(StubTriviaSource, FuntoonTriviaQuestionRepository):
+    pass
+
+
+class StubMillionaireTriviaQuestionRepository(StubTriviaSource, MillionaireTriviaQuestionRepository):
+    pass
+
+
+class StubOpenTriviaDatabaseTriviaQuestionRepository(StubTriviaSource, OpenTriviaDatabaseTriviaQuestionRepository):
+    pass
+
+
+class StubOpenTriviaQaTriviaQuestionRepository(StubTriviaSource, OpenTriviaQaTriviaQuestionRepository):
+    pass
+
+
+class StubPkmnTriviaQuestionRepository(StubTriviaSource, PkmnTriviaQuestionRepository):
+    pass
+
+
+class StubTriviaDatabaseTriviaQuestionRepository(StubTriviaSource, TriviaDatabaseTriviaQuestionRepository):
+    pass
+
+
+class StubTriviaQuestionCompanyTriviaQuestionRepository(StubTriviaSource, TriviaQuestionCompanyTriviaQuestionRepository):
+    pass
+
+
+class StubWillFryTriviaQuestionRepository(StubTriviaSource, WillFryTriviaQuestionRepository):
+    pass
+
+
+class StubWwtbamTriviaQuestionRepository(StubTriviaSource, WwtbamTriviaQuestionRepository):
+    pass
+
+
+class StubTriviaVerifier(TriviaVerifierInterface):
+
+    async def checkContent(
+        self,
+        question: Optional[AbsTriviaQuestion],
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        if question is not None and question.getTriviaId().startswith('rejected-'):
+            return TriviaContentCode.CONTAINS_BANNED_CONTENT
+
+        return TriviaContentCode.OK
+
+    async def checkHistory(
+        self,
+        question: AbsTriviaQuestion,
+        emote: str,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> TriviaContentCode:
+        return TriviaContentCode.OK
+
+
+class StubTwitchHandleProvider(TwitchHandleProviderInterface):
+
+    async def getTwitchHandle(self) -> str:
+        return 'CynanBot'
+
+
+class TestTriviaRepository():
+
+    fetchOptions = TriviaFetchOptions(twitchChannel = 'smCharles')
+
+    hedgingSettings: Dict[str, Any] = {
+        'max_trivia_fetch_hedge_delay_seconds': 0.05,
+        'min_trivia_fetch_hedge_delay_seconds': 0.05,
+        'trivia_fetch_hedging_enabled': True
+    }
+
+    def __createTriviaRepository(
+        self,
+        clock: StubClock,
+        triviaSources: List[str],
+        fetchPlan: Optional[StubFetchPlan] = None,
+        consumptionRateWindowSeconds: float = 600,
+        maxConcurrentFetchesPerTriviaSource: int = 2,
+        spoolerLoopSleepTimeSeconds: float = 120,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> TriviaRepository:
+        settingsJson: Dict[str, Any] = {
+            'max_super_trivia_question_spool_size': 0,
+            'max_trivia_question_spool_size': 5,
+            'trivia_fetch_hedging_enabled': False,
+            'trivia_source_instability_threshold': 10,
+            'trivia_sources': { triviaSource: { 'is_enabled': True } for triviaSource in triviaSources }
+        }
+
+        if settings is not None:
+            settingsJson.update(settings)
+
+        if fetchPlan is None:
+            fetchPlan = StubFetchPlan()
+
+        self.sources: Dict[TriviaSource, StubTriviaSource] = {
+            TriviaSource.BONGO: StubBongoTriviaQuestionRepository(TriviaSource.BONGO, fetchPlan),
+            TriviaSource.FUNTOON: StubFuntoonTriviaQuestionRepository(TriviaSource.FUNTOON, fetchPlan),
+            TriviaSource.MILLIONAIRE: StubMillionaireTriviaQuestionRepository(TriviaSource.MILLIONAIRE, fetchPlan),
+            TriviaSource.OPEN_TRIVIA_DATABASE: StubOpenTriviaDatabaseTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_DATABASE, fetchPlan),
+            TriviaSource.OPEN_TRIVIA_QA: StubOpenTriviaQaTriviaQuestionRepository(TriviaSource.OPEN_TRIVIA_QA, fetchPlan),
+            TriviaSource.POKE_API: StubPkmnTriviaQuestionRepository(TriviaSource.POKE_API, fetchPlan),
+            TriviaSource.THE_QUESTION_CO: StubTriviaQuestionCompanyTriviaQuestionRepository(TriviaSource.THE_QUESTION_CO, fetchPlan),
+            TriviaSource.TRIVIA_DATABASE: StubTriviaDatabaseTriviaQuestionRepository(TriviaSource.TRIVIA_DATABASE, fetchPlan),
+            TriviaSource.WILL_FRY_TRIVIA: StubWillFryTriviaQuestionRepository(TriviaSource.WILL_FRY_TRIVIA, fetchPlan),
+            TriviaSource.WWTBAM: StubWwtbamTriviaQuestionRepository(TriviaSource.WWTBAM, fetchPlan)
+        }
+
+        timber = TimberStub()
+
+        return TriviaRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            bongoTriviaQuestionRepository = self.sources[TriviaSource.BONGO],
+            funtoonTriviaQuestionRepository = self.sources[TriviaSource.FUNTOON],
+            jokeTriviaQuestionRepository = None,
+            jServiceTriviaQuestionRepository = None,
+            lotrTriviaQuestionRepository = None,
+            millionaireTriviaQuestionRepository = self.sources[TriviaSource.MILLIONAIRE],
+            quizApiTriviaQuestionRepository = None,
+            openTriviaDatabaseTriviaQuestionRepository = self.sources[TriviaSource.OPEN_TRIVIA_DATABASE],
+            openTriviaQaTriviaQuestionRepository = self.sources[TriviaSource.OPEN_TRIVIA_QA],
+            pkmnTriviaQuestionRepository = self.sources[TriviaSource.POKE_API],
+            timber = timber,
+            triviaDatabaseTriviaQuestionRepository = self.sources[TriviaSource.TRIVIA_DATABASE],
+            triviaQuestionCompanyTriviaQuestionRepository = self.sources[TriviaSource.THE_QUESTION_CO],
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(settingsJson)
+            ),
+            triviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(timber = timber),
+            triviaVerifier = StubTriviaVerifier(),
+            twitchHandleProvider = StubTwitchHandleProvider(),
+            willFryTriviaQuestionRepository = self.sources[TriviaSource.WILL_FRY_TRIVIA],
+            wwtbamTriviaQuestionRepository = self.sources[TriviaSource.WWTBAM],
+            consumptionRateWindowSeconds = consumptionRateWindowSeconds,
+            maxConcurrentFetchesPerTriviaSource = maxConcurrentFetchesPerTriviaSource,
+            spoolerLoopSleepTimeSeconds = spoolerLoopSleepTimeSeconds,
+            triviaSourceBackoffSeconds = 5,
+            clock = clock
+        )
+
+    async def __refillSpools(self, triviaRepository: TriviaRepository) -> int:
+        # the spooler's background loop never ends, so tests run a single pass of it directly
+        return await triviaRepository._TriviaRepository__refillSpools()
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_withFastTriviaSourceNotHedged(self):
+        fetchPlan = StubFetchPlan()
+        triviaRepository = self.__createTriviaRepository(
+            clock = StubClock(),
+            triviaSources = [ 'bongo', 'will_fry_trivia' ],
+            fetchPlan = fetchPlan,
+            settings = self.hedgingSettings
+        )
+
+        question = await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        assert fetchPlan.triviaSources == [ question.getTriviaSource() ]
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_withHedgedFetchRejected(self):
+        # the hedge answers first, but its question fails verification, so the slow trivia source still wins
+        fetchPlan = StubFetchPlan(delaysSeconds = [ 0.2 ], rejectedFetches = { 1 })
+        triviaRepository = self.__createTriviaRepository(
+            clock = StubClock(),
+            triviaSources = [ 'bongo', 'will_fry_trivia' ],
+            fetchPlan = fetchPlan,
+            settings = self.hedgingSettings
+        )
+
+        question = await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        assert len(fetchPlan.triviaSources) == 2
+        assert question.getTriviaSource() is fetchPlan.triviaSources[0]
+        assert not question.getTriviaId().startswith('rejected-')
+
+        for source in self.sources.values():
+            assert source.cancelledFetches == 0
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_withHedgedFetchWon(self):
+        fetchPlan = StubFetchPlan(delaysSeconds = [ 10 ])
+        triviaRepository = self.__createTriviaRepository(
+            clock = StubClock(),
+            triviaSources = [ 'bongo', 'will_fry_trivia' ],
+            fetchPlan = fetchPlan,
+            settings = self.hedgingSettings
+        )
+
+        question = await asyncio.wait_for(
+            triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions),
+            timeout = 5
+        )
+
+        assert len(fetchPlan.triviaSources) == 2
+        slowTriviaSource = fetchPlan.triviaSources[0]
+        hedgeTriviaSource = fetchPlan.triviaSources[1]
+        assert slowTriviaSource is not hedgeTriviaSource
+        assert question.getTriviaSource() is hedgeTriviaSource
+
+        # lets the losing fetch finish being cancelled
+        await asyncio.sleep(0.01)
+        assert self.sources[slowTriviaSource].cancelledFetches == 1
+        assert self.sources[hedgeTriviaSource].cancelledFetches == 0
+
+        # the losing fetch still tells the latency tracker how long it took at the very least
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert set(metrics.getFetchLatencySeconds().keys()) == { slowTriviaSource, hedgeTriviaSource }
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_withHedgingDisabled(self):
+        fetchPlan = StubFetchPlan(delaysSeconds = [ 0.2 ])
+        triviaRepository = self.__createTriviaRepository(
+            clock = StubClock(),
+            triviaSources = [ 'bongo', 'will_fry_trivia' ],
+            fetchPlan = fetchPlan,
+            settings = {
+                'max_trivia_fetch_hedge_delay_seconds': 0.05,
+                'min_trivia_fetch_hedge_delay_seconds': 0.05,
+                'trivia_fetch_hedging_enabled': False
+            }
+        )
+
+        question = await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        assert fetchPlan.triviaSources == [ question.getTriviaSource() ]
+
+    @pytest.mark.asyncio
+    async def test_fetchTrivia_withLocalTriviaSourcesNeverHedged(self):
+        fetchPlan = StubFetchPlan(delaysSeconds = [ 0.2 ])
+        triviaRepository = self.__createTriviaRepository(
+            clock = StubClock(),
+            triviaSources = [ 'millionaire', 'wwtbam' ],
+            fetchPlan = fetchPlan,
+            settings = self.hedgingSettings
+        )
+
+        question = await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        assert fetchPlan.triviaSources == [ question.getTriviaSource() ]
+
+    @pytest.mark.asyncio
+    async def test_getSpoolMetrics_withTargetSpoolSizeFollowingDemand(self):
+        clock = StubClock()
+        triviaRepository = self.__createTriviaRepository(clock, [ 'bongo' ])
+
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaTargetSpoolSize() == 1
+
+        # 10 questions within the 600 second window means 2 are expected within the next 120 seconds
+        for _ in range(10):
+            await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaTargetSpoolSize() == 3
+        assert metrics.getSuperTriviaTargetSpoolSize() == 0
+
+        for _ in range(30):
+            await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaTargetSpoolSize() == 5
+
+        clock.now = clock.now + 601
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaTargetSpoolSize() == 1
+
+    @pytest.mark.asyncio
+    async def test_refillSpools_withBackoffAfterFailures(self):
+        clock = StubClock()
+        triviaRepository = self.__createTriviaRepository(clock, [ 'bongo' ])
+        bongo = self.sources[TriviaSource.BONGO]
+        bongo.isFailing = True
+
+        assert await self.__refillSpools(triviaRepository) == 0
+        assert len(bongo.fetchCounts) == 1
+
+        # the first failure backs off for 5 seconds
+        clock.now = clock.now + 4
+        assert await self.__refillSpools(triviaRepository) == 0
+        assert len(bongo.fetchCounts) == 1
+
+        clock.now = clock.now + 2
+        assert await self.__refillSpools(triviaRepository) == 0
+        assert len(bongo.fetchCounts) == 2
+
+        # the second failure backs off for twice as long
+        clock.now = clock.now + 9
+        assert await self.__refillSpools(triviaRepository) == 0
+        assert len(bongo.fetchCounts) == 2
+
+        clock.now = clock.now + 2
+        bongo.isFailing = False
+        assert await self.__refillSpools(triviaRepository) == 1
+        assert len(bongo.fetchCounts) == 3
+
+    @pytest.mark.asyncio
+    async def test_refillSpools_withBackoffResetAfterSuccess(self):
+        clock = StubClock()
+        triviaRepository = self.__createTriviaRepository(clock, [ 'bongo' ], maxConcurrentFetchesPerTriviaSource = 1)
+        bongo = self.sources[TriviaSource.BONGO]
+        bongo.isFailing = True
+
+        assert await self.__refillSpools(triviaRepository) == 0
+        assert len(bongo.fetchCounts) == 1
+
+        # a direct fetch isn't held back by the spooler's backoff, and its success ends the backoff
+        clock.now = clock.now + 1
+        bongo.isFailing = False
+        question = await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        assert question.getTriviaSource() is TriviaSource.BONGO
+        assert len(bongo.fetchCounts) == 2
+
+        assert await self.__refillSpools(triviaRepository) == 1
+        assert len(bongo.fetchCounts) == 3
+
+    @pytest.mark.asyncio
+    async def test_refillSpools_withLocalTriviaSourceRequestsBatched(self):
+        clock = StubClock()
+        triviaRepository = self.__createTriviaRepository(
+            clock = clock,
+            triviaSources = [ 'millionaire' ],
+            consumptionRateWindowSeconds = 60,
+            maxConcurrentFetchesPerTriviaSource = 1,
+            spoolerLoopSleepTimeSeconds = 300
+        )
+
+        millionaire = self.sources[TriviaSource.MILLIONAIRE]
+        await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        millionaire.fetchCounts.clear()
+
+        assert await self.__refillSpools(triviaRepository) == 5
+        assert millionaire.fetchCounts == [ 5 ]
+
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaSpoolSize() == 5
+
+    @pytest.mark.asyncio
+    async def test_refillSpools_withMaxConcurrentFetchesPerTriviaSource(self):
+        clock = StubClock()
+        triviaRepository = self.__createTriviaRepository(
+            clock = clock,
+            triviaSources = [ 'bongo', 'will_fry_trivia' ],
+            consumptionRateWindowSeconds = 60,
+            maxConcurrentFetchesPerTriviaSource = 2,
+            spoolerLoopSleepTimeSeconds = 300
+        )
+
+        await triviaRepository.fetchTrivia('QuestionMark', self.fetchOptions)
+        bongo = self.sources[TriviaSource.BONGO]
+        willFry = self.sources[TriviaSource.WILL_FRY_TRIVIA]
+        bongo.fetchCounts.clear()
+        willFry.fetchCounts.clear()
+
+        # 5 questions are wanted, but each trivia source can only be asked for 2 at a time
+        assert await self.__refillSpools(triviaRepository) == 4
+        assert bongo.fetchCounts == [ 1, 1 ]
+        assert bongo.maxConcurrentFetches == 2
+        assert willFry.fetchCounts == [ 1, 1 ]
+        assert willFry.maxConcurrentFetches == 2
+
+        metrics = await triviaRepository.getSpoolMetrics()
+        assert metrics.getTriviaSpoolSize() == 4
+        assert metrics.getTriviaTargetSpoolSize() == 5
@@ -0,0 +1,85 @@
+import asyncio
+
+import pytest
+
+try:
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ..triviaScoreRepository import TriviaScoreRepository
+except:
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from trivia.triviaScoreRepository import TriviaScoreRepository
+
+
+class TestTriviaScoreRepository():
+
+    def __createBackingDatabase(self, tmp_path) -> BackingSqliteDatabase:
+        return BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaScore_createsMissingScore(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase = backingDatabase)
+
+        result = await repository.fetchTriviaScore('smCharles', '12345')
+        assert result.getStreak() == 0
+        assert result.getTriviaWins() == 0
+
+        async with await backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow('SELECT COUNT(*) FROM triviascores')
+
+        await backingDatabase.close()
+        assert record == [ 1 ]
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaScore_readsExistingScore(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase = backingDatabase)
+
+        await repository.incrementTriviaWins('smCharles', '12345')
+        await repository.incrementTriviaWins('smCharles', '12345')
+
+        result = await repository.fetchTriviaScore('smCharles', '12345')
+        await backingDatabase.close()
+
+        assert result.getStreak() == 2
+        assert result.getTriviaWins() == 2
+
+    @pytest.mark.asyncio
+    async def test_fetchTriviaScore_withConcurrentFirstLookups(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase = backingDatabase)
+
+        results = await asyncio.gather(*[ repository.fetchTriviaScore('smCharles', '12345') for _ in range(10) ])
+
+        async with await backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow('SELECT COUNT(*) FROM triviascores')
+
+        await backingDatabase.close()
+        assert record == [ 1 ]
+        assert all(result.getTriviaWins() == 0 for result in results)
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins_withConcurrentIncrements(self, tmp_path):
+        backingDatabase = self.__createBackingDatabase(tmp_path)
+        repository = TriviaScoreRepository(backingDatabase = backingDatabase)
+
+        await asyncio.gather(
+            *[ repository.incrementTriviaWins('smCharles', '12345') for _ in range(20) ],
+            *[ repository.incrementSuperTriviaWins('smCharles', '12345') for _ in range(5) ]
+        )
+
+        result = await repository.fetchTriviaScore('smCharles', '12345')
+        assert result.getStreak() == 20
+        assert result.getSuperTriviaWins() == 5
+        assert result.getTriviaLosses() == 0
+        assert result.getTriviaWins() == 20
+
+        result = await repository.incrementTriviaLosses('smCharles', '12345')
+        await backingDatabase.close()
+
+        assert result.getStreak() == -1
+        assert result.getTriviaLosses() == 1
+        assert result.getTriviaWins() == 20
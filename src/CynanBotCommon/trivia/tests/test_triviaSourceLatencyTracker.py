@@ -0,0 +1,60 @@
+try:
+    from ..triviaRepositories.triviaSourceLatencyTracker import \
+        TriviaSourceLatencyTracker
+    from ..triviaSource import TriviaSource
+except:
+    from trivia.triviaRepositories.triviaSourceLatencyTracker import \
+        TriviaSourceLatencyTracker
+    from trivia.triviaSource import TriviaSource
+
+
+class TestTriviaSourceLatencyTracker():
+
+    def __createTracker(self) -> TriviaSourceLatencyTracker:
+        tracker = TriviaSourceLatencyTracker(maxSamplesPerTriviaSource = 20)
+
+        for latencySeconds in range(1, 21):
+            tracker.recordLatency(TriviaSource.J_SERVICE, float(latencySeconds))
+
+        return tracker
+
+    def test_getAverage(self):
+        tracker = self.__createTracker()
+        assert tracker.getAverage(TriviaSource.J_SERVICE) == 10.5
+
+    def test_getP50(self):
+        tracker = self.__createTracker()
+        assert tracker.getP50(TriviaSource.J_SERVICE) == 10
+
+    def test_getP95(self):
+        tracker = self.__createTracker()
+        assert tracker.getP95(TriviaSource.J_SERVICE) == 19
+
+    def test_getP95s(self):
+        tracker = self.__createTracker()
+        assert tracker.getP95s() == { TriviaSource.J_SERVICE: 19 }
+
+    def test_getPercentile_withNoSamples(self):
+        tracker = self.__createTracker()
+        assert tracker.getPercentile(TriviaSource.QUIZ_API, 95) is None
+        assert tracker.getSampleCount(TriviaSource.QUIZ_API) == 0
+
+    def test_recordLatency_dropsOldestSamples(self):
+        tracker = self.__createTracker()
+
+        for _ in range(20):
+            tracker.recordLatency(TriviaSource.J_SERVICE, 0.5)
+
+        assert tracker.getSampleCount(TriviaSource.J_SERVICE) == 20
+        assert tracker.getP95(TriviaSource.J_SERVICE) == 0.5
+
+    def test_recordLatency_withNegativeLatency(self):
+        tracker = self.__createTracker()
+        exception: Exception = None
+
+        try:
+            tracker.recordLatency(TriviaSource.J_SERVICE, -1)
+        except Exception as e:
+            exception = e
+
+        assert isinstance(exception, ValueError)
@@ -0,0 +1,56 @@
+try:
+    from ..triviaRepositories.triviaSpoolMetrics import TriviaSpoolMetrics
+    from ..triviaSource import TriviaSource
+except:
+    from trivia.triviaRepositories.triviaSpoolMetrics import \
+        TriviaSpoolMetrics
+    from trivia.triviaSource import TriviaSource
+
+
+class TestTriviaSpoolMetrics():
+
+    def __createMetrics(self, spoolHits: int, spoolMisses: int) -> TriviaSpoolMetrics:
+        return TriviaSpoolMetrics(
+            fetchLatencySeconds = { TriviaSource.OPEN_TRIVIA_QA: 0.5 },
+            fetchLatencyP50Seconds = { TriviaSource.OPEN_TRIVIA_QA: 0.4 },
+            fetchLatencyP95Seconds = { TriviaSource.OPEN_TRIVIA_QA: 1.2 },
+            spoolHits = spoolHits,
+            spoolMisses = spoolMisses,
+            superTriviaSpoolSize = 1,
+            superTriviaTargetSpoolSize = 2,
+            triviaSpoolSize = 3,
+            triviaTargetSpoolSize = 4
+        )
+
+    def test_getFetchLatencySeconds(self):
+        metrics = self.__createMetrics(spoolHits = 0, spoolMisses = 0)
+        assert metrics.getFetchLatencySeconds() == { TriviaSource.OPEN_TRIVIA_QA: 0.5 }
+        assert metrics.getFetchLatencyP50Seconds() == { TriviaSource.OPEN_TRIVIA_QA: 0.4 }
+        assert metrics.getFetchLatencyP95Seconds() == { TriviaSource.OPEN_TRIVIA_QA: 1.2 }
+
+    def test_getSpoolHitRate(self):
+        metrics = self.__createMetrics(spoolHits = 3, spoolMisses = 1)
+        assert metrics.getSpoolHitRate() == 0.75
+
+    def test_getSpoolHitRate_withNoRetrievals(self):
+        metrics = self.__createMetrics(spoolHits = 0, spoolMisses = 0)
+        assert metrics.getSpoolHitRate() == 0
+
+    def test_getSpoolSizes(self):
+        metrics = self.__createMetrics(spoolHits = 0, spoolMisses = 0)
+        assert metrics.getSuperTriviaSpoolSize() == 1
+        assert metrics.getSuperTriviaTargetSpoolSize() == 2
+        assert metrics.getTriviaSpoolSize() == 3
+        assert metrics.getTriviaTargetSpoolSize() == 4
+
+    def test_constructWithNegativeSpoolHits(self):
+        metrics: TriviaSpoolMetrics = None
+        exception: Exception = None
+
+        try:
+            metrics = self.__createMetrics(spoolHits = -1, spoolMisses = 0)
+        except Exception as e:
+            exception = e
+
+        assert metrics is None
+        assert isinstance(exception, ValueError)
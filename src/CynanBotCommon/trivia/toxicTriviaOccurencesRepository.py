@@ -1,16 +1,14 @@
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.trivia.toxicTriviaResult import ToxicTriviaResult
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from trivia.toxicTriviaResult import ToxicTriviaResult
 
@@ -30,7 +28,7 @@ class ToxicTriviaOccurencesRepository():
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timeZone: timezone = timeZone
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def fetchDetails(
         self,
@@ -44,24 +42,22 @@ class ToxicTriviaOccurencesRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT count, mostrecent FROM toxictriviaoccurences
-                WHERE twitchchannel = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
-
-        toxicCount: int = 0
-        mostRecent: Optional[datetime] = None
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT count, mostrecent FROM toxictriviaoccurences
+                    WHERE twitchchannel = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
 
-        if utils.hasItems(record):
-            toxicCount = record[0]
-            mostRecent = utils.getDateTimeFromStr(record[1])
+            toxicCount: int = 0
+            mostRecent: Optional[datetime] = None
 
-        await connection.close()
+            if utils.hasItems(record):
+                toxicCount = record[0]
+                mostRecent = utils.getDateTimeFromStr(record[1])
 
         return ToxicTriviaResult(
             mostRecent = mostRecent,
@@ -71,10 +67,6 @@ class ToxicTriviaOccurencesRepository():
             userId = userId
         )
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def incrementToxicCount(
         self,
         twitchChannel: str,
@@ -110,15 +102,12 @@ class ToxicTriviaOccurencesRepository():
 
         return newResult
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
                         count integer DEFAULT 0 NOT NULL,
@@ -129,8 +118,8 @@ class ToxicTriviaOccurencesRepository():
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
                         count INTEGER NOT NULL DEFAULT 0,
@@ -142,9 +131,12 @@ class ToxicTriviaOccurencesRepository():
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'ToxicTriviaOccurencesRepository',
+            statements = statements
+        )
 
     async def __updateToxicCount(
         self,
@@ -166,14 +158,12 @@ class ToxicTriviaOccurencesRepository():
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                    INSERT INTO toxictriviaoccurences (count, mostrecent, twitchchannel, userid)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (twitchchannel, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
-            ''',
-            newToxicCount, nowDateTimeStr, twitchChannel, userId
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                        INSERT INTO toxictriviaoccurences (count, mostrecent, twitchchannel, userid)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
+                ''',
+                newToxicCount, nowDateTimeStr, twitchChannel, userId
+            )
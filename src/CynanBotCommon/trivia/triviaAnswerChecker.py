@@ -1,13 +1,9 @@
-import math
-import re
-import traceback
-from typing import Any, Dict, Generator, List, Optional, Pattern, Set
-
-import polyleven
+from typing import Any, Dict, Generator, List, Optional, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.timber.timberLevel import TimberLevel
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.multipleChoiceTriviaQuestion import \
         MultipleChoiceTriviaQuestion
@@ -16,6 +12,7 @@ try:
     from CynanBotCommon.trivia.triviaAnswerCheckResult import \
         TriviaAnswerCheckResult
     from CynanBotCommon.trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+    from CynanBotCommon.trivia.triviaAnswerMatcher import TriviaAnswerMatcher
     from CynanBotCommon.trivia.triviaExceptions import (
         BadTriviaAnswerException, UnsupportedTriviaTypeException)
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
@@ -26,6 +23,7 @@ try:
 except:
     import utils
     from timber.timberInterface import TimberInterface
+    from timber.timberLevel import TimberLevel
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.multipleChoiceTriviaQuestion import \
         MultipleChoiceTriviaQuestion
@@ -33,6 +31,7 @@ except:
         QuestionAnswerTriviaQuestion
     from trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
     from trivia.triviaAnswerCompiler import TriviaAnswerCompiler
+    from trivia.triviaAnswerMatcher import TriviaAnswerMatcher
     from trivia.triviaExceptions import (BadTriviaAnswerException,
                                          UnsupportedTriviaTypeException)
     from trivia.triviaSettingsRepositoryInterface import \
@@ -60,8 +59,6 @@ class TriviaAnswerChecker():
         self.__triviaAnswerCompiler: TriviaAnswerCompiler = triviaAnswerCompiler
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
 
-        self.__whitespacePattern: Pattern = re.compile(r'\s\s+', re.IGNORECASE)
-
         self.__irregular_nouns: Dict[str, str] = {
             'child': 'children',
             'goose': 'geese',
@@ -91,10 +88,13 @@ class TriviaAnswerChecker():
         self,
         answer: Optional[str],
         triviaQuestion: AbsTriviaQuestion,
-        extras: Optional[Dict[str, Any]] = None
+        extras: Optional[Dict[str, Any]] = None,
+        answerMatcher: Optional[TriviaAnswerMatcher] = None
     ) -> TriviaAnswerCheckResult:
         if not isinstance(triviaQuestion, AbsTriviaQuestion):
             raise ValueError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+        elif answerMatcher is not None and not isinstance(answerMatcher, TriviaAnswerMatcher):
+            raise ValueError(f'answerMatcher argument is malformed: \"{answerMatcher}\"')
 
         if not utils.isValidStr(answer):
             return TriviaAnswerCheckResult.INVALID_INPUT
@@ -102,12 +102,80 @@ class TriviaAnswerChecker():
         if triviaQuestion.getTriviaType() is TriviaType.MULTIPLE_CHOICE:
             return await self.__checkAnswerMultipleChoice(answer, triviaQuestion)
         elif triviaQuestion.getTriviaType() is TriviaType.QUESTION_ANSWER:
-            return await self.__checkAnswerQuestionAnswer(answer, triviaQuestion, extras)
+            return await self.__checkAnswerQuestionAnswer(answer, triviaQuestion, extras, answerMatcher)
         elif triviaQuestion.getTriviaType() is TriviaType.TRUE_FALSE:
             return await self.__checkAnswerTrueFalse(answer, triviaQuestion)
         else:
             raise UnsupportedTriviaTypeException(f'Unsupported TriviaType: \"{triviaQuestion.getTriviaType()}\"')
 
+    async def checkAnswers(
+        self,
+        answers: List[Optional[str]],
+        triviaQuestion: AbsTriviaQuestion,
+        extras: Optional[Dict[str, Any]] = None,
+        answerMatcher: Optional[TriviaAnswerMatcher] = None
+    ) -> List[TriviaAnswerCheckResult]:
+        if not isinstance(answers, List):
+            raise ValueError(f'answers argument is malformed: \"{answers}\"')
+        elif not isinstance(triviaQuestion, AbsTriviaQuestion):
+            raise ValueError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+        elif answerMatcher is not None and not isinstance(answerMatcher, TriviaAnswerMatcher):
+            raise ValueError(f'answerMatcher argument is malformed: \"{answerMatcher}\"')
+
+        # Results are returned in the same order as the given answers, but checking stops at the
+        # first correct answer. So, the returned list only goes up to and includes that answer.
+        results: List[TriviaAnswerCheckResult] = list()
+
+        if not isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
+            resultsByAnswer: Dict[Optional[str], TriviaAnswerCheckResult] = dict()
+
+            for answer in answers:
+                result = resultsByAnswer.get(answer)
+
+                if result is None:
+                    result = await self.checkAnswer(answer, triviaQuestion, extras)
+                    resultsByAnswer[answer] = result
+
+                results.append(result)
+
+                if result is TriviaAnswerCheckResult.CORRECT:
+                    break
+
+            return results
+
+        if answerMatcher is None:
+            answerMatcher = await self.compileAnswerMatcher(triviaQuestion)
+
+        maxPhraseGuessLength = await self.__triviaSettingsRepository.getMaxPhraseGuessLength()
+        resultsByCleanedAnswers: Dict[Tuple[str, ...], TriviaAnswerCheckResult] = dict()
+
+        self.__timber.log(
+            tag = 'TriviaAnswerChecker',
+            msg = 'Checking batch of %d answer(s) — (correctAnswers=\"%s\") (cleanedCorrectAnswers=\"%s\") (extras=\"%s\")',
+            level = TimberLevel.DEBUG,
+            args = [ len(answers), triviaQuestion.getCorrectAnswers(), triviaQuestion.getCleanedCorrectAnswers(), extras ]
+        )
+
+        for answer in answers:
+            if not utils.isValidStr(answer):
+                results.append(TriviaAnswerCheckResult.INVALID_INPUT)
+                continue
+
+            # many guesses in a burst of answers normalize to the same thing, so each one is only checked once
+            cleanedAnswers = tuple(await self.__cleanAnswer(answer, maxPhraseGuessLength))
+            result = resultsByCleanedAnswers.get(cleanedAnswers)
+
+            if result is None:
+                result = await self.__checkCleanedAnswers(list(cleanedAnswers), answerMatcher)
+                resultsByCleanedAnswers[cleanedAnswers] = result
+
+            results.append(result)
+
+            if result is TriviaAnswerCheckResult.CORRECT:
+                break
+
+        return results
+
     async def __checkAnswerMultipleChoice(
         self,
         answer: Optional[str],
@@ -122,7 +190,13 @@ class TriviaAnswerChecker():
         try:
             answerOrdinal = await self.__triviaAnswerCompiler.compileTextAnswerToMultipleChoiceOrdinal(answer)
         except BadTriviaAnswerException as e:
-            self.__timber.log('TriviaAnswerChecker', f'Unable to convert multiple choice answer to ordinal: \"{answer}\": {e}', e, traceback.format_exc())
+            self.__timber.log(
+                tag = 'TriviaAnswerChecker',
+                msg = 'Unable to convert multiple choice answer to ordinal: \"%s\": %s',
+                exception = e,
+                args = [ answer, e ],
+                excInfo = True
+            )
             return TriviaAnswerCheckResult.INVALID_INPUT
 
         if not utils.isValidInt(answerOrdinal):
@@ -148,50 +222,32 @@ class TriviaAnswerChecker():
         self,
         answer: Optional[str],
         triviaQuestion: QuestionAnswerTriviaQuestion,
-        extras: Optional[Dict[str, Any]] = None
+        extras: Optional[Dict[str, Any]] = None,
+        answerMatcher: Optional[TriviaAnswerMatcher] = None
     ) -> TriviaAnswerCheckResult:
         if not isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
             raise ValueError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
         elif triviaQuestion.getTriviaType() is not TriviaType.QUESTION_ANSWER:
             raise RuntimeError(f'TriviaType is not {TriviaType.QUESTION_ANSWER}: \"{triviaQuestion.getTriviaType()}\"')
 
-        # prevent potential for insane answer lengths
         maxPhraseGuessLength = await self.__triviaSettingsRepository.getMaxPhraseGuessLength()
-        if utils.isValidStr(answer) and len(answer) > maxPhraseGuessLength:
-            answer = answer[0:maxPhraseGuessLength]
+        cleanedAnswers = await self.__cleanAnswer(answer, maxPhraseGuessLength)
 
-        cleanedAnswers = await self.__triviaAnswerCompiler.compileTextAnswersList([ answer ], False)
         if not all(utils.isValidStr(cleanedAnswer) for cleanedAnswer in cleanedAnswers):
             return TriviaAnswerCheckResult.INCORRECT
 
+        if answerMatcher is None:
+            answerMatcher = await self.compileAnswerMatcher(triviaQuestion)
+
         cleanedCorrectAnswers = triviaQuestion.getCleanedCorrectAnswers()
-        self.__timber.log('TriviaAnswerChecker', f'In depth question/answer debug information — (answer=\"{answer}\") (cleanedAnswers=\"{cleanedAnswers}\") (correctAnswers=\"{triviaQuestion.getCorrectAnswers()}\") (cleanedCorrectAnswers=\"{cleanedCorrectAnswers}\") (extras=\"{extras}\")')
-
-        for cleanedCorrectAnswer in cleanedCorrectAnswers:
-            for cleanedAnswer in cleanedAnswers:
-                expandedGuesses = await self.__triviaAnswerCompiler.expandNumerals(cleanedAnswer)
-
-                for guess in expandedGuesses:
-                    if guess == cleanedCorrectAnswer:
-                        return TriviaAnswerCheckResult.CORRECT
-
-                    guessWords = self.__whitespacePattern.sub(' ', guess).split(' ')
-                    answerWords = self.__whitespacePattern.sub(' ', cleanedCorrectAnswer).split(' ')
-                    minWords = min(len(guessWords), len(answerWords))
-
-                    for gWords in self.__mergeWords(guessWords, minWords):
-                        for aWords in self.__mergeWords(answerWords, minWords):
-                            # This expansion of all() is required because you can't perform list comprehension on async
-                            #   generators yet. :(
-                            valid = True
-                            for i in range(len(gWords)):
-                                if not await self.__compareWords(gWords[i], aWords[i]):
-                                    valid = False
-                                    break
-                            if valid:
-                                return TriviaAnswerCheckResult.CORRECT
+        self.__timber.log(
+            tag = 'TriviaAnswerChecker',
+            msg = 'In depth question/answer debug information — (answer=\"%s\") (cleanedAnswers=\"%s\") (correctAnswers=\"%s\") (cleanedCorrectAnswers=\"%s\") (extras=\"%s\")',
+            level = TimberLevel.DEBUG,
+            args = [ answer, cleanedAnswers, triviaQuestion.getCorrectAnswers(), cleanedCorrectAnswers, extras ]
+        )
 
-        return TriviaAnswerCheckResult.INCORRECT
+        return await self.__checkCleanedAnswers(cleanedAnswers, answerMatcher)
 
     async def __checkAnswerTrueFalse(
         self,
@@ -207,7 +263,13 @@ class TriviaAnswerChecker():
         try:
             answerBool = await self.__triviaAnswerCompiler.compileBoolAnswer(answer)
         except BadTriviaAnswerException as e:
-            self.__timber.log('TriviaAnswerChecker', f'Unable to convert true false answer to bool: \"{answer}\": {e}', e, traceback.format_exc())
+            self.__timber.log(
+                tag = 'TriviaAnswerChecker',
+                msg = 'Unable to convert true false answer to bool: \"%s\": %s',
+                exception = e,
+                args = [ answer, e ],
+                excInfo = True
+            )
             return TriviaAnswerCheckResult.INVALID_INPUT
 
         if answerBool in triviaQuestion.getCorrectAnswerBools():
@@ -215,30 +277,42 @@ class TriviaAnswerChecker():
         else:
             return TriviaAnswerCheckResult.INCORRECT
 
-    # generates all possible groupings of the given words such that the resulting word count is target_length
-    # example: words = ["a", "b", "c", "d"], target_length = 2
-    #          generates ["abc", "d"], ["ab", "cd"], ["a", "bcd"]
-    def __mergeWords(self, wordList: List[str], target_length: int) -> Generator[List[str], None, None]:
-        if target_length == 1:
-            yield [''.join(wordList)]
-        elif len(wordList) <= target_length:
-            yield wordList
-        else:
-            for i in range(len(wordList) - target_length + 1):
-                for w in self.__mergeWords(wordList[i+1:], target_length - 1):
-                    yield [''.join(wordList[0:i+1])] + w
-
-    # compare two individual words, returns true if any valid variants match between the two words
-    async def __compareWords(self, word1: str, word2: str) -> bool:
-        thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
-        for w1 in self.__genVariantPossibilities(word1):
-            for w2 in self.__genVariantPossibilities(word2):
-                # calculate threshold based on shorter word length
-                threshold = math.floor(min(len(w1), len(w2)) / thresholdGrowthRate)
-                dist = polyleven.levenshtein(w1, w2, threshold + 1)
-                if dist <= threshold:
-                    return True
-        return False
+    async def __checkCleanedAnswers(
+        self,
+        cleanedAnswers: List[str],
+        answerMatcher: TriviaAnswerMatcher
+    ) -> TriviaAnswerCheckResult:
+        if not all(utils.isValidStr(cleanedAnswer) for cleanedAnswer in cleanedAnswers):
+            return TriviaAnswerCheckResult.INCORRECT
+
+        for cleanedAnswer in cleanedAnswers:
+            expandedGuesses = await self.__triviaAnswerCompiler.expandNumerals(cleanedAnswer)
+
+            for guess in expandedGuesses:
+                if answerMatcher.isMatch(guess):
+                    return TriviaAnswerCheckResult.CORRECT
+
+        return TriviaAnswerCheckResult.INCORRECT
+
+    async def __cleanAnswer(self, answer: str, maxPhraseGuessLength: int) -> List[str]:
+        # prevent potential for insane answer lengths
+        if len(answer) > maxPhraseGuessLength:
+            answer = answer[0:maxPhraseGuessLength]
+
+        return await self.__triviaAnswerCompiler.compileTextAnswersList([ answer ], False)
+
+    async def compileAnswerMatcher(self, triviaQuestion: AbsTriviaQuestion) -> Optional[TriviaAnswerMatcher]:
+        if not isinstance(triviaQuestion, AbsTriviaQuestion):
+            raise ValueError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+
+        if not isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
+            return None
+
+        return TriviaAnswerMatcher(
+            cleanedCorrectAnswers = triviaQuestion.getCleanedCorrectAnswers(),
+            thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate(),
+            variantGenerator = self.__genVariantPossibilities
+        )
 
     def __genVariantPossibilities(self, word: str) -> Generator[str, None, None]:
         yield word
@@ -8,21 +8,37 @@ from roman import RomanError
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.lruCache import LruCache
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.triviaExceptions import BadTriviaAnswerException
 except:
     import utils
+    from lruCache import LruCache
     from timber.timberInterface import TimberInterface
     from trivia.triviaExceptions import BadTriviaAnswerException
 
 
 class TriviaAnswerCompiler():
 
-    def __init__(self, timber: TimberInterface):
+    def __init__(
+        self,
+        timber: TimberInterface,
+        maxNumeralExpansions: int = 256,
+        numeralSubstitutesCacheCapacity: int = 1024
+    ):
         if not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(maxNumeralExpansions):
+            raise ValueError(f'maxNumeralExpansions argument is malformed: \"{maxNumeralExpansions}\"')
+        elif maxNumeralExpansions < 1 or maxNumeralExpansions > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxNumeralExpansions argument is out of bounds: {maxNumeralExpansions}')
 
         self.__timber: TimberInterface = timber
+        self.__maxNumeralExpansions: int = maxNumeralExpansions
+
+        # numeral substitutes are expensive to generate, and the same few numerals are guessed over and over
+        self.__arabicNumeralSubstitutesCache: LruCache = LruCache(numeralSubstitutesCacheCapacity)
+        self.__romanNumeralSubstitutesCache: LruCache = LruCache(numeralSubstitutesCacheCapacity)
 
         self.__ampersandRegEx: Pattern = re.compile(r'(^&\s+)|(\s+&\s+)|(\s+&$)', re.IGNORECASE)
         self.__decadeRegEx: Pattern = re.compile(r'^((in\s+)?the\s+)?(\d{4})\'?s$', re.IGNORECASE)
@@ -309,6 +325,9 @@ class TriviaAnswerCompiler():
     async def expandNumerals(self, answer: str) -> List[str]:
         split = self.__numeralRegEx.split(answer)
 
+        if len(split) == 1:
+            return [ answer ]
+
         for i in range(1, len(split), 2):
             match = self.__groupedNumeralRegEx.fullmatch(split[i])
             if not match:
@@ -320,7 +339,16 @@ class TriviaAnswerCompiler():
                 # arabic numerals
                 split[i] = await self.__getArabicNumeralSubstitutes(match.group(1))
 
-        return list(set(''.join(item) for item in utils.permuteSubArrays(split)))
+        expandedAnswers: Set[str] = set()
+
+        # every numeral multiplies the number of possibilities, so stop once there are plenty of them
+        for item in utils.permuteSubArrays(split):
+            expandedAnswers.add(''.join(item))
+
+            if len(expandedAnswers) >= self.__maxNumeralExpansions:
+                break
+
+        return list(expandedAnswers)
 
     async def compileTextAnswerToMultipleChoiceOrdinal(self, answer: Optional[str]) -> int:
         if not utils.isValidStr(answer):
@@ -347,6 +375,15 @@ class TriviaAnswerCompiler():
         return ord(cleanedAnswer.upper()) % 65
 
     async def __getArabicNumeralSubstitutes(self, arabicNumerals: str) -> List[str]:
+        substitutes: Optional[List[str]] = self.__arabicNumeralSubstitutesCache.get(arabicNumerals)
+
+        if substitutes is None:
+            substitutes = await self.__createArabicNumeralSubstitutes(arabicNumerals)
+            self.__arabicNumeralSubstitutesCache.put(arabicNumerals, substitutes)
+
+        return substitutes
+
+    async def __createArabicNumeralSubstitutes(self, arabicNumerals: str) -> List[str]:
         individualDigits = ' '.join([num2words(int(digit)) for digit in arabicNumerals])
         n = int(arabicNumerals)
 
@@ -359,6 +396,16 @@ class TriviaAnswerCompiler():
             ]
 
     async def __getRomanNumeralSubstitutes(self, romanNumerals: str) -> List[str]:
+        romanNumerals = romanNumerals.lower()
+        substitutes: Optional[List[str]] = self.__romanNumeralSubstitutesCache.get(romanNumerals)
+
+        if substitutes is None:
+            substitutes = await self.__createRomanNumeralSubstitutes(romanNumerals)
+            self.__romanNumeralSubstitutesCache.put(romanNumerals, substitutes)
+
+        return substitutes
+
+    async def __createRomanNumeralSubstitutes(self, romanNumerals: str) -> List[str]:
         n: Optional[int] = None
 
         try:
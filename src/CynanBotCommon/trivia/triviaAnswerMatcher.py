@@ -0,0 +1,168 @@
+import math
+import re
+from typing import (Callable, Dict, FrozenSet, Generator, Iterable, List,
+                    Pattern, Tuple)
+
+import polyleven
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.lruCache import LruCache
+except:
+    import utils
+    from lruCache import LruCache
+
+
+class TriviaAnswerMatcher():
+
+    def __init__(
+        self,
+        cleanedCorrectAnswers: List[str],
+        thresholdGrowthRate: int,
+        variantGenerator: Callable[[str], Iterable[str]],
+        guessVariantsCacheCapacity: int = 512
+    ):
+        if not utils.hasItems(cleanedCorrectAnswers):
+            raise ValueError(f'cleanedCorrectAnswers argument is malformed: \"{cleanedCorrectAnswers}\"')
+        elif not utils.isValidInt(thresholdGrowthRate):
+            raise ValueError(f'thresholdGrowthRate argument is malformed: \"{thresholdGrowthRate}\"')
+        elif thresholdGrowthRate < 1 or thresholdGrowthRate > utils.getIntMaxSafeSize():
+            raise ValueError(f'thresholdGrowthRate argument is out of bounds: {thresholdGrowthRate}')
+        elif not callable(variantGenerator):
+            raise ValueError(f'variantGenerator argument is malformed: \"{variantGenerator}\"')
+
+        self.__thresholdGrowthRate: int = thresholdGrowthRate
+        self.__variantGenerator: Callable[[str], Iterable[str]] = variantGenerator
+
+        self.__whitespacePattern: Pattern = re.compile(r'\s\s+', re.IGNORECASE)
+
+        self.__cleanedCorrectAnswers: FrozenSet[str] = frozenset(cleanedCorrectAnswers)
+        self.__answerWords: List[List[str]] = list()
+
+        # merged word candidates for each correct answer, keyed by (correct answer index, target word count)
+        self.__answerMerges: Dict[Tuple[int, int], List[List[str]]] = dict()
+
+        # variants are stored alongside their maximum allowed Levenshtein distance
+        self.__answerVariants: Dict[str, List[Tuple[str, int]]] = dict()
+        self.__guessVariants: LruCache = LruCache(guessVariantsCacheCapacity)
+
+        for cleanedCorrectAnswer in self.__cleanedCorrectAnswers:
+            answerWords = self.__splitWords(cleanedCorrectAnswer)
+            answerIndex = len(self.__answerWords)
+            self.__answerWords.append(answerWords)
+
+            # precompute the two most common shapes: word for word, and everything merged into one word
+            for targetLength in { 1, len(answerWords) }:
+                for merge in self.__getAnswerMerges(answerIndex, targetLength):
+                    for word in merge:
+                        self.__getAnswerVariants(word)
+
+    def __compareWords(self, guessWord: str, answerWord: str) -> bool:
+        answerVariants = self.__getAnswerVariants(answerWord)
+
+        for guessVariant, guessThreshold in self.__getGuessVariants(guessWord):
+            for answerVariant, answerThreshold in answerVariants:
+                # the threshold is based on the shorter word length, so it's the smaller of the two
+                threshold = min(guessThreshold, answerThreshold)
+
+                if abs(len(guessVariant) - len(answerVariant)) > threshold:
+                    continue
+
+                if polyleven.levenshtein(guessVariant, answerVariant, threshold + 1) <= threshold:
+                    return True
+
+        return False
+
+    def __computeVariants(self, word: str) -> List[Tuple[str, int]]:
+        variants: List[Tuple[str, int]] = list()
+
+        for variant in self.__variantGenerator(word):
+            variants.append((variant, math.floor(len(variant) / self.__thresholdGrowthRate)))
+
+        return variants
+
+    def __getAnswerMerges(self, answerIndex: int, targetLength: int) -> List[List[str]]:
+        key = (answerIndex, targetLength)
+        merges = self.__answerMerges.get(key)
+
+        if merges is None:
+            merges = list(self.__mergeWords(self.__answerWords[answerIndex], targetLength))
+            self.__answerMerges[key] = merges
+
+        return merges
+
+    def __getAnswerVariants(self, word: str) -> List[Tuple[str, int]]:
+        variants = self.__answerVariants.get(word)
+
+        if variants is None:
+            variants = self.__computeVariants(word)
+            self.__answerVariants[word] = variants
+
+        return variants
+
+    def getCleanedCorrectAnswers(self) -> FrozenSet[str]:
+        return self.__cleanedCorrectAnswers
+
+    def __getGuessVariants(self, word: str) -> List[Tuple[str, int]]:
+        variants = self.__guessVariants.get(word)
+
+        if variants is None:
+            variants = self.__computeVariants(word)
+            self.__guessVariants.put(word, variants)
+
+        return variants
+
+    def getThresholdGrowthRate(self) -> int:
+        return self.__thresholdGrowthRate
+
+    def isMatch(self, guess: str) -> bool:
+        if not utils.isValidStr(guess):
+            return False
+        elif guess in self.__cleanedCorrectAnswers:
+            return True
+
+        guessWords = self.__splitWords(guess)
+
+        # many merge combinations share the same word pairs, so each pair is only ever compared once
+        comparisons: Dict[Tuple[str, str], bool] = dict()
+
+        for answerIndex, answerWords in enumerate(self.__answerWords):
+            targetLength = min(len(guessWords), len(answerWords))
+            answerMerges = self.__getAnswerMerges(answerIndex, targetLength)
+
+            for gWords in self.__mergeWords(guessWords, targetLength):
+                for aWords in answerMerges:
+                    isValid = True
+
+                    for gWord, aWord in zip(gWords, aWords):
+                        key = (gWord, aWord)
+                        isEqual = comparisons.get(key)
+
+                        if isEqual is None:
+                            isEqual = self.__compareWords(gWord, aWord)
+                            comparisons[key] = isEqual
+
+                        if not isEqual:
+                            isValid = False
+                            break
+
+                    if isValid:
+                        return True
+
+        return False
+
+    # generates all possible groupings of the given words such that the resulting word count is target_length
+    # example: words = ["a", "b", "c", "d"], target_length = 2
+    #          generates ["abc", "d"], ["ab", "cd"], ["a", "bcd"]
+    def __mergeWords(self, wordList: List[str], target_length: int) -> Generator[List[str], None, None]:
+        if target_length == 1:
+            yield [''.join(wordList)]
+        elif len(wordList) <= target_length:
+            yield wordList
+        else:
+            for i in range(len(wordList) - target_length + 1):
+                for w in self.__mergeWords(wordList[i+1:], target_length - 1):
+                    yield [''.join(wordList[0:i+1])] + w
+
+    def __splitWords(self, text: str) -> List[str]:
+        return self.__whitespacePattern.sub(' ', text).split(' ')
@@ -2,11 +2,8 @@ from typing import Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
-    from CynanBotCommon.contentScanner.bannedPhrase import BannedPhrase
-    from CynanBotCommon.contentScanner.bannedWord import BannedWord
     from CynanBotCommon.contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
-    from CynanBotCommon.contentScanner.bannedWordType import BannedWordType
     from CynanBotCommon.contentScanner.contentScannerInterface import \
         ContentScannerInterface
     from CynanBotCommon.timber.timberInterface import TimberInterface
@@ -19,11 +16,8 @@ try:
     from CynanBotCommon.trivia.triviaType import TriviaType
 except:
     import utils
-    from contentScanner.bannedPhrase import BannedPhrase
-    from contentScanner.bannedWord import BannedWord
     from contentScanner.bannedWordsRepositoryInterface import \
         BannedWordsRepositoryInterface
-    from contentScanner.bannedWordType import BannedWordType
     from contentScanner.contentScannerInterface import ContentScannerInterface
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
@@ -158,24 +152,19 @@ class TriviaContentScanner(TriviaContentScannerInterface):
 
         phrases = await self.__getAllPhrasesFromQuestion(question)
         words = await self.__getAllWordsFromQuestion(question)
-        absBannedWords = await self.__bannedWordsRepository.getBannedWordsAsync()
-
-        for absBannedWord in absBannedWords:
-            if absBannedWord.getType() is BannedWordType.EXACT_WORD:
-                bannedWord: BannedWord = absBannedWord
-
-                if bannedWord.getWord() in words:
-                    self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned word ({absBannedWord}): \"{bannedWord.getWord()}\"')
-                    return TriviaContentCode.CONTAINS_BANNED_CONTENT
-            elif absBannedWord.getType() is BannedWordType.PHRASE:
-                bannedPhrase: BannedPhrase = absBannedWord
-
-                for phrase in phrases:
-                    if bannedPhrase.getPhrase() in phrase:
-                        self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned phrase ({absBannedWord}): \"{phrase}\"')
-                        return TriviaContentCode.CONTAINS_BANNED_CONTENT
-            else:
-                raise RuntimeError(f'unknown BannedWordType ({absBannedWord}): \"{absBannedWord.getType()}\"')
+        bannedWordsMatcher = await self.__bannedWordsRepository.getBannedWordsMatcherAsync()
+
+        bannedWord = bannedWordsMatcher.findBannedWord(words)
+        if bannedWord is not None:
+            self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned word ({bannedWord}): \"{bannedWord.getWord()}\"')
+            return TriviaContentCode.CONTAINS_BANNED_CONTENT
+
+        for phrase in phrases:
+            bannedPhrase = bannedWordsMatcher.findBannedPhrase(phrase)
+
+            if bannedPhrase is not None:
+                self.__timber.log('TriviaContentScanner', f'Trivia content contains a banned phrase ({bannedPhrase}): \"{phrase}\"')
+                return TriviaContentCode.CONTAINS_BANNED_CONTENT
 
         return TriviaContentCode.OK
 
@@ -4,7 +4,6 @@ from typing import Dict, List, Optional, Set
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.triviaEmoteGeneratorInterface import \
@@ -12,7 +11,6 @@ try:
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.triviaEmoteGeneratorInterface import \
@@ -34,7 +32,7 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
         self.__emotesDict: Dict[str, Optional[Set[str]]] = self.__createEmotesDict()
         self.__emotesList: List[str] = list(self.__emotesDict)
 
@@ -145,31 +143,25 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT emoteindex FROM triviaemotes
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
-
-        emoteIndex: Optional[int] = None
-        if utils.hasItems(record):
-            emoteIndex = record[0]
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT emoteindex FROM triviaemotes
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
-        await connection.close()
+            emoteIndex: Optional[int] = None
+            if utils.hasItems(record):
+                emoteIndex = record[0]
 
         if not utils.isValidInt(emoteIndex) or emoteIndex < 0 or emoteIndex >= len(self.__emotesList):
             emoteIndex = 0
 
         return emoteIndex
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def getNextEmoteFor(self, twitchChannel: str) -> str:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -177,17 +169,16 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
         emoteIndex = await self.__getCurrentEmoteIndexFor(twitchChannel)
         emoteIndex = (emoteIndex + 1) % len(self.__emotesList)
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviaemotes (emoteindex, twitchchannel)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannel) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
-            ''',
-            emoteIndex, twitchChannel
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    INSERT INTO triviaemotes (emoteindex, twitchchannel)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannel) DO UPDATE SET emoteindex = EXCLUDED.emoteindex
+                ''',
+                emoteIndex, twitchChannel
+            )
 
-        await connection.close()
         return self.__emotesList[emoteIndex]
 
     def getRandomEmote(self) -> str:
@@ -207,15 +198,12 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
 
         return None
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviaemotes (
                         emoteindex smallint DEFAULT 0 NOT NULL,
@@ -223,8 +211,8 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviaemotes (
                         emoteindex INTEGER NOT NULL DEFAULT 0,
@@ -233,6 +221,9 @@ class TriviaEmoteGenerator(TriviaEmoteGeneratorInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TriviaEmoteGenerator',
+            statements = statements
+        )
@@ -5,7 +5,6 @@ try:
     from CynanBotCommon.administratorProviderInterface import \
         AdministratorProviderInterface
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.addTriviaGameControllerResult import \
@@ -22,7 +21,6 @@ except:
     import utils
     from administratorProviderInterface import AdministratorProviderInterface
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.addTriviaGameControllerResult import \
@@ -63,7 +61,7 @@ class TriviaGameGlobalControllersRepository():
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def addController(self, userName: str) -> AddTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -81,49 +79,46 @@ class TriviaGameGlobalControllersRepository():
             self.__timber.log('TriviaGameGlobalControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to add \"{userName}\" as a trivia game global controller: \"{userId}\"')
             return AddTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM triviagameglobalcontrollers
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM triviagameglobalcontrollers
+                    WHERE userid = $1
+                    LIMIT 1
+                ''',
+                userId
+            )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
-
-        if utils.isValidInt(count) and count >= 1:
-            await connection.close()
-            self.__timber.log('TriviaGameGlobalControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller, but this user has already been added as one')
-            return AddTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO triviagameglobalcontrollers (userid)
-                VALUES ($1)
-                ON CONFLICT (userid) DO NOTHING
-            ''',
-            userId
-        )
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
+
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('TriviaGameGlobalControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller, but this user has already been added as one')
+                return AddTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO triviagameglobalcontrollers (userid)
+                    VALUES ($1)
+                    ON CONFLICT (userid) DO NOTHING
+                ''',
+                userId
+            )
 
-        await connection.close()
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller')
         return AddTriviaGameControllerResult.ADDED
 
     async def getControllers(self) -> List[TriviaGameGlobalController]:
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT triviagameglobalcontrollers.userid, userids.username FROM triviagameglobalcontrollers
-                INNER JOIN userids ON triviagameglobalcontrollers.userid = userids.userid
-                ORDER BY userids.username ASC
-            '''
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT triviagameglobalcontrollers.userid, userids.username FROM triviagameglobalcontrollers
+                    INNER JOIN userids ON triviagameglobalcontrollers.userid = userids.userid
+                    ORDER BY userids.username ASC
+                '''
+            )
 
-        await connection.close()
         controllers: List[TriviaGameGlobalController] = list()
 
         if not utils.hasItems(records):
@@ -139,27 +134,20 @@ class TriviaGameGlobalControllersRepository():
 
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
                         userid public.citext NOT NULL PRIMARY KEY
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
                         userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE
@@ -167,9 +155,12 @@ class TriviaGameGlobalControllersRepository():
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TriviaGameGlobalControllersRepository',
+            statements = statements
+        )
 
     async def removeController(self, userName: str) -> RemoveTriviaGameControllerResult:
         if not utils.isValidStr(userName):
@@ -181,16 +172,15 @@ class TriviaGameGlobalControllersRepository():
             self.__timber.log('TriviaGameGlobalControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to remove \"{userName}\" as a trivia game global controller')
             return RemoveTriviaGameControllerResult.ERROR
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagameglobalcontrollers
-                WHERE userid = $1
-            ''',
-            userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagameglobalcontrollers
+                    WHERE userid = $1
+                ''',
+                userId
+            )
 
-        await connection.close()
         self.__timber.log('TriviaGameGlobalControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a trivia game global controller')
 
         return RemoveTriviaGameControllerResult.REMOVED
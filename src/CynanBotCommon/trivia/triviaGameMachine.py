@@ -1,9 +1,9 @@
 import asyncio
-import queue
+import heapq
+import itertools
 import traceback
 from datetime import datetime, timedelta, timezone
-from queue import SimpleQueue
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -194,8 +194,6 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
-        sleepTimeSeconds: float = 0.5,
-        queueTimeoutSeconds: int = 3,
         timeZone: timezone = timezone.utc
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
@@ -228,14 +226,6 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise ValueError(f'twitchTokensRepositoryInterface argument is malformed: \"{twitchTokensRepository}\"')
         elif not isinstance(userIdsRepository, UserIdsRepositoryInterface):
             raise ValueError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise ValueError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 0.25 or sleepTimeSeconds > 3:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise ValueError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
         elif not isinstance(timeZone, timezone):
             raise ValueError(f'timeZone argument is malformed: \"{timeZone}\"')
 
@@ -254,14 +244,20 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
-        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
         self.__timeZone: timezone = timeZone
 
         self.__isStarted: bool = False
         self.__eventListener: Optional[TriviaEventListener] = None
-        self.__actionQueue: SimpleQueue[AbsTriviaAction] = SimpleQueue()
-        self.__eventQueue: SimpleQueue[AbsTriviaEvent] = SimpleQueue()
+        self.__eventListenerAvailable: Optional[asyncio.Event] = None
+
+        # a None action in the action queue is a request to refresh the status of all trivia games
+        self.__actionQueue: Optional[asyncio.Queue] = None
+        self.__eventQueue: Optional[asyncio.Queue] = None
+
+        # deadlines are a heap of (time, tiebreaker, action to submit at that time, or None to refresh)
+        self.__deadlines: List[Tuple[datetime, int, Optional[AbsTriviaAction]]] = list()
+        self.__deadlinesChanged: Optional[asyncio.Event] = None
+        self.__deadlineCounter: Iterator[int] = itertools.count()
 
     async def __applyToxicSuperTriviaPunishment(
         self,
@@ -344,13 +340,70 @@ class TriviaGameMachine(TriviaGameMachineInterface):
     async def __checkAnswer(
         self,
         answer: Optional[str],
-        triviaQuestion: AbsTriviaQuestion,
+        state: AbsTriviaGameState,
         extras: Optional[Dict[str, Any]] = None
     ) -> TriviaAnswerCheckResult:
-        if not isinstance(triviaQuestion, AbsTriviaQuestion):
-            raise ValueError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+        if not isinstance(state, AbsTriviaGameState):
+            raise ValueError(f'state argument is malformed: \"{state}\"')
+
+        return await self.__triviaAnswerChecker.checkAnswer(
+            answer = answer,
+            triviaQuestion = state.getTriviaQuestion(),
+            extras = extras,
+            answerMatcher = state.getTriviaAnswerMatcher()
+        )
+
+    def __getActionQueue(self) -> asyncio.Queue:
+        actionQueue = self.__actionQueue
+
+        if actionQueue is None:
+            actionQueue = asyncio.Queue()
+            self.__actionQueue = actionQueue
+
+        return actionQueue
+
+    def __getDeadlinesChanged(self) -> asyncio.Event:
+        deadlinesChanged = self.__deadlinesChanged
+
+        if deadlinesChanged is None:
+            deadlinesChanged = asyncio.Event()
+            self.__deadlinesChanged = deadlinesChanged
+
+        return deadlinesChanged
+
+    def __getEventListenerAvailable(self) -> asyncio.Event:
+        eventListenerAvailable = self.__eventListenerAvailable
+
+        if eventListenerAvailable is None:
+            eventListenerAvailable = asyncio.Event()
+            self.__eventListenerAvailable = eventListenerAvailable
 
-        return await self.__triviaAnswerChecker.checkAnswer(answer, triviaQuestion, extras)
+        return eventListenerAvailable
+
+    def __getEventQueue(self) -> asyncio.Queue:
+        eventQueue = self.__eventQueue
+
+        if eventQueue is None:
+            eventQueue = asyncio.Queue()
+            self.__eventQueue = eventQueue
+
+        return eventQueue
+
+    async def __handleAction(self, action: AbsTriviaAction):
+        triviaActionType = action.getTriviaActionType()
+
+        if triviaActionType is TriviaActionType.CHECK_ANSWER:
+            await self.__handleActionCheckAnswer(action)
+        elif triviaActionType is TriviaActionType.CHECK_SUPER_ANSWER:
+            await self.__handleActionCheckSuperAnswer(action)
+        elif triviaActionType is TriviaActionType.CLEAR_SUPER_TRIVIA_QUEUE:
+            await self.__handleActionClearSuperTriviaQueue(action)
+        elif triviaActionType is TriviaActionType.START_NEW_GAME:
+            await self.__handleActionStartNewTriviaGame(action)
+        elif triviaActionType is TriviaActionType.START_NEW_SUPER_GAME:
+            await self.__handleActionStartNewSuperTriviaGame(action)
+        else:
+            raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{triviaActionType}\"')
 
     async def __handleActionCheckAnswer(self, action: CheckAnswerTriviaAction):
         if not isinstance(action, CheckAnswerTriviaAction):
@@ -388,7 +441,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         checkResult = await self.__checkAnswer(
             answer = action.getAnswer(),
-            triviaQuestion = state.getTriviaQuestion(),
+            state = state,
             extras = {
                 'actionId': action.getActionId(),
                 'twitchChannel': action.getTwitchChannel(),
@@ -479,39 +532,55 @@ class TriviaGameMachine(TriviaGameMachineInterface):
     async def __handleActionCheckSuperAnswer(self, action: CheckSuperAnswerTriviaAction):
         if not isinstance(action, CheckSuperAnswerTriviaAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
-        elif action.getTriviaActionType() is not TriviaActionType.CHECK_SUPER_ANSWER:
-            raise RuntimeError(f'TriviaActionType is not {TriviaActionType.CHECK_SUPER_ANSWER}: \"{action.getTriviaActionType()}\"')
 
-        state = await self.__triviaGameStore.getSuperGame(action.getTwitchChannel())
+        await self.__handleActionsCheckSuperAnswer([ action ])
+
+    async def __handleActionsCheckSuperAnswer(self, actions: List[CheckSuperAnswerTriviaAction]):
+        if not utils.hasItems(actions):
+            raise ValueError(f'actions argument is malformed: \"{actions}\"')
+
+        for action in actions:
+            if not isinstance(action, CheckSuperAnswerTriviaAction):
+                raise ValueError(f'actions argument contains a malformed action: \"{action}\"')
+            elif action.getTriviaActionType() is not TriviaActionType.CHECK_SUPER_ANSWER:
+                raise RuntimeError(f'TriviaActionType is not {TriviaActionType.CHECK_SUPER_ANSWER}: \"{action.getTriviaActionType()}\"')
+            elif action.getTwitchChannel().lower() != actions[0].getTwitchChannel().lower():
+                raise ValueError(f'actions argument contains actions for more than one Twitch channel: \"{actions}\"')
+
+        state = await self.__triviaGameStore.getSuperGame(actions[0].getTwitchChannel())
 
         if state is None:
-            await self.__submitEvent(SuperGameNotReadyCheckAnswerTriviaEvent(
-                actionId = action.getActionId(),
-                answer = action.getAnswer(),
-                twitchChannel = action.getTwitchChannel(),
-                userId = action.getUserId(),
-                userName = action.getUserName()
-            ))
+            await self.__submitSuperGameNotReadyEvents(actions)
             return
 
-        if not state.isEligibleToAnswer(action.getUserId()):
-            return
+        eligibleActions: List[CheckSuperAnswerTriviaAction] = list()
 
-        state.incrementAnswerCount(action.getUserId())
+        for action in actions:
+            if state.isEligibleToAnswer(action.getUserId()):
+                state.incrementAnswerCount(action.getUserId())
+                eligibleActions.append(action)
 
-        checkResult = await self.__checkAnswer(
-            answer = action.getAnswer(),
+        if not utils.hasItems(eligibleActions):
+            return
+
+        checkResults = await self.__triviaAnswerChecker.checkAnswers(
+            answers = [ action.getAnswer() for action in eligibleActions ],
             triviaQuestion = state.getTriviaQuestion(),
             extras = {
-                'actionId': action.getActionId(),
-                'twitchChannel': action.getTwitchChannel(),
-                'userId': action.getUserId(),
-                'userName': action.getUserName()
-            }
+                'actionIds': [ action.getActionId() for action in eligibleActions ],
+                'twitchChannel': state.getTwitchChannel()
+            },
+            answerMatcher = state.getTriviaAnswerMatcher()
         )
 
-        # we're intentionally ONLY checking for TriviaAnswerCheckResult.CORRECT
-        if checkResult is not TriviaAnswerCheckResult.CORRECT:
+        winningAction: Optional[CheckSuperAnswerTriviaAction] = None
+
+        for action, checkResult in zip(eligibleActions, checkResults):
+            # we're intentionally ONLY checking for TriviaAnswerCheckResult.CORRECT
+            if checkResult is TriviaAnswerCheckResult.CORRECT:
+                winningAction = action
+                break
+
             await self.__submitEvent(IncorrectSuperAnswerTriviaEvent(
                 triviaQuestion = state.getTriviaQuestion(),
                 specialTriviaStatus = state.getSpecialTriviaStatus(),
@@ -523,8 +592,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
                 userId = action.getUserId(),
                 userName = action.getUserName()
             ))
+
+        if winningAction is None:
             return
 
+        action = winningAction
         await self.__removeSuperTriviaGame(action.getTwitchChannel())
         toxicTriviaPunishmentResult: Optional[ToxicTriviaPunishmentResult] = None
         pointsForWinning = state.getPointsForWinning()
@@ -583,6 +655,9 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             triviaScoreResult = triviaScoreResult
         ))
 
+        # answers that arrived after the winning answer were too late, as the game is now over
+        await self.__submitSuperGameNotReadyEvents(actions[actions.index(action) + 1:])
+
     async def __handleActionClearSuperTriviaQueue(self, action: ClearSuperTriviaQueueTriviaAction):
         if not isinstance(action, ClearSuperTriviaQueueTriviaAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
@@ -667,7 +742,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             userName = action.getUserName()
         )
 
+        # the answer matcher is compiled once here, so that it can be shared by every answer to this question
+        state.setTriviaAnswerMatcher(await self.__triviaAnswerChecker.compileAnswerMatcher(triviaQuestion))
+
         await self.__triviaGameStore.add(state)
+        self.__scheduleDeadline(state.getEndTime())
 
         await self.__submitEvent(NewTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -716,7 +795,10 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # channel is on cooldown. This situation occurs if this Twitch channel just finished answering
             # a super trivia question, and prevents us from just immediately jumping into the next super
             # trivia question.
-            self.submitAction(action)
+            self.__scheduleDeadline(
+                deadline = self.__superTriviaCooldownHelper.getCooldownEndTime(action.getTwitchChannel()),
+                action = action
+            )
             return
 
         superTriviaFirstQuestionDelay = timedelta(
@@ -728,7 +810,10 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             # was created too recently. We don't want super trivia questions to start instantaneously, as
             # it could mean that some people in chat are not ready to answer at first. So this minor delay
             # helps prevent such a situation.
-            self.submitAction(action)
+            self.__scheduleDeadline(
+                deadline = (action.getCreationTime() + superTriviaFirstQuestionDelay).getDateTime(),
+                action = action
+            )
             return
 
         emote = await self.__triviaEmoteGenerator.getNextEmoteFor(action.getTwitchChannel())
@@ -776,7 +861,11 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannel = action.getTwitchChannel()
         )
 
+        # the answer matcher is compiled once here, so that it can be shared by every answer to this question
+        state.setTriviaAnswerMatcher(await self.__triviaAnswerChecker.compileAnswerMatcher(triviaQuestion))
+
         await self.__triviaGameStore.add(state)
+        self.__scheduleDeadline(state.getEndTime())
 
         await self.__submitEvent(NewSuperTriviaGameEvent(
             triviaQuestion = triviaQuestion,
@@ -789,6 +878,33 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannel = action.getTwitchChannel(),
         ))
 
+    async def __handleSuperAnswerActions(self, actions: List[CheckSuperAnswerTriviaAction]):
+        if not utils.hasItems(actions):
+            return
+
+        actionsByChannel: Dict[str, List[CheckSuperAnswerTriviaAction]] = dict()
+
+        for action in actions:
+            twitchChannel = action.getTwitchChannel().lower()
+
+            if twitchChannel in actionsByChannel:
+                actionsByChannel[twitchChannel].append(action)
+            else:
+                actionsByChannel[twitchChannel] = [ action ]
+
+        for channelActions in actionsByChannel.values():
+            try:
+                await self.__handleActionsCheckSuperAnswer(channelActions)
+            except Exception as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when handling {len(channelActions)} super answer action(s) (queue size: {self.__getActionQueue().qsize()}) (actions: {channelActions}): {e}', e, traceback.format_exc())
+
+    def __onEventListenerChanged(self):
+        # the event loop re-checks the event listener once woken, and goes back to waiting if it has been removed
+        self.__getEventListenerAvailable().set()
+
+    def __putAction(self, action: Optional[AbsTriviaAction]):
+        self.__getActionQueue().put_nowait(action)
+
     async def __refreshStatusOfTriviaGames(self):
         await self.__removeDeadTriviaGames()
         await self.__beginQueuedTriviaGames()
@@ -888,68 +1004,115 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         await self.__triviaGameStore.removeSuperGame(twitchChannel)
         await self.__superTriviaCooldownHelper.update(twitchChannel)
 
+        # any queued super trivia games for this channel can begin once its cooldown has passed
+        self.__scheduleDeadline(self.__superTriviaCooldownHelper.getCooldownEndTime(twitchChannel))
+
+    def __scheduleDeadline(
+        self,
+        deadline: datetime,
+        action: Optional[AbsTriviaAction] = None
+    ):
+        heapq.heappush(self.__deadlines, (deadline, next(self.__deadlineCounter), action))
+        self.__getDeadlinesChanged().set()
+
     def setEventListener(self, listener: Optional[TriviaEventListener]):
         if listener is not None and not isinstance(listener, TriviaEventListener):
             raise ValueError(f'listener argument is malformed: \"{listener}\"')
 
         self.__eventListener = listener
 
+        # event listeners can be set from any thread, so the event loop is woken up from the event loop's thread
+        self.__backgroundTaskHelper.getEventLoop().call_soon_threadsafe(self.__onEventListenerChanged)
+
     async def __startActionLoop(self):
+        actionQueue = self.__getActionQueue()
+
         while True:
-            actions: List[AbsTriviaAction] = list()
+            actions: List[Optional[AbsTriviaAction]] = [ await actionQueue.get() ]
 
-            try:
-                while not self.__actionQueue.empty():
-                    actions.append(self.__actionQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up actions list (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e)
+            # take everything else that's already waiting too, so that bursts of super trivia answers can be checked together
+            while not actionQueue.empty():
+                actions.append(actionQueue.get_nowait())
 
-            try:
-                for action in actions:
-                    triviaActionType = action.getTriviaActionType()
-
-                    if triviaActionType is TriviaActionType.CHECK_ANSWER:
-                        await self.__handleActionCheckAnswer(action)
-                    elif triviaActionType is TriviaActionType.CHECK_SUPER_ANSWER:
-                        await self.__handleActionCheckSuperAnswer(action)
-                    elif triviaActionType is TriviaActionType.CLEAR_SUPER_TRIVIA_QUEUE:
-                        await self.__handleActionClearSuperTriviaQueue(action)
-                    elif triviaActionType is TriviaActionType.START_NEW_GAME:
-                        await self.__handleActionStartNewTriviaGame(action)
-                    elif triviaActionType is TriviaActionType.START_NEW_SUPER_GAME:
-                        await self.__handleActionStartNewSuperTriviaGame(action)
-                    else:
-                        raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{triviaActionType}\"')
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through actions (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e, traceback.format_exc())
+            superAnswerActions: List[CheckSuperAnswerTriviaAction] = list()
 
-            try:
-                await self.__refreshStatusOfTriviaGames()
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
+            for action in actions:
+                if action is not None and action.getTriviaActionType() is TriviaActionType.CHECK_SUPER_ANSWER:
+                    superAnswerActions.append(action)
+                    continue
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                # super trivia answers are only grouped up until some other action, so that ordering between them is kept
+                await self.__handleSuperAnswerActions(superAnswerActions)
+                superAnswerActions.clear()
+
+                if action is None:
+                    try:
+                        await self.__refreshStatusOfTriviaGames()
+                    except Exception as e:
+                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
+
+                    continue
+
+                try:
+                    await self.__handleAction(action)
+                except Exception as e:
+                    self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when handling action (queue size: {self.__getActionQueue().qsize()}) (action: {action}): {e}', e, traceback.format_exc())
+
+            await self.__handleSuperAnswerActions(superAnswerActions)
+
+    async def __startDeadlineLoop(self):
+        deadlinesChanged = self.__getDeadlinesChanged()
 
-    async def __startEventLoop(self):
         while True:
-            eventListener = self.__eventListener
+            deadlinesChanged.clear()
 
-            if eventListener is not None:
-                events: List[AbsTriviaEvent] = list()
+            if not utils.hasItems(self.__deadlines):
+                await deadlinesChanged.wait()
+                continue
 
+            now = datetime.now(self.__timeZone)
+            secondsUntilDeadline = (self.__deadlines[0][0] - now).total_seconds()
+
+            if secondsUntilDeadline > 0:
                 try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) (events size: {len(events)}): {e}', e, traceback.format_exc())
+                    await asyncio.wait_for(deadlinesChanged.wait(), timeout = secondsUntilDeadline)
+                except asyncio.TimeoutError:
+                    pass
 
-                for event in events:
-                    try:
-                        await eventListener.onNewTriviaEvent(event)
-                    except Exception as e:
-                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) (event: {event}): {e}', e, traceback.format_exc())
+                continue
+
+            isRefreshNeeded = False
+
+            while utils.hasItems(self.__deadlines) and self.__deadlines[0][0] <= now:
+                _, _, action = heapq.heappop(self.__deadlines)
+
+                if action is None:
+                    isRefreshNeeded = True
+                else:
+                    self.__putAction(action)
+
+            if isRefreshNeeded:
+                self.__putAction(None)
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+    async def __startEventLoop(self):
+        eventListenerAvailable = self.__getEventListenerAvailable()
+        eventQueue = self.__getEventQueue()
+
+        while True:
+            eventListener = self.__eventListener
+
+            if eventListener is None:
+                # events are held in the queue until an event listener has been set
+                eventListenerAvailable.clear()
+                await eventListenerAvailable.wait()
+                continue
+
+            event: AbsTriviaEvent = await eventQueue.get()
+
+            try:
+                await eventListener.onNewTriviaEvent(event)
+            except Exception as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when handling event (queue size: {self.__getEventQueue().qsize()}) (event: {event}): {e}', e, traceback.format_exc())
 
     def startMachine(self):
         if self.__isStarted:
@@ -960,22 +1123,31 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__timber.log('TriviaGameMachine', 'Starting TriviaGameMachine...')
 
         self.__backgroundTaskHelper.createTask(self.__startActionLoop())
+        self.__backgroundTaskHelper.createTask(self.__startDeadlineLoop())
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
+        # catch any trivia games that were already queued before this machine was started
+        self.__backgroundTaskHelper.getEventLoop().call_soon_threadsafe(self.__putAction, None)
+
     def submitAction(self, action: AbsTriviaAction):
         if not isinstance(action, AbsTriviaAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
 
-        try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+        # actions can be submitted from any thread, so they're handed off to the event loop's thread
+        self.__backgroundTaskHelper.getEventLoop().call_soon_threadsafe(self.__putAction, action)
 
     async def __submitEvent(self, event: AbsTriviaEvent):
         if not isinstance(event, AbsTriviaEvent):
             raise ValueError(f'event argument is malformed: \"{event}\"')
 
-        try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        self.__getEventQueue().put_nowait(event)
+
+    async def __submitSuperGameNotReadyEvents(self, actions: List[CheckSuperAnswerTriviaAction]):
+        for action in actions:
+            await self.__submitEvent(SuperGameNotReadyCheckAnswerTriviaEvent(
+                actionId = action.getActionId(),
+                answer = action.getAnswer(),
+                twitchChannel = action.getTwitchChannel(),
+                userId = action.getUserId(),
+                userName = action.getUserName()
+            ))
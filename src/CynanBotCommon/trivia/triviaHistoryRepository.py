@@ -1,10 +1,10 @@
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
@@ -20,7 +20,7 @@ try:
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
@@ -34,6 +34,17 @@ except:
     from trivia.triviaType import TriviaType
 
 
+fetchMostRecentTriviaQuestionStatement: DatabaseStatement = DatabaseStatement(
+    name = 'triviaHistory.fetchMostRecentTriviaQuestion',
+    query = '''
+        SELECT emote, triviaid, triviasource, triviatype FROM triviahistory
+        WHERE emote IS NOT NULL AND emote = $1 AND twitchchannel = $2
+        ORDER BY datetime DESC
+        LIMIT 1
+    '''
+)
+
+
 class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
 
     def __init__(
@@ -57,11 +68,7 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
         self.__timeZone: timezone = timeZone
 
-        self.__isDatabaseReady: bool = False
-
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        self.__registerDatabaseTables()
 
     async def getMostRecentTriviaQuestionDetails(
         self,
@@ -73,18 +80,11 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT emote, triviaid, triviasource, triviatype FROM triviahistory
-                WHERE emote IS NOT NULL AND emote = $1 AND twitchchannel = $2
-                ORDER BY datetime DESC
-                LIMIT 1
-            ''',
-            emote, twitchChannel
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                fetchMostRecentTriviaQuestionStatement,
+                emote, twitchChannel
+            )
 
         if not utils.hasItems(record):
             return None
@@ -97,15 +97,12 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             triviaType = TriviaType.fromStr(record[3])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviahistory (
                         datetime text NOT NULL,
@@ -118,8 +115,16 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS triviahistory_twitchchannel_emote_datetime
+                    ON triviahistory (twitchchannel, emote, datetime DESC)
+                    INCLUDE (triviaid, triviasource, triviatype)
+                '''
+            )
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviahistory (
                         datetime TEXT NOT NULL,
@@ -132,10 +137,21 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
                     )
                 '''
             )
+
+            statements.append(
+                '''
+                    CREATE INDEX IF NOT EXISTS triviahistory_twitchchannel_emote_datetime
+                    ON triviahistory (twitchchannel, emote, datetime DESC, triviaid, triviasource, triviatype)
+                '''
+            )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TriviaHistoryRepository',
+            statements = statements,
+            version = 2
+        )
 
     async def verify(
         self,
@@ -153,51 +169,30 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
         triviaId = question.getTriviaId()
         triviaSource = question.getTriviaSource().toStr()
         triviaType = question.getTriviaType().toStr()
-
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT datetime FROM triviahistory
-                WHERE triviaid = $1 AND triviasource = $2 AND triviatype = $3 AND twitchchannel = $4
-                LIMIT 1
-            ''',
-            triviaId, triviaSource, triviaType, twitchChannel
-        )
+        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
 
         nowDateTime = datetime.now(self.__timeZone)
         nowDateTimeStr = nowDateTime.isoformat()
+        repeatCutoffDateTimeStr = (nowDateTime - minimumTimeDelta).isoformat()
 
-        if not utils.hasItems(record):
-            await connection.execute(
+        # A single upsert both records this question and tells us whether it's a repeat: a brand new
+        # entry is inserted, and an existing entry is only updated if it's older than the repeat window.
+        # If the existing entry is still within the window, then nothing is written and no row is returned.
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
                 '''
                     INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannel)
                     VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (triviaid, triviasource, triviatype, twitchchannel) DO UPDATE
+                    SET datetime = EXCLUDED.datetime, emote = EXCLUDED.emote
+                    WHERE triviahistory.datetime < $7
+                    RETURNING datetime
                 ''',
-                nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel
+                nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel, repeatCutoffDateTimeStr
             )
 
-            await connection.close()
-            return TriviaContentCode.OK
-
-        questionDateTimeStr: str = record[0]
-        questionDateTime = datetime.fromisoformat(questionDateTimeStr)
-        minimumTimeDelta = timedelta(days = await self.__triviaSettingsRepository.getMinDaysBeforeRepeatQuestion())
-
-        if questionDateTime + minimumTimeDelta >= nowDateTime:
-            await connection.close()
-            self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat (now=\"{nowDateTimeStr}\" db=\"{questionDateTimeStr}\" triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" twitchChannel=\"{twitchChannel}\"')
+        if not utils.hasItems(record):
+            self.__timber.log('TriviaHistoryRepository', f'Encountered duplicate triviaHistory entry that is within the window of being a repeat (now=\"{nowDateTimeStr}\" cutoff=\"{repeatCutoffDateTimeStr}\" triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" twitchChannel=\"{twitchChannel}\"')
             return TriviaContentCode.REPEAT
 
-        await connection.execute(
-            '''
-                UPDATE triviahistory
-                SET datetime = $1, emote = $2
-                WHERE triviaid = $3 AND triviasource = $4 AND triviatype = $5 AND twitchchannel = $6
-            ''',
-            nowDateTimeStr, emote, triviaId, triviaSource, triviaType, twitchChannel
-        )
-
-        await connection.close()
-        self.__timber.log('TriviaHistoryRepository', f'Updated triviaHistory entry to {nowDateTimeStr} from {questionDateTimeStr} (triviaId=\"{triviaId}\" triviaSource=\"{triviaSource}\" triviaType=\"{triviaType}\" twitchChannel=\"{twitchChannel}\")')
-
         return TriviaContentCode.OK
@@ -0,0 +1,274 @@
+import asyncio
+import pathlib
+import random
+from abc import abstractmethod
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import aiofiles
+import aiofiles.ospath
+import aiosqlite
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
+    from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+    from CynanBotCommon.trivia.triviaRepositories.absTriviaQuestionRepository import \
+        AbsTriviaQuestionRepository
+    from CynanBotCommon.trivia.triviaRepositories.localTriviaQuestionBank import \
+        LocalTriviaQuestionBank
+    from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+except:
+    import utils
+    from trivia.absTriviaQuestion import AbsTriviaQuestion
+    from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaRepositories.absTriviaQuestionRepository import \
+        AbsTriviaQuestionRepository
+    from trivia.triviaRepositories.localTriviaQuestionBank import \
+        LocalTriviaQuestionBank
+    from trivia.triviaSettingsRepositoryInterface import \
+        TriviaSettingsRepositoryInterface
+
+
+# Shared by the trivia question sources that are bundled as SQLite database files. Rather than
+# having SQLite sort an entire table with ORDER BY RANDOM() for every question, the table's rowids
+# are looked up once, and then random rows are picked by rowid over a single read-only connection.
+# With preloading enabled, the whole table is instead read into a LocalTriviaQuestionBank once, and
+# every fetch after that is served from memory.
+class AbsLocalTriviaQuestionRepository(AbsTriviaQuestionRepository):
+
+    def __init__(
+        self,
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        triviaDatabaseFile: str,
+        tableName: str,
+        columns: List[str],
+        isPreloadEnabled: bool = False
+    ):
+        super().__init__(triviaSettingsRepository)
+
+        if not utils.isValidStr(triviaDatabaseFile):
+            raise ValueError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
+        elif not utils.isValidStr(tableName):
+            raise ValueError(f'tableName argument is malformed: \"{tableName}\"')
+        elif not utils.hasItems(columns):
+            raise ValueError(f'columns argument is malformed: \"{columns}\"')
+        elif not utils.isValidBool(isPreloadEnabled):
+            raise ValueError(f'isPreloadEnabled argument is malformed: \"{isPreloadEnabled}\"')
+
+        self.__triviaDatabaseFile: str = triviaDatabaseFile
+        self.__tableName: str = tableName
+        self.__columns: List[str] = columns
+        self.__isPreloadEnabled: bool = isPreloadEnabled
+
+        self.__connection: Optional[aiosqlite.Connection] = None
+        self.__connectionLock: Optional[asyncio.Lock] = None
+        self.__hasQuestionSetAvailable: Optional[bool] = None
+        self.__questionBank: Optional[LocalTriviaQuestionBank] = None
+
+        # when the table's rowids are contiguous this is just a range, otherwise it's every rowid in the table
+        self.__rowIds: Optional[Sequence[int]] = None
+
+    def __chooseRandomRowIds(self, count: int) -> List[int]:
+        rowIds = self.__rowIds
+
+        if rowIds is None or len(rowIds) == 0:
+            raise RuntimeError(f'{self.getTriviaSource()} trivia database is empty: \"{self.__triviaDatabaseFile}\"')
+
+        return random.sample(rowIds, min(count, len(rowIds)))
+
+    async def close(self):
+        async with self.__getConnectionLock():
+            if self.__connection is not None:
+                await self.__connection.close()
+                self.__connection = None
+
+    @abstractmethod
+    async def _createTriviaQuestion(
+        self,
+        row: Tuple[Any, ...],
+        fetchOptions: TriviaFetchOptions
+    ) -> AbsTriviaQuestion:
+        pass
+
+    async def __fetchRandomRows(
+        self,
+        count: int,
+        columnFilters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Any, ...]]:
+        if columnFilters is not None:
+            for column in columnFilters:
+                if column not in self.__columns:
+                    raise ValueError(f'columnFilters argument contains an unknown column (\"{column}\"): {columnFilters}')
+
+        if self.__isPreloadEnabled:
+            questionBank = await self.__getQuestionBank()
+            rows = questionBank.chooseRandomRows(count, columnFilters)
+
+            if not utils.hasItems(rows):
+                raise RuntimeError(f'Received no data from {self.getTriviaSource()} question bank (columnFilters={columnFilters})')
+
+            return rows
+
+        connection = await self.__getConnection()
+
+        if utils.hasItems(columnFilters):
+            # the rowid cache can't help with filtering, so filtered fetches have SQLite pick the rows
+            where = ' AND '.join(f'{column} = ?' for column in columnFilters)
+
+            cursor = await connection.execute(
+                f'''
+                    SELECT {', '.join(self.__columns)} FROM {self.__tableName}
+                    WHERE rowid IN (SELECT rowid FROM {self.__tableName} WHERE {where} ORDER BY RANDOM() LIMIT ?)
+                ''',
+                list(columnFilters.values()) + [ count ]
+            )
+        else:
+            rowIds = self.__chooseRandomRowIds(count)
+            placeholders = ', '.join('?' * len(rowIds))
+
+            cursor = await connection.execute(
+                f'''
+                    SELECT {', '.join(self.__columns)} FROM {self.__tableName}
+                    WHERE rowid IN ({placeholders})
+                ''',
+                rowIds
+            )
+
+        rows = await cursor.fetchall()
+        await cursor.close()
+
+        if not utils.hasItems(rows):
+            raise RuntimeError(f'Received malformed data from {self.getTriviaSource()} database: {rows}')
+
+        for row in rows:
+            if not utils.hasItems(row) or len(row) != len(self.__columns):
+                raise RuntimeError(f'Received malformed data from {self.getTriviaSource()} database: {row}')
+
+        # SQLite hands the rows back in rowid order, so they need to be mixed back up again
+        rows = list(rows)
+        random.shuffle(rows)
+        return rows
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        if not isinstance(fetchOptions, TriviaFetchOptions):
+            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+
+        rows = await self.__fetchRandomRows(1)
+        return await self._createTriviaQuestion(rows[0], fetchOptions)
+
+    async def fetchTriviaQuestions(
+        self,
+        fetchOptions: TriviaFetchOptions,
+        count: int,
+        columnFilters: Optional[Dict[str, Any]] = None
+    ) -> List[AbsTriviaQuestion]:
+        if not isinstance(fetchOptions, TriviaFetchOptions):
+            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
+        elif not utils.isValidInt(count):
+            raise ValueError(f'count argument is malformed: \"{count}\"')
+        elif count < 1 or count > 100:
+            raise ValueError(f'count argument is out of bounds: {count}')
+        elif columnFilters is not None and not isinstance(columnFilters, Dict):
+            raise ValueError(f'columnFilters argument is malformed: \"{columnFilters}\"')
+
+        questions: List[AbsTriviaQuestion] = list()
+
+        for row in await self.__fetchRandomRows(count, columnFilters):
+            questions.append(await self._createTriviaQuestion(row, fetchOptions))
+
+        return questions
+
+    async def __getConnection(self) -> aiosqlite.Connection:
+        async with self.__getConnectionLock():
+            if self.__connection is not None:
+                return self.__connection
+
+            connection = await self.__openConnection()
+
+            if self.__rowIds is None:
+                self.__rowIds = await self.__loadRowIds(connection)
+
+            self.__connection = connection
+            return connection
+
+    def __getConnectionLock(self) -> asyncio.Lock:
+        connectionLock = self.__connectionLock
+
+        if connectionLock is None:
+            connectionLock = asyncio.Lock()
+            self.__connectionLock = connectionLock
+
+        return connectionLock
+
+    def getPreloadedSizeInBytes(self) -> Optional[int]:
+        questionBank = self.__questionBank
+
+        if questionBank is None:
+            return None
+
+        return questionBank.getSizeInBytes()
+
+    async def __getQuestionBank(self) -> LocalTriviaQuestionBank:
+        async with self.__getConnectionLock():
+            if self.__questionBank is not None:
+                return self.__questionBank
+
+            connection = await self.__openConnection()
+
+            try:
+                columns = ', '.join(self.__columns)
+                cursor = await connection.execute(f'SELECT {columns} FROM {self.__tableName}')
+                rows = await cursor.fetchall()
+                await cursor.close()
+            finally:
+                await connection.close()
+
+            questionBank = LocalTriviaQuestionBank(
+                columns = self.__columns,
+                rows = list(rows)
+            )
+
+            self.__questionBank = questionBank
+            return questionBank
+
+    async def hasQuestionSetAvailable(self) -> bool:
+        if self.__hasQuestionSetAvailable is not None:
+            return self.__hasQuestionSetAvailable
+
+        hasQuestionSetAvailable = await aiofiles.ospath.exists(self.__triviaDatabaseFile)
+        self.__hasQuestionSetAvailable = hasQuestionSetAvailable
+
+        return hasQuestionSetAvailable
+
+    async def __loadRowIds(self, connection: aiosqlite.Connection) -> Sequence[int]:
+        cursor = await connection.execute(f'SELECT MIN(rowid), MAX(rowid), COUNT(*) FROM {self.__tableName}')
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        if not utils.hasItems(row) or row[2] == 0:
+            return list()
+
+        minRowId: int = row[0]
+        maxRowId: int = row[1]
+        rowCount: int = row[2]
+
+        if maxRowId - minRowId + 1 == rowCount:
+            return range(minRowId, maxRowId + 1)
+
+        cursor = await connection.execute(f'SELECT rowid FROM {self.__tableName}')
+        rows = await cursor.fetchall()
+        await cursor.close()
+
+        return [ row[0] for row in rows ]
+
+    async def __openConnection(self) -> aiosqlite.Connection:
+        if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
+            raise FileNotFoundError(f'{self.getTriviaSource()} trivia database file not found: \"{self.__triviaDatabaseFile}\"')
+
+        databaseUri = f'{pathlib.Path(self.__triviaDatabaseFile).absolute().as_uri()}?mode=ro'
+        return await aiosqlite.connect(databaseUri, uri = True)
+
+    async def preload(self):
+        if self.__isPreloadEnabled:
+            await self.__getQuestionBank()
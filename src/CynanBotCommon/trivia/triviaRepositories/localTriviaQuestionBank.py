@@ -0,0 +1,141 @@
+import random
+import sys
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+try:
+    import CynanBotCommon.utils as utils
+except:
+    import utils
+
+
+# An in-memory, column oriented copy of a local trivia question table. Integer columns are
+# stored in arrays, while every other column is a tuple whose strings are interned, so that
+# repeated values (categories, difficulties, common answers) are only ever stored once.
+class LocalTriviaQuestionBank():
+
+    def __init__(self, columns: List[str], rows: List[Tuple[Any, ...]]):
+        if not utils.hasItems(columns):
+            raise ValueError(f'columns argument is malformed: \"{columns}\"')
+        elif not isinstance(rows, List):
+            raise ValueError(f'rows argument is malformed: \"{rows}\"')
+
+        self.__columnNames: Dict[str, int] = { column: index for index, column in enumerate(columns) }
+        self.__columns: List[Sequence[Any]] = list()
+        self.__size: int = len(rows)
+
+        for index in range(len(columns)):
+            self.__columns.append(self.__createColumn([ row[index] for row in rows ]))
+
+        # row indexes for each distinct value of a column, built the first time that column is filtered on
+        self.__valueIndexes: Dict[int, Dict[Any, array]] = dict()
+
+    def chooseRandomRows(
+        self,
+        count: int,
+        columnFilters: Optional[Dict[str, Any]] = None
+    ) -> List[Tuple[Any, ...]]:
+        if not utils.isValidInt(count):
+            raise ValueError(f'count argument is malformed: \"{count}\"')
+        elif count < 1 or count > utils.getIntMaxSafeSize():
+            raise ValueError(f'count argument is out of bounds: {count}')
+        elif columnFilters is not None and not isinstance(columnFilters, Dict):
+            raise ValueError(f'columnFilters argument is malformed: \"{columnFilters}\"')
+
+        if utils.hasItems(columnFilters):
+            rowIndexes = self.__findRowIndexes(columnFilters)
+        else:
+            rowIndexes = range(self.__size)
+
+        # random.sample() only accepts an array from Python 3.10 onwards, so positions within
+        # rowIndexes are sampled instead, which also avoids copying the array into a list
+        positions = random.sample(range(len(rowIndexes)), min(count, len(rowIndexes)))
+        return [ self.__getRow(rowIndexes[position]) for position in positions ]
+
+    def __createColumn(self, values: List[Any]) -> Sequence[Any]:
+        if len(values) >= 1 and all(type(value) is int for value in values):
+            try:
+                return array('q', values)
+            except OverflowError:
+                pass
+
+        return tuple(sys.intern(value) if isinstance(value, str) else value for value in values)
+
+    def __findRowIndexes(self, columnFilters: Dict[str, Any]) -> Sequence[int]:
+        candidates: List[Sequence[int]] = list()
+
+        for column, value in columnFilters.items():
+            candidates.append(self.__getValueIndex(self.__getColumnIndex(column)).get(value, array('l')))
+
+        # start from the smallest set of matching rows, then check the remaining filters row by row
+        candidates.sort(key = len)
+        rowIndexes = candidates[0]
+
+        if len(candidates) == 1:
+            return rowIndexes
+
+        otherRowIndexes: List[Set[int]] = [ set(candidate) for candidate in candidates[1:] ]
+        return [ rowIndex for rowIndex in rowIndexes if all(rowIndex in other for other in otherRowIndexes) ]
+
+    def getColumnValues(self, column: str) -> Set[Any]:
+        return set(self.__getValueIndex(self.__getColumnIndex(column)).keys())
+
+    def __getColumnIndex(self, column: str) -> int:
+        if not utils.isValidStr(column):
+            raise ValueError(f'column argument is malformed: \"{column}\"')
+
+        columnIndex = self.__columnNames.get(column)
+
+        if columnIndex is None:
+            raise ValueError(f'column argument is not a column of this LocalTriviaQuestionBank: \"{column}\"')
+
+        return columnIndex
+
+    def __getRow(self, rowIndex: int) -> Tuple[Any, ...]:
+        return tuple(column[rowIndex] for column in self.__columns)
+
+    def getSize(self) -> int:
+        return self.__size
+
+    def getSizeInBytes(self) -> int:
+        sizeInBytes = sys.getsizeof(self.__columns)
+        seenValues: Set[int] = set()
+
+        for column in self.__columns:
+            sizeInBytes = sizeInBytes + sys.getsizeof(column)
+
+            if isinstance(column, array):
+                continue
+
+            # interned strings are shared between rows, so each one is only counted once
+            for value in column:
+                if value is not None and id(value) not in seenValues:
+                    seenValues.add(id(value))
+                    sizeInBytes = sizeInBytes + sys.getsizeof(value)
+
+        for valueIndex in self.__valueIndexes.values():
+            sizeInBytes = sizeInBytes + sys.getsizeof(valueIndex)
+
+            for rowIndexes in valueIndex.values():
+                sizeInBytes = sizeInBytes + sys.getsizeof(rowIndexes)
+
+        return sizeInBytes
+
+    def __getValueIndex(self, columnIndex: int) -> Dict[Any, array]:
+        valueIndex = self.__valueIndexes.get(columnIndex)
+
+        if valueIndex is None:
+            valueIndex = dict()
+
+            for rowIndex, value in enumerate(self.__columns[columnIndex]):
+                rowIndexes = valueIndex.get(value)
+
+                if rowIndexes is None:
+                    rowIndexes = array('l')
+                    valueIndex[value] = rowIndexes
+
+                rowIndexes.append(rowIndex)
+
+            self.__valueIndexes[columnIndex] = valueIndex
+
+        return valueIndex
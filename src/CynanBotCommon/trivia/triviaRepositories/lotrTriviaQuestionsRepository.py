@@ -1,8 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
-
-import aiofiles
-import aiofiles.ospath
-import aiosqlite
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -17,8 +13,8 @@ try:
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
     from CynanBotCommon.trivia.triviaQuestionCompiler import \
         TriviaQuestionCompiler
-    from CynanBotCommon.trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from CynanBotCommon.trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from CynanBotCommon.trivia.triviaSource import TriviaSource
@@ -35,15 +31,15 @@ except:
     from trivia.triviaDifficulty import TriviaDifficulty
     from trivia.triviaFetchOptions import TriviaFetchOptions
     from trivia.triviaQuestionCompiler import TriviaQuestionCompiler
-    from trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from trivia.triviaSource import TriviaSource
     from trivia.triviaType import TriviaType
 
 
-class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
+class LotrTriviaQuestionRepository(AbsLocalTriviaQuestionRepository):
 
     def __init__(
         self,
@@ -52,9 +48,23 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
         triviaAnswerCompiler: TriviaAnswerCompiler,
         triviaQuestionCompiler: TriviaQuestionCompiler,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
-        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/lotrTriviaQuestionsDatabase.sqlite'
+        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/lotrTriviaQuestionsDatabase.sqlite',
+        isPreloadEnabled: bool = False
     ):
-        super().__init__(triviaSettingsRepository)
+        super().__init__(
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaDatabaseFile = triviaDatabaseFile,
+            tableName = 'lotrQuestions',
+            columns = [
+                'answerA',
+                'answerB',
+                'answerC',
+                'answerD',
+                'question',
+                'triviaId'
+            ],
+            isPreloadEnabled = isPreloadEnabled
+        )
 
         if not isinstance(additionalTriviaAnswersRepository, AdditionalTriviaAnswersRepositoryInterface):
             raise ValueError(f'additionalTriviaAnswersRepository argument is malformed: \"{additionalTriviaAnswersRepository}\"')
@@ -64,24 +74,20 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
             raise ValueError(f'triviaAnswerCompiler argument is malformed: \"{triviaAnswerCompiler}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
-        elif not utils.isValidStr(triviaDatabaseFile):
-            raise ValueError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
 
         self.__additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface = additionalTriviaAnswersRepository
         self.__timber: TimberInterface = timber
         self.__triviaAnswerCompiler: TriviaAnswerCompiler = triviaAnswerCompiler
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
-        self.__triviaDatabaseFile: str = triviaDatabaseFile
-
-        self.__hasQuestionSetAvailable: Optional[bool] = None
-
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
+    async def _createTriviaQuestion(
+        self,
+        row: Tuple[Any, ...],
+        fetchOptions: TriviaFetchOptions
+    ) -> AbsTriviaQuestion:
         self.__timber.log('LotrTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
 
-        triviaDict = await self.__fetchTriviaQuestionDict()
+        triviaDict = self.__createTriviaQuestionDict(row)
 
         if await self._triviaSettingsRepository.isDebugLoggingEnabled():
             self.__timber.log('LotrTriviaQuestionRepository', f'{triviaDict}')
@@ -122,23 +128,7 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
             triviaSource = TriviaSource.LORD_OF_THE_RINGS
         )
 
-    async def __fetchTriviaQuestionDict(self) -> Dict[str, Any]:
-        if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
-            raise FileNotFoundError(f'LOTR trivia database file not found: \"{self.__triviaDatabaseFile}\"')
-
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answerA, answerB, answerC, answerD, question, triviaId FROM lotrQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
-
-        row = await cursor.fetchone()
-        if not utils.hasItems(row) or len(row) != 6:
-            raise RuntimeError(f'Received malformed data from LOTR database: {row}')
-
+    def __createTriviaQuestionDict(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
         correctAnswers: List[str] = list()
         self.__selectiveAppend(correctAnswers, row[0])
         self.__selectiveAppend(correctAnswers, row[1])
@@ -154,8 +144,6 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[5]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -164,15 +152,6 @@ class LotrTriviaQuestionRepository(AbsTriviaQuestionRepository):
     def getTriviaSource(self) -> TriviaSource:
         return TriviaSource.LORD_OF_THE_RINGS
 
-    async def hasQuestionSetAvailable(self) -> bool:
-        if self.__hasQuestionSetAvailable is not None:
-            return self.__hasQuestionSetAvailable
-
-        hasQuestionSetAvailable = await aiofiles.ospath.exists(self.__triviaDatabaseFile)
-        self.__hasQuestionSetAvailable = hasQuestionSetAvailable
-
-        return hasQuestionSetAvailable
-
     def __selectiveAppend(self, correctAnswers: List[str], correctAnswer: Optional[str]):
         if correctAnswers is None:
             raise ValueError(f'correctAnswers argument is malformed: \"{correctAnswers}\"')
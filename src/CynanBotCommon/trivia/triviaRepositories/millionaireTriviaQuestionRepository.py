@@ -1,8 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
-
-import aiofiles
-import aiofiles.ospath
-import aiosqlite
+from typing import Any, Dict, List, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -14,8 +10,8 @@ try:
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
     from CynanBotCommon.trivia.triviaQuestionCompiler import \
         TriviaQuestionCompiler
-    from CynanBotCommon.trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from CynanBotCommon.trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from CynanBotCommon.trivia.triviaSource import TriviaSource
@@ -29,45 +25,56 @@ except:
     from trivia.triviaDifficulty import TriviaDifficulty
     from trivia.triviaFetchOptions import TriviaFetchOptions
     from trivia.triviaQuestionCompiler import TriviaQuestionCompiler
-    from trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from trivia.triviaSource import TriviaSource
     from trivia.triviaType import TriviaType
 
 
-class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
+class MillionaireTriviaQuestionRepository(AbsLocalTriviaQuestionRepository):
 
     def __init__(
         self,
         timber: TimberInterface,
         triviaQuestionCompiler: TriviaQuestionCompiler,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
-        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/millionaireTriviaQuestionsDatabase.sqlite'
+        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/millionaireTriviaQuestionsDatabase.sqlite',
+        isPreloadEnabled: bool = False
     ):
-        super().__init__(triviaSettingsRepository)
+        super().__init__(
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaDatabaseFile = triviaDatabaseFile,
+            tableName = 'millionaireQuestions',
+            columns = [
+                'answer',
+                'question',
+                'responseA',
+                'responseB',
+                'responseC',
+                'responseD',
+                'triviaId'
+            ],
+            isPreloadEnabled = isPreloadEnabled
+        )
 
         if not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
-        elif not utils.isValidStr(triviaDatabaseFile):
-            raise ValueError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
 
         self.__timber: TimberInterface = timber
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
-        self.__triviaDatabaseFile: str = triviaDatabaseFile
-
-        self.__hasQuestionSetAvailable: Optional[bool] = None
-
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
+    async def _createTriviaQuestion(
+        self,
+        row: Tuple[Any, ...],
+        fetchOptions: TriviaFetchOptions
+    ) -> AbsTriviaQuestion:
         self.__timber.log('MillionaireTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
 
-        triviaDict = await self.__fetchTriviaQuestionDict()
+        triviaDict = self.__createTriviaQuestionDict(row)
 
         if await self._triviaSettingsRepository.isDebugLoggingEnabled():
             self.__timber.log('MillionaireTriviaQuestionRepository', f'{triviaDict}')
@@ -100,23 +107,7 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
             triviaSource = TriviaSource.MILLIONAIRE
         )
 
-    async def __fetchTriviaQuestionDict(self) -> Dict[str, Any]:
-        if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
-            raise FileNotFoundError(f'Millionaire trivia database file not found: \"{self.__triviaDatabaseFile}\"')
-
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answer, question, responseA, responseB, responseC, responseD, triviaId FROM millionaireQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
-
-        row = await cursor.fetchone()
-        if not utils.hasItems(row) or len(row) != 7:
-            raise RuntimeError(f'Received malformed data from Millionaire database: {row}')
-
+    def __createTriviaQuestionDict(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
         triviaQuestionDict: Dict[str, Any] = {
             'answer': row[0],
             'question': row[1],
@@ -124,8 +115,6 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[6]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -133,12 +122,3 @@ class MillionaireTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     def getTriviaSource(self) -> TriviaSource:
         return TriviaSource.MILLIONAIRE
-
-    async def hasQuestionSetAvailable(self) -> bool:
-        if self.__hasQuestionSetAvailable is not None:
-            return self.__hasQuestionSetAvailable
-
-        hasQuestionSetAvailable = await aiofiles.ospath.exists(self.__triviaDatabaseFile)
-        self.__hasQuestionSetAvailable = hasQuestionSetAvailable
-
-        return hasQuestionSetAvailable
@@ -8,7 +8,6 @@ try:
     from CynanBotCommon.network.networkClientProvider import \
         NetworkClientProvider
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
@@ -37,7 +36,6 @@ except:
     from network.exceptions import GenericNetworkException
     from network.networkClientProvider import NetworkClientProvider
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.absTriviaQuestion import AbsTriviaQuestion
@@ -90,7 +88,7 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
         self.__triviaIdGenerator: TriviaIdGeneratorInterface = triviaIdGenerator
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
         self.__cache: Dict[str, Optional[str]] = dict()
 
     async def clearCaches(self):
@@ -247,10 +245,6 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
 
         raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Open Trivia Database: {jsonResponse}')
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
     async def __getOrFetchNewSessionToken(self, twitchChannel: str) -> Optional[str]:
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -279,15 +273,12 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
     async def hasQuestionSetAvailable(self) -> bool:
         return True
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
                         sessiontoken text DEFAULT NULL,
@@ -295,8 +286,8 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
                         sessiontoken TEXT DEFAULT NULL,
@@ -305,9 +296,12 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'OpenTriviaDatabaseTriviaQuestionRepository',
+            statements = statements
+        )
 
     async def __removeSessionToken(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
@@ -327,17 +321,15 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
         if utils.isValidStr(sessionToken):
             return sessionToken
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT sessiontoken FROM opentriviadatabasesessiontokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
-
-        await connection.close()
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT sessiontoken FROM opentriviadatabasesessiontokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
         if utils.hasItems(record):
             sessionToken = record[0]
@@ -356,28 +348,25 @@ class OpenTriviaDatabaseTriviaQuestionRepository(AbsTriviaQuestionRepository, Cl
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-
-        if utils.isValidStr(sessionToken):
-            await connection.execute(
-                '''
-                    INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannel)
-                    VALUES ($1, $2)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
-                ''',
-                sessionToken, twitchChannel
-            )
-
-            self.__cache[twitchChannel.lower()] = sessionToken
-        else:
-            await connection.execute(
-                '''
-                    DELETE FROM opentriviadatabasesessiontokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
+        async with await self.__backingDatabase.getConnection() as connection:
+            if utils.isValidStr(sessionToken):
+                await connection.execute(
+                    '''
+                        INSERT INTO opentriviadatabasesessiontokens (sessiontoken, twitchchannel)
+                        VALUES ($1, $2)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET sessiontoken = EXCLUDED.sessiontoken
+                    ''',
+                    sessionToken, twitchChannel
+                )
 
-            self.__cache.pop(twitchChannel.lower(), None)
+                self.__cache[twitchChannel.lower()] = sessionToken
+            else:
+                await connection.execute(
+                    '''
+                        DELETE FROM opentriviadatabasesessiontokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
 
-        await connection.close()
+                self.__cache.pop(twitchChannel.lower(), None)
@@ -1,8 +1,4 @@
-from typing import Any, Dict, List, Optional, Set
-
-import aiofiles
-import aiofiles.ospath
-import aiosqlite
+from typing import Any, Dict, List, Set, Tuple
 
 try:
     import CynanBotCommon.utils as utils
@@ -16,8 +12,8 @@ try:
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
     from CynanBotCommon.trivia.triviaQuestionCompiler import \
         TriviaQuestionCompiler
-    from CynanBotCommon.trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from CynanBotCommon.trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from CynanBotCommon.trivia.triviaSource import TriviaSource
@@ -34,8 +30,8 @@ except:
     from trivia.triviaExceptions import UnsupportedTriviaTypeException
     from trivia.triviaFetchOptions import TriviaFetchOptions
     from trivia.triviaQuestionCompiler import TriviaQuestionCompiler
-    from trivia.triviaRepositories.absTriviaQuestionRepository import \
-        AbsTriviaQuestionRepository
+    from trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from trivia.triviaSettingsRepositoryInterface import \
         TriviaSettingsRepositoryInterface
     from trivia.triviaSource import TriviaSource
@@ -43,37 +39,50 @@ except:
     from trivia.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
 
 
-class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
+class OpenTriviaQaTriviaQuestionRepository(AbsLocalTriviaQuestionRepository):
 
     def __init__(
         self,
         timber: TimberInterface,
         triviaQuestionCompiler: TriviaQuestionCompiler,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
-        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/openTriviaQaTriviaQuestionDatabase.sqlite'
+        triviaDatabaseFile: str = 'CynanBotCommon/trivia/questionSources/openTriviaQaTriviaQuestionDatabase.sqlite',
+        isPreloadEnabled: bool = False
     ):
-        super().__init__(triviaSettingsRepository)
+        super().__init__(
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaDatabaseFile = triviaDatabaseFile,
+            tableName = 'triviaQuestions',
+            columns = [
+                'correctAnswer',
+                'newCategory',
+                'question',
+                'questionId',
+                'questionType',
+                'response1',
+                'response2',
+                'response3',
+                'response4'
+            ],
+            isPreloadEnabled = isPreloadEnabled
+        )
 
         if not isinstance(timber, TimberInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompiler):
             raise ValueError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
-        elif not utils.isValidStr(triviaDatabaseFile):
-            raise ValueError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
 
         self.__timber: TimberInterface = timber
         self.__triviaQuestionCompiler: TriviaQuestionCompiler = triviaQuestionCompiler
-        self.__triviaDatabaseFile: str = triviaDatabaseFile
-
-        self.__hasQuestionSetAvailable: Optional[bool] = None
-
-    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
-        if not isinstance(fetchOptions, TriviaFetchOptions):
-            raise ValueError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
+    async def _createTriviaQuestion(
+        self,
+        row: Tuple[Any, ...],
+        fetchOptions: TriviaFetchOptions
+    ) -> AbsTriviaQuestion:
         self.__timber.log('OpenTriviaQaTriviaQuestionRepository', f'Fetching trivia question... (fetchOptions={fetchOptions})')
 
-        triviaDict = await self.__fetchTriviaQuestionDict()
+        triviaDict = self.__createTriviaQuestionDict(row)
 
         if await self._triviaSettingsRepository.isDebugLoggingEnabled():
             self.__timber.log('OpenTriviaQaTriviaQuestionRepository', f'{triviaDict}')
@@ -128,23 +137,7 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
         raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for OpenTriviaQaTriviaQuestionRepository: {triviaDict}')
 
-    async def __fetchTriviaQuestionDict(self) -> Dict[str, Any]:
-        if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
-            raise FileNotFoundError(f'Open Trivia QA trivia database file not found: \"{self.__triviaDatabaseFile}\"')
-
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4 FROM triviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
-
-        row = await cursor.fetchone()
-        if not utils.hasItems(row) or len(row) != 9:
-            raise RuntimeError(f'Received malformed data from OpenTriviaQaTriviaQuestion database: {row}')
-
+    def __createTriviaQuestionDict(self, row: Tuple[Any, ...]) -> Dict[str, Any]:
         triviaQuestionDict: Dict[str, Any] = {
             'category': row[1],
             'correctAnswer': row[0],
@@ -154,8 +147,6 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'responses': [ row[5], row[6], row[7], row[8] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     def getSupportedTriviaTypes(self) -> Set[TriviaType]:
@@ -163,12 +154,3 @@ class OpenTriviaQaTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     def getTriviaSource(self) -> TriviaSource:
         return TriviaSource.OPEN_TRIVIA_QA
-
-    async def hasQuestionSetAvailable(self) -> bool:
-        if self.__hasQuestionSetAvailable is not None:
-            return self.__hasQuestionSetAvailable
-
-        hasQuestionSetAvailable = await aiofiles.ospath.exists(self.__triviaDatabaseFile)
-        self.__hasQuestionSetAvailable = hasQuestionSetAvailable
-
-        return hasQuestionSetAvailable
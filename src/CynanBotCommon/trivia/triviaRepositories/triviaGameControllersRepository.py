@@ -3,7 +3,6 @@ from typing import List, Optional
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.trivia.addTriviaGameControllerResult import \
@@ -18,7 +17,6 @@ try:
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
     from trivia.addTriviaGameControllerResult import \
@@ -55,7 +53,7 @@ class TriviaGameControllersRepository():
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
 
     async def addController(
         self,
@@ -78,35 +76,33 @@ class TriviaGameControllersRepository():
             self.__timber.log('TriviaGameControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to add \"{userName}\" as a trivia game controller for \"{twitchChannel}\": \"{userId}\"')
             return AddTriviaGameControllerResult.ERROR
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT COUNT(1) FROM triviagamecontrollers
-                WHERE twitchchannel = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT COUNT(1) FROM triviagamecontrollers
+                    WHERE twitchchannel = $1 AND userid = $2
+                    LIMIT 1
+                ''',
+                twitchChannel, userId
+            )
 
-        count: Optional[int] = None
-        if utils.hasItems(record):
-            count = record[0]
-
-        if utils.isValidInt(count) and count >= 1:
-            await connection.close()
-            self.__timber.log('TriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\", but this user has already been added as one')
-            return AddTriviaGameControllerResult.ALREADY_EXISTS
-
-        await connection.execute(
-            '''
-                INSERT INTO triviagamecontrollers (twitchchannel, userid)
-                VALUES ($1, $2)
-                ON CONFLICT (twitchchannel, userid) DO NOTHING
-            ''',
-            twitchChannel, userId
-        )
+            count: Optional[int] = None
+            if utils.hasItems(record):
+                count = record[0]
+
+            if utils.isValidInt(count) and count >= 1:
+                self.__timber.log('TriviaGameControllersRepository', f'Tried to add userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\", but this user has already been added as one')
+                return AddTriviaGameControllerResult.ALREADY_EXISTS
+
+            await connection.execute(
+                '''
+                    INSERT INTO triviagamecontrollers (twitchchannel, userid)
+                    VALUES ($1, $2)
+                    ON CONFLICT (twitchchannel, userid) DO NOTHING
+                ''',
+                twitchChannel, userId
+            )
 
-        await connection.close()
         self.__timber.log('TriviaGameControllersRepository', f'Added userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\"')
 
         return AddTriviaGameControllerResult.ADDED
@@ -115,18 +111,17 @@ class TriviaGameControllersRepository():
         if not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        records = await connection.fetchRows(
-            '''
-                SELECT triviagamecontrollers.twitchchannel, triviagamecontrollers.userid, userids.username FROM triviagamecontrollers
-                INNER JOIN userids ON triviagamecontrollers.userid = userids.userid
-                WHERE triviagamecontrollers.twitchchannel = $1
-                ORDER BY userids.username ASC
-            ''',
-            twitchChannel
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            records = await connection.fetchRows(
+                '''
+                    SELECT triviagamecontrollers.twitchchannel, triviagamecontrollers.userid, userids.username FROM triviagamecontrollers
+                    INNER JOIN userids ON triviagamecontrollers.userid = userids.userid
+                    WHERE triviagamecontrollers.twitchchannel = $1
+                    ORDER BY userids.username ASC
+                ''',
+                twitchChannel
+            )
 
-        await connection.close()
         controllers: List[TriviaGameController] = list()
 
         if not utils.hasItems(records):
@@ -142,19 +137,12 @@ class TriviaGameControllersRepository():
         controllers.sort(key = lambda controller: controller.getUserName().lower())
         return controllers
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviagamecontrollers (
                         twitchchannel public.citext NOT NULL,
@@ -163,8 +151,8 @@ class TriviaGameControllersRepository():
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviagamecontrollers (
                         twitchchannel TEXT NOT NULL COLLATE NOCASE,
@@ -174,9 +162,12 @@ class TriviaGameControllersRepository():
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TriviaGameControllersRepository',
+            statements = statements
+        )
 
     async def removeController(
         self,
@@ -194,16 +185,15 @@ class TriviaGameControllersRepository():
             self.__timber.log('TriviaGameControllersRepository', f'Retrieved no userId from UserIdsRepository when trying to remove \"{userName}\" as a trivia game controller for \"{twitchChannel}\"')
             return RemoveTriviaGameControllerResult.ERROR
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                DELETE FROM triviagamecontrollers
-                WHERE twitchchannel = $1 AND userid = $2
-            ''',
-            twitchChannel, userId
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM triviagamecontrollers
+                    WHERE twitchchannel = $1 AND userid = $2
+                ''',
+                twitchChannel, userId
+            )
 
-        await connection.close()
         self.__timber.log('TriviaGameControllersRepository', f'Removed userName=\"{userName}\" userId=\"{userId}\" as a trivia game controller for \"{twitchChannel}\"')
 
         return RemoveTriviaGameControllerResult.REMOVED
@@ -1,9 +1,13 @@
 import asyncio
+import math
 import queue
 import random
+import time
 import traceback
+from collections import defaultdict, deque
 from queue import SimpleQueue
-from typing import Dict, List, Optional, Set
+from typing import (Awaitable, Callable, Deque, Dict, List, Optional, Set,
+                    Tuple)
 
 try:
     import CynanBotCommon.utils as utils
@@ -21,6 +25,8 @@ try:
         NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException,
         TooManyTriviaFetchAttemptsException)
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+    from CynanBotCommon.trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaRepositories.bongoTriviaQuestionRepository import \
         BongoTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
@@ -49,6 +55,10 @@ try:
         TriviaQuestionRepositoryInterface
     from CynanBotCommon.trivia.triviaRepositories.triviaRepositoryInterface import \
         TriviaRepositoryInterface
+    from CynanBotCommon.trivia.triviaRepositories.triviaSourceLatencyTracker import \
+        TriviaSourceLatencyTracker
+    from CynanBotCommon.trivia.triviaRepositories.triviaSpoolMetrics import \
+        TriviaSpoolMetrics
     from CynanBotCommon.trivia.triviaRepositories.willFryTriviaQuestionRepository import \
         WillFryTriviaQuestionRepository
     from CynanBotCommon.trivia.triviaRepositories.wwtbamTriviaQuestionRepository import \
@@ -79,6 +89,8 @@ except:
         NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException,
         TooManyTriviaFetchAttemptsException)
     from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaRepositories.absLocalTriviaQuestionRepository import \
+        AbsLocalTriviaQuestionRepository
     from trivia.triviaRepositories.funtoonTriviaQuestionRepository import \
         FuntoonTriviaQuestionRepository
     from trivia.triviaRepositories.jokeTriviaQuestionRepository import \
@@ -105,6 +117,10 @@ except:
         TriviaQuestionRepositoryInterface
     from trivia.triviaRepositories.triviaRepositoryInterface import \
         TriviaRepositoryInterface
+    from trivia.triviaRepositories.triviaSourceLatencyTracker import \
+        TriviaSourceLatencyTracker
+    from trivia.triviaRepositories.triviaSpoolMetrics import \
+        TriviaSpoolMetrics
     from trivia.triviaRepositories.wwtbamTriviaQuestionRepository import \
         WwtbamTriviaQuestionRepository
     from trivia.triviaSettingsRepositoryInterface import \
@@ -143,8 +159,13 @@ class TriviaRepository(TriviaRepositoryInterface):
         twitchHandleProvider: TwitchHandleProviderInterface,
         willFryTriviaQuestionRepository: WillFryTriviaQuestionRepository,
         wwtbamTriviaQuestionRepository: WwtbamTriviaQuestionRepository,
+        consumptionRateWindowSeconds: float = 600,
+        maxConcurrentFetchesPerTriviaSource: int = 2,
+        maxTriviaSourceBackoffSeconds: float = 300,
         spoolerLoopSleepTimeSeconds: float = 120,
-        triviaRetrySleepTimeSeconds: float = 0.25
+        triviaRetrySleepTimeSeconds: float = 0.25,
+        triviaSourceBackoffSeconds: float = 5,
+        clock: Callable[[], float] = time.monotonic
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelper):
             raise ValueError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -186,6 +207,16 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise ValueError(f'willFryTriviaQuestionRepository argument is malformed: \"{willFryTriviaQuestionRepository}\"')
         elif not isinstance(wwtbamTriviaQuestionRepository, WwtbamTriviaQuestionRepository):
             raise ValueError(f'wwtbamTriviaQuestionRepository argument is malformed: \"{wwtbamTriviaQuestionRepository}\"')
+        elif not utils.isValidNum(consumptionRateWindowSeconds):
+            raise ValueError(f'consumptionRateWindowSeconds argument is malformed: \"{consumptionRateWindowSeconds}\"')
+        elif consumptionRateWindowSeconds < 60 or consumptionRateWindowSeconds > 3600:
+            raise ValueError(f'consumptionRateWindowSeconds argument is out of bounds: {consumptionRateWindowSeconds}')
+        elif not utils.isValidInt(maxConcurrentFetchesPerTriviaSource):
+            raise ValueError(f'maxConcurrentFetchesPerTriviaSource argument is malformed: \"{maxConcurrentFetchesPerTriviaSource}\"')
+        elif maxConcurrentFetchesPerTriviaSource < 1 or maxConcurrentFetchesPerTriviaSource > 8:
+            raise ValueError(f'maxConcurrentFetchesPerTriviaSource argument is out of bounds: {maxConcurrentFetchesPerTriviaSource}')
+        elif not utils.isValidNum(maxTriviaSourceBackoffSeconds):
+            raise ValueError(f'maxTriviaSourceBackoffSeconds argument is malformed: \"{maxTriviaSourceBackoffSeconds}\"')
         elif not utils.isValidNum(spoolerLoopSleepTimeSeconds):
             raise ValueError(f'spoolerLoopSleepTimeSeconds argument is malformed: \"{spoolerLoopSleepTimeSeconds}\"')
         elif spoolerLoopSleepTimeSeconds < 15 or spoolerLoopSleepTimeSeconds > 300:
@@ -194,6 +225,12 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise ValueError(f'triviaRetrySleepTimeSeconds argument is malformed: \"{triviaRetrySleepTimeSeconds}\"')
         elif triviaRetrySleepTimeSeconds < 0.25 or triviaRetrySleepTimeSeconds > 3:
             raise ValueError(f'triviaRetrySleepTimeSeconds argument is out of bounds: {triviaRetrySleepTimeSeconds}')
+        elif not utils.isValidNum(triviaSourceBackoffSeconds):
+            raise ValueError(f'triviaSourceBackoffSeconds argument is malformed: \"{triviaSourceBackoffSeconds}\"')
+        elif triviaSourceBackoffSeconds < 1 or triviaSourceBackoffSeconds > maxTriviaSourceBackoffSeconds:
+            raise ValueError(f'triviaSourceBackoffSeconds argument is out of bounds: {triviaSourceBackoffSeconds}')
+        elif not callable(clock):
+            raise ValueError(f'clock argument is malformed: \"{clock}\"')
 
         self.__backgroundTaskHelper: BackgroundTaskHelper = backgroundTaskHelper
         self.__bongoTriviaQuestionRepository: TriviaQuestionRepositoryInterface = bongoTriviaQuestionRepository
@@ -215,21 +252,74 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
         self.__willFryTriviaQuestionRepository: TriviaQuestionRepositoryInterface = willFryTriviaQuestionRepository
         self.__wwtbamTriviaQuestionRepository: TriviaQuestionRepositoryInterface = wwtbamTriviaQuestionRepository
+        self.__consumptionRateWindowSeconds: float = consumptionRateWindowSeconds
+        self.__maxConcurrentFetchesPerTriviaSource: int = maxConcurrentFetchesPerTriviaSource
+        self.__maxTriviaSourceBackoffSeconds: float = maxTriviaSourceBackoffSeconds
         self.__spoolerLoopSleepTimeSeconds: float = spoolerLoopSleepTimeSeconds
         self.__triviaRetrySleepTimeSeconds: float = triviaRetrySleepTimeSeconds
+        self.__triviaSourceBackoffSeconds: float = triviaSourceBackoffSeconds
+        self.__clock: Callable[[], float] = clock
 
         self.__isSpoolerStarted: bool = False
         self.__triviaSourceToRepositoryMap: Dict[TriviaSource, Optional[TriviaQuestionRepositoryInterface]] = self.__createTriviaSourceToRepositoryMap()
         self.__superTriviaQuestionSpool: SimpleQueue[QuestionAnswerTriviaQuestion] = SimpleQueue()
         self.__triviaQuestionSpool: SimpleQueue[AbsTriviaQuestion] = SimpleQueue()
+        self.__spoolerEvent: Optional[asyncio.Event] = None
 
-    async def __chooseRandomTriviaSource(self, triviaFetchOptions: TriviaFetchOptions) -> TriviaQuestionRepositoryInterface:
+        # the times at which questions were asked for, used to size each spool to its recent consumption rate
+        self.__superTriviaDemandTimes: Deque[float] = deque()
+        self.__triviaDemandTimes: Deque[float] = deque()
+
+        self.__fetchesInFlight: Dict[TriviaSource, int] = defaultdict(lambda: 0)
+        self.__triviaSourceLatencyTracker: TriviaSourceLatencyTracker = TriviaSourceLatencyTracker()
+        self.__triviaSourceBackoffTimes: Dict[TriviaSource, float] = dict()
+        self.__spoolHits: int = 0
+        self.__spoolMisses: int = 0
+
+    async def __chooseHedgeTriviaSource(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        hedgedTriviaSource: TriviaSource
+    ) -> Optional[TriviaQuestionRepositoryInterface]:
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif not isinstance(hedgedTriviaSource, TriviaSource):
+            raise ValueError(f'hedgedTriviaSource argument is malformed: \"{hedgedTriviaSource}\"')
+
+        now = self.__clock()
+        excludedTriviaSources: Set[TriviaSource] = { hedgedTriviaSource }
+
+        for triviaSource, backoffTime in self.__triviaSourceBackoffTimes.items():
+            if backoffTime > now:
+                excludedTriviaSources.add(triviaSource)
+
+        try:
+            triviaQuestionRepository = await self.__chooseRandomTriviaSource(
+                triviaFetchOptions = triviaFetchOptions,
+                excludedTriviaSources = excludedTriviaSources
+            )
+        except RuntimeError:
+            # there's no other trivia source to race against this one, so it'll just have to be waited on
+            return None
+
+        return triviaQuestionRepository
+
+    async def __chooseRandomTriviaSource(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        excludedTriviaSources: Optional[Set[TriviaSource]] = None
+    ) -> TriviaQuestionRepositoryInterface:
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif excludedTriviaSources is not None and not isinstance(excludedTriviaSources, Set):
+            raise ValueError(f'excludedTriviaSources argument is malformed: \"{excludedTriviaSources}\"')
 
         triviaSourcesAndWeights: Dict[TriviaSource, int] = await self.__triviaSettingsRepository.getAvailableTriviaSourcesAndWeights()
         triviaSourcesToRemove: Set[TriviaSource] = await self.__getCurrentlyInvalidTriviaSources(triviaFetchOptions)
 
+        if excludedTriviaSources is not None:
+            triviaSourcesToRemove.update(excludedTriviaSources)
+
         for triviaSourceToRemove in triviaSourcesToRemove:
             if triviaSourceToRemove in triviaSourcesAndWeights:
                 del triviaSourcesAndWeights[triviaSourceToRemove]
@@ -255,6 +345,44 @@ class TriviaRepository(TriviaRepositoryInterface):
         randomlyChosenTriviaSource = randomChoices[0]
         return self.__triviaSourceToRepositoryMap[randomlyChosenTriviaSource]
 
+    async def __chooseSpoolTriviaSource(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        scheduledFetches: Dict[TriviaSource, int],
+        localSpoolRequests: Dict[Tuple[TriviaSource, TriviaFetchOptions], int]
+    ) -> Optional[TriviaQuestionRepositoryInterface]:
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif not isinstance(scheduledFetches, Dict):
+            raise ValueError(f'scheduledFetches argument is malformed: \"{scheduledFetches}\"')
+        elif not isinstance(localSpoolRequests, Dict):
+            raise ValueError(f'localSpoolRequests argument is malformed: \"{localSpoolRequests}\"')
+
+        now = self.__clock()
+        excludedTriviaSources: Set[TriviaSource] = set()
+
+        for triviaSource in TriviaSource:
+            backoffTime = self.__triviaSourceBackoffTimes.get(triviaSource)
+
+            if (triviaSource, triviaFetchOptions) in localSpoolRequests:
+                # one more question from an already scheduled local fetch doesn't take up any more concurrency
+                continue
+            elif self.__fetchesInFlight[triviaSource] + scheduledFetches.get(triviaSource, 0) >= self.__maxConcurrentFetchesPerTriviaSource:
+                excludedTriviaSources.add(triviaSource)
+            elif backoffTime is not None and backoffTime > now:
+                excludedTriviaSources.add(triviaSource)
+
+        try:
+            triviaQuestionRepository = await self.__chooseRandomTriviaSource(
+                triviaFetchOptions = triviaFetchOptions,
+                excludedTriviaSources = excludedTriviaSources
+            )
+        except RuntimeError:
+            # every trivia source is either already busy or backing off, so the spool will be topped up later
+            return None
+
+        return triviaQuestionRepository
+
     def __createTriviaSourceToRepositoryMap(self) -> Dict[TriviaSource, Optional[TriviaQuestionRepositoryInterface]]:
         triviaSourceToRepositoryMap: Dict[TriviaSource, Optional[TriviaQuestionRepositoryInterface]] = {
             TriviaSource.BONGO: self.__bongoTriviaQuestionRepository,
@@ -292,33 +420,23 @@ class TriviaRepository(TriviaRepositoryInterface):
         retryCount: int = 0
         maxRetryCount = await self.__triviaSettingsRepository.getMaxRetryCount()
         attemptedTriviaSources: List[TriviaSource] = list()
+        self.__recordDemand(triviaFetchOptions)
 
         while retryCount < maxRetryCount:
             question = await self.__retrieveSpooledTriviaQuestion(triviaFetchOptions)
 
             if question is None:
-                triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-                triviaSource = triviaQuestionRepository.getTriviaSource()
-                attemptedTriviaSources.append(triviaSource)
-
-                try:
-                    question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-                except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-                    self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-                except GenericTriviaNetworkException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except MalformedTriviaJsonException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except Exception as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-
-            if await self.__verifyTriviaQuestionContent(
+                question = await self.__fetchHedgedTriviaQuestion(
+                    triviaFetchOptions = triviaFetchOptions,
+                    attemptedTriviaSources = attemptedTriviaSources
+                )
+            elif not await self.__verifyTriviaQuestionContent(
                 question = question,
                 triviaFetchOptions = triviaFetchOptions
-            ) and await self.__verifyTriviaQuestionIsNotDuplicate(
+            ):
+                question = None
+
+            if question is not None and await self.__verifyTriviaQuestionIsNotDuplicate(
                 question = question,
                 emote = emote,
                 triviaFetchOptions = triviaFetchOptions
@@ -331,6 +449,132 @@ class TriviaRepository(TriviaRepositoryInterface):
 
         raise TooManyTriviaFetchAttemptsException(f'Unable to fetch trivia from {attemptedTriviaSources} after {retryCount} attempts (max attempts is {maxRetryCount})')
 
+    async def __fetchHedgedTriviaQuestion(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        attemptedTriviaSources: List[TriviaSource]
+    ) -> Optional[AbsTriviaQuestion]:
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif not isinstance(attemptedTriviaSources, List):
+            raise ValueError(f'attemptedTriviaSources argument is malformed: \"{attemptedTriviaSources}\"')
+
+        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
+        triviaSource = triviaQuestionRepository.getTriviaSource()
+        attemptedTriviaSources.append(triviaSource)
+
+        # local trivia sources answer far too quickly to ever be worth hedging
+        if isinstance(triviaQuestionRepository, AbsLocalTriviaQuestionRepository) or not await self.__triviaSettingsRepository.isTriviaFetchHedgingEnabled():
+            return await self.__fetchVerifiedTriviaQuestion(triviaQuestionRepository, triviaFetchOptions)
+
+        fetches: Set[asyncio.Task] = set()
+        fetches.add(asyncio.create_task(self.__fetchVerifiedTriviaQuestion(triviaQuestionRepository, triviaFetchOptions)))
+
+        try:
+            hedgeDelaySeconds = await self.__getHedgeDelaySeconds(triviaSource)
+            done, _ = await asyncio.wait(fetches, timeout = hedgeDelaySeconds)
+
+            if len(done) == 0:
+                hedgeTriviaQuestionRepository = await self.__chooseHedgeTriviaSource(triviaFetchOptions, triviaSource)
+
+                if hedgeTriviaQuestionRepository is not None:
+                    hedgeTriviaSource = hedgeTriviaQuestionRepository.getTriviaSource()
+                    attemptedTriviaSources.append(hedgeTriviaSource)
+                    self.__timber.log('TriviaRepository', f'{triviaSource} hasn\'t answered within {hedgeDelaySeconds} second(s), so {hedgeTriviaSource} is being raced against it')
+                    fetches.add(asyncio.create_task(self.__fetchVerifiedTriviaQuestion(hedgeTriviaQuestionRepository, triviaFetchOptions)))
+
+            # the first trivia source to hand back a question that passes verification wins
+            pending = fetches
+
+            while len(pending) >= 1:
+                done, pending = await asyncio.wait(pending, return_when = asyncio.FIRST_COMPLETED)
+
+                for fetch in done:
+                    question = fetch.result()
+
+                    if question is not None:
+                        return question
+
+            return None
+        finally:
+            for fetch in fetches:
+                if not fetch.done():
+                    fetch.cancel()
+
+    async def __fetchTriviaQuestions(
+        self,
+        triviaQuestionRepository: TriviaQuestionRepositoryInterface,
+        triviaFetchOptions: TriviaFetchOptions,
+        count: int
+    ) -> List[AbsTriviaQuestion]:
+        if not isinstance(triviaQuestionRepository, TriviaQuestionRepositoryInterface):
+            raise ValueError(f'triviaQuestionRepository argument is malformed: \"{triviaQuestionRepository}\"')
+        elif not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif not utils.isValidInt(count):
+            raise ValueError(f'count argument is malformed: \"{count}\"')
+        elif count < 1 or count > 100:
+            raise ValueError(f'count argument is out of bounds: {count}')
+
+        triviaSource = triviaQuestionRepository.getTriviaSource()
+        questions: List[AbsTriviaQuestion] = list()
+        self.__fetchesInFlight[triviaSource] = self.__fetchesInFlight[triviaSource] + 1
+        startTime = self.__clock()
+
+        try:
+            if count >= 2 and isinstance(triviaQuestionRepository, AbsLocalTriviaQuestionRepository):
+                questions.extend(await triviaQuestionRepository.fetchTriviaQuestions(triviaFetchOptions, count))
+            else:
+                for _ in range(count):
+                    questions.append(await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions))
+        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
+            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
+        except GenericTriviaNetworkException as e:
+            errorCount = self.__incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+        except MalformedTriviaJsonException as e:
+            errorCount = self.__incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+        except asyncio.CancelledError:
+            # this fetch lost a hedged race, so all that's known is that it took at least this long
+            self.__triviaSourceLatencyTracker.recordLatency(triviaSource, self.__clock() - startTime)
+            raise
+        except Exception as e:
+            errorCount = self.__incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+        finally:
+            self.__fetchesInFlight[triviaSource] = self.__fetchesInFlight[triviaSource] - 1
+
+        if utils.hasItems(questions):
+            self.__triviaSourceLatencyTracker.recordLatency(triviaSource, self.__clock() - startTime)
+            self.__triviaSourceBackoffTimes.pop(triviaSource, None)
+
+        return questions
+
+    async def __fetchVerifiedTriviaQuestion(
+        self,
+        triviaQuestionRepository: TriviaQuestionRepositoryInterface,
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> Optional[AbsTriviaQuestion]:
+        questions = await self.__fetchTriviaQuestions(
+            triviaQuestionRepository = triviaQuestionRepository,
+            triviaFetchOptions = triviaFetchOptions,
+            count = 1
+        )
+
+        if not utils.hasItems(questions):
+            return None
+
+        question = questions[0]
+
+        if not await self.__verifyTriviaQuestionContent(
+            question = question,
+            triviaFetchOptions = triviaFetchOptions
+        ):
+            return None
+
+        return question
+
     async def __getCurrentlyInvalidTriviaSources(self, triviaFetchOptions: TriviaFetchOptions) -> Set[TriviaSource]:
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
@@ -382,6 +626,83 @@ class TriviaRepository(TriviaRepositoryInterface):
 
         return unstableTriviaSources
 
+    async def __getHedgeDelaySeconds(self, triviaSource: TriviaSource) -> float:
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        minHedgeDelaySeconds = await self.__triviaSettingsRepository.getMinTriviaFetchHedgeDelaySeconds()
+        maxHedgeDelaySeconds = await self.__triviaSettingsRepository.getMaxTriviaFetchHedgeDelaySeconds()
+        p95LatencySeconds = self.__triviaSourceLatencyTracker.getP95(triviaSource)
+
+        # Only hedge once a trivia source is slower than it usually is. Until there's enough
+        # history to know what "usually" looks like, wait for as long as is allowed.
+        if p95LatencySeconds is None or self.__triviaSourceLatencyTracker.getSampleCount(triviaSource) < 8:
+            return maxHedgeDelaySeconds
+
+        return min(max(p95LatencySeconds, minHedgeDelaySeconds), maxHedgeDelaySeconds)
+
+    async def getSpoolMetrics(self) -> TriviaSpoolMetrics:
+        return TriviaSpoolMetrics(
+            fetchLatencySeconds = self.__triviaSourceLatencyTracker.getAverages(),
+            fetchLatencyP50Seconds = self.__triviaSourceLatencyTracker.getP50s(),
+            fetchLatencyP95Seconds = self.__triviaSourceLatencyTracker.getP95s(),
+            spoolHits = self.__spoolHits,
+            spoolMisses = self.__spoolMisses,
+            superTriviaSpoolSize = self.__superTriviaQuestionSpool.qsize(),
+            superTriviaTargetSpoolSize = await self.__getSuperTriviaTargetSpoolSize(),
+            triviaSpoolSize = self.__triviaQuestionSpool.qsize(),
+            triviaTargetSpoolSize = await self.__getTriviaTargetSpoolSize()
+        )
+
+    def __getSpoolerEvent(self) -> asyncio.Event:
+        spoolerEvent = self.__spoolerEvent
+
+        if spoolerEvent is None:
+            spoolerEvent = asyncio.Event()
+            self.__spoolerEvent = spoolerEvent
+
+        return spoolerEvent
+
+    async def __getSuperTriviaTargetSpoolSize(self) -> int:
+        return self.__getTargetSpoolSize(
+            demandTimes = self.__superTriviaDemandTimes,
+            maxSpoolSize = await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize()
+        )
+
+    def __getTargetSpoolSize(self, demandTimes: Deque[float], maxSpoolSize: int) -> int:
+        if not isinstance(demandTimes, Deque):
+            raise ValueError(f'demandTimes argument is malformed: \"{demandTimes}\"')
+        elif not utils.isValidInt(maxSpoolSize):
+            raise ValueError(f'maxSpoolSize argument is malformed: \"{maxSpoolSize}\"')
+
+        now = self.__clock()
+
+        while len(demandTimes) >= 1 and now - demandTimes[0] > self.__consumptionRateWindowSeconds:
+            demandTimes.popleft()
+
+        # enough questions to cover the recent rate of consumption until the spooler's next
+        # scheduled run, plus one more so that a spool is never intentionally left empty
+        expectedDemand = math.ceil(len(demandTimes) * self.__spoolerLoopSleepTimeSeconds / self.__consumptionRateWindowSeconds)
+        return max(0, min(expectedDemand + 1, maxSpoolSize))
+
+    async def __getTriviaTargetSpoolSize(self) -> int:
+        return self.__getTargetSpoolSize(
+            demandTimes = self.__triviaDemandTimes,
+            maxSpoolSize = await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize()
+        )
+
+    def __incrementErrorCount(self, triviaSource: TriviaSource) -> int:
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+
+        # the spooler stays away from a failing trivia source for exponentially longer each time
+        backoffSeconds = min(self.__triviaSourceBackoffSeconds * math.pow(2, min(errorCount - 1, 16)), self.__maxTriviaSourceBackoffSeconds)
+        self.__triviaSourceBackoffTimes[triviaSource] = self.__clock() + backoffSeconds
+
+        return errorCount
+
     async def __isJokeTriviaQuestionRepositoryAvailable(self) -> bool:
         return self.__jokeTriviaQuestionRepository is not None
 
@@ -394,6 +715,73 @@ class TriviaRepository(TriviaRepositoryInterface):
     async def __isQuizApiTriviaQuestionRepositoryAvailable(self) -> bool:
         return self.__quizApiTriviaQuestionRepository is not None
 
+    def __recordDemand(self, triviaFetchOptions: TriviaFetchOptions):
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise ValueError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+
+        if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
+            self.__superTriviaDemandTimes.append(self.__clock())
+        else:
+            self.__triviaDemandTimes.append(self.__clock())
+
+        # wake up the spooler so that it can top up whichever spool this is about to drain
+        self.__getSpoolerEvent().set()
+
+    async def __refillSpools(self) -> int:
+        superTriviaDeficit = await self.__getSuperTriviaTargetSpoolSize() - self.__superTriviaQuestionSpool.qsize()
+        triviaDeficit = await self.__getTriviaTargetSpoolSize() - self.__triviaQuestionSpool.qsize()
+
+        if superTriviaDeficit <= 0 and triviaDeficit <= 0:
+            return 0
+
+        twitchHandle = await self.__twitchHandleProvider.getTwitchHandle()
+
+        superTriviaFetchOptions = TriviaFetchOptions(
+            twitchChannel = twitchHandle,
+            isJokeTriviaRepositoryEnabled = False,
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        )
+
+        triviaFetchOptions = TriviaFetchOptions(
+            twitchChannel = twitchHandle,
+            isJokeTriviaRepositoryEnabled = False,
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
+        )
+
+        scheduledFetches: Dict[TriviaSource, int] = dict()
+        localSpoolRequests: Dict[Tuple[TriviaSource, TriviaFetchOptions], int] = dict()
+        spoolFetches: List[Awaitable[int]] = list()
+
+        # alternate between the two spools, so that neither one can use up every trivia source's concurrency
+        for index in range(max(superTriviaDeficit, triviaDeficit)):
+            if index < triviaDeficit:
+                await self.__scheduleSpoolFetch(triviaFetchOptions, scheduledFetches, localSpoolRequests, spoolFetches)
+
+            if index < superTriviaDeficit:
+                await self.__scheduleSpoolFetch(superTriviaFetchOptions, scheduledFetches, localSpoolRequests, spoolFetches)
+
+        for (triviaSource, fetchOptions), count in localSpoolRequests.items():
+            spoolFetches.append(self.__spoolNewTriviaQuestions(
+                triviaQuestionRepository = self.__triviaSourceToRepositoryMap[triviaSource],
+                triviaFetchOptions = fetchOptions,
+                count = count
+            ))
+
+        if not utils.hasItems(spoolFetches):
+            return 0
+
+        self.__timber.log('TriviaRepository', f'Spooling up trivia questions from {scheduledFetches} (trivia qsize: {self.__triviaQuestionSpool.qsize()}, super trivia qsize: {self.__superTriviaQuestionSpool.qsize()})')
+        results = await asyncio.gather(*spoolFetches, return_exceptions = True)
+        spooledQuestions: int = 0
+
+        for result in results:
+            if isinstance(result, Exception):
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when spooling trivia questions: {result}', result)
+            else:
+                spooledQuestions = spooledQuestions + result
+
+        return spooledQuestions
+
     async def __retrieveSpooledTriviaQuestion(
         self,
         triviaFetchOptions: TriviaFetchOptions
@@ -405,108 +793,124 @@ class TriviaRepository(TriviaRepositoryInterface):
             if not self.__superTriviaQuestionSpool.empty():
                 try:
                     self.__timber.log('TriviaRepository', f'Retrieving spooled super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-                    return self.__superTriviaQuestionSpool.get_nowait()
+                    question = self.__superTriviaQuestionSpool.get_nowait()
+                    self.__spoolHits = self.__spoolHits + 1
+                    return question
                 except queue.Empty as e:
                     self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled super trivia question', e, traceback.format_exc())
         else:
             if not self.__triviaQuestionSpool.empty():
                 try:
                     self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-                    return self.__triviaQuestionSpool.get_nowait()
+                    question = self.__triviaQuestionSpool.get_nowait()
+                    self.__spoolHits = self.__spoolHits + 1
+                    return question
                 except queue.Empty as e:
                     self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled trivia question', e, traceback.format_exc())
 
+        self.__spoolMisses = self.__spoolMisses + 1
         return None
 
-    async def __spoolNewSuperTriviaQuestion(self):
-        if self.__superTriviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize():
+    async def __scheduleSpoolFetch(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        scheduledFetches: Dict[TriviaSource, int],
+        localSpoolRequests: Dict[Tuple[TriviaSource, TriviaFetchOptions], int],
+        spoolFetches: List[Awaitable[int]]
+    ):
+        triviaQuestionRepository = await self.__chooseSpoolTriviaSource(triviaFetchOptions, scheduledFetches, localSpoolRequests)
+
+        if triviaQuestionRepository is None:
             return
 
-        triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            isJokeTriviaRepositoryEnabled = False,
-            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        triviaSource = triviaQuestionRepository.getTriviaSource()
+
+        if isinstance(triviaQuestionRepository, AbsLocalTriviaQuestionRepository):
+            # local trivia sources can hand back several questions from a single query, so all of
+            # the questions requested from one of them are gathered up into one fetch
+            key = (triviaSource, triviaFetchOptions)
+
+            if key not in localSpoolRequests:
+                scheduledFetches[triviaSource] = scheduledFetches.get(triviaSource, 0) + 1
+
+            localSpoolRequests[key] = localSpoolRequests.get(key, 0) + 1
+        else:
+            scheduledFetches[triviaSource] = scheduledFetches.get(triviaSource, 0) + 1
+
+            spoolFetches.append(self.__spoolNewTriviaQuestions(
+                triviaQuestionRepository = triviaQuestionRepository,
+                triviaFetchOptions = triviaFetchOptions,
+                count = 1
+            ))
+
+    async def __spoolNewTriviaQuestions(
+        self,
+        triviaQuestionRepository: TriviaQuestionRepositoryInterface,
+        triviaFetchOptions: TriviaFetchOptions,
+        count: int
+    ) -> int:
+        questions = await self.__fetchTriviaQuestions(
+            triviaQuestionRepository = triviaQuestionRepository,
+            triviaFetchOptions = triviaFetchOptions,
+            count = count
         )
 
-        self.__timber.log('TriviaRepository', f'Spooling up a super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-        triviaSource = triviaQuestionRepository.getTriviaSource()
-        question: Optional[AbsTriviaQuestion] = None
+        spooledQuestions: int = 0
 
-        try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except GenericTriviaNetworkException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching super trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except MalformedTriviaJsonException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching super trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except Exception as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching super trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
+        for question in questions:
+            if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
+                isSpooled = await self.__spoolSuperTriviaQuestion(question, triviaFetchOptions)
+            else:
+                isSpooled = await self.__spoolTriviaQuestion(question, triviaFetchOptions)
+
+            if isSpooled:
+                spooledQuestions = spooledQuestions + 1
 
+        return spooledQuestions
+
+    async def __spoolSuperTriviaQuestion(
+        self,
+        question: Optional[AbsTriviaQuestion],
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> bool:
         if question is None:
-            return
+            return False
         elif question.getTriviaType() is not TriviaType.QUESTION_ANSWER or not isinstance(question, QuestionAnswerTriviaQuestion):
             self.__timber.log('TriviaRepository', f'Encountered unexpected super trivia question type ({question}) when spooling a super trivia question')
-            return
+            return False
 
         if not await self.__verifyTriviaQuestionContent(
             question = question,
             triviaFetchOptions = triviaFetchOptions
         ):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a super trivia question')
-            return
+            return False
 
         self.__superTriviaQuestionSpool.put(question)
         self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question (new qsize: {self.__superTriviaQuestionSpool.qsize()})')
+        return True
 
-    async def __spoolNewTriviaQuestion(self):
-        if self.__triviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize():
-            return
-
-        triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            isJokeTriviaRepositoryEnabled = False,
-            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
-        )
-
-        self.__timber.log('TriviaRepository', f'Spooling up a trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-        triviaSource = triviaQuestionRepository.getTriviaSource()
-        question: Optional[AbsTriviaQuestion] = None
-
-        try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except GenericTriviaNetworkException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except MalformedTriviaJsonException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-        except Exception as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question for spool (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-
+    async def __spoolTriviaQuestion(
+        self,
+        question: Optional[AbsTriviaQuestion],
+        triviaFetchOptions: TriviaFetchOptions
+    ) -> bool:
         if question is None:
-            return
+            return False
         elif question.getTriviaType() is TriviaType.QUESTION_ANSWER or isinstance(question, QuestionAnswerTriviaQuestion):
             self.__timber.log('TriviaRepository', f'Encountered unexpected trivia question type ({question}) when spooling a trivia question')
-            return
+            return False
 
         if not await self.__verifyTriviaQuestionContent(
             question = question,
             triviaFetchOptions = triviaFetchOptions
         ):
             self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a trivia question')
-            return
+            return False
 
         self.__triviaQuestionSpool.put(question)
         self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question (new qsize: {self.__triviaQuestionSpool.qsize()})')
+        return True
 
     def startSpooler(self):
         if self.__isSpoolerStarted:
@@ -519,18 +923,27 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__backgroundTaskHelper.createTask(self.__startTriviaQuestionSpooler())
 
     async def __startTriviaQuestionSpooler(self):
+        spoolerEvent = self.__getSpoolerEvent()
+
         while True:
+            spooledQuestions: int = 0
+
             try:
-                await self.__spoolNewTriviaQuestion()
+                spooledQuestions = await self.__refillSpools()
             except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool', e, traceback.format_exc())
+                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spools', e, traceback.format_exc())
+
+            # the spools may still be short of their targets if a trivia source's concurrency limit was hit,
+            # so go around again right away for as long as questions are still being successfully spooled
+            if spooledQuestions >= 1:
+                continue
 
             try:
-                await self.__spoolNewSuperTriviaQuestion()
-            except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing super trivia question spool', e, traceback.format_exc())
+                await asyncio.wait_for(spoolerEvent.wait(), timeout = self.__spoolerLoopSleepTimeSeconds)
+            except asyncio.TimeoutError:
+                pass
 
-            await asyncio.sleep(self.__spoolerLoopSleepTimeSeconds)
+            spoolerEvent.clear()
 
     async def __verifyTriviaQuestionContent(
         self,
@@ -4,9 +4,13 @@ from typing import Optional
 try:
     from CynanBotCommon.trivia.absTriviaQuestion import AbsTriviaQuestion
     from CynanBotCommon.trivia.triviaFetchOptions import TriviaFetchOptions
+    from CynanBotCommon.trivia.triviaRepositories.triviaSpoolMetrics import \
+        TriviaSpoolMetrics
 except:
     from trivia.absTriviaQuestion import AbsTriviaQuestion
     from trivia.triviaFetchOptions import TriviaFetchOptions
+    from trivia.triviaRepositories.triviaSpoolMetrics import \
+        TriviaSpoolMetrics
 
 
 class TriviaRepositoryInterface(ABC):
@@ -19,6 +23,10 @@ class TriviaRepositoryInterface(ABC):
     ) -> Optional[AbsTriviaQuestion]:
         pass
 
+    @abstractmethod
+    async def getSpoolMetrics(self) -> TriviaSpoolMetrics:
+        pass
+
     @abstractmethod
     def startSpooler(self):
         pass
@@ -0,0 +1,100 @@
+import math
+from collections import defaultdict, deque
+from typing import Callable, Deque, Dict, Optional
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.trivia.triviaSource import TriviaSource
+except:
+    import utils
+    from trivia.triviaSource import TriviaSource
+
+
+class TriviaSourceLatencyTracker():
+
+    def __init__(self, maxSamplesPerTriviaSource: int = 64):
+        if not utils.isValidInt(maxSamplesPerTriviaSource):
+            raise ValueError(f'maxSamplesPerTriviaSource argument is malformed: \"{maxSamplesPerTriviaSource}\"')
+        elif maxSamplesPerTriviaSource < 1 or maxSamplesPerTriviaSource > 1024:
+            raise ValueError(f'maxSamplesPerTriviaSource argument is out of bounds: {maxSamplesPerTriviaSource}')
+
+        self.__maxSamplesPerTriviaSource: int = maxSamplesPerTriviaSource
+
+        # only the most recent samples are kept, so that the numbers follow a trivia source as it speeds up or slows down
+        self.__latencies: Dict[TriviaSource, Deque[float]] = defaultdict(lambda: deque(maxlen = self.__maxSamplesPerTriviaSource))
+
+    def getAverage(self, triviaSource: TriviaSource) -> Optional[float]:
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        latencies = self.__latencies.get(triviaSource)
+
+        if latencies is None or len(latencies) == 0:
+            return None
+
+        return sum(latencies) / len(latencies)
+
+    def getAverages(self) -> Dict[TriviaSource, float]:
+        return self.__getForEachTriviaSource(self.getAverage)
+
+    def __getForEachTriviaSource(self, getter: Callable[[TriviaSource], Optional[float]]) -> Dict[TriviaSource, float]:
+        values: Dict[TriviaSource, float] = dict()
+
+        for triviaSource in list(self.__latencies.keys()):
+            value = getter(triviaSource)
+
+            if value is not None:
+                values[triviaSource] = value
+
+        return values
+
+    def getP50(self, triviaSource: TriviaSource) -> Optional[float]:
+        return self.getPercentile(triviaSource, 50)
+
+    def getP50s(self) -> Dict[TriviaSource, float]:
+        return self.__getForEachTriviaSource(self.getP50)
+
+    def getP95(self, triviaSource: TriviaSource) -> Optional[float]:
+        return self.getPercentile(triviaSource, 95)
+
+    def getP95s(self) -> Dict[TriviaSource, float]:
+        return self.__getForEachTriviaSource(self.getP95)
+
+    def getPercentile(self, triviaSource: TriviaSource, percentile: float) -> Optional[float]:
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+        elif not utils.isValidNum(percentile):
+            raise ValueError(f'percentile argument is malformed: \"{percentile}\"')
+        elif percentile <= 0 or percentile > 100:
+            raise ValueError(f'percentile argument is out of bounds: {percentile}')
+
+        latencies = self.__latencies.get(triviaSource)
+
+        if latencies is None or len(latencies) == 0:
+            return None
+
+        # nearest-rank percentile, which is always one of the actual samples
+        sortedLatencies = sorted(latencies)
+        rank = math.ceil(percentile / 100 * len(sortedLatencies))
+        return sortedLatencies[rank - 1]
+
+    def getSampleCount(self, triviaSource: TriviaSource) -> int:
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        latencies = self.__latencies.get(triviaSource)
+
+        if latencies is None:
+            return 0
+
+        return len(latencies)
+
+    def recordLatency(self, triviaSource: TriviaSource, latencySeconds: float):
+        if not isinstance(triviaSource, TriviaSource):
+            raise ValueError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+        elif not utils.isValidNum(latencySeconds):
+            raise ValueError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+        elif latencySeconds < 0:
+            raise ValueError(f'latencySeconds argument is out of bounds: {latencySeconds}')
+
+        self.__latencies[triviaSource].append(latencySeconds)
@@ -0,0 +1,94 @@
+from typing import Dict
+
+try:
+    import CynanBotCommon.utils as utils
+    from CynanBotCommon.trivia.triviaSource import TriviaSource
+except:
+    import utils
+    from trivia.triviaSource import TriviaSource
+
+
+class TriviaSpoolMetrics():
+
+    def __init__(
+        self,
+        fetchLatencySeconds: Dict[TriviaSource, float],
+        fetchLatencyP50Seconds: Dict[TriviaSource, float],
+        fetchLatencyP95Seconds: Dict[TriviaSource, float],
+        spoolHits: int,
+        spoolMisses: int,
+        superTriviaSpoolSize: int,
+        superTriviaTargetSpoolSize: int,
+        triviaSpoolSize: int,
+        triviaTargetSpoolSize: int
+    ):
+        if not isinstance(fetchLatencySeconds, Dict):
+            raise ValueError(f'fetchLatencySeconds argument is malformed: \"{fetchLatencySeconds}\"')
+        elif not isinstance(fetchLatencyP50Seconds, Dict):
+            raise ValueError(f'fetchLatencyP50Seconds argument is malformed: \"{fetchLatencyP50Seconds}\"')
+        elif not isinstance(fetchLatencyP95Seconds, Dict):
+            raise ValueError(f'fetchLatencyP95Seconds argument is malformed: \"{fetchLatencyP95Seconds}\"')
+        elif not utils.isValidInt(spoolHits):
+            raise ValueError(f'spoolHits argument is malformed: \"{spoolHits}\"')
+        elif spoolHits < 0 or spoolHits > utils.getLongMaxSafeSize():
+            raise ValueError(f'spoolHits argument is out of bounds: {spoolHits}')
+        elif not utils.isValidInt(spoolMisses):
+            raise ValueError(f'spoolMisses argument is malformed: \"{spoolMisses}\"')
+        elif spoolMisses < 0 or spoolMisses > utils.getLongMaxSafeSize():
+            raise ValueError(f'spoolMisses argument is out of bounds: {spoolMisses}')
+        elif not utils.isValidInt(superTriviaSpoolSize):
+            raise ValueError(f'superTriviaSpoolSize argument is malformed: \"{superTriviaSpoolSize}\"')
+        elif not utils.isValidInt(superTriviaTargetSpoolSize):
+            raise ValueError(f'superTriviaTargetSpoolSize argument is malformed: \"{superTriviaTargetSpoolSize}\"')
+        elif not utils.isValidInt(triviaSpoolSize):
+            raise ValueError(f'triviaSpoolSize argument is malformed: \"{triviaSpoolSize}\"')
+        elif not utils.isValidInt(triviaTargetSpoolSize):
+            raise ValueError(f'triviaTargetSpoolSize argument is malformed: \"{triviaTargetSpoolSize}\"')
+
+        self.__fetchLatencySeconds: Dict[TriviaSource, float] = fetchLatencySeconds
+        self.__fetchLatencyP50Seconds: Dict[TriviaSource, float] = fetchLatencyP50Seconds
+        self.__fetchLatencyP95Seconds: Dict[TriviaSource, float] = fetchLatencyP95Seconds
+        self.__spoolHits: int = spoolHits
+        self.__spoolMisses: int = spoolMisses
+        self.__superTriviaSpoolSize: int = superTriviaSpoolSize
+        self.__superTriviaTargetSpoolSize: int = superTriviaTargetSpoolSize
+        self.__triviaSpoolSize: int = triviaSpoolSize
+        self.__triviaTargetSpoolSize: int = triviaTargetSpoolSize
+
+    def getFetchLatencyP50Seconds(self) -> Dict[TriviaSource, float]:
+        return self.__fetchLatencyP50Seconds
+
+    def getFetchLatencyP95Seconds(self) -> Dict[TriviaSource, float]:
+        return self.__fetchLatencyP95Seconds
+
+    def getFetchLatencySeconds(self) -> Dict[TriviaSource, float]:
+        return self.__fetchLatencySeconds
+
+    def getSpoolHitRate(self) -> float:
+        total = self.__spoolHits + self.__spoolMisses
+
+        if total == 0:
+            return 0
+
+        return float(self.__spoolHits) / float(total)
+
+    def getSpoolHits(self) -> int:
+        return self.__spoolHits
+
+    def getSpoolMisses(self) -> int:
+        return self.__spoolMisses
+
+    def getSuperTriviaSpoolSize(self) -> int:
+        return self.__superTriviaSpoolSize
+
+    def getSuperTriviaTargetSpoolSize(self) -> int:
+        return self.__superTriviaTargetSpoolSize
+
+    def getTriviaSpoolSize(self) -> int:
+        return self.__triviaSpoolSize
+
+    def getTriviaTargetSpoolSize(self) -> int:
+        return self.__triviaTargetSpoolSize
+
+    def toStr(self) -> str:
+        return f'fetchLatencySeconds={self.__fetchLatencySeconds}, fetchLatencyP50Seconds={self.__fetchLatencyP50Seconds}, fetchLatencyP95Seconds={self.__fetchLatencyP95Seconds}, spoolHits={self.__spoolHits}, spoolMisses={self.__spoolMisses}, superTriviaSpoolSize={self.__superTriviaSpoolSize}, superTriviaTargetSpoolSize={self.__superTriviaTargetSpoolSize}, triviaSpoolSize={self.__triviaSpoolSize}, triviaTargetSpoolSize={self.__triviaTargetSpoolSize}'
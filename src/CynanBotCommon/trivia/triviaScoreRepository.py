@@ -1,13 +1,15 @@
+from typing import Any, List, Optional
+
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.trivia.triviaScoreResult import TriviaScoreResult
 except:
     import utils
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
     from storage.databaseType import DatabaseType
     from trivia.triviaScoreResult import TriviaScoreResult
 
@@ -20,7 +22,64 @@ class TriviaScoreRepository():
 
         self.__backingDatabase: BackingDatabase = backingDatabase
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
+
+        self.__fetchTriviaScoreStatement: DatabaseStatement = DatabaseStatement(
+            name = 'triviaScores.fetchTriviaScore',
+            query = '''
+                SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid FROM triviascores
+                WHERE twitchchannel = $1 AND userid = $2
+                LIMIT 1
+            '''
+        )
+
+        # a missing score can be created by two lookups at the same time, so this leaves whichever one
+        # got there first alone rather than failing on the primary key
+        self.__insertTriviaScoreStatement: DatabaseStatement = DatabaseStatement(
+            name = 'triviaScores.insertTriviaScore',
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (0, 0, 0, 0, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO NOTHING
+            '''
+        )
+
+        # Each increment is a single statement that does its arithmetic on the stored row. Reading
+        # the row and then writing back new values would lose increments on PostgreSQL, where two
+        # transactions at READ COMMITTED can both read the same row before either one writes.
+        self.__incrementSuperTriviaWinsStatement: DatabaseStatement = DatabaseStatement(
+            name = 'triviaScores.incrementSuperTriviaWins',
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (0, 1, 0, 0, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET supertriviawins = triviascores.supertriviawins + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid
+            '''
+        )
+
+        self.__incrementTriviaLossesStatement: DatabaseStatement = DatabaseStatement(
+            name = 'triviaScores.incrementTriviaLosses',
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (-1, 0, 1, 0, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET
+                    streak = CASE WHEN triviascores.streak <= -1 THEN triviascores.streak - 1 ELSE -1 END,
+                    trivialosses = triviascores.trivialosses + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid
+            '''
+        )
+
+        self.__incrementTriviaWinsStatement: DatabaseStatement = DatabaseStatement(
+            name = 'triviaScores.incrementTriviaWins',
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
+                VALUES (1, 0, 0, 1, $1, $2)
+                ON CONFLICT (twitchchannel, userid) DO UPDATE SET
+                    streak = CASE WHEN triviascores.streak >= 1 THEN triviascores.streak + 1 ELSE 1 END,
+                    triviawins = triviascores.triviawins + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid
+            '''
+        )
 
     async def fetchTriviaScore(
         self,
@@ -34,50 +93,14 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid FROM triviascores
-                WHERE twitchchannel = $1 AND userid = $2
-                LIMIT 1
-            ''',
-            twitchChannel, userId
-        )
-
-        if utils.hasItems(record):
-            result = TriviaScoreResult(
-                streak = record[0],
-                superTriviaWins = record[1],
-                triviaLosses = record[2],
-                triviaWins = record[3],
-                twitchChannel = record[4],
-                userId = record[5]
-            )
-
-            await connection.close()
-            return result
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__fetchTriviaScoreStatement, twitchChannel, userId)
 
-        await connection.execute(
-            '''
-                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-            ''',
-            0, 0, 0, 0, twitchChannel, userId
-        )
-
-        await connection.close()
-        return TriviaScoreResult(
-            streak = 0,
-            superTriviaWins = 0,
-            triviaLosses = 0,
-            triviaWins = 0,
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
+            if not utils.hasItems(record):
+                await connection.execute(self.__insertTriviaScoreStatement, twitchChannel, userId)
+                record = await connection.fetchRow(self.__fetchTriviaScoreStatement, twitchChannel, userId)
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+        return self.__toTriviaScoreResult(record)
 
     async def incrementSuperTriviaWins(
         self,
@@ -91,32 +114,10 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
-
-        newSuperTriviaWins: int = result.getSuperTriviaWins() + 1
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__incrementSuperTriviaWinsStatement, twitchChannel, userId)
 
-        newResult = TriviaScoreResult(
-            streak = result.getStreak(),
-            superTriviaWins = newSuperTriviaWins,
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
-
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
-
-        return newResult
+        return self.__toTriviaScoreResult(record)
 
     async def incrementTriviaLosses(
         self,
@@ -130,38 +131,10 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
-
-        newStreak: int = 0
-        if result.getStreak() <= -1:
-            newStreak = result.getStreak() - 1
-        else:
-            newStreak = -1
-
-        newTriviaLosses: int = result.getTriviaLosses() + 1
-
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = newTriviaLosses,
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
-
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__incrementTriviaLossesStatement, twitchChannel, userId)
 
-        return newResult
+        return self.__toTriviaScoreResult(record)
 
     async def incrementTriviaWins(
         self,
@@ -175,48 +148,17 @@ class TriviaScoreRepository():
         elif userId == '0':
             raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
-            twitchChannel = twitchChannel,
-            userId = userId
-        )
-
-        newStreak: int = 0
-        if result.getStreak() >= 1:
-            newStreak = result.getStreak() + 1
-        else:
-            newStreak = 1
-
-        newTriviaWins: int = result.getTriviaWins() + 1
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__incrementTriviaWinsStatement, twitchChannel, userId)
 
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = newTriviaWins,
-            twitchChannel = result.getTwitchChannel(),
-            userId = result.getUserId()
-        )
-
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            userId = newResult.getUserId()
-        )
-
-        return newResult
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
+        return self.__toTriviaScoreResult(record)
 
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviascores (
                         streak integer DEFAULT 0 NOT NULL,
@@ -229,8 +171,8 @@ class TriviaScoreRepository():
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS triviascores (
                         streak INTEGER NOT NULL DEFAULT 0,
@@ -244,50 +186,22 @@ class TriviaScoreRepository():
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TriviaScoreRepository',
+            statements = statements
+        )
 
-    async def __updateTriviaScore(
-        self,
-        newStreak: int,
-        newSuperTriviaWins: int,
-        newTriviaLosses: int,
-        newTriviaWins: int,
-        twitchChannel: str,
-        userId: str
-    ):
-        if not utils.isValidInt(newStreak):
-            raise ValueError(f'newStreak argument is malformed: \"{newStreak}\"')
-        elif newStreak < utils.getIntMinSafeSize() or newStreak > utils.getIntMaxSafeSize():
-            raise ValueError(f'newStreak argument is out of boudns: {newStreak}')
-        elif not utils.isValidInt(newSuperTriviaWins):
-            raise ValueError(f'newSuperTriviaWins argument is malformed: \"{newSuperTriviaWins}\"')
-        elif newSuperTriviaWins < 0 or newSuperTriviaWins > utils.getIntMaxSafeSize():
-            raise ValueError(f'newSuperTriviaWins argument is out of bounds: {newSuperTriviaWins}')
-        elif not utils.isValidInt(newTriviaLosses):
-            raise ValueError(f'newTriviaLosses argument is malformed: \"{newTriviaLosses}\"')
-        elif newTriviaLosses < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaLosses argument is out of bounds: {newTriviaLosses}')
-        elif not utils.isValidInt(newTriviaWins):
-            raise ValueError(f'newTriviaWins argument is malformed: \"{newTriviaWins}\"')
-        elif newTriviaWins < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaWins argument is out of bounds: {newTriviaWins}')
-        elif not utils.isValidStr(twitchChannel):
-            raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(userId):
-            raise ValueError(f'userId argument is malformed: \"{userId}\"')
-        elif userId == '0':
-            raise ValueError(f'userId argument is an illegal value: \"{userId}\"')
+    def __toTriviaScoreResult(self, record: Optional[List[Any]]) -> TriviaScoreResult:
+        if not utils.hasItems(record):
+            raise RuntimeError(f'Unable to read trivia score record: \"{record}\"')
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
-                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannel, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (twitchchannel, userid) DO UPDATE SET streak = EXCLUDED.streak, supertriviawins = EXCLUDED.supertriviawins, triviaLosses = EXCLUDED.trivialosses, triviawins = EXCLUDED.triviawins
-            ''',
-            newStreak, newSuperTriviaWins, newTriviaLosses, newTriviaWins, twitchChannel, userId
+        return TriviaScoreResult(
+            streak = record[0],
+            superTriviaWins = record[1],
+            triviaLosses = record[2],
+            triviaWins = record[3],
+            twitchChannel = record[4],
+            userId = record[5]
         )
-
-        await connection.close()
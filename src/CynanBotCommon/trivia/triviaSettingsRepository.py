@@ -132,6 +132,16 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
 
         return maxSuperGameQueueSize
 
+    async def getMaxTriviaFetchHedgeDelaySeconds(self) -> float:
+        jsonContents = await self.__readJson()
+        maxHedgeDelaySeconds = utils.getFloatFromDict(jsonContents, 'max_trivia_fetch_hedge_delay_seconds', 4)
+        minHedgeDelaySeconds = utils.getFloatFromDict(jsonContents, 'min_trivia_fetch_hedge_delay_seconds', 0.75)
+
+        if maxHedgeDelaySeconds < minHedgeDelaySeconds:
+            raise ValueError(f'\"max_trivia_fetch_hedge_delay_seconds\" ({maxHedgeDelaySeconds}) is less than \"min_trivia_fetch_hedge_delay_seconds\" ({minHedgeDelaySeconds})')
+
+        return maxHedgeDelaySeconds
+
     async def getMinDaysBeforeRepeatQuestion(self) -> int:
         jsonContents = await self.__readJson()
         return utils.getIntFromDict(jsonContents, 'min_days_before_repeat_question', 10)
@@ -148,6 +158,15 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
 
         return minMultipleChoiceResponses
 
+    async def getMinTriviaFetchHedgeDelaySeconds(self) -> float:
+        jsonContents = await self.__readJson()
+        minHedgeDelaySeconds = utils.getFloatFromDict(jsonContents, 'min_trivia_fetch_hedge_delay_seconds', 0.75)
+
+        if minHedgeDelaySeconds < 0:
+            raise ValueError(f'\"min_trivia_fetch_hedge_delay_seconds\" is out of bounds: {minHedgeDelaySeconds}')
+
+        return minHedgeDelaySeconds
+
     async def getShinyProbability(self) -> float:
         jsonContents = await self.__readJson()
         return utils.getFloatFromDict(jsonContents, 'shiny_probability', 0.03)
@@ -176,6 +195,10 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
         jsonContents = await self.__readJson()
         return utils.getBoolFromDict(jsonContents, 'debug_logging_enabled', True)
 
+    async def isTriviaFetchHedgingEnabled(self) -> bool:
+        jsonContents = await self.__readJson()
+        return utils.getBoolFromDict(jsonContents, 'trivia_fetch_hedging_enabled', True)
+
     async def __readJson(self) -> Dict[str, Any]:
         if self.__settingsCache is not None:
             return self.__settingsCache
@@ -75,6 +75,10 @@ class TriviaSettingsRepositoryInterface(Clearable):
     async def getMaxSuperTriviaGameQueueSize(self) -> int:
         pass
 
+    @abstractmethod
+    async def getMaxTriviaFetchHedgeDelaySeconds(self) -> float:
+        pass
+
     @abstractmethod
     async def getMinDaysBeforeRepeatQuestion(self) -> int:
         pass
@@ -83,6 +87,10 @@ class TriviaSettingsRepositoryInterface(Clearable):
     async def getMinMultipleChoiceResponses(self) -> int:
         pass
 
+    @abstractmethod
+    async def getMinTriviaFetchHedgeDelaySeconds(self) -> float:
+        pass
+
     @abstractmethod
     async def getShinyProbability(self) -> float:
         pass
@@ -110,3 +118,7 @@ class TriviaSettingsRepositoryInterface(Clearable):
     @abstractmethod
     async def isDebugLoggingEnabled(self) -> bool:
         pass
+
+    @abstractmethod
+    async def isTriviaFetchHedgingEnabled(self) -> bool:
+        pass
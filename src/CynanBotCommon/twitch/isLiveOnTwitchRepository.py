@@ -1,12 +1,13 @@
+import asyncio
 from datetime import timedelta
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.administratorProviderInterface import \
         AdministratorProviderInterface
+    from CynanBotCommon.asyncTtlCache import AsyncTtlCache
     from CynanBotCommon.timber.timberInterface import TimberInterface
-    from CynanBotCommon.timedDict import TimedDict
     from CynanBotCommon.twitch.isLiveOnTwitchRepositoryInterface import \
         IsLiveOnTwitchRepositoryInterface
     from CynanBotCommon.twitch.twitchApiServiceInterface import \
@@ -17,8 +18,8 @@ try:
 except:
     import utils
     from administratorProviderInterface import AdministratorProviderInterface
+    from asyncTtlCache import AsyncTtlCache
     from timber.timberInterface import TimberInterface
-    from timedDict import TimedDict
 
     from twitch.isLiveOnTwitchRepositoryInterface import \
         IsLiveOnTwitchRepositoryInterface
@@ -54,28 +55,28 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
 
-        self.__cache: TimedDict = TimedDict(cacheTimeDelta)
+        self.__cache: AsyncTtlCache = AsyncTtlCache(timeToLive = cacheTimeDelta)
 
     async def clearCaches(self):
         self.__cache.clear()
         self.__timber.log('IsLiveOnTwitchRepository', 'Caches cleared')
 
-    async def __fetchLiveUserDetails(
+    async def __fetchLiveStatus(
         self,
-        twitchHandles: List[str],
-        twitchHandlesToLiveStatus: Dict[str, bool]
-    ):
-        twitchHandlesToFetch: Set[str] = set()
+        twitchHandle: str,
+        liveUserDetailsTask: Optional[asyncio.Future]
+    ) -> bool:
+        twitchHandlesToLiveStatus: Optional[Dict[str, bool]] = None
 
-        for twitchHandle in twitchHandles:
-            if twitchHandle.lower() in twitchHandlesToLiveStatus:
-                continue
+        if liveUserDetailsTask is not None:
+            twitchHandlesToLiveStatus = await liveUserDetailsTask
 
-            twitchHandlesToFetch.add(twitchHandle.lower())
+        if twitchHandlesToLiveStatus is None or twitchHandle not in twitchHandlesToLiveStatus:
+            twitchHandlesToLiveStatus = await self.__fetchLiveUserDetails([ twitchHandle ])
 
-        if not utils.hasItems(twitchHandlesToFetch):
-            return
+        return twitchHandlesToLiveStatus[twitchHandle]
 
+    async def __fetchLiveUserDetails(self, twitchHandles: List[str]) -> Dict[str, bool]:
         userName = await self.__administratorProvider.getAdministratorUserName()
 
         await self.__twitchTokensRepository.validateAndRefreshAccessToken(userName)
@@ -83,18 +84,18 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
 
         liveUserDetails = await self.__twitchApiService.fetchLiveUserDetails(
             twitchAccessToken = twitchAccessToken,
-            userNames = list(twitchHandlesToFetch)
+            userNames = twitchHandles
         )
 
-        for liveUserDetail in liveUserDetails:
-            isLive = liveUserDetail.getStreamType() is TwitchStreamType.LIVE
-            twitchHandlesToLiveStatus[liveUserDetail.getUserName().lower()] = isLive
-            self.__cache[liveUserDetail.getUserName().lower()] = isLive
+        twitchHandlesToLiveStatus: Dict[str, bool] = dict()
 
         for twitchHandle in twitchHandles:
-            if twitchHandle.lower() not in twitchHandlesToLiveStatus:
-                twitchHandlesToLiveStatus[twitchHandle.lower()] = False
-                self.__cache[twitchHandle.lower()] = False
+            twitchHandlesToLiveStatus[twitchHandle] = False
+
+        for liveUserDetail in liveUserDetails:
+            twitchHandlesToLiveStatus[liveUserDetail.getUserName().lower()] = liveUserDetail.getStreamType() is TwitchStreamType.LIVE
+
+        return twitchHandlesToLiveStatus
 
     async def isLive(self, twitchHandles: List[str]) -> Dict[str, bool]:
         twitchHandlesToLiveStatus: Dict[str, bool] = dict()
@@ -102,25 +103,45 @@ class IsLiveOnTwitchRepository(IsLiveOnTwitchRepositoryInterface):
         if not utils.hasItems(twitchHandles):
             return twitchHandlesToLiveStatus
 
-        await self.__populateFromCache(
-            twitchHandles = twitchHandles,
-            twitchHandlesToLiveStatus = twitchHandlesToLiveStatus
-        )
+        twitchHandles = list(dict.fromkeys(twitchHandle.lower() for twitchHandle in twitchHandles))
+        twitchHandlesToFetch: Set[str] = set()
 
-        await self.__fetchLiveUserDetails(
-            twitchHandles = twitchHandles,
-            twitchHandlesToLiveStatus = twitchHandlesToLiveStatus
-        )
+        for twitchHandle in twitchHandles:
+            if not self.__cache.containsKey(twitchHandle) and not self.__cache.isLoading(twitchHandle):
+                twitchHandlesToFetch.add(twitchHandle)
+
+        # all of the uncached handles are fetched together in a single API call, while any
+        # handles that are already being fetched by a concurrent call will wait on that call
+        liveUserDetailsTask: Optional[asyncio.Future] = None
+
+        if utils.hasItems(twitchHandlesToFetch):
+            liveUserDetailsTask = asyncio.ensure_future(self.__fetchLiveUserDetails(list(twitchHandlesToFetch)))
+            liveUserDetailsTask.add_done_callback(self.__onLiveUserDetailsTaskDone)
+
+        liveStatuses = await asyncio.gather(*[
+            self.__cache.getOrLoad(
+                key = twitchHandle,
+                loader = lambda twitchHandle = twitchHandle: self.__fetchLiveStatus(twitchHandle, liveUserDetailsTask)
+            ) for twitchHandle in twitchHandles
+        ])
+
+        # every load that needed the batched fetch has finished by now, so if it's still running,
+        # nothing is ever going to look at its result
+        if liveUserDetailsTask is not None and not liveUserDetailsTask.done():
+            liveUserDetailsTask.cancel()
+
+        for twitchHandle, isLive in zip(twitchHandles, liveStatuses):
+            twitchHandlesToLiveStatus[twitchHandle] = utils.isValidBool(isLive) and isLive
 
         return twitchHandlesToLiveStatus
 
-    async def __populateFromCache(
-        self,
-        twitchHandles: List[str],
-        twitchHandlesToLiveStatus: Dict[str, bool]
-    ):
-        for twitchHandle in twitchHandles:
-            isLive = self.__cache[twitchHandle.lower()]
+    def __onLiveUserDetailsTaskDone(self, liveUserDetailsTask: asyncio.Future):
+        if liveUserDetailsTask.cancelled():
+            return
+
+        # retrieving the exception here means that it's never reported as unhandled, even if
+        # every load that was waiting on this task has already given up on it
+        exception = liveUserDetailsTask.exception()
 
-            if utils.isValidBool(isLive):
-                twitchHandlesToLiveStatus[twitchHandle.lower()] = isLive
+        if exception is not None:
+            self.__timber.log('IsLiveOnTwitchRepository', f'Encountered exception when fetching live user details: {exception}', exception)
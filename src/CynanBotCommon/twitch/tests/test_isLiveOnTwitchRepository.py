@@ -0,0 +1,74 @@
+from unittest import mock
+
+import pytest
+
+try:
+    from ...administratorProviderInterface import \
+        AdministratorProviderInterface
+    from ...timber.timberStub import TimberStub
+    from ..isLiveOnTwitchRepository import IsLiveOnTwitchRepository
+    from ..twitchApiServiceInterface import TwitchApiServiceInterface
+    from ..twitchLiveUserDetails import TwitchLiveUserDetails
+    from ..twitchStreamType import TwitchStreamType
+    from ..twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+except:
+    from administratorProviderInterface import AdministratorProviderInterface
+    from timber.timberStub import TimberStub
+
+    from twitch.isLiveOnTwitchRepository import IsLiveOnTwitchRepository
+    from twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+    from twitch.twitchLiveUserDetails import TwitchLiveUserDetails
+    from twitch.twitchStreamType import TwitchStreamType
+    from twitch.twitchTokensRepositoryInterface import \
+        TwitchTokensRepositoryInterface
+
+
+class TestIsLiveOnTwitchRepository():
+
+    def __createLiveUserDetails(self, userName: str) -> TwitchLiveUserDetails:
+        liveUserDetails = mock.MagicMock(spec = TwitchLiveUserDetails)
+        liveUserDetails.getUserName.return_value = userName
+        liveUserDetails.getStreamType.return_value = TwitchStreamType.LIVE
+        return liveUserDetails
+
+    def __createRepository(self, twitchApiService: TwitchApiServiceInterface) -> IsLiveOnTwitchRepository:
+        administratorProvider = mock.MagicMock(spec = AdministratorProviderInterface)
+        administratorProvider.getAdministratorUserName.return_value = 'smCharles'
+
+        return IsLiveOnTwitchRepository(
+            administratorProvider = administratorProvider,
+            timber = TimberStub(),
+            twitchApiService = twitchApiService,
+            twitchTokensRepository = mock.MagicMock(spec = TwitchTokensRepositoryInterface)
+        )
+
+    @pytest.mark.asyncio
+    async def test_isLive_fetchesUncachedHandlesTogether(self):
+        twitchApiService = mock.MagicMock(spec = TwitchApiServiceInterface)
+        twitchApiService.fetchLiveUserDetails.return_value = [ self.__createLiveUserDetails('Samus') ]
+        repository = self.__createRepository(twitchApiService)
+
+        result = await repository.isLive([ 'samus', 'MARIO' ])
+        assert result == { 'samus': True, 'mario': False }
+        assert twitchApiService.fetchLiveUserDetails.call_count == 1
+
+        result = await repository.isLive([ 'samus', 'mario' ])
+        assert result == { 'samus': True, 'mario': False }
+        assert twitchApiService.fetchLiveUserDetails.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_isLive_whenApiFails(self):
+        twitchApiService = mock.MagicMock(spec = TwitchApiServiceInterface)
+        twitchApiService.fetchLiveUserDetails.side_effect = RuntimeError('failed')
+        repository = self.__createRepository(twitchApiService)
+
+        with pytest.raises(RuntimeError):
+            await repository.isLive([ 'samus', 'mario' ])
+
+        # failures aren't cached, so the next call tries again
+        twitchApiService.fetchLiveUserDetails.side_effect = None
+        twitchApiService.fetchLiveUserDetails.return_value = list()
+
+        result = await repository.isLive([ 'samus', 'mario' ])
+        assert result == { 'samus': False, 'mario': False }
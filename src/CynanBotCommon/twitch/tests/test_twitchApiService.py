@@ -0,0 +1,120 @@
+from typing import Any, Dict, Optional
+from unittest import mock
+
+import pytest
+
+try:
+    from ...network.exceptions import GenericNetworkException
+    from ...network.networkClientProvider import NetworkClientProvider
+    from ...network.networkHandle import NetworkHandle
+    from ...network.networkResponse import NetworkResponse
+    from ...timber.timberStub import TimberStub
+    from ..twitchApiService import TwitchApiService
+    from ..twitchBroadcasterType import TwitchBroadcasterType
+    from ..twitchCredentialsProviderInterface import \
+        TwitchCredentialsProviderInterface
+    from ..websocket.twitchWebsocketJsonMapperInterface import \
+        TwitchWebsocketJsonMapperInterface
+except:
+    from network.exceptions import GenericNetworkException
+    from network.networkClientProvider import NetworkClientProvider
+    from network.networkHandle import NetworkHandle
+    from network.networkResponse import NetworkResponse
+    from timber.timberStub import TimberStub
+
+    from twitch.twitchApiService import TwitchApiService
+    from twitch.twitchBroadcasterType import TwitchBroadcasterType
+    from twitch.twitchCredentialsProviderInterface import \
+        TwitchCredentialsProviderInterface
+    from twitch.websocket.twitchWebsocketJsonMapperInterface import \
+        TwitchWebsocketJsonMapperInterface
+
+
+class TestTwitchApiService():
+
+    def __createTwitchApiService(
+        self,
+        statusCode: int = 200,
+        jsonResponse: Optional[Dict[str, Any]] = None
+    ):
+        response = mock.MagicMock(spec = NetworkResponse)
+        response.getStatusCode.return_value = statusCode
+        response.json.return_value = jsonResponse
+
+        networkHandle = mock.MagicMock(spec = NetworkHandle)
+        networkHandle.get.return_value = response
+
+        networkClientProvider = mock.MagicMock(spec = NetworkClientProvider)
+        networkClientProvider.get.return_value = networkHandle
+
+        twitchCredentialsProvider = mock.MagicMock(spec = TwitchCredentialsProviderInterface)
+        twitchCredentialsProvider.getTwitchClientId.return_value = 'clientId'
+
+        twitchApiService = TwitchApiService(
+            networkClientProvider = networkClientProvider,
+            timber = TimberStub(),
+            twitchCredentialsProvider = twitchCredentialsProvider,
+            twitchWebsocketJsonMapper = mock.MagicMock(spec = TwitchWebsocketJsonMapperInterface)
+        )
+
+        return networkHandle, twitchApiService
+
+    @pytest.mark.asyncio
+    async def test_fetchUsersDetails_fetchesUserIdsAndUserNamesTogether(self):
+        networkHandle, twitchApiService = self.__createTwitchApiService(jsonResponse = {
+            'data': [
+                { 'id': '1', 'login': 'samus', 'display_name': 'Samus', 'broadcaster_type': 'partner', 'type': '' },
+                { 'id': '2', 'login': 'ridley', 'display_name': 'Ridley', 'broadcaster_type': '', 'type': '' }
+            ]
+        })
+
+        usersDetails = await twitchApiService.fetchUsersDetails(
+            twitchAccessToken = 'token',
+            userIds = [ '1' ],
+            userNames = [ 'Ridley', 'kraid' ]
+        )
+
+        networkHandle.get.assert_called_once_with(
+            url = 'https://api.twitch.tv/helix/users?id=1&login=ridley&login=kraid',
+            headers = {
+                'Authorization': 'Bearer token',
+                'Client-Id': 'clientId'
+            }
+        )
+
+        assert [ (userDetails.getUserId(), userDetails.getLogin()) for userDetails in usersDetails ] == [ ('1', 'samus'), ('2', 'ridley') ]
+        assert usersDetails[0].getBroadcasterType() is TwitchBroadcasterType.PARTNER
+
+    @pytest.mark.asyncio
+    async def test_fetchUsersDetails_withEmptyData(self):
+        _, twitchApiService = self.__createTwitchApiService(jsonResponse = { 'data': [ ] })
+
+        usersDetails = await twitchApiService.fetchUsersDetails(twitchAccessToken = 'token', userIds = [ '1' ])
+        assert usersDetails == list()
+
+    @pytest.mark.asyncio
+    async def test_fetchUsersDetails_withNoUsers(self):
+        networkHandle, twitchApiService = self.__createTwitchApiService()
+
+        assert await twitchApiService.fetchUsersDetails(twitchAccessToken = 'token') == list()
+        networkHandle.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetchUsersDetails_withNon200StatusCode(self):
+        _, twitchApiService = self.__createTwitchApiService(statusCode = 500)
+
+        with pytest.raises(GenericNetworkException):
+            await twitchApiService.fetchUsersDetails(twitchAccessToken = 'token', userIds = [ '1' ])
+
+    @pytest.mark.asyncio
+    async def test_fetchUsersDetails_withTooManyUsers(self):
+        networkHandle, twitchApiService = self.__createTwitchApiService()
+
+        with pytest.raises(ValueError):
+            await twitchApiService.fetchUsersDetails(
+                twitchAccessToken = 'token',
+                userIds = [ str(userId) for userId in range(60) ],
+                userNames = [ f'user{userId}' for userId in range(41) ]
+            )
+
+        networkHandle.get.assert_not_called()
@@ -796,13 +796,79 @@ class TwitchApiService(TwitchApiServiceInterface):
             self.__timber.log('TwitchApiService', f'Couldn\'t find entry with matching \"login\" field in JSON response when fetching user details (userName=\"{userName}\"): {jsonResponse}')
             return None
 
-        return TwitchUserDetails(
-            displayName = utils.getStrFromDict(entry, 'display_name'),
-            login = utils.getStrFromDict(entry, 'login'),
-            userId = utils.getStrFromDict(entry, 'id'),
-            broadcasterType = TwitchBroadcasterType.fromStr(utils.getStrFromDict(entry, 'broadcaster_type')),
-            userType = TwitchUserType.fromStr(utils.getStrFromDict(entry, 'type'))
-        )
+        return self.__parseUserDetails(entry)
+
+    async def fetchUsersDetails(
+        self,
+        twitchAccessToken: str,
+        userIds: Optional[List[str]] = None,
+        userNames: Optional[List[str]] = None
+    ) -> List[TwitchUserDetails]:
+        if not utils.isValidStr(twitchAccessToken):
+            raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+        elif userIds is not None and not utils.areValidStrs(userIds):
+            raise ValueError(f'userIds argument is malformed: \"{userIds}\"')
+        elif userNames is not None and not utils.areValidStrs(userNames):
+            raise ValueError(f'userNames argument is malformed: \"{userNames}\"')
+
+        if userIds is None:
+            userIds = list()
+
+        if userNames is None:
+            userNames = list()
+
+        if len(userIds) + len(userNames) == 0:
+            return list()
+        elif len(userIds) + len(userNames) > 100:
+            raise ValueError(f'userIds and userNames arguments have too many values (len is {len(userIds) + len(userNames)}, max is 100): \"{userIds}\", \"{userNames}\"')
+
+        userNames = [ userName.lower() for userName in userNames ]
+        self.__timber.log('TwitchApiService', f'Fetching users details... (userIds=\"{userIds}\") (userNames=\"{userNames}\")')
+
+        queryParameters: List[str] = list()
+        queryParameters.extend(f'id={userId}' for userId in userIds)
+        queryParameters.extend(f'login={userName}' for userName in userNames)
+        queryParametersStr = '&'.join(queryParameters)
+
+        twitchClientId = await self.__twitchCredentialsProvider.getTwitchClientId()
+        clientSession = await self.__networkClientProvider.get()
+
+        try:
+            response = await clientSession.get(
+                url = f'https://api.twitch.tv/helix/users?{queryParametersStr}',
+                headers = {
+                    'Authorization': f'Bearer {twitchAccessToken}',
+                    'Client-Id': twitchClientId
+                }
+            )
+        except GenericNetworkException as e:
+            self.__timber.log('TwitchApiService', f'Encountered network error when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {e}', e, traceback.format_exc())
+            raise GenericNetworkException(f'TwitchApiService encountered network error when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {e}')
+
+        if response.getStatusCode() != 200:
+            self.__timber.log('TwitchApiService', f'Encountered non-200 HTTP status code when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {response.getStatusCode()}')
+            raise GenericNetworkException(f'TwitchApiService encountered non-200 HTTP status code when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {response.getStatusCode()}')
+
+        jsonResponse: Optional[Dict[str, Any]] = await response.json()
+        await response.close()
+
+        if not utils.hasItems(jsonResponse):
+            self.__timber.log('TwitchApiService', f'Received a null/empty JSON response when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {jsonResponse}')
+            raise TwitchJsonException(f'TwitchApiService received a null/empty JSON response when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {jsonResponse}')
+        elif 'error' in jsonResponse and len(jsonResponse['error']) >= 1:
+            self.__timber.log('TwitchApiService', f'Received an error of some kind when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {jsonResponse}')
+            raise TwitchErrorException(f'TwitchApiService received an error of some kind when fetching users details (userIds=\"{userIds}\") (userNames=\"{userNames}\"): {jsonResponse}')
+
+        data: Optional[List[Dict[str, Any]]] = jsonResponse.get('data')
+        usersDetails: List[TwitchUserDetails] = list()
+
+        if not utils.hasItems(data):
+            return usersDetails
+
+        for dataEntry in data:
+            usersDetails.append(self.__parseUserDetails(dataEntry))
+
+        return usersDetails
 
     async def fetchUserSubscriptionDetails(
         self,
@@ -872,6 +938,15 @@ class TwitchApiService(TwitchApiServiceInterface):
             subscriberTier = TwitchSubscriberTier.fromStr(utils.getStrFromDict(entry, 'tier'))
         )
 
+    def __parseUserDetails(self, entry: Dict[str, Any]) -> TwitchUserDetails:
+        return TwitchUserDetails(
+            displayName = utils.getStrFromDict(entry, 'display_name'),
+            login = utils.getStrFromDict(entry, 'login'),
+            userId = utils.getStrFromDict(entry, 'id'),
+            broadcasterType = TwitchBroadcasterType.fromStr(utils.getStrFromDict(entry, 'broadcaster_type')),
+            userType = TwitchUserType.fromStr(utils.getStrFromDict(entry, 'type'))
+        )
+
     async def refreshTokens(self, twitchRefreshToken: str) -> TwitchTokensDetails:
         if not utils.isValidStr(twitchRefreshToken):
             raise ValueError(f'twitchRefreshToken argument is malformed: \"{twitchRefreshToken}\"')
@@ -111,6 +111,15 @@ class TwitchApiServiceInterface(ABC):
     ) -> Optional[TwitchUserDetails]:
         pass
 
+    @abstractmethod
+    async def fetchUsersDetails(
+        self,
+        twitchAccessToken: str,
+        userIds: Optional[List[str]] = None,
+        userNames: Optional[List[str]] = None
+    ) -> List[TwitchUserDetails]:
+        pass
+
     @abstractmethod
     async def fetchUserSubscriptionDetails(
         self,
@@ -69,7 +69,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__tokensExpirationBuffer: timedelta = tokensExpirationBuffer
         self.__timeZone: timezone = timeZone
 
-        self.__isDatabaseReady: bool = False
+        self.__registerDatabaseTables()
         self.__cache: Dict[str, TwitchTokensDetails] = dict()
         self.__tokenExpirationTimes: Dict[str, Optional[datetime]] = dict()
         self.__twitchTokensRepositoryListener: Optional[TwitchTokensRepositoryListener] = None
@@ -172,7 +172,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         return tokensDetails.getAccessToken()
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
+        await self.__consumeSeedFile()
         return await self.__backingDatabase.getConnection()
 
     async def getExpiringTwitchChannels(self) -> Optional[List[str]]:
@@ -206,17 +206,15 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         if twitchChannel.lower() in self.__cache:
             return self.__cache[twitchChannel.lower()]
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
-                WHERE twitchchannel = $1
-                LIMIT 1
-            ''',
-            twitchChannel
-        )
-
-        await connection.close()
+        async with await self.__getDatabaseConnection() as connection:
+            record = await connection.fetchRow(
+                '''
+                    SELECT expirationtime, accesstoken, refreshtoken FROM twitchtokens
+                    WHERE twitchchannel = $1
+                    LIMIT 1
+                ''',
+                twitchChannel
+            )
 
         if not utils.hasItems(record):
             self.__cache.pop(twitchChannel.lower(), None)
@@ -245,15 +243,12 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         accessToken = await self.getAccessToken(twitchChannel)
         return utils.isValidStr(accessToken)
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtokens (
                         expirationtime text DEFAULT NULL,
@@ -263,8 +258,8 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS twitchtokens (
                         expirationtime TEXT DEFAULT NULL,
@@ -275,10 +270,12 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
-        await self.__consumeSeedFile()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'TwitchTokensRepository',
+            statements = statements
+        )
 
     async def __refreshTokensDetails(
         self,
@@ -315,16 +312,15 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
 
         self.__timber.log('TwitchTokensRepository', f'Removing user \"{twitchChannel}\"...')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                DELETE FROM twitchtokens
-                WHERE twitchchannel = $1
-            ''',
-            twitchChannel
-        )
+        async with await self.__getDatabaseConnection() as connection:
+            await connection.execute(
+                '''
+                    DELETE FROM twitchtokens
+                    WHERE twitchchannel = $1
+                ''',
+                twitchChannel
+            )
 
-        await connection.close()
         self.__cache.pop(twitchChannel.lower(), None)
         self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
 
@@ -378,17 +374,16 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                UPDATE twitchtokens
-                SET expirationtime = $1
-                WHERE twitchchannel = $2
-            ''',
-            expirationTime.isoformat(), twitchChannel
-        )
+        async with await self.__getDatabaseConnection() as connection:
+            await connection.execute(
+                '''
+                    UPDATE twitchtokens
+                    SET expirationtime = $1
+                    WHERE twitchchannel = $2
+                ''',
+                expirationTime.isoformat(), twitchChannel
+            )
 
-        await connection.close()
         self.__cache.pop(twitchChannel.lower(), None)
         self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
 
@@ -408,37 +403,34 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         elif not utils.isValidStr(twitchChannel):
             raise ValueError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
 
-        connection = await self.__getDatabaseConnection()
-
-        if tokensDetails is None:
-            await connection.execute(
-                '''
-                    DELETE FROM twitchtokens
-                    WHERE twitchchannel = $1
-                ''',
-                twitchChannel
-            )
-
-            self.__cache.pop(twitchChannel.lower(), None)
-            self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been deleted')
-        else:
-            expirationTime = tokensDetails.getExpirationTime()
-
-            await connection.execute(
-                '''
-                    INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannel)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (twitchchannel) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
-                ''',
-                expirationTime.isoformat(), tokensDetails.getAccessToken(), tokensDetails.getRefreshToken(), twitchChannel
-            )
+        async with await self.__getDatabaseConnection() as connection:
+            if tokensDetails is None:
+                await connection.execute(
+                    '''
+                        DELETE FROM twitchtokens
+                        WHERE twitchchannel = $1
+                    ''',
+                    twitchChannel
+                )
 
-            self.__cache[twitchChannel.lower()] = tokensDetails
-            self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
-            self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been updated ({tokensDetails})')
+                self.__cache.pop(twitchChannel.lower(), None)
+                self.__tokenExpirationTimes.pop(twitchChannel.lower(), None)
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been deleted')
+            else:
+                expirationTime = tokensDetails.getExpirationTime()
+
+                await connection.execute(
+                    '''
+                        INSERT INTO twitchtokens (expirationtime, accesstoken, refreshtoken, twitchchannel)
+                        VALUES ($1, $2, $3, $4)
+                        ON CONFLICT (twitchchannel) DO UPDATE SET expirationtime = EXCLUDED.expirationtime, accesstoken = EXCLUDED.accesstoken, refreshtoken = EXCLUDED.refreshtoken
+                    ''',
+                    expirationTime.isoformat(), tokensDetails.getAccessToken(), tokensDetails.getRefreshToken(), twitchChannel
+                )
 
-        await connection.close()
+                self.__cache[twitchChannel.lower()] = tokensDetails
+                self.__tokenExpirationTimes[twitchChannel.lower()] = expirationTime
+                self.__timber.log('TwitchTokensRepository', f'Twitch tokens details for \"{twitchChannel}\" has been updated ({tokensDetails})')
 
     async def validateAndRefreshAccessToken(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
@@ -1,6 +1,5 @@
 import asyncio
 import queue
-import traceback
 from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta, timezone
 from queue import SimpleQueue
@@ -386,7 +385,13 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
                 exception = e
 
             if exception is not None:
-                self.__timber.log('TwitchWebsocketClient', f'Encountered an exception when attempting to convert dictionary ({dictionary}) at index {index} into WebsocketDataBundle: {exception}', exception, traceback.format_exc())
+                self.__timber.log(
+                    tag = 'TwitchWebsocketClient',
+                    msg = 'Encountered an exception when attempting to convert dictionary (%s) at index %d into WebsocketDataBundle: %s',
+                    exception = exception,
+                    args = [ dictionary, index, exception ],
+                    excInfo = True
+                )
                 continue
             elif dataBundle is None:
                 self.__timber.log('TwitchWebsocketClient', f'Received `None` when attempting to convert dictionary at index {index} into WebsocketDataBundle: \"{dictionary}\"')
@@ -427,7 +432,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
                     while not self.__dataBundleQueue.empty():
                         dataBundles.append(self.__dataBundleQueue.get_nowait())
                 except queue.Empty as e:
-                    self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Empty when building up dataBundles list (queue size: {self.__dataBundleQueue.qsize()}) (dataBundles size: {len(dataBundles)}): {e}', e, traceback.format_exc())
+                    self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Empty when building up dataBundles list (queue size: {self.__dataBundleQueue.qsize()}) (dataBundles size: {len(dataBundles)}): {e}', e, excInfo = True)
 
                 for dataBundle in dataBundles:
                     if not await self.__isValidMessage(dataBundle):
@@ -436,7 +441,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
                     try:
                         await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
                     except Exception as e:
-                        self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({dataBundle=}): {e}', e, traceback.format_exc())
+                        self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({dataBundle=}): {e}', e, excInfo = True)
 
             await asyncio.sleep(self.__queueSleepTimeSeconds)
 
@@ -460,7 +465,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
                             await self.__handleConnectionRelatedMessageFor(user, dataBundle)
                             await self.__submitDataBundle(dataBundle)
             except Exception as e:
-                self.__timber.log('TwitchWebsocketClient', f'Encountered websocket exception for \"{user}\" when connected to \"{twitchWebsocketUrl}\": {e}', e, traceback.format_exc())
+                self.__timber.log('TwitchWebsocketClient', f'Encountered websocket exception for \"{user}\" when connected to \"{twitchWebsocketUrl}\": {e}', e, excInfo = True)
                 self.__sessionIdFor[user] = ''
 
             await asyncio.sleep(self.__websocketSleepTimeSeconds)
@@ -482,4 +487,10 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         try:
             self.__dataBundleQueue.put(dataBundle, block = True, timeout = self.__queueTimeoutSeconds)
         except queue.Full as e:
-            self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Full when submitting a new dataBundle ({dataBundle}) into the dataBundle queue (queue size: {self.__dataBundleQueue.qsize()}): {e}', e, traceback.format_exc())
+            self.__timber.log(
+                tag = 'TwitchWebsocketClient',
+                msg = 'Encountered queue.Full when submitting a new dataBundle (%s) into the dataBundle queue (queue size: %d): %s',
+                exception = e,
+                args = [ dataBundle, self.__dataBundleQueue.qsize(), e ],
+                excInfo = True
+            )
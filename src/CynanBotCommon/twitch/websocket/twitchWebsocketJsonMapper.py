@@ -4,6 +4,7 @@ try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.simpleDateTime import SimpleDateTime
     from CynanBotCommon.timber.timberInterface import TimberInterface
+    from CynanBotCommon.timber.timberLevel import TimberLevel
     from CynanBotCommon.twitch.twitchSubscriberTier import TwitchSubscriberTier
     from CynanBotCommon.twitch.websocket.twitchWebsocketJsonMapperInterface import \
         TwitchWebsocketJsonMapperInterface
@@ -47,6 +48,7 @@ except:
     import utils
     from simpleDateTime import SimpleDateTime
     from timber.timberInterface import TimberInterface
+    from timber.timberLevel import TimberLevel
 
     from twitch.twitchSubscriberTier import TwitchSubscriberTier
     from twitch.websocket.twitchWebsocketJsonMapperInterface import \
@@ -351,7 +353,12 @@ class TwitchWebsocketJsonMapper(TwitchWebsocketJsonMapperInterface):
         metadata = await self.__parseMetadata(dataBundleJson.get('metadata'))
 
         if metadata is None:
-            self.__timber.log('TwitchWebsocketJsonMapper', f'Websocket message ({dataBundleJson}) is missing \"metadata\" ({metadata}) field')
+            self.__timber.log(
+                tag = 'TwitchWebsocketJsonMapper',
+                msg = 'Websocket message (%s) is missing \"metadata\" (%s) field',
+                level = TimberLevel.DEBUG,
+                args = [ dataBundleJson, metadata ]
+            )
             return None
 
         payload = await self.__parsePayload(dataBundleJson.get('payload'))
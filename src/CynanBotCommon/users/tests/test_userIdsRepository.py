@@ -0,0 +1,221 @@
+import asyncio
+from typing import List, Optional
+from unittest import mock
+
+import pytest
+
+try:
+    from ...network.exceptions import GenericNetworkException
+    from ...storage.backingDatabase import BackingDatabase
+    from ...storage.backingSqliteDatabase import BackingSqliteDatabase
+    from ...storage.databaseConnection import DatabaseConnection
+    from ...storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+    from ...storage.databaseStatementCache import DatabaseStatementCache
+    from ...storage.databaseType import DatabaseType
+    from ...timber.timberStub import TimberStub
+    from ...twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+    from ...twitch.twitchBroadcasterType import TwitchBroadcasterType
+    from ...twitch.twitchUserDetails import TwitchUserDetails
+    from ...twitch.twitchUserType import TwitchUserType
+    from ..userIdsRepository import UserIdsRepository
+except:
+    from network.exceptions import GenericNetworkException
+    from storage.backingDatabase import BackingDatabase
+    from storage.backingSqliteDatabase import BackingSqliteDatabase
+    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseSchemaRegistry import DatabaseSchemaRegistry
+    from storage.databaseStatementCache import DatabaseStatementCache
+    from storage.databaseType import DatabaseType
+    from timber.timberStub import TimberStub
+
+    from twitch.twitchApiServiceInterface import TwitchApiServiceInterface
+    from twitch.twitchBroadcasterType import TwitchBroadcasterType
+    from twitch.twitchUserDetails import TwitchUserDetails
+    from twitch.twitchUserType import TwitchUserType
+    from users.userIdsRepository import UserIdsRepository
+
+
+class StubBackingDatabase(BackingDatabase):
+
+    def __init__(self, backingDatabase: BackingSqliteDatabase):
+        self.__backingDatabase: BackingSqliteDatabase = backingDatabase
+        self.connections: int = 0
+        self.failingConnections: int = 0
+
+    async def close(self):
+        await self.__backingDatabase.close()
+
+    async def getConnection(self) -> DatabaseConnection:
+        self.connections = self.connections + 1
+
+        if self.failingConnections >= 1:
+            self.failingConnections = self.failingConnections - 1
+            raise RuntimeError('database is unavailable')
+
+        # gives any other lookups that are waiting a chance to run in the meantime
+        await asyncio.sleep(0)
+        return await self.__backingDatabase.getConnection()
+
+    def getDatabaseType(self) -> DatabaseType:
+        return self.__backingDatabase.getDatabaseType()
+
+    def getSchemaRegistry(self) -> DatabaseSchemaRegistry:
+        return self.__backingDatabase.getSchemaRegistry()
+
+    def getStatementCache(self) -> DatabaseStatementCache:
+        return self.__backingDatabase.getStatementCache()
+
+
+class TestUserIdsRepository():
+
+    def __createRepository(
+        self,
+        backingDatabase: StubBackingDatabase,
+        usersDetails: Optional[List[TwitchUserDetails]] = None
+    ):
+        twitchApiService = mock.MagicMock(spec = TwitchApiServiceInterface)
+        twitchApiService.fetchUsersDetails.return_value = usersDetails or list()
+
+        repository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            timber = TimberStub(),
+            twitchApiService = twitchApiService
+        )
+
+        return twitchApiService, repository
+
+    async def __createBackingDatabase(self, tmp_path, users: List[List[str]]) -> StubBackingDatabase:
+        backingDatabase = StubBackingDatabase(BackingSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        ))
+
+        # the users are written by a different repository, so that the one under test starts out cold
+        _, writer = self.__createRepository(backingDatabase)
+
+        for userId, userName in users:
+            await writer.setUser(userId = userId, userName = userName)
+
+        backingDatabase.connections = 0
+        return backingDatabase
+
+    def __createUserDetails(self, userId: str, login: str) -> TwitchUserDetails:
+        return TwitchUserDetails(
+            displayName = login,
+            login = login,
+            userId = userId,
+            broadcasterType = TwitchBroadcasterType.NORMAL,
+            userType = TwitchUserType.NORMAL
+        )
+
+    async def __insertUser(self, backingDatabase: StubBackingDatabase, userId: str, userName: str):
+        # this skips the repository, so that its caches don't know about the user
+        async with await backingDatabase.getConnection() as connection:
+            await connection.execute('INSERT INTO userids (userid, username) VALUES ($1, $2)', userId, userName)
+
+        backingDatabase.connections = 0
+
+    @pytest.mark.asyncio
+    async def test_fetchUserIds_withCachedDatabaseAndTwitchUsers(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ], [ '2', 'ridley' ] ])
+        twitchApiService, repository = self.__createRepository(backingDatabase, [ self.__createUserDetails('3', 'kraid') ])
+
+        # this warms the caches with every user that's in the database so far
+        assert await repository.fetchUserId('samus') == '1'
+        await self.__insertUser(backingDatabase, '4', 'mother')
+
+        result = await repository.fetchUserIds([ 'SAMUS', 'ridley', 'Mother', 'kraid', 'nobody' ], 'token')
+        assert result == { 'SAMUS': '1', 'ridley': '2', 'Mother': '4', 'kraid': '3' }
+
+        # one query for the uncached user names, and another to save the user from Twitch
+        assert backingDatabase.connections == 2
+
+        twitchApiService.fetchUsersDetails.assert_called_once_with(
+            twitchAccessToken = 'token',
+            userIds = None,
+            userNames = [ 'kraid', 'nobody' ]
+        )
+
+        # everything that was found is cached now, including the user from Twitch
+        twitchApiService.fetchUsersDetails.reset_mock()
+        backingDatabase.connections = 0
+
+        result = await repository.fetchUserIds([ 'samus', 'mother', 'kraid' ], 'token')
+        assert result == { 'samus': '1', 'mother': '4', 'kraid': '3' }
+        assert backingDatabase.connections == 0
+        twitchApiService.fetchUsersDetails.assert_not_called()
+
+        # and the user from Twitch was saved to the database
+        _, otherRepository = self.__createRepository(backingDatabase)
+        assert await otherRepository.fetchUserName('3') == 'kraid'
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchUserNames_withCachedDatabaseAndTwitchUsers(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ] ])
+        twitchApiService, repository = self.__createRepository(backingDatabase, [ self.__createUserDetails('3', 'kraid') ])
+
+        assert await repository.fetchUserName('1') == 'samus'
+        await self.__insertUser(backingDatabase, '2', 'ridley')
+
+        result = await repository.fetchUserNames([ '1', '2', '3', '9', '1' ], 'token')
+        assert result == { '1': 'samus', '2': 'ridley', '3': 'kraid' }
+
+        twitchApiService.fetchUsersDetails.assert_called_once_with(
+            twitchAccessToken = 'token',
+            userIds = [ '3', '9' ],
+            userNames = None
+        )
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchUserNames_withoutTwitchAccessToken(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ] ])
+        twitchApiService, repository = self.__createRepository(backingDatabase)
+
+        result = await repository.fetchUserNames([ '1', '2' ])
+        await backingDatabase.close()
+
+        assert result == { '1': 'samus' }
+        twitchApiService.fetchUsersDetails.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_fetchUserNames_withTwitchNetworkError(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ] ])
+        twitchApiService, repository = self.__createRepository(backingDatabase)
+        twitchApiService.fetchUsersDetails.side_effect = GenericNetworkException('timed out')
+
+        result = await repository.fetchUserNames([ '1', '2' ], 'token')
+        await backingDatabase.close()
+
+        assert result == { '1': 'samus' }
+        assert twitchApiService.fetchUsersDetails.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_warmCaches_withConcurrentFirstLookups(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ] ])
+        _, repository = self.__createRepository(backingDatabase)
+
+        results = await asyncio.gather(*[ repository.fetchUserName('1') for _ in range(10) ])
+        await backingDatabase.close()
+
+        assert results == [ 'samus' ] * 10
+        assert backingDatabase.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_warmCaches_withFailureThenRetry(self, tmp_path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path, [ [ '1', 'samus' ] ])
+        _, repository = self.__createRepository(backingDatabase)
+        backingDatabase.failingConnections = 1
+
+        with pytest.raises(RuntimeError):
+            await repository.fetchUserName('1')
+
+        # the failed warm up isn't remembered, so this one warms the caches and then reads from them
+        assert await repository.fetchUserName('1') == 'samus'
+        assert backingDatabase.connections == 2
+
+        assert await repository.fetchUserName('1') == 'samus'
+        assert backingDatabase.connections == 2
+        await backingDatabase.close()
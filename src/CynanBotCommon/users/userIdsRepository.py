@@ -1,12 +1,13 @@
+import asyncio
 import traceback
-from typing import Optional
+from typing import Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
     from CynanBotCommon.lruCache import LruCache
     from CynanBotCommon.network.exceptions import GenericNetworkException
     from CynanBotCommon.storage.backingDatabase import BackingDatabase
-    from CynanBotCommon.storage.databaseConnection import DatabaseConnection
+    from CynanBotCommon.storage.databaseStatement import DatabaseStatement
     from CynanBotCommon.storage.databaseType import DatabaseType
     from CynanBotCommon.timber.timberInterface import TimberInterface
     from CynanBotCommon.twitch.twitchApiServiceInterface import \
@@ -20,7 +21,7 @@ except:
     from lruCache import LruCache
     from network.exceptions import GenericNetworkException
     from storage.backingDatabase import BackingDatabase
-    from storage.databaseConnection import DatabaseConnection
+    from storage.databaseStatement import DatabaseStatement
     from storage.databaseType import DatabaseType
     from timber.timberInterface import TimberInterface
 
@@ -36,7 +37,8 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         self,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
-        twitchApiService: TwitchApiServiceInterface
+        twitchApiService: TwitchApiServiceInterface,
+        cacheCapacity: int = 1024
     ):
         if not isinstance(backingDatabase, BackingDatabase):
             raise ValueError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
@@ -44,15 +46,64 @@ class UserIdsRepository(UserIdsRepositoryInterface):
             raise ValueError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(twitchApiService, TwitchApiServiceInterface):
             raise ValueError(f'twitchApiService argument is malformed: \"{twitchApiService}\"')
+        elif not utils.isValidInt(cacheCapacity):
+            raise ValueError(f'cacheCapacity argument is malformed: \"{cacheCapacity}\"')
+        elif cacheCapacity < 2 or cacheCapacity > utils.getIntMaxSafeSize():
+            raise ValueError(f'cacheCapacity argument is out of bounds: {cacheCapacity}')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
 
-        self.__isDatabaseReady: bool = False
+        # user names are case insensitive, so the user ID cache is keyed by lowercase user name
+        self.__userIdsCache: LruCache = LruCache(cacheCapacity)
+        self.__userNamesCache: LruCache = LruCache(cacheCapacity)
+        self.__cacheCapacity: int = cacheCapacity
+        self.__batchSize: int = 100
+        self.__isCacheWarmed: bool = False
+        self.__warmCachesLock: Optional[asyncio.Lock] = None
+
+        self.__registerDatabaseTables()
+
+        self.__fetchUserIdStatement: DatabaseStatement = DatabaseStatement(
+            name = 'userIds.fetchUserId',
+            query = '''
+                SELECT userid FROM userids
+                WHERE username = $1
+                LIMIT 1
+            '''
+        )
+
+        self.__fetchUserNameStatement: DatabaseStatement = DatabaseStatement(
+            name = 'userIds.fetchUserName',
+            query = '''
+                SELECT username FROM userids
+                WHERE userid = $1
+                LIMIT 1
+            '''
+        )
+
+        self.__warmCachesStatement: DatabaseStatement = DatabaseStatement(
+            name = 'userIds.warmCaches',
+            query = '''
+                SELECT userid, username FROM userids
+                LIMIT $1
+            '''
+        )
+
+        self.__setUserStatement: DatabaseStatement = DatabaseStatement(
+            name = 'userIds.setUser',
+            query = '''
+                INSERT INTO userids (userid, username)
+                VALUES ($1, $2)
+                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
+            '''
+        )
 
     async def clearCaches(self):
-        # TODO
+        self.__userIdsCache.clear()
+        self.__userNamesCache.clear()
+        self.__isCacheWarmed = False
         self.__timber.log('UserIdsRepository', 'Caches cleared')
 
     async def fetchAnonymousUserId(self, twitchAccessToken: str) -> Optional[str]:
@@ -83,23 +134,20 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT userid FROM userids
-                WHERE username = $1
-                LIMIT 1
-            ''',
-            userName
-        )
+        await self.__warmCaches()
+        userId: Optional[str] = self.__userIdsCache.get(userName.lower())
+
+        if utils.isValidStr(userId):
+            return userId
+
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__fetchUserIdStatement, userName)
 
-        userId: Optional[str] = None
         if utils.hasItems(record):
             userId = record[0]
 
-        await connection.close()
-
         if utils.isValidStr(userId):
+            self.__putInCaches(userId = userId, userName = userName)
             return userId
         elif not utils.isValidStr(twitchAccessToken):
             self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch user ID for \"{userName}\" as no twitchAccessToken was specified')
@@ -153,23 +201,20 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
             raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-        connection = await self.__getDatabaseConnection()
-        record = await connection.fetchRow(
-            '''
-                SELECT username FROM userids
-                WHERE userid = $1
-                LIMIT 1
-            ''',
-            userId
-        )
+        await self.__warmCaches()
+        userName: Optional[str] = self.__userNamesCache.get(userId)
+
+        if utils.isValidStr(userName):
+            return userName
+
+        async with await self.__backingDatabase.getConnection() as connection:
+            record = await connection.fetchRow(self.__fetchUserNameStatement, userId)
 
-        userName: Optional[str] = None
         if utils.hasItems(record):
             userName = record[0]
 
-        await connection.close()
-
         if utils.isValidStr(userName):
+            self.__putInCaches(userId = userId, userName = userName)
             return userName
         elif not utils.isValidStr(twitchAccessToken):
             self.__timber.log('UserIdsRepository', f'Can\'t lookup Twitch username for \"{userId}\" as no twitchAccessToken was specified')
@@ -179,10 +224,13 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         userDetails: Optional[TwitchUserDetails] = None
 
         try:
-            userDetails = await self.__twitchApiService.fetchUserDetails(
+            usersDetails = await self.__twitchApiService.fetchUsersDetails(
                 twitchAccessToken = twitchAccessToken,
-                userName = userName
+                userIds = [ userId ]
             )
+
+            if utils.hasItems(usersDetails):
+                userDetails = usersDetails[0]
         except GenericNetworkException as e:
             self.__timber.log('UserIdsRepository', f'Received a network error when fetching Twitch username for user ID \"{userId}\": {e}', e, traceback.format_exc())
             return None
@@ -196,19 +244,165 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
         return userName
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
+    async def fetchUserIds(
+        self,
+        userNames: List[str],
+        twitchAccessToken: Optional[str] = None
+    ) -> Dict[str, str]:
+        if not isinstance(userNames, List):
+            raise ValueError(f'userNames argument is malformed: \"{userNames}\"')
+        elif utils.hasItems(userNames) and not utils.areValidStrs(userNames):
+            raise ValueError(f'userNames argument is malformed: \"{userNames}\"')
+        elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
+            raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
+        await self.__warmCaches()
+
+        # user names are case insensitive, so they are resolved by their lowercase form
+        userNamesToUserIds: Dict[str, str] = dict()
+        missingUserNames: List[str] = list()
 
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
+        for userName in dict.fromkeys(userName.lower() for userName in userNames):
+            userId: Optional[str] = self.__userIdsCache.get(userName)
 
-        if connection.getDatabaseType() is DatabaseType.POSTGRESQL:
-            await connection.createTableIfNotExists(
+            if utils.isValidStr(userId):
+                userNamesToUserIds[userName] = userId
+            else:
+                missingUserNames.append(userName)
+
+        if utils.hasItems(missingUserNames):
+            for userId, userName in (await self.__fetchUsersFromDatabase('username', missingUserNames)).items():
+                userNamesToUserIds[userName.lower()] = userId
+
+            missingUserNames = [ userName for userName in missingUserNames if userName not in userNamesToUserIds ]
+
+        if utils.hasItems(missingUserNames) and utils.isValidStr(twitchAccessToken):
+            self.__timber.log('UserIdsRepository', f'User IDs for {len(missingUserNames)} username(s) weren\'t found locally, so performing a network call to fetch instead...')
+
+            for userId, userName in (await self.__fetchUsersFromTwitch(twitchAccessToken, userNames = missingUserNames)).items():
+                userNamesToUserIds[userName.lower()] = userId
+
+        return { userName: userNamesToUserIds[userName.lower()] for userName in userNames if userName.lower() in userNamesToUserIds }
+
+    async def fetchUserNames(
+        self,
+        userIds: List[str],
+        twitchAccessToken: Optional[str] = None
+    ) -> Dict[str, str]:
+        if not isinstance(userIds, List):
+            raise ValueError(f'userIds argument is malformed: \"{userIds}\"')
+        elif utils.hasItems(userIds) and not utils.areValidStrs(userIds):
+            raise ValueError(f'userIds argument is malformed: \"{userIds}\"')
+        elif twitchAccessToken is not None and not utils.isValidStr(twitchAccessToken):
+            raise ValueError(f'twitchAccessToken argument is malformed: \"{twitchAccessToken}\"')
+
+        await self.__warmCaches()
+
+        userIdsToUserNames: Dict[str, str] = dict()
+        missingUserIds: List[str] = list()
+
+        for userId in dict.fromkeys(userIds):
+            userName: Optional[str] = self.__userNamesCache.get(userId)
+
+            if utils.isValidStr(userName):
+                userIdsToUserNames[userId] = userName
+            else:
+                missingUserIds.append(userId)
+
+        if utils.hasItems(missingUserIds):
+            userIdsToUserNames.update(await self.__fetchUsersFromDatabase('userid', missingUserIds))
+            missingUserIds = [ userId for userId in missingUserIds if userId not in userIdsToUserNames ]
+
+        if utils.hasItems(missingUserIds) and utils.isValidStr(twitchAccessToken):
+            self.__timber.log('UserIdsRepository', f'Usernames for {len(missingUserIds)} user ID(s) weren\'t found locally, so performing a network call to fetch instead...')
+            userIdsToUserNames.update(await self.__fetchUsersFromTwitch(twitchAccessToken, userIds = missingUserIds))
+
+        return userIdsToUserNames
+
+    async def __fetchUsersFromDatabase(self, column: str, values: List[str]) -> Dict[str, str]:
+        users: Dict[str, str] = dict()
+        async with await self.__backingDatabase.getConnection() as connection:
+            for index in range(0, len(values), self.__batchSize):
+                batch = values[index:index + self.__batchSize]
+                placeholders = ', '.join(f'${position}' for position in range(1, len(batch) + 1))
+
+                records = await connection.fetchRows(
+                    f'''
+                        SELECT userid, username FROM userids
+                        WHERE {column} IN ({placeholders})
+                    ''',
+                    *batch
+                )
+
+                if not utils.hasItems(records):
+                    continue
+
+                for record in records:
+                    users[record[0]] = record[1]
+                    self.__putInCaches(userId = record[0], userName = record[1])
+
+        return users
+
+    async def __fetchUsersFromTwitch(
+        self,
+        twitchAccessToken: str,
+        userIds: Optional[List[str]] = None,
+        userNames: Optional[List[str]] = None
+    ) -> Dict[str, str]:
+        users: Dict[str, str] = dict()
+
+        for index in range(0, len(userIds or userNames), self.__batchSize):
+            try:
+                usersDetails = await self.__twitchApiService.fetchUsersDetails(
+                    twitchAccessToken = twitchAccessToken,
+                    userIds = None if userIds is None else userIds[index:index + self.__batchSize],
+                    userNames = None if userNames is None else userNames[index:index + self.__batchSize]
+                )
+            except GenericNetworkException as e:
+                self.__timber.log('UserIdsRepository', f'Received a network error when fetching Twitch users details: {e}', e, traceback.format_exc())
+                break
+
+            for userDetails in usersDetails:
+                users[userDetails.getUserId()] = userDetails.getLogin()
+
+        if not utils.hasItems(users):
+            return users
+
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.executeMany(
+                self.__setUserStatement,
+                [ [ userId, userName ] for userId, userName in users.items() ]
+            )
+
+        for userId, userName in users.items():
+            self.__putInCaches(userId = userId, userName = userName)
+
+        return users
+
+    def __getWarmCachesLock(self) -> asyncio.Lock:
+        warmCachesLock = self.__warmCachesLock
+
+        if warmCachesLock is None:
+            warmCachesLock = asyncio.Lock()
+            self.__warmCachesLock = warmCachesLock
+
+        return warmCachesLock
+
+    def __putInCaches(self, userId: str, userName: str):
+        oldUserName: Optional[str] = self.__userNamesCache.pop(userId)
+
+        if utils.isValidStr(oldUserName) and oldUserName.lower() != userName.lower():
+            self.__userIdsCache.pop(oldUserName.lower())
+
+        self.__userIdsCache.put(userName.lower(), userId)
+        self.__userNamesCache.put(userId, userName)
+
+    def __registerDatabaseTables(self):
+        databaseType = self.__backingDatabase.getDatabaseType()
+        statements: List[str] = list()
+
+        if databaseType is DatabaseType.POSTGRESQL:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS userids (
                         userid public.citext NOT NULL PRIMARY KEY,
@@ -216,8 +410,8 @@ class UserIdsRepository(UserIdsRepositoryInterface):
                     )
                 '''
             )
-        elif connection.getDatabaseType() is DatabaseType.SQLITE:
-            await connection.createTableIfNotExists(
+        elif databaseType is DatabaseType.SQLITE:
+            statements.append(
                 '''
                     CREATE TABLE IF NOT EXISTS userids (
                         userid TEXT NOT NULL PRIMARY KEY COLLATE NOCASE,
@@ -226,9 +420,12 @@ class UserIdsRepository(UserIdsRepositoryInterface):
                 '''
             )
         else:
-            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.getDatabaseType()}\"')
+            raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{databaseType}\"')
 
-        await connection.close()
+        self.__backingDatabase.getSchemaRegistry().register(
+            name = 'UserIdsRepository',
+            statements = statements
+        )
 
     async def requireAnonymousUserId(self, twitchAccessToken: str) -> str:
         if not utils.isValidStr(twitchAccessToken):
@@ -312,14 +509,35 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         elif not utils.isValidStr(userName):
             raise ValueError(f'userName argument is malformed: \"{userName}\"')
 
-        connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO userids (userid, username)
-                VALUES ($1, $2)
-                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
-            ''',
-            userId, userName
-        )
+        if self.__userNamesCache.get(userId) == userName:
+            # this user is already known, so there is nothing to write
+            return
+
+        async with await self.__backingDatabase.getConnection() as connection:
+            await connection.execute(self.__setUserStatement, userId, userName)
+
+        self.__putInCaches(userId = userId, userName = userName)
+
+    async def __warmCaches(self):
+        if self.__isCacheWarmed:
+            return
+
+        # concurrent first lookups all wait on a single warm query, rather than each running their own
+        async with self.__getWarmCachesLock():
+            if self.__isCacheWarmed:
+                return
+
+            async with await self.__backingDatabase.getConnection() as connection:
+                records = await connection.fetchRows(self.__warmCachesStatement, self.__cacheCapacity)
+
+            # only mark the caches as warmed once the records have actually loaded, so that a
+            # failed fetch gets retried by the next lookup
+            self.__isCacheWarmed = True
+
+            if not utils.hasItems(records):
+                return
+
+            for record in records:
+                self.__putInCaches(userId = record[0], userName = record[1])
 
-        await connection.close()
+        self.__timber.log('UserIdsRepository', f'Warmed caches with {len(records)} user(s)')
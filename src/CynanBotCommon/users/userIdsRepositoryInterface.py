@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Dict, List, Optional
 
 try:
     from CynanBotCommon.clearable import Clearable
@@ -33,6 +33,14 @@ class UserIdsRepositoryInterface(Clearable):
     ) -> Optional[int]:
         pass
 
+    @abstractmethod
+    async def fetchUserIds(
+        self,
+        userNames: List[str],
+        twitchAccessToken: Optional[str] = None
+    ) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     async def fetchUserName(
         self,
@@ -41,6 +49,14 @@ class UserIdsRepositoryInterface(Clearable):
     ) -> Optional[str]:
         pass
 
+    @abstractmethod
+    async def fetchUserNames(
+        self,
+        userIds: List[str],
+        twitchAccessToken: Optional[str] = None
+    ) -> Dict[str, str]:
+        pass
+
     @abstractmethod
     async def requireAnonymousUserId(self, twitchAccessToken: str) -> str:
         pass
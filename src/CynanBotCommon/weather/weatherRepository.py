@@ -4,12 +4,12 @@ from typing import Any, Dict, List, Optional
 
 try:
     import CynanBotCommon.utils as utils
+    from CynanBotCommon.asyncTtlCache import AsyncTtlCache
     from CynanBotCommon.location.location import Location
     from CynanBotCommon.network.exceptions import GenericNetworkException
     from CynanBotCommon.network.networkClientProvider import \
         NetworkClientProvider
     from CynanBotCommon.timber.timberInterface import TimberInterface
-    from CynanBotCommon.timedDict import TimedDict
     from CynanBotCommon.weather.airQualityIndex import AirQualityIndex
     from CynanBotCommon.weather.uvIndex import UvIndex
     from CynanBotCommon.weather.weatherReport import WeatherReport
@@ -17,11 +17,11 @@ try:
         WeatherRepositoryInterface
 except:
     import utils
+    from asyncTtlCache import AsyncTtlCache
     from location.location import Location
     from network.exceptions import GenericNetworkException
     from network.networkClientProvider import NetworkClientProvider
     from timber.timberInterface import TimberInterface
-    from timedDict import TimedDict
     from weather.airQualityIndex import AirQualityIndex
     from weather.uvIndex import UvIndex
     from weather.weatherReport import WeatherReport
@@ -56,7 +56,7 @@ class WeatherRepository(WeatherRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__maxAlerts: int = maxAlerts
 
-        self.__cache: TimedDict = TimedDict(timeDelta = cacheTimeDelta)
+        self.__cache: AsyncTtlCache = AsyncTtlCache(timeToLive = cacheTimeDelta)
         self.__conditionIcons: Dict[str, str] = self.__createConditionIconsDict()
 
     async def __chooseTomorrowFromForecast(self, jsonResponse: Dict[str, Any]) -> Dict[str, Any]:
@@ -163,14 +163,10 @@ class WeatherRepository(WeatherRepositoryInterface):
         if not isinstance(location, Location):
             raise ValueError(f'location argument is malformed: \"{location}\"')
 
-        cacheValue = self.__cache[location.getLocationId()]
-        if cacheValue is not None:
-            return cacheValue
-
-        weatherReport = await self.__fetchWeather(location)
-        self.__cache[location.getLocationId()] = weatherReport
-
-        return weatherReport
+        return await self.__cache.getOrLoad(
+            key = location.getLocationId(),
+            loader = lambda: self.__fetchWeather(location)
+        )
 
     async def __fetchWeather(self, location: Location) -> WeatherReport:
         if not isinstance(location, Location):
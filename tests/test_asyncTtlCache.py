@@ -0,0 +1,157 @@
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+try:
+    from CynanBotCommon.asyncTtlCache import AsyncTtlCache
+except:
+    from asyncTtlCache import AsyncTtlCache
+
+
+class FakeClock():
+
+    def __init__(self):
+        self.now: float = 0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestAsyncTtlCache():
+
+    def test_constructWithZeroMaxSize(self):
+        cache: AsyncTtlCache = None
+        exception: Exception = None
+
+        try:
+            cache = AsyncTtlCache(timeToLive = timedelta(minutes = 1), maxSize = 0)
+        except Exception as e:
+            exception = e
+
+        assert cache is None
+        assert isinstance(exception, ValueError)
+
+    def test_get_afterExpiration(self):
+        clock = FakeClock()
+        cache = AsyncTtlCache(timeToLive = timedelta(seconds = 10), clock = clock)
+        cache.put('a', 1)
+
+        clock.now = 9
+        assert cache.get('a') == 1
+
+        clock.now = 10
+        assert cache.get('a') is None
+        assert cache.getSize() == 0
+        assert cache.getExpirations() == 1
+        assert cache.getHits() == 1
+        assert cache.getMisses() == 1
+
+    def test_put_evictsLeastRecentlyUsed(self):
+        cache = AsyncTtlCache(timeToLive = timedelta(minutes = 1), maxSize = 2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        assert cache.get('a') == 1
+
+        cache.put('c', 3)
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+        assert cache.getEvictions() == 1
+
+    def test_put_purgesExpiredEntries(self):
+        clock = FakeClock()
+        cache = AsyncTtlCache(
+            timeToLive = timedelta(seconds = 10),
+            purgeInterval = timedelta(seconds = 30),
+            clock = clock
+        )
+
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        clock.now = 30
+        cache.put('c', 3)
+        assert cache.getSize() == 1
+        assert cache.getExpirations() == 2
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_coalescesConcurrentLoads(self):
+        cache = AsyncTtlCache(timeToLive = timedelta(minutes = 1))
+        loads: int = 0
+
+        async def loader() -> str:
+            nonlocal loads
+            loads = loads + 1
+            await asyncio.sleep(0.01)
+            return 'value'
+
+        results = await asyncio.gather(*[ cache.getOrLoad('a', loader) for _ in range(5) ])
+        assert results == [ 'value' ] * 5
+        assert loads == 1
+
+        assert await cache.getOrLoad('a', loader) == 'value'
+        assert loads == 1
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_doesNotCacheExceptions(self):
+        cache = AsyncTtlCache(timeToLive = timedelta(minutes = 1))
+
+        async def failingLoader() -> str:
+            await asyncio.sleep(0.01)
+            raise RuntimeError('failed')
+
+        results = await asyncio.gather(
+            cache.getOrLoad('a', failingLoader),
+            cache.getOrLoad('a', failingLoader),
+            return_exceptions = True
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert not cache.isLoading('a')
+        assert cache.getSize() == 0
+
+        async def loader() -> str:
+            return 'value'
+
+        assert await cache.getOrLoad('a', loader) == 'value'
+
+    @pytest.mark.asyncio
+    async def test_getOrLoad_cancelledWaiterDoesNotCancelLoad(self):
+        cache = AsyncTtlCache(timeToLive = timedelta(minutes = 1))
+        loads: int = 0
+
+        async def loader() -> str:
+            nonlocal loads
+            loads = loads + 1
+            await asyncio.sleep(0.05)
+            return 'value'
+
+        firstWaiter = asyncio.ensure_future(cache.getOrLoad('a', loader))
+        secondWaiter = asyncio.ensure_future(cache.getOrLoad('a', loader))
+        await asyncio.sleep(0.01)
+
+        # the waiter that started the load goes away, but the other one still gets its value
+        firstWaiter.cancel()
+
+        assert await secondWaiter == 'value'
+        assert firstWaiter.cancelled()
+        assert loads == 1
+        assert cache.get('a') == 'value'
+
+    def test_containsKey_doesNotCountStats(self):
+        clock = FakeClock()
+        cache = AsyncTtlCache(
+            timeToLive = timedelta(seconds = 10),
+            clock = clock
+        )
+
+        assert not cache.containsKey('a')
+        cache.put('a', 'value')
+        assert cache.containsKey('a')
+
+        clock.now = 10
+        assert not cache.containsKey('a')
+
+        assert cache.getHits() == 0
+        assert cache.getMisses() == 0
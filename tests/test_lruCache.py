@@ -123,3 +123,58 @@ class TestLruCache():
         assert lruCache.contains('bulbasaur') is False
         assert lruCache.contains('pikachu') is True
         assert lruCache.contains('mew') is True
+
+    def test_getAndPut(self):
+        lruCache = LruCache(2)
+        assert lruCache.get('charmander') is None
+
+        lruCache.put('charmander', 4)
+        lruCache.put('squirtle', 7)
+        assert lruCache.get('charmander') == 4
+
+        lruCache.put('bulbasaur', 1)
+        assert lruCache.get('squirtle') is None
+        assert lruCache.get('charmander') == 4
+        assert lruCache.get('bulbasaur') == 1
+
+        assert lruCache.getHits() == 3
+        assert lruCache.getMisses() == 2
+        assert lruCache.getEvictions() == 1
+
+    def test_pop(self):
+        lruCache = LruCache(3)
+        lruCache.put('pikachu', 25)
+        assert lruCache.pop('pikachu') == 25
+        assert lruCache.pop('pikachu') is None
+        assert lruCache.contains('pikachu') is False
+        assert lruCache.getSize() == 0
+        assert lruCache.getSizeInBytes() == 0
+
+    def test_setCapacity(self):
+        lruCache = LruCache(4)
+        lruCache.put('charmander')
+        lruCache.put('squirtle')
+        lruCache.put('bulbasaur')
+        lruCache.put('pikachu')
+
+        lruCache.setCapacity(2)
+        assert lruCache.getCapacity() == 2
+        assert lruCache.getSize() == 2
+        assert lruCache.contains('charmander') is False
+        assert lruCache.contains('squirtle') is False
+        assert lruCache.contains('bulbasaur') is True
+        assert lruCache.contains('pikachu') is True
+
+    def test_sizeInBytes(self):
+        lruCache = LruCache(3, sizeOf = len)
+        lruCache.put('mew', 'psychic')
+        assert lruCache.getSizeInBytes() == 10
+
+        lruCache.put('mew', 'cat')
+        assert lruCache.getSizeInBytes() == 6
+
+        lruCache.put('pikachu', 'mouse')
+        assert lruCache.getSizeInBytes() == 18
+
+        lruCache.clear()
+        assert lruCache.getSizeInBytes() == 0